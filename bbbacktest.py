@@ -0,0 +1,251 @@
+"""
+Copyright (c) 2024 Jim Maastricht
+
+Backtest PlayerProjector settings against real seasons.
+For each target season Y the projector only sees the seasons before Y, and its projected rates are scored
+against what the players actually did in Y: RMSE and bias for OBP, HR/AB and K% for batters, ERA, WHIP
+and K% for pitchers.  Target seasons and parameter sets run in a process pool, and every (season, params)
+score is cached against the historical file hashes so a bigger grid only scores the new combinations.
+"""
+
+import hashlib
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.core.frame import DataFrame
+
+import bbplayer_projections_forecast_player as player_projector
+import bbinnings
+from bbmanifest import PREPROCESS_CACHE_DIR, PreprocessManifest
+from bbplayer_projections import BaseballStatsPreProcess
+
+BACKTEST_CACHE_VERSION = 1  # bump when the scoring or projector code changes so cached scores are rebuilt
+MIN_SCORED_PA = 200  # batters need this many actual PA in the target season to be scored
+MIN_SCORED_IP = 40  # pitchers need this many actual innings
+BATTING_STATS = ["G", "PA", "AB", "R", "H", "2B", "3B", "HR", "RBI", "SB", "CS", "BB", "SO", "SH", "SF", "HBP", "GIDP"]
+PITCHING_STATS = ["G", "GS", "CG", "SHO", "IP", "H", "ER", "SO", "BB", "HR", "W", "L", "SV", "HBP", "BK", "WP"]
+
+_HISTORY: Dict[str, DataFrame] = {}  # set once per worker process by _init_worker
+
+
+def param_grid(**axes: List[float]) -> List[dict]:
+    """
+    every combination of the given values, keys are batter.<stat> or pitcher.<stat> for a k value override
+    and aging_scale for the aging curves, e.g. param_grid(**{"batter.HR": [20, 25, 30], "aging_scale": [0.5, 1]})
+    :param axes: parameter name to the values to try
+    :return: list of param sets, the first one is the first value of every axis
+    """
+    names = list(axes)
+    return [dict(zip(names, values)) for values in itertools.product(*(axes[name] for name in names))]
+
+
+def params_label(params: dict) -> str:
+    """Short readable name for a param set, 'default' for the projector's own settings."""
+    return " ".join(f"{name}={value}" for name, value in sorted(params.items())) or "default"
+
+
+def make_projector(league_averages: Dict[str, float], params: dict) -> player_projector.PlayerProjector:
+    """
+    PlayerProjector with a param set applied over its defaults
+    :param league_averages: regression means for the seasons being projected
+    :param params: batter.<stat> and pitcher.<stat> k values plus an optional aging_scale
+    :return: projector
+    """
+    projector = player_projector.PlayerProjector(league_averages, aging_scale=params.get("aging_scale", 1.0))
+    for name, value in params.items():
+        side, _, stat = name.partition(".")
+        if side == "batter":
+            projector.k_vals_batter[stat] = value
+        elif side == "pitcher":
+            projector.k_vals_pitcher[stat] = value
+        elif name != "aging_scale":
+            raise ValueError(f"Unknown backtest parameter {name}, use batter.<stat>, pitcher.<stat> or aging_scale")
+    return projector
+
+
+def batting_rates(df: DataFrame) -> DataFrame:
+    """OBP, HR/AB and K% from batting counting stats."""
+    on_base_chances = df["AB"] + df["BB"] + df["HBP"] + df["SF"]
+    return pd.DataFrame({
+        "OBP": (df["H"] + df["BB"] + df["HBP"]) / on_base_chances.replace(0, np.nan),
+        "HR/AB": df["HR"] / df["AB"].replace(0, np.nan),
+        "K%": df["SO"] / df["PA"].replace(0, np.nan),
+    }, index=df.index)
+
+
+def pitching_rates(df: DataFrame, innings: pd.Series) -> DataFrame:
+    """
+    ERA, WHIP and K% from pitching counting stats
+    :param df: pitching counting stats
+    :param innings: innings as a true decimal, not the .1/.2 notation
+    :return: df of rates
+    """
+    innings = innings.replace(0, np.nan)
+    return pd.DataFrame({
+        "ERA": df["ER"] * 9 / innings,
+        "WHIP": (df["BB"] + df["H"]) / innings,
+        "K%": df["SO"] / df["PA"].replace(0, np.nan),
+    }, index=df.index)
+
+
+def score_season(history: DataFrame, season: int, params: dict, is_p: bool) -> List[dict]:
+    """
+    project season from the seasons before it and score the projected rates against the actual ones
+    :param history: historical df, one row per player per season
+    :param season: target season
+    :param params: param set for the projector
+    :param is_p: True for pitchers
+    :return: one row per stat with RMSE, bias (projected minus actual) and the number of players scored
+    """
+    prior = history[history["Season"] < season]
+    actual = history[history["Season"] == season].set_index("Hashcode")
+    if prior.empty or actual.empty:
+        return []
+    league_averages = BaseballStatsPreProcess.calculate_league_averages(prior, is_pitching=is_p)
+    projector = make_projector(league_averages, params)
+    projected = projector.calculate_projected_stats(prior, PITCHING_STATS if is_p else BATTING_STATS, is_p)
+    projected = projected.set_index("Hashcode")
+
+    if is_p:
+        actual_innings = pd.Series(bbinnings.ip_to_outs(actual["IP"].to_numpy()) / 3, index=actual.index)
+        actual = actual[actual_innings >= MIN_SCORED_IP]
+        players = projected.index.intersection(actual.index)
+        proj_rates = pitching_rates(projected.loc[players], projected.loc[players, "IP_True"])
+        actual_rates = pitching_rates(actual.loc[players], actual_innings.loc[players])
+    else:
+        actual = actual[actual["PA"] >= MIN_SCORED_PA]
+        players = projected.index.intersection(actual.index)
+        proj_rates = batting_rates(projected.loc[players])
+        actual_rates = batting_rates(actual.loc[players])
+
+    rows = []
+    for stat in proj_rates.columns:
+        error = (proj_rates[stat] - actual_rates[stat]).dropna()
+        rows.append({
+            "Season": season,
+            "Side": "pitching" if is_p else "batting",
+            "Stat": stat,
+            "RMSE": float(np.sqrt(np.mean(error**2))) if len(error) else np.nan,
+            "Bias": float(error.mean()) if len(error) else np.nan,
+            "N": len(error),
+        })
+    return rows
+
+
+def _init_worker(history: Dict[str, DataFrame]) -> None:
+    """process pool initializer, ships the history to each worker once instead of with every task"""
+    global _HISTORY
+    _HISTORY = history
+    return
+
+
+def _run_task(task: Tuple[int, dict]) -> List[dict]:
+    """score one (season, params) task for batters and pitchers"""
+    season, params = task
+    return score_season(_HISTORY["batting"], season, params, False) + score_season(
+        _HISTORY["pitching"], season, params, True
+    )
+
+
+class ProjectionBacktest:
+    """
+    Scores projector param sets over several target seasons.
+
+    Attributes:
+        history: side ('batting' or 'pitching') to historical df, one row per player per season
+        target_seasons: seasons to project and score, each one is projected from the seasons before it
+        workers: processes for scoring, 1 runs serially
+    """
+
+    def __init__(self, load_seasons: List[int], target_seasons: Optional[List[int]] = None,
+                 workers: Optional[int] = None, cache_dir: Optional[str] = PREPROCESS_CACHE_DIR) -> None:
+        """
+        :param load_seasons: seasons in the historical file names written by bbplayer_projections.py
+        :param target_seasons: seasons to score, defaults to every loaded season after the first
+        :param workers: processes for scoring, None is one per cpu
+        :param cache_dir: directory for cached scores, None disables caching
+        """
+        seasons_str = " ".join(str(season) for season in load_seasons)
+        self.files = {side: f"{seasons_str} historical-{side.capitalize()}.csv" for side in ["batting", "pitching"]}
+        self.history = {side: pd.read_csv(file_name) for side, file_name in self.files.items()}
+        self.target_seasons = target_seasons if target_seasons is not None else sorted(load_seasons)[1:]
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.cache_dir = cache_dir
+        return
+
+    @staticmethod
+    def cache_key(season: int, params: dict) -> str:
+        """manifest key for one (season, params) score"""
+        digest = hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()[:12]
+        return f"backtest {season} {digest}"
+
+    def run(self, param_sets: List[dict]) -> DataFrame:
+        """
+        score every param set on every target season, cached scores are reused
+        :param param_sets: list of param sets, see param_grid
+        :return: df with one row per season, param set and stat: Params, Season, Side, Stat, RMSE, Bias, N
+        """
+        manifest = (PreprocessManifest("backtest", self.cache_dir, BACKTEST_CACHE_VERSION)
+                    if self.cache_dir is not None else None)
+        inputs = list(self.files.values())
+        tasks = [(season, params) for params in param_sets for season in self.target_seasons]
+        scores: Dict[int, List[dict]] = {}
+        missing = []
+        for i, (season, params) in enumerate(tasks):
+            cached = manifest.load(self.cache_key(season, params), inputs) if manifest is not None else None
+            if cached is not None:
+                scores[i] = cached
+            else:
+                missing.append(i)
+
+        if self.workers <= 1 or len(missing) <= 1:
+            _init_worker(self.history)
+            results = [_run_task(tasks[i]) for i in missing]
+        else:
+            chunksize = max(1, len(missing) // (self.workers * 4))
+            with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                     initargs=(self.history,)) as pool:
+                results = list(pool.map(_run_task, [tasks[i] for i in missing], chunksize=chunksize))
+        for i, rows in zip(missing, results):
+            scores[i] = rows
+            if manifest is not None:
+                manifest.store(self.cache_key(*tasks[i]), inputs, rows)
+        if manifest is not None:
+            manifest.save()
+            print(f"Backtest: {manifest.hits} scores from cache, {len(missing)} computed")
+
+        rows = [dict(row, Params=params_label(tasks[i][1])) for i in range(len(tasks)) for row in scores[i]]
+        return pd.DataFrame(rows, columns=["Params", "Season", "Side", "Stat", "RMSE", "Bias", "N"])
+
+    @staticmethod
+    def report(results: DataFrame) -> DataFrame:
+        """
+        pool the per-season scores into one row per param set, RMSE and bias weighted by players scored.
+        Score is the mean RMSE relative to the first param set, lower is better
+        :param results: output of run
+        :return: df indexed by Params with an RMSE and a Bias col per stat, sorted best first
+        """
+        results = results.assign(SE=results["RMSE"] ** 2 * results["N"], BiasN=results["Bias"] * results["N"])
+        pooled = results.groupby(["Params", "Side", "Stat"], sort=False)[["SE", "BiasN", "N"]].sum()
+        pooled["RMSE"] = np.sqrt(pooled["SE"] / pooled["N"])
+        pooled["Bias"] = pooled["BiasN"] / pooled["N"]
+        table = pooled[["RMSE", "Bias"]].unstack(["Side", "Stat"])
+        table.columns = [f"{stat} {side[:3]} {metric}" for metric, side, stat in table.columns]
+        rmse_cols = [col for col in table.columns if col.endswith("RMSE")]
+        table["Score"] = (table[rmse_cols] / table[rmse_cols].iloc[0]).mean(axis=1)
+        rmse_first = rmse_cols + ["Score"] + [col for col in table.columns if col.endswith("Bias")]
+        return table[rmse_first].sort_values("Score")
+
+
+if __name__ == "__main__":
+    backtest = ProjectionBacktest(load_seasons=[2020, 2021, 2022, 2023, 2024, 2025, 2026],
+                                  target_seasons=[2021, 2022, 2023, 2024, 2025])
+    grid = param_grid(**{"batter.HR": [25, 15, 40], "pitcher.ER": [300, 150, 600], "aging_scale": [1.0, 0.5, 1.5]})
+    pd.set_option("display.width", 250)
+    pd.set_option("display.max_columns", 20)
+    print(ProjectionBacktest.report(backtest.run(grid)).round(4).head(10).to_string())
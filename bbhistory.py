@@ -0,0 +1,209 @@
+"""
+Copyright (c) 2024 Jim Maastricht
+
+On-disk columnar store for multi-decade historical player data.
+Each season is a directory with one .npy file per column.  Numeric columns are memory mapped and text
+columns are loaded one column of one season at a time, so readers never hold more than a season's worth
+of raw columns.  Rows are tagged with a player bucket (crc32 of the hashcode modulo the bucket count) so complete
+player histories can be streamed a bucket at a time for projections.
+"""
+
+import json
+import os
+import shutil
+import zlib
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+from pandas.core.frame import DataFrame
+
+HISTORY_STORE_DIR = "history-store"
+STORE_VERSION = 1
+BUCKET_FILE = "bucket.npy"
+INDEX_FILE = "index.npy"
+META_FILE = "meta.json"
+
+
+class HistoricalStore:
+    """
+    Season-partitioned columnar store for one side (pitching or batting) of the historical data.
+
+    Attributes:
+        root: directory holding store.json and one sub directory per season
+        key: player id column used for bucketing, rows of a player always land in the same bucket
+        buckets: number of player buckets, fixed when the store is first written
+    """
+
+    def __init__(self, root: str, key: str = "Hashcode", buckets: int = 8) -> None:
+        """
+        :param root: store directory, created on the first write
+        :param key: player id column
+        :param buckets: player buckets for new stores, an existing store keeps its own count
+        """
+        self.root = root
+        self.key = key
+        self.buckets = buckets
+        store_file = os.path.join(root, "store.json")
+        if os.path.exists(store_file):
+            with open(store_file, "r", encoding="utf-8") as f:
+                info = json.load(f)
+            if info.get("version") == STORE_VERSION and info.get("key") == key:
+                self.buckets = info["buckets"]
+            else:  # written by another format, start over
+                shutil.rmtree(root)
+        self._meta: Dict[int, dict] = {}
+        return
+
+    def _season_dir(self, season: int) -> str:
+        return os.path.join(self.root, str(season))
+
+    def meta(self, season: int) -> dict:
+        """column names and dtypes, index name and row count of a stored season"""
+        if season not in self._meta:
+            with open(os.path.join(self._season_dir(season), META_FILE), "r", encoding="utf-8") as f:
+                self._meta[season] = json.load(f)
+        return self._meta[season]
+
+    def seasons(self) -> List[int]:
+        """stored seasons, oldest first"""
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(int(name) for name in os.listdir(self.root)
+                      if os.path.exists(os.path.join(self.root, name, META_FILE)))
+
+    def write_season(self, season: int, df: DataFrame) -> None:
+        """
+        replace a season with df, the index (e.g. Player_Season_Key) is kept
+        :param season: season year
+        :param df: rows of the season, bucketed by the key column or by the index without one
+        :return: None
+        """
+        os.makedirs(self.root, exist_ok=True)
+        with open(os.path.join(self.root, "store.json"), "w", encoding="utf-8") as f:
+            json.dump({"version": STORE_VERSION, "key": self.key, "buckets": self.buckets}, f)
+        season_dir = self._season_dir(season)
+        if os.path.isdir(season_dir):
+            shutil.rmtree(season_dir)
+        os.makedirs(season_dir)
+        self._meta.pop(season, None)
+
+        columns = []
+        for i, col in enumerate(df.columns):
+            values = df[col].to_numpy()
+            if values.dtype.kind not in "biuf":
+                values = values.astype(object)
+            np.save(os.path.join(season_dir, f"c{i}.npy"), values, allow_pickle=values.dtype == object)
+            columns.append({"name": col, "file": f"c{i}.npy", "dtype": values.dtype.str})
+        np.save(os.path.join(season_dir, INDEX_FILE), df.index.to_numpy().astype(object), allow_pickle=True)
+        keys = df[self.key] if self.key in df.columns else df.index  # e.g. partial season rows keyed by the index
+        np.save(os.path.join(season_dir, BUCKET_FILE), self.bucket_of(keys))
+        meta = {"columns": columns, "index_name": df.index.name, "rows": len(df)}
+        with open(os.path.join(season_dir, META_FILE), "w", encoding="utf-8") as f:  # written last, marks complete
+            json.dump(meta, f)
+        return
+
+    def bucket_of(self, keys: pd.Series) -> np.ndarray:
+        """bucket number of each player id, crc32 so it is the same in every run and process"""
+        return np.fromiter((zlib.crc32(str(k).encode()) % self.buckets for k in keys), dtype=np.int16,
+                           count=len(keys))
+
+    def read_column(self, season: int, col: str, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        one column of a season, only the requested rows of a numeric column are read from disk
+        :param season: season year
+        :param col: column name
+        :param rows: row positions, None for all
+        :return: array
+        """
+        entry = next(c for c in self.meta(season)["columns"] if c["name"] == col)
+        path = os.path.join(self._season_dir(season), entry["file"])
+        if entry["dtype"] == "|O":
+            values = np.load(path, allow_pickle=True)
+        else:
+            values = np.load(path, mmap_mode="r")
+        return np.array(values if rows is None else values[rows])
+
+    def read_season(self, season: int, columns: Optional[List[str]] = None,
+                    rows: Optional[np.ndarray] = None) -> DataFrame:
+        """
+        rows of one season as a df with the stored index
+        :param season: season year
+        :param columns: columns to read, None for all in stored order.  Columns the season lacks are NaN, as in
+            the concatenated frame
+        :param rows: row positions, None for all
+        :return: df
+        """
+        meta = self.meta(season)
+        names = [c["name"] for c in meta["columns"]] if columns is None else columns
+        index = np.load(os.path.join(self._season_dir(season), INDEX_FILE), allow_pickle=True)
+        index = pd.Index(index if rows is None else index[rows], name=meta["index_name"])
+        stored = {c["name"] for c in meta["columns"]}
+        return pd.DataFrame({col: self.read_column(season, col, rows) if col in stored else np.full(len(index), np.nan)
+                             for col in names}, index=index)
+
+    def player_histories(self, seasons: List[int], columns: Optional[List[str]] = None) -> Iterator[DataFrame]:
+        """
+        complete multi-season histories a bucket of players at a time.  Rows keep their season order, and the
+        index is the row's position in all seasons concatenated, the same as pd.concat(..., ignore_index=True)
+        :param seasons: seasons to include, in order
+        :param columns: columns to read, None for all
+        :return: iterator of dfs, one per non empty bucket
+        """
+        bucket_ids = {season: np.load(os.path.join(self._season_dir(season), BUCKET_FILE)) for season in seasons}
+        offsets = np.cumsum([0] + [len(bucket_ids[season]) for season in seasons])
+        for bucket in range(self.buckets):
+            parts = []
+            for season, offset in zip(seasons, offsets):
+                rows = np.flatnonzero(bucket_ids[season] == bucket)
+                if len(rows) > 0:
+                    part = self.read_season(season, columns, rows)
+                    part.index = pd.Index(offset + rows)
+                    parts.append(part)
+            if parts:
+                yield pd.concat(parts, axis=0)
+
+    def unique_keys(self, season: int) -> set:
+        """player ids in a season"""
+        return set(self.read_column(season, self.key))
+
+    def to_csv(self, path: str, seasons: List[int]) -> None:
+        """
+        write seasons to one csv a season at a time, columns are the union in order of first appearance.
+        Int columns are written as floats when another season has them as floats or lacks them, as pd.concat would
+        :param path: csv file name
+        :param seasons: seasons in order
+        :return: None
+        """
+        kinds: Dict[str, set] = {}
+        for season in seasons:
+            for c in self.meta(season)["columns"]:
+                kinds.setdefault(c["name"], set()).add(np.dtype(c["dtype"]).kind)
+        columns = list(kinds)
+        upcast = [col for col in columns if "f" in kinds[col]
+                  or any(col not in {c["name"] for c in self.meta(season)["columns"]} for season in seasons)]
+        for i, season in enumerate(seasons):
+            df = self.read_season(season).reindex(columns=columns)
+            ints = [col for col in upcast if df[col].dtype.kind in "biu"]
+            df[ints] = df[ints].astype(float)
+            df.to_csv(path, mode="w" if i == 0 else "a", header=i == 0, index=True)
+        return
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    rng = np.random.default_rng(3)
+    frames = {season: pd.DataFrame({"Hashcode": rng.choice([10**30 + i for i in range(50)], 40, replace=False),
+                                    "Player": [f"Player {i}" for i in range(40)], "H": rng.integers(0, 200, 40),
+                                    "Season": season}) for season in [2023, 2024, 2025]}
+    with tempfile.TemporaryDirectory() as tmp:
+        store = HistoricalStore(os.path.join(tmp, "batting"), buckets=4)
+        for season, frame in frames.items():
+            store.write_season(season, frame)  # one season in memory at a time
+        full = pd.concat(frames.values(), ignore_index=True)
+        streamed = pd.concat(store.player_histories(store.seasons())).sort_index()
+        print("seasons:", store.seasons(), "rows:", len(streamed))
+        print("matches in-memory concat:", streamed.equals(full))
+        for chunk in store.player_histories(store.seasons()):
+            print("bucket players:", chunk["Hashcode"].nunique(), "rows:", len(chunk))
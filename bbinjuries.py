@@ -6,6 +6,12 @@ Injury type definitions with duration ranges for pitchers, batters, and general
 
 import random
 
+import numpy as np
+
+# duration buckets used to match an injury description to a sampled length, lower bound in days
+DURATION_BUCKETS = (0, 15, 30)
+UNDISCLOSED = "Undisclosed Injury"
+
 
 class InjuryType:
     """
@@ -73,6 +79,81 @@ class InjuryType:
 
         # Track injury types that have special IL rules
         self.concussion_injuries = {"Concussion"}
+        self.concussion_odds = {True: 0.01, False: 0.02}  # pitchers, batters
+        self.default_days = {True: (15, 30), False: (10, 20)}  # range for descriptions not in the catalog
+        self._compile_tables()
+
+    def _compile_tables(self) -> None:
+        """
+        compile the injury dicts into arrays for vectorized sampling.  every description gets an integer code,
+        code 0 is no injury.  min and max days are per code and role (batter row 0, pitcher row 1) and each
+        duration bucket holds the candidate codes with their cumulative probabilities
+        :return: None
+        """
+        self.descriptions = np.array(
+            ["", *dict.fromkeys([*self.pitcher_injuries, *self.batter_injuries, *self.general_injuries]), UNDISCLOSED],
+            dtype=object,
+        )
+        self.description_codes = {desc: code for code, desc in enumerate(self.descriptions)}
+        self.concussion_code = self.description_codes["Concussion"]
+        self.undisclosed_code = self.description_codes[UNDISCLOSED]
+        self.min_days = np.zeros((2, len(self.descriptions)), dtype=np.int64)
+        self.max_days = np.zeros((2, len(self.descriptions)), dtype=np.int64)
+        for is_pitcher in (False, True):
+            # same precedence as get_injury_days_from_description: pitcher, then batter, then general
+            for desc in self.descriptions[1:]:
+                min_max = self.pitcher_injuries.get(
+                    desc, self.batter_injuries.get(desc, self.general_injuries.get(desc, self.default_days[is_pitcher]))
+                )
+                self.min_days[int(is_pitcher), self.description_codes[desc]] = min_max[0]
+                self.max_days[int(is_pitcher), self.description_codes[desc]] = min_max[1]
+
+        # candidates and cumulative probabilities for each role and duration bucket, uniform like random.choice
+        self.bucket_codes = {}
+        self.bucket_cdf = {}
+        for is_pitcher, role_injuries in ((True, self.pitcher_injuries), (False, self.batter_injuries)):
+            for bucket, low in enumerate(DURATION_BUCKETS):
+                high = DURATION_BUCKETS[bucket + 1] if bucket + 1 < len(DURATION_BUCKETS) else np.inf
+                candidates = [
+                    desc
+                    for desc, (min_days, _) in {**role_injuries, **self.general_injuries}.items()
+                    if low <= min_days < high and desc not in self.concussion_injuries
+                ]
+                codes = np.array([self.description_codes[desc] for desc in candidates] or [self.undisclosed_code])
+                self.bucket_codes[(is_pitcher, bucket)] = codes
+                self.bucket_cdf[(is_pitcher, bucket)] = np.arange(1, len(codes) + 1) / len(codes)
+        return
+
+    def sample_injuries(self, days: np.ndarray, is_pitcher: bool, rng: np.random.Generator) -> tuple:
+        """
+        vectorized get_pitcher_injury / get_batter_injury plus get_injury_days_from_description for many players
+        :param days: sampled injury length for each newly injured player, picks the duration bucket
+        :param is_pitcher: pitcher or batter injury catalog
+        :param rng: numpy random generator
+        :return: description codes and the number of days for each description
+        """
+        days = np.asarray(days)
+        bucket = np.searchsorted(DURATION_BUCKETS, days, side="right") - 1
+        draws = rng.random(len(days))
+        codes = np.empty(len(days), dtype=np.int64)
+        for b in range(len(DURATION_BUCKETS)):
+            in_bucket = bucket == b
+            if in_bucket.any():
+                cdf = self.bucket_cdf[(is_pitcher, b)]
+                pick = np.minimum(np.searchsorted(cdf, draws[in_bucket], side="right"), len(cdf) - 1)
+                codes[in_bucket] = self.bucket_codes[(is_pitcher, b)][pick]
+        codes[rng.random(len(days)) < self.concussion_odds[is_pitcher]] = self.concussion_code
+        role = int(is_pitcher)
+        injury_days = rng.integers(self.min_days[role, codes], self.max_days[role, codes], endpoint=True)
+        return codes, injury_days
+
+    def is_concussion_array(self, injury_descriptions: np.ndarray) -> np.ndarray:
+        """
+        vectorized is_concussion
+        :param injury_descriptions: array of injury descriptions
+        :return: boolean array, True for concussions
+        """
+        return np.isin(injury_descriptions, list(self.concussion_injuries))
 
     def get_pitcher_injury(self, days: int) -> str:
         """
@@ -182,3 +263,8 @@ if __name__ == "__main__":
     for days in [10, 20, 45]:
         injury = injury_system.get_batter_injury(days)
         print(f"Batter injured for {days} days: {injury}")
+
+    # Test vectorized sampling
+    codes, days = injury_system.sample_injuries(np.array([10, 20, 45]), is_pitcher=True, rng=np.random.default_rng())
+    for desc, length in zip(injury_system.descriptions[codes], days):
+        print(f"Vectorized pitcher injury: {desc} for {length} days")
@@ -0,0 +1,21 @@
+"""
+Copyright (c) 2024 Jim Maastricht
+
+Innings pitched notation helpers.
+IP is written in thirds with a base-3 decimal, 47.2 is 47 2/3 innings, so it cannot be added, multiplied
+or divided as a float. Convert to outs for arithmetic and back to IP notation for display.
+"""
+
+import numpy as np
+
+
+def ip_to_outs(ip: np.ndarray) -> np.ndarray:
+    """Convert baseball IP notation to outs (6.2 -> 20)."""
+    ip = np.asarray(ip, dtype=np.float64)
+    return np.trunc(ip) * 3 + np.round(ip % 1 * 10)
+
+
+def outs_to_ip(total_outs: np.ndarray) -> np.ndarray:
+    """Convert outs to baseball IP notation (20 outs -> 6.2)."""
+    total_outs = np.asarray(total_outs, dtype=np.float64)
+    return np.floor(total_outs / 3) + (total_outs % 3) / 10
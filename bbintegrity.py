@@ -0,0 +1,247 @@
+"""
+Copyright (c) 2024 Jim Maastricht
+
+Projection integrity checks, run at the end of every preprocessing run and on their own after a nightly refresh.
+League and per-player deltas in OBP, BABIP, SLG, HR rate and K% between the projections and history are computed
+with joins on the player key instead of row loops, compared with thresholds, and collected in one report df.
+python bbintegrity.py exits with 1 when any check fails so a scheduled refresh can stop before the sim uses the files.
+"""
+
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.core.frame import DataFrame
+
+STATS = ["OBP", "BABIP", "SLG", "HR/PA", "K%"]
+LEAGUE_THRESHOLDS = {"OBP": 0.015, "BABIP": 0.015, "SLG": 0.030, "HR/PA": 0.008, "K%": 0.025}  # max league change
+PLAYER_THRESHOLDS = {"OBP": 0.100, "BABIP": 0.100, "SLG": 0.200, "HR/PA": 0.035, "K%": 0.100}  # max player change
+MAX_PLAYER_VIOLATION_SHARE = 0.05  # a player stat check fails when more than this share of players are past it
+MIN_BASELINE_PA = 150  # players need this many PA (batters faced for pitchers) in their last season to be compared
+FULL_SEASON_SHARE = 0.5  # seasons with less than this share of the biggest season's PA are partial
+BATTING_COLS = ["H", "2B", "3B", "HR", "BB", "HBP", "SF", "AB", "SO", "PA"]
+PITCHING_COLS = ["H", "HR", "BB", "SO", "PA"]
+
+
+def rate_parts(df: DataFrame, is_p: bool) -> Dict[str, Tuple[pd.Series, pd.Series]]:
+    """
+    numerator and denominator of every checked rate, so league rates weight players by playing time
+    :param df: projected or historical df with the counting stats
+    :param is_p: True for pitchers, rates are against the batters they faced
+    :return: stat to (numerator, denominator)
+    """
+    h, hr, bb, so, pa = (df[col].astype(float) for col in ["H", "HR", "BB", "SO", "PA"])
+    if is_p:
+        return {
+            "OBP": (h + bb, pa),
+            "BABIP": (h - hr, pa - so - bb - hr),
+            "SLG": (h + 3 * hr, pa - bb),  # no 2B/3B against, singles and homers only
+            "HR/PA": (hr, pa),
+            "K%": (so, pa),
+        }
+    ab, hbp, sf = df["AB"].astype(float), df["HBP"].astype(float), df["SF"].astype(float)
+    total_bases = h + df["2B"] + 2 * df["3B"] + 3 * hr
+    return {
+        "OBP": (h + bb + hbp, ab + bb + hbp + sf),
+        "BABIP": (h - hr, ab - so - hr + sf),
+        "SLG": (total_bases, ab),
+        "HR/PA": (hr, pa),
+        "K%": (so, pa),
+    }
+
+
+def league_rates(df: DataFrame, is_p: bool) -> pd.Series:
+    """playing time weighted league rate of every checked stat"""
+    return pd.Series({stat: num.sum() / den.sum() if den.sum() > 0 else np.nan
+                      for stat, (num, den) in rate_parts(df, is_p).items()})
+
+
+def player_rates(df: DataFrame, is_p: bool) -> DataFrame:
+    """rate of every checked stat per row, NaN where the denominator is zero"""
+    return pd.DataFrame({stat: num / den.where(den > 0) for stat, (num, den) in rate_parts(df, is_p).items()},
+                        index=df.index)
+
+
+def player_keys(df: DataFrame) -> pd.Series:
+    """
+    player id of each row as a str, from Hashcode or the Player_Season_Key prefix (partial season rows lack a Hashcode)
+    :param df: projected df indexed by Hashcode or historical df with or indexed by Player_Season_Key
+    :return: series aligned with df
+    """
+    if "Player_Season_Key" in df.columns:
+        keys = df["Player_Season_Key"]
+    elif df.index.name == "Player_Season_Key":
+        keys = pd.Series(df.index, index=df.index)
+    else:
+        keys = pd.Series(df["Hashcode"] if "Hashcode" in df.columns else df.index, index=df.index)
+    return keys.astype(str).str.split("_").str[0]
+
+
+def full_seasons(historical: DataFrame) -> List[int]:
+    """seasons with at least FULL_SEASON_SHARE of the biggest season's PA, the rest are partial"""
+    pa = historical.groupby("Season")["PA"].sum()
+    return sorted(pa.index[pa >= pa.max() * FULL_SEASON_SHARE])
+
+
+class ProjectionIntegrity:
+    """
+    Checks projections against history and keeps the results.
+
+    Attributes:
+        report: one row per check: Side, Check, Stat, Projected, Baseline, Delta, Threshold, Checked, Violations, Passed
+        player_deltas: side to a df of per-player projected rates, last season rates and deltas, indexed by player
+    """
+
+    def __init__(self, league_thresholds: Optional[Dict[str, float]] = None,
+                 player_thresholds: Optional[Dict[str, float]] = None,
+                 max_violation_share: float = MAX_PLAYER_VIOLATION_SHARE,
+                 min_baseline_pa: int = MIN_BASELINE_PA) -> None:
+        """
+        :param league_thresholds: stat to the largest allowed change in the league rate, defaults LEAGUE_THRESHOLDS
+        :param player_thresholds: stat to the largest allowed change for one player, defaults PLAYER_THRESHOLDS
+        :param max_violation_share: share of players allowed past a player threshold before the check fails
+        :param min_baseline_pa: PA a player needs in their last season to be compared
+        """
+        self.league_thresholds = dict(LEAGUE_THRESHOLDS, **(league_thresholds or {}))
+        self.player_thresholds = dict(PLAYER_THRESHOLDS, **(player_thresholds or {}))
+        self.max_violation_share = max_violation_share
+        self.min_baseline_pa = min_baseline_pa
+        self.report = pd.DataFrame()
+        self.player_deltas: Dict[str, DataFrame] = {}
+        return
+
+    @property
+    def passed(self) -> bool:
+        """True when every check passed"""
+        return bool(self.report["Passed"].all()) if not self.report.empty else True
+
+    def check(self, projected: Dict[str, DataFrame], historical: Dict[str, DataFrame]) -> DataFrame:
+        """
+        run every check for both sides
+        :param projected: 'batting' and 'pitching' projected dfs
+        :param historical: 'batting' and 'pitching' historical dfs, one row per player per season
+        :return: report df, also kept in self.report
+        """
+        rows = []
+        for side in ["batting", "pitching"]:
+            rows += self.check_side(side, projected[side], historical[side])
+        self.report = pd.DataFrame(rows, columns=["Side", "Check", "Stat", "Projected", "Baseline", "Delta",
+                                                  "Threshold", "Checked", "Violations", "Passed"])
+        return self.report
+
+    def check_side(self, side: str, projected: DataFrame, historical: DataFrame) -> List[dict]:
+        """
+        structural, league and per-player checks for one side
+        :param side: 'batting' or 'pitching'
+        :param projected: projected df
+        :param historical: historical df with Season and the counting stats
+        :return: list of report rows
+        """
+        is_p = side == "pitching"
+        cols = PITCHING_COLS if is_p else BATTING_COLS
+        proj_keys = player_keys(projected)
+        counts = projected[cols].to_numpy(dtype=float)
+        structural = [
+            ("duplicate players", int(proj_keys.duplicated().sum())),
+            ("missing or negative stats", int((~np.isfinite(counts) | (counts < 0)).any(axis=1).sum())),
+        ]
+        rows = [{"Side": side, "Check": check, "Stat": "", "Checked": len(projected), "Violations": violations,
+                 "Passed": violations == 0} for check, violations in structural]
+
+        historical = historical.assign(PA=historical["PA"].fillna(0))
+        seasons = full_seasons(historical)
+        last_full = historical[historical["Season"] == seasons[-1]] if seasons else historical.iloc[:0]
+        proj_league = league_rates(projected, is_p)
+        base_league = league_rates(last_full, is_p)
+        for stat in STATS:
+            delta = proj_league[stat] - base_league[stat]
+            rows.append({"Side": side, "Check": f"league vs {seasons[-1] if seasons else 'none'}", "Stat": stat,
+                         "Projected": proj_league[stat], "Baseline": base_league[stat], "Delta": delta,
+                         "Threshold": self.league_thresholds[stat], "Checked": 1,
+                         "Violations": int(not abs(delta) <= self.league_thresholds[stat]),
+                         "Passed": bool(abs(delta) <= self.league_thresholds[stat])})
+
+        # each player's most recent season with enough playing time, joined to the projection on the player key
+        qualified = historical[historical["PA"] >= self.min_baseline_pa]
+        qualified = qualified.assign(Key=player_keys(qualified).to_numpy()).sort_values("Season", kind="stable")
+        last = qualified.drop_duplicates("Key", keep="last").set_index("Key")
+        proj = player_rates(projected, is_p).set_axis(proj_keys.to_numpy())
+        proj = proj[~proj.index.duplicated()]
+        deltas = proj.join(player_rates(last, is_p), how="inner", lsuffix="", rsuffix=" Last")
+        for stat in STATS:
+            deltas[f"{stat} Delta"] = deltas[stat] - deltas[f"{stat} Last"]
+        self.player_deltas[side] = deltas
+        for stat in STATS:
+            delta = deltas[f"{stat} Delta"].dropna()
+            violations = int((delta.abs() > self.player_thresholds[stat]).sum())
+            rows.append({"Side": side, "Check": "player vs last season", "Stat": stat,
+                         "Projected": deltas[stat].mean(), "Baseline": deltas[f"{stat} Last"].mean(),
+                         "Delta": delta.abs().mean(), "Threshold": self.player_thresholds[stat],
+                         "Checked": len(delta), "Violations": violations,
+                         "Passed": violations <= self.max_violation_share * len(delta)})
+        return rows
+
+    def worst_players(self, side: str, count: int = 10) -> DataFrame:
+        """
+        players furthest past their thresholds, largest first
+        :param side: 'batting' or 'pitching'
+        :param count: players to return
+        :return: df with the projected, last season and delta of every stat plus Worst, the largest delta/threshold
+        """
+        deltas = self.player_deltas[side]
+        ratio = pd.DataFrame({stat: deltas[f"{stat} Delta"].abs() / self.player_thresholds[stat] for stat in STATS})
+        return deltas.assign(Worst=ratio.max(axis=1)).nlargest(count, "Worst")
+
+    def print_report(self, names: Optional[Dict[str, pd.Series]] = None, count: int = 5) -> None:
+        """
+        print the report and the worst players of every failed player check
+        :param names: side to a series of player names indexed by player key, for the worst player lists
+        :param count: worst players to list per side
+        :return: None
+        """
+        print("\n" + "=" * 110)
+        print(f"{'INTEGRITY CHECK: PROJECTION vs HISTORY':^110}")
+        print("=" * 110)
+        print(self.report.to_string(index=False, float_format=lambda x: f"{x:.4f}"))
+        for side in self.player_deltas:
+            failed = self.report[(self.report["Side"] == side) & ~self.report["Passed"]]
+            if failed["Check"].str.startswith("player").any():
+                worst = self.worst_players(side, count)
+                if names is not None and side in names:
+                    worst.insert(0, "Player", names[side].reindex(worst.index).to_numpy())
+                print(f"\nWorst {side} projections:")
+                print(worst.to_string(float_format=lambda x: f"{x:.3f}"))
+        print("-" * 110)
+        print("PASSED" if self.passed else f"FAILED: {int((~self.report['Passed']).sum())} checks")
+        return
+
+
+def load_and_check(load_seasons: List[int], checker: Optional[ProjectionIntegrity] = None) -> ProjectionIntegrity:
+    """
+    check the projected and historical files written for load_seasons, reading only the columns the checks use
+    :param load_seasons: seasons in the file names
+    :param checker: configured checker, None for the default thresholds
+    :return: checker holding the report
+    """
+    checker = ProjectionIntegrity() if checker is None else checker
+    seasons_str = " ".join(str(season) for season in load_seasons)
+    projected, historical, names = {}, {}, {}
+    for side, cols in [("batting", BATTING_COLS), ("pitching", PITCHING_COLS)]:
+        file_side = side.capitalize()
+        projected[side] = pd.read_csv(f"{seasons_str} player-projected-stats-pp-{file_side}.csv",
+                                      usecols=["Hashcode", "Player"] + cols, dtype={"Hashcode": str})
+        historical[side] = pd.read_csv(f"{seasons_str} historical-{file_side}.csv",
+                                       usecols=["Player_Season_Key", "Season"] + cols)
+        names[side] = projected[side].set_index("Hashcode")["Player"]
+    checker.check(projected, historical)
+    checker.print_report(names)
+    return checker
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    result = load_and_check([2020, 2021, 2022, 2023, 2024, 2025, 2026])
+    print(f"checked in {time.perf_counter() - start:.2f}s")
+    sys.exit(0 if result.passed else 1)
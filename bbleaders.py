@@ -0,0 +1,257 @@
+"""
+Copyright (c) 2024 Jim Maastricht
+
+League leader boards (AVG, OBP, OPS, HR, W, ERA, WHIP, SO, SV) maintained incrementally.
+Each board keeps a small sorted candidate set plus a cut-off key; every qualified player better than the
+cut-off is guaranteed to be in the set, so a day's changed players update the board without a league-wide
+sort and leader queries only touch the top K.
+"""
+
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.core.frame import DataFrame
+
+# stat: (batting or pitching, sort ascending, volume col, minimum volume per team game)
+LEADER_STATS = {
+    "AVG": ("batting", False, "PA", 3.1),
+    "OBP": ("batting", False, "PA", 3.1),
+    "OPS": ("batting", False, "PA", 3.1),
+    "HR": ("batting", False, "PA", 0.0),
+    "W": ("pitching", False, "IP", 0.0),
+    "ERA": ("pitching", True, "IP", 1.0),
+    "WHIP": ("pitching", True, "IP", 1.0),
+    "SO": ("pitching", False, "IP", 0.0),
+    "SV": ("pitching", False, "IP", 0.0),
+}
+NO_GAMES_MIN_VOLUME = {"PA": 50, "IP": 20.0}  # rate stat floor before any team game is played
+NO_CUTOFF = (np.inf, np.inf)  # every qualified player is a candidate
+
+
+class LeaderBoard:
+    """
+    Top-K candidates for one stat and league. Keys are (sort key, player ordinal) tuples, smaller is better,
+    the ordinal makes ties deterministic.
+
+    Attributes:
+        members: hashcode to key for every candidate, all qualified players with a key below cutoff are members
+        cutoff: key of the best player left out at the last rebuild or trim
+        depth: number of candidates kept after a rebuild, several times the number of leaders shown
+    """
+
+    def __init__(self, stat: str, ascending: bool, volume_col: str, league: Optional[str] = None,
+                 depth: int = 40) -> None:
+        """
+        :param stat: column to rank by
+        :param ascending: True if a lower value is better (ERA, WHIP)
+        :param volume_col: PA or IP, used for the qualification threshold
+        :param league: restrict the board to one league, None is the full league
+        :param depth: candidates kept on rebuild
+        """
+        self.stat = stat
+        self.ascending = ascending
+        self.volume_col = volume_col
+        self.league = league
+        self.depth = depth
+        self.members: Dict[Hashable, Tuple[float, int]] = {}
+        self.cutoff = NO_CUTOFF
+        self.min_volume = 0.0
+        self.valid = False  # needs a full rebuild before use
+        self._sorted: Optional[List[Hashable]] = None
+        return
+
+    def _keys(self, df: DataFrame, ordinal: pd.Series, min_volume: float) -> DataFrame:
+        """Sort keys for the qualified rows of df, columns key and ord."""
+        volume = pd.to_numeric(df[self.volume_col], errors="coerce").fillna(0)
+        qualified = (volume > 0) & (volume >= min_volume)
+        if self.league is not None and "League" in df.columns:
+            qualified &= df["League"] == self.league
+        values = pd.to_numeric(df.loc[qualified, self.stat], errors="coerce").to_numpy(dtype=float)
+        keys = np.nan_to_num(values if self.ascending else -values, nan=np.inf)
+        return pd.DataFrame({"key": keys, "ord": ordinal.reindex(df.index[qualified]).to_numpy()},
+                            index=df.index[qualified])
+
+    def rebuild(self, df: DataFrame, ordinal: pd.Series, min_volume: float) -> None:
+        """
+        full pass over the league, used on first use or when too few candidates are left
+        :param df: full season df for the board's side of the ball
+        :param ordinal: hashcode to a fixed player number for tie breaks
+        :param min_volume: qualification threshold in PA or IP
+        :return: None
+        """
+        keys = self._keys(df, ordinal, min_volume)
+        order = np.lexsort((keys["ord"].to_numpy(), keys["key"].to_numpy()))
+        if len(order) > self.depth:
+            left_out = keys.iloc[order[self.depth]]
+            self.cutoff = (left_out["key"], left_out["ord"])
+            order = order[: self.depth]
+        else:
+            self.cutoff = NO_CUTOFF
+        best = keys.iloc[order]
+        self.members = dict(zip(best.index, zip(best["key"], best["ord"])))
+        self.min_volume = min_volume
+        self.valid = True
+        self._sorted = None
+        return
+
+    def update(self, df: DataFrame, ordinal: pd.Series, changed: pd.Index, min_volume: float) -> None:
+        """
+        apply one day of changed players.  players who did not play keep their stat, so they can only leave
+        the board by falling below the qualification threshold
+        :param df: full season df for the board's side of the ball
+        :param ordinal: hashcode to a fixed player number for tie breaks
+        :param changed: hashcodes with new stats since the last update
+        :param min_volume: qualification threshold in PA or IP, a lower threshold forces a rebuild
+        :return: None
+        """
+        if not self.valid or min_volume < self.min_volume:
+            self.rebuild(df, ordinal, min_volume)
+            return
+        for hashcode in changed:
+            self.members.pop(hashcode, None)
+        if len(self.members) > 0:  # drop retired members and those below a higher threshold
+            still_qualified = self._keys(df.loc[df.index.intersection(list(self.members))], ordinal, min_volume)
+            self.members = {h: self.members[h] for h in still_qualified.index}
+        self.min_volume = min_volume
+
+        keys = self._keys(df.loc[changed], ordinal, min_volume)
+        for hashcode, key, ord_num in zip(keys.index, keys["key"], keys["ord"]):
+            if (key, ord_num) < self.cutoff:
+                self.members[hashcode] = (key, ord_num)
+        if len(self.members) > 2 * self.depth:  # trim back, the best one trimmed becomes the new cut-off
+            ranked = sorted(self.members.items(), key=lambda item: item[1])
+            self.cutoff = ranked[self.depth][1]
+            self.members = dict(ranked[: self.depth])
+        self._sorted = None
+        return
+
+    def top(self, count: int) -> Optional[List[Hashable]]:
+        """
+        :param count: number of leaders
+        :return: hashcodes best first, None if the board needs a rebuild to answer
+        """
+        if not self.valid or (len(self.members) < count and self.cutoff != NO_CUTOFF):
+            return None
+        if self._sorted is None:
+            self._sorted = [h for h, _ in sorted(self.members.items(), key=lambda item: item[1])]
+        return self._sorted[:count]
+
+
+class LeagueLeaders:
+    """
+    Leader boards for every stat in LEADER_STATS, full league plus each league, updated from changed players.
+
+    Attributes:
+        games_played: team games used for the PA and IP qualification thresholds
+        boards: (stat, league) to LeaderBoard, league None is the full league
+    """
+
+    def __init__(self, batting_df: DataFrame, pitching_df: DataFrame, depth: int = 40) -> None:
+        """
+        :param batting_df: season batting df, used for the player ordinals and league names
+        :param pitching_df: season pitching df
+        :param depth: candidates kept per board
+        """
+        self.games_played = 0
+        self.batting_ordinal = pd.Series(np.arange(len(batting_df)), index=batting_df.index)
+        self.pitching_ordinal = pd.Series(np.arange(len(pitching_df)), index=pitching_df.index)
+        leagues = [None]
+        if "League" in batting_df.columns:
+            leagues += sorted(batting_df["League"].dropna().unique())
+        self.boards: Dict[Tuple[str, Optional[str]], LeaderBoard] = {
+            (stat, league): LeaderBoard(stat, ascending, volume_col, league, depth)
+            for stat, (_, ascending, volume_col, _) in LEADER_STATS.items()
+            for league in leagues
+        }
+        return
+
+    def min_volume(self, stat: str) -> float:
+        """Qualification threshold for a stat at the current games played, rate stats keep a floor at 0 games."""
+        _, _, volume_col, per_game = LEADER_STATS[stat]
+        if self.games_played == 0 and per_game > 0:
+            return NO_GAMES_MIN_VOLUME[volume_col]
+        return per_game * self.games_played
+
+    def qualification(self) -> Tuple[int, float]:
+        """
+        :return: minimum PA for batting rate stats and minimum IP for ERA and WHIP
+        """
+        return int(self.min_volume("AVG")), float(self.min_volume("ERA"))
+
+    def invalidate(self) -> None:
+        """Force a rebuild of every board on next use, e.g. after a full stat recompute."""
+        for board in self.boards.values():
+            board.valid = False
+        return
+
+    def update(self, batting_df: DataFrame, pitching_df: DataFrame, changed_batters: Sequence,
+               changed_pitchers: Sequence, games_played: Optional[int] = None) -> None:
+        """
+        apply changed players to every board
+        :param batting_df: season batting df with current rate stats
+        :param pitching_df: season pitching df with current rate stats
+        :param changed_batters: hashcodes of batters with new stats
+        :param changed_pitchers: hashcodes of pitchers with new stats
+        :param games_played: team games for qualification, None keeps the current value
+        :return: None
+        """
+        if len(changed_batters) == 0 and len(changed_pitchers) == 0 and games_played in (None, self.games_played):
+            return  # nothing new, boards that need a rebuild do it on their next query
+        if games_played is not None:
+            self.games_played = games_played
+        changed_b = batting_df.index[batting_df.index.isin(changed_batters)]
+        changed_p = pitching_df.index[pitching_df.index.isin(changed_pitchers)]
+        for (stat, _), board in self.boards.items():
+            if LEADER_STATS[stat][0] == "batting":
+                board.update(batting_df, self.batting_ordinal, changed_b, self.min_volume(stat))
+            else:
+                board.update(pitching_df, self.pitching_ordinal, changed_p, self.min_volume(stat))
+        return
+
+    def top(self, stat: str, batting_df: DataFrame, pitching_df: DataFrame, league: Optional[str] = None,
+            count: int = 10) -> List[Hashable]:
+        """
+        :param stat: one of LEADER_STATS
+        :param batting_df: season batting df, only read if the board has to rebuild
+        :param pitching_df: season pitching df, only read if the board has to rebuild
+        :param league: league name or None for the full league
+        :param count: number of leaders
+        :return: hashcodes of the leaders, best first
+        """
+        if stat not in LEADER_STATS:
+            raise ValueError(f"No leader board for {stat}, choose from {list(LEADER_STATS)}")
+        board = self.boards.get((stat, league))
+        if board is None:
+            return []
+        leaders = board.top(count)
+        if leaders is None:
+            is_batting = LEADER_STATS[stat][0] == "batting"
+            board.rebuild(batting_df if is_batting else pitching_df,
+                          self.batting_ordinal if is_batting else self.pitching_ordinal, self.min_volume(stat))
+            leaders = board.top(count)
+        return leaders
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(7)
+    n = 2000
+    batting = pd.DataFrame({"Player": [f"Player {i}" for i in range(n)], "League": rng.choice(["AL", "NL"], n),
+                            "PA": np.zeros(n), "H": np.zeros(n), "HR": np.zeros(n)})
+    pitching = pd.DataFrame({"Player": [f"Pitcher {i}" for i in range(n)], "League": batting["League"],
+                             "IP": np.zeros(n), "ERA": np.zeros(n), "WHIP": np.zeros(n), "W": np.zeros(n),
+                             "SO": np.zeros(n), "SV": np.zeros(n)})
+    batting["AVG"] = batting["OBP"] = batting["OPS"] = 0.0
+    leaders = LeagueLeaders(batting, pitching)
+    for day in range(1, 31):
+        played = rng.choice(n, 400, replace=False)
+        batting.loc[played, "PA"] += 4
+        batting.loc[played, "H"] += rng.integers(0, 3, 400)
+        batting.loc[played, "HR"] += rng.integers(0, 2, 400)
+        batting["AVG"] = batting["OBP"] = batting["OPS"] = (batting["H"] / (batting["PA"] * 0.9)).fillna(0)
+        leaders.update(batting, pitching, played, [], games_played=day // 4)  # about 1 in 4 players a day
+    for stat in ["AVG", "HR"]:
+        fast = leaders.top(stat, batting, pitching, count=5)
+        full = batting[batting["PA"] >= leaders.min_volume(stat)][stat]
+        print(stat, batting.loc[fast, ["Player", stat, "PA"]].to_string(), sep="\n")
+        print("matches full sort:", list(batting.loc[fast, stat]) == list(full.sort_values(ascending=False).head(5)))
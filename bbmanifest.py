@@ -0,0 +1,138 @@
+"""
+Copyright (c) 2024 Jim Maastricht
+
+Content-hash manifest for incremental preprocessing.
+Records a SHA-256 for every input file and caches the cleaned frames built from them, so a rerun of
+bbplayer_projections.py only rebuilds the seasons whose CSV (or the salary file) actually changed.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+PREPROCESS_CACHE_DIR = "preprocess-cache"
+CACHE_VERSION = 1  # bump when the cleaning code changes so cached frames are rebuilt
+
+
+class PreprocessManifest:
+    """
+    Input file hashes and the cached outputs built from them.
+
+    Attributes:
+        cache_dir: directory holding the {name}-manifest.json file and one pickle per cached entry
+        files: path to {size, mtime_ns, sha256} of every input seen, the hash is reused while size and mtime match
+        entries: cache key to {inputs: {path: sha256}, cache: pickle file name}
+    """
+
+    def __init__(self, name: str, cache_dir: str = PREPROCESS_CACHE_DIR, version: int = CACHE_VERSION) -> None:
+        """
+        :param name: manifest name, one per pipeline so pipelines in different processes never share a file
+        :param cache_dir: directory for the manifest and cached frames, created on first save
+        :param version: cleaning code version, a manifest written by another version is ignored
+        """
+        self.cache_dir = cache_dir
+        self.version = version
+        self.path = os.path.join(cache_dir, f"{name}-manifest.json")
+        self.files: Dict[str, dict] = {}
+        self.entries: Dict[str, dict] = {}
+        self.hits = 0
+        self.misses = 0
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError):
+                manifest = {}
+            if manifest.get("version") == self.version:
+                self.files = manifest.get("files", {})
+                self.entries = manifest.get("entries", {})
+        return
+
+    def file_hash(self, path: str) -> str:
+        """
+        SHA-256 of a file's contents, recomputed only when its size or modification time changed
+        :param path: input file
+        :return: hex digest
+        """
+        stat = os.stat(path)
+        known = self.files.get(path)
+        if known is not None and known["size"] == stat.st_size and known["mtime_ns"] == stat.st_mtime_ns:
+            return known["sha256"]
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        self.files[path] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest.hexdigest()}
+        return self.files[path]["sha256"]
+
+    def is_current(self, key: str, inputs: List[str]) -> bool:
+        """
+        True if key was stored from inputs with their current hashes, without loading the cached value
+        :param key: cache entry name
+        :param inputs: files the cached value was built from
+        :return: bool
+        """
+        entry = self.entries.get(key)
+        return entry is not None and entry["inputs"] == {path: self.file_hash(path) for path in inputs}
+
+    def load(self, key: str, inputs: List[str]) -> Optional[object]:
+        """
+        cached value for key if every input still has the hash recorded when it was stored
+        :param key: cache entry name, e.g. 'pitching 2025'
+        :param inputs: files the cached value was built from
+        :return: cached value or None if missing or stale
+        """
+        entry = self.entries.get(key)
+        hashes = {path: self.file_hash(path) for path in inputs}
+        if entry is None or entry["inputs"] != hashes:
+            self.misses += 1
+            return None
+        try:
+            value = pd.read_pickle(os.path.join(self.cache_dir, entry["cache"]))
+        except (OSError, EOFError, pickle.UnpicklingError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def store(self, key: str, inputs: List[str], value: object) -> None:
+        """
+        cache value for key against the current hashes of its inputs
+        :param key: cache entry name
+        :param inputs: files the value was built from
+        :param value: picklable value, usually a tuple of DataFrames
+        :return: None
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        cache_file = key.replace(" ", "-") + ".pkl"
+        pd.to_pickle(value, os.path.join(self.cache_dir, cache_file))
+        self.entries[key] = {"inputs": {path: self.file_hash(path) for path in inputs}, "cache": cache_file}
+        return
+
+    def save(self) -> None:
+        """write the manifest, called once the run has stored all its entries"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"version": self.version, "files": self.files, "entries": self.entries}, f, indent=1)
+        return
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv = os.path.join(tmp, "2026 player-stats-Batters.csv")
+        pd.DataFrame({"Player": ["A", "B"], "H": [1, 2]}).to_csv(csv, index=False)
+        manifest = PreprocessManifest("batting", os.path.join(tmp, "cache"))
+        print("first run:", manifest.load("batting 2026", [csv]))
+        manifest.store("batting 2026", [csv], pd.read_csv(csv))
+        manifest.save()
+
+        manifest = PreprocessManifest("batting", os.path.join(tmp, "cache"))
+        print("unchanged input:", manifest.load("batting 2026", [csv]) is not None)
+        pd.DataFrame({"Player": ["A", "B"], "H": [3, 2]}).to_csv(csv, index=False)
+        print("changed input:", manifest.load("batting 2026", [csv]) is not None)
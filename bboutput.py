@@ -0,0 +1,132 @@
+"""
+Copyright (c) 2024 Jim Maastricht
+
+Asynchronous dispatch of BaseballSeason output.
+OutputDispatcher wraps an output handler and calls it on its own thread, so a slow terminal or log file does
+not stall the simulation. Messages that queue up while the handler is busy are batched: consecutive text
+only messages of one category, e.g. a day's progress dots or the team sections of a report, reach the
+handler as one call. Messages with metadata are passed on one by one and in order.
+The queue is bounded: when it is full, messages of the droppable categories are dropped and counted, the
+others wait for room, which slows the simulation down to the speed of the output instead of growing memory.
+"""
+
+import queue
+import threading
+from typing import Callable, Dict, Iterable, List, Optional
+
+from bblogger import logger
+
+MAX_PENDING = 2000  # queued messages before the simulation waits or drops
+MAX_BATCH = 500  # messages taken from the queue per batch
+
+_STOP = object()  # queue item ending the dispatch thread
+
+
+class OutputDispatcher:
+    """
+    Output handler that hands messages to another output handler on a dispatch thread.
+
+    Attributes:
+        handler: output handler called on the dispatch thread
+        dropped: messages dropped because the queue was full
+    """
+
+    def __init__(
+            self,
+            handler: Callable[[str, str, Optional[Dict]], None],
+            max_pending: int = MAX_PENDING,
+            drop_categories: Iterable[str] = (),
+    ) -> None:
+        """
+        :param handler: output handler to call, e.g. console_output_handler
+        :param max_pending: queued messages before the caller waits, or drops a droppable message
+        :param drop_categories: categories that may be dropped when the queue is full, e.g. progress output
+        """
+        self.handler = handler
+        self.drop_categories = frozenset(drop_categories)
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="output-dispatch", daemon=True)
+        self._thread.start()
+        return
+
+    def __call__(self, category: str, text: str, metadata: Optional[Dict] = None) -> None:
+        """
+        queue a message, same signature as an output handler
+        :param category: OutputCategory of the message
+        :param text: text of the message
+        :param metadata: structured data for the message
+        :return: None
+        """
+        if self._closed:  # late messages are handled at once instead of lost
+            self.handler(category, text, metadata)
+            return
+        if category in self.drop_categories:
+            try:
+                self._queue.put_nowait((category, text, metadata))
+            except queue.Full:
+                self.dropped += 1
+            return
+        self._queue.put((category, text, metadata))
+        return
+
+    def flush(self) -> None:
+        """
+        wait until every message queued so far has been handled
+        :return: None
+        """
+        if self._closed or threading.current_thread() is self._thread:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+        return
+
+    def close(self) -> None:
+        """
+        handle the queued messages and stop the dispatch thread, later messages are handled by the caller
+        :return: None
+        """
+        if self._closed:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._closed = True
+        if self.dropped:
+            logger.info(f"Output dispatcher dropped {self.dropped} messages")
+        return
+
+    def _run(self) -> None:
+        """dispatch thread: take what is queued, join what can be joined and call the handler"""
+        while True:
+            items = [self._queue.get()]
+            while len(items) < MAX_BATCH:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            pending: List[str] = []  # text of consecutive text only messages of pending_category
+            pending_category = None
+            for item in items + [None]:
+                mergeable = isinstance(item, tuple) and item[2] is None
+                if pending and not (mergeable and item[0] == pending_category):
+                    self._handle(pending_category, "".join(pending), None)
+                    pending = []
+                if mergeable:
+                    pending_category = item[0]
+                    pending.append(item[1])
+                elif isinstance(item, tuple):
+                    self._handle(*item)
+                elif isinstance(item, threading.Event):
+                    item.set()
+                elif item is _STOP:
+                    return
+
+    def _handle(self, category: str, text: str, metadata: Optional[Dict]) -> None:
+        """call the handler, a failing handler loses the message but not the thread"""
+        try:
+            self.handler(category, text, metadata)
+        except Exception as e:
+            logger.error(f"Output handler failed for {category}: {e}")
+        return
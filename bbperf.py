@@ -0,0 +1,278 @@
+"""
+Copyright (c) 2024 Jim Maastricht
+
+Engine instrumentation for the performance dashboard in the admin tab.
+PerfMonitor collects games and plate appearances per second over a rolling window, time per day for each
+phase of a sim day, worker utilization, time spent waiting for BaseballStats.thread_lock and process RSS.
+It is off until the dashboard is shown: phase timers are a shared no-op and TimedLock skips the clock, so
+the cost when hidden is one attribute check per timed call.
+Phase times are CPU time of the thread running the phase, games run side by side on threads and wall
+time would charge each game, and the team setup overlapping them, for the others.
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+PERF_WINDOW_SECONDS = 30.0  # rolling window for games/sec, PAs/sec and worker utilization
+PERF_DAYS = 10  # sim days averaged for the per day phase times
+# phases of a sim day, in the order they run; UI refresh is timed on the Tk thread
+PHASES = ("daily update", "team setup", "at-bats", "box score commit", "GM assessments", "UI refresh")
+
+_NOT_TIMED = nullcontext()  # shared timer while the monitor is off
+
+
+@dataclass
+class PerfSnapshot:
+    """Dashboard values at one point in time."""
+
+    games_per_sec: float = 0.0
+    pas_per_sec: float = 0.0
+    worker_utilization: float = 0.0  # share of the window the worker spent simulating, 0 to 1
+    lock_wait_ms: float = 0.0  # per day, waiting for BaseballStats.thread_lock
+    phase_ms: Dict[str, float] = field(default_factory=dict)  # per day, averaged over the last PERF_DAYS days
+    days: int = 0  # days in the phase averages
+    rss_mb: Optional[float] = None
+
+
+class _PhaseTimer:
+    """Adds the CPU time the current thread spends in a with block to a phase of the day."""
+
+    __slots__ = ("monitor", "phase", "start")
+
+    def __init__(self, monitor: "PerfMonitor", phase: str) -> None:
+        self.monitor = monitor
+        self.phase = phase
+        self.start = 0.0
+
+    def __enter__(self) -> "_PhaseTimer":
+        self.start = time.thread_time()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.monitor.add_phase(self.phase, time.thread_time() - self.start)
+
+
+class PerfMonitor:
+    """
+    Thread safe performance counters, recorded only while enabled.
+
+    Attributes:
+        enabled: set by the dashboard while it is visible, everything else checks it before timing
+        window: seconds covered by the rolling rates
+    """
+
+    def __init__(self, window: float = PERF_WINDOW_SECONDS, days: int = PERF_DAYS) -> None:
+        """
+        :param window: seconds covered by games/sec, PAs/sec and worker utilization
+        :param days: sim days averaged for the phase times
+        """
+        self.enabled = False
+        self.window = window
+        self._lock = threading.Lock()
+        self._enabled_at = 0.0
+        self._events = deque()  # (time, games, plate appearances, worker busy seconds)
+        self._day = dict.fromkeys(PHASES, 0.0)  # phase seconds of the day being simulated
+        self._day_games = 0
+        self._day_pas = 0
+        self._day_lock_wait = 0.0
+        self._days = deque(maxlen=days)  # (phase seconds, lock wait seconds) of recent days
+        return
+
+    def set_enabled(self, enabled: bool) -> None:
+        """
+        turn recording on or off, turning it on starts with empty counters
+        :param enabled: True while the dashboard is visible
+        :return: None
+        """
+        if enabled and not self.enabled:
+            with self._lock:
+                self._events.clear()
+                self._days.clear()
+                self._day = dict.fromkeys(PHASES, 0.0)
+                self._day_games = 0
+                self._day_pas = 0
+                self._day_lock_wait = 0.0
+                self._enabled_at = time.perf_counter()
+        self.enabled = enabled
+        return
+
+    def timer(self, phase: str):
+        """
+        time a with block as part of a phase of the current day, a shared no-op while disabled
+        :param phase: one of PHASES
+        :return: context manager
+        """
+        return _PhaseTimer(self, phase) if self.enabled else _NOT_TIMED
+
+    def run_timed(self, phase: str, func: Callable, *args) -> Any:
+        """
+        call func as part of a phase, e.g. as the target of a game thread
+        :param phase: one of PHASES
+        :param func: function to call
+        :param args: arguments for func
+        :return: what func returns
+        """
+        with self.timer(phase):
+            return func(*args)
+
+    def add_phase(self, phase: str, seconds: float) -> None:
+        """add CPU seconds to a phase of the current day"""
+        with self._lock:
+            self._day[phase] = self._day.get(phase, 0.0) + seconds
+        return
+
+    def add_games(self, count: int) -> None:
+        """count games simulated in the current day"""
+        with self._lock:
+            self._day_games += count
+        return
+
+    def add_plate_appearances(self, count: int) -> None:
+        """count plate appearances from a committed box score"""
+        with self._lock:
+            self._day_pas += count
+        return
+
+    def add_lock_wait(self, seconds: float) -> None:
+        """add time a thread waited for a contended TimedLock"""
+        with self._lock:
+            self._day_lock_wait += seconds
+        return
+
+    def add_busy(self, seconds: float) -> None:
+        """add time the worker spent simulating, for worker utilization"""
+        with self._lock:
+            self._events.append((time.perf_counter(), 0, 0, seconds))
+        return
+
+    def end_day(self) -> None:
+        """
+        close the current day: its phase times join the averages, its games and plate appearances the rolling rates
+        :return: None
+        """
+        with self._lock:
+            self._events.append((time.perf_counter(), self._day_games, self._day_pas, 0.0))
+            self._days.append((self._day, self._day_lock_wait))
+            self._day = dict.fromkeys(PHASES, 0.0)
+            self._day_games = 0
+            self._day_pas = 0
+            self._day_lock_wait = 0.0
+        return
+
+    def snapshot(self) -> PerfSnapshot:
+        """
+        current dashboard values
+        :return: rates over the window since enabled, per day averages over the recent days
+        """
+        now = time.perf_counter()
+        with self._lock:
+            while self._events and self._events[0][0] < now - self.window:
+                self._events.popleft()
+            span = max(now - max(now - self.window, self._enabled_at), 1e-6)
+            games = sum(event[1] for event in self._events)
+            pas = sum(event[2] for event in self._events)
+            busy = sum(event[3] for event in self._events)
+            days = list(self._days)
+        phase_ms = {}
+        if days:
+            phase_ms = {phase: 1000 * sum(day[0].get(phase, 0.0) for day in days) / len(days) for phase in PHASES}
+        return PerfSnapshot(
+            games_per_sec=games / span,
+            pas_per_sec=pas / span,
+            worker_utilization=min(1.0, busy / span),
+            lock_wait_ms=1000 * sum(day[1] for day in days) / len(days) if days else 0.0,
+            phase_ms=phase_ms,
+            days=len(days),
+            rss_mb=process_rss_mb(),
+        )
+
+
+class TimedLock:
+    """
+    threading.Lock that reports contended waits to a PerfMonitor while it is enabled.
+    An uncontended acquire does not read the clock, a disabled monitor costs one attribute check.
+    """
+
+    def __init__(self, monitor: PerfMonitor) -> None:
+        """
+        :param monitor: receives the wait times
+        """
+        self._lock = threading.Lock()
+        self._monitor = monitor
+        return
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        """threading.Lock.acquire, timing the wait when the lock is held by another thread"""
+        if not self._monitor.enabled:
+            return self._lock.acquire(blocking, timeout)
+        if self._lock.acquire(False):
+            return True
+        if not blocking:
+            return False
+        start = time.perf_counter()
+        acquired = self._lock.acquire(True, timeout)
+        self._monitor.add_lock_wait(time.perf_counter() - start)
+        return acquired
+
+    def release(self) -> None:
+        """threading.Lock.release"""
+        self._lock.release()
+
+    def locked(self) -> bool:
+        """threading.Lock.locked"""
+        return self._lock.locked()
+
+    def __enter__(self) -> bool:
+        return self.acquire()
+
+    def __exit__(self, *exc) -> None:
+        self._lock.release()
+
+
+def process_rss_mb() -> Optional[float]:
+    """
+    resident memory of this process, without psutil
+    :return: MB, the peak instead of the current value where only getrusage is available, None if unknown
+    """
+    try:  # linux
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, AttributeError, IndexError):
+        pass
+    if sys.platform == "win32":
+        try:
+            import ctypes
+            from ctypes import wintypes
+
+            class ProcessMemoryCounters(ctypes.Structure):
+                _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD)] + [
+                    (name, ctypes.c_size_t)
+                    for name in ("PeakWorkingSetSize", "WorkingSetSize", "QuotaPeakPagedPoolUsage",
+                                 "QuotaPagedPoolUsage", "QuotaPeakNonPagedPoolUsage", "QuotaNonPagedPoolUsage",
+                                 "PagefileUsage", "PeakPagefileUsage")
+                ]
+
+            counters = ProcessMemoryCounters()
+            counters.cb = ctypes.sizeof(counters)
+            get_process = ctypes.windll.kernel32.GetCurrentProcess
+            get_process.restype = wintypes.HANDLE
+            get_memory_info = ctypes.windll.psapi.GetProcessMemoryInfo
+            get_memory_info.argtypes = [wintypes.HANDLE, ctypes.POINTER(ProcessMemoryCounters), wintypes.DWORD]
+            if get_memory_info(get_process(), ctypes.byref(counters), counters.cb):
+                return counters.WorkingSetSize / 2**20
+        except (OSError, AttributeError):
+            pass
+        return None
+    try:  # macOS and other unix, peak resident size
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+    except (ImportError, OSError):
+        return None
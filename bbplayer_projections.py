@@ -19,18 +19,31 @@ import hashlib
 # data imported from https://www.rotowire.com/baseball/stats.php
 import os
 import random
-from typing import List, Optional
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Iterable, Iterator, List, Optional
 
 import numpy as np
 import pandas as pd
 from numpy import ndarray
 from pandas.core.frame import DataFrame
 
+import bbinnings
 import bbplayer_projections_forecast_player as player_projector
+from bbhistory import HistoricalStore
+from bbintegrity import BATTING_COLS, PITCHING_COLS, ProjectionIntegrity, load_and_check
+from bbmanifest import PREPROCESS_CACHE_DIR, PreprocessManifest
 import city_names as city
 import salary
 from bblogger import logger
 
+SALARY_FILE = "mlb-salaries-2000-24.csv"
+RAW_CSV_DTYPES = {"Player": str, "Team": str, "Pos": str}  # keys missing from a file are ignored
+# derived cols zeroed along with the counting stats for players without new season games
+PITCHING_ZERO_COLS = ["ERA", "WHIP", "OBP", "AVG_faced", "Total_OB", "Total_Outs", "AB", "HLD", "BS", "Injured Days"]
+BATTING_ZERO_COLS = ["AVG", "OBP", "SLG", "OPS", "Total_OB", "Total_Outs"]
+
 
 class BaseballStatsPreProcess:
     """
@@ -59,6 +72,10 @@ class BaseballStatsPreProcess:
         min_games_for_trusted: int = 80,
         load_batter_file: str = "player-stats-Batters.csv",
         load_pitcher_file: str = "player-stats-Pitching.csv",
+        workers: Optional[int] = None,
+        cache_dir: Optional[str] = PREPROCESS_CACHE_DIR,
+        history_dir: Optional[str] = None,
+        integrity_check: bool = True,
     ) -> None:
         """
         Load and preprocess baseball statistics for the specified seasons.
@@ -80,9 +97,25 @@ class BaseballStatsPreProcess:
         :param load_batter_file: Base filename for raw batter CSV files
             (year prefix added automatically, e.g. ``'player-stats-Batters.csv'``).
         :param load_pitcher_file: Base filename for raw pitcher CSV files.
+        :param workers: Process pool size for running the pitching and batting
+            pipelines side by side. None uses every core, 1 runs both in this process.
+        :param cache_dir: Directory for the input-hash manifest and cached per-season
+            cleaned frames. Only seasons whose CSV or the salary file changed are
+            re-cleaned. None rebuilds every season without caching.
+        :param history_dir: Directory for an on-disk columnar history store (see
+            ``bbhistory.HISTORY_STORE_DIR``). Seasons are cleaned one at a time into the
+            store and projections read player histories a bucket at a time, so memory
+            is bounded by the largest season instead of all seasons, e.g. for
+            1990-2026. None keeps every season in memory. Random data needs memory.
+        :param integrity_check: Check the projections against history once the files
+            are saved (see ``bbintegrity``). The result is kept in ``self.integrity``.
         """
         # self.create_hash = lambda text: int(hashlib.md5(text.encode('utf-8')).hexdigest()[:5], 16)
-        self.jigger_data = lambda x: x + int(np.abs(np.random.normal(loc=x * 0.10, scale=2, size=1)))
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.cache_dir = cache_dir
+        if history_dir is not None and generate_random_data:
+            raise ValueError("generate_random_data rewrites the historical frames in memory, use history_dir=None")
+        self.history_dir = history_dir
 
         self.numeric_bcols = [
             "G",
@@ -238,7 +271,9 @@ class BaseballStatsPreProcess:
         self.new_season_batting_data = None
         self.generate_random_data = generate_random_data
 
-        self.df_salary = salary.retrieve_salary("mlb-salaries-2000-24.csv", self.create_hash)
+        self.hash_cache = salary.HashCache(self.create_hash, cache_dir)  # codes kept between runs with the manifest
+        self.df_salary = salary.retrieve_salary(SALARY_FILE, self.create_hash, hash_cache=self.hash_cache)
+        self.hash_cache.save()
 
         # Step 1: Load ALL seasons raw data first
         self._load_raw_data(load_batter_file, load_pitcher_file)
@@ -260,35 +295,67 @@ class BaseballStatsPreProcess:
         if new_season is not None:
             self.create_new_season_from_existing(load_batter_file, load_pitcher_file)
         self.save_data()
+        self.hash_cache.save()
+        self.integrity = self.check_integrity() if integrity_check else None
         return
 
-    def create_hash(self, name, role):
+    @staticmethod
+    def jigger_data(x):
+        # a method rather than a lambda attribute so the instance pickles for the process pool
+        return x + int(np.abs(np.random.normal(loc=x * 0.10, scale=2, size=1)))
+
+    @staticmethod
+    def create_hash(name, role):
         # This ensures "Will Smith_Hitter" and "Will Smith_Pitcher"
         # generate two completely unique hex/integer values
         combined_string = f"{name}_{role}"
         hex_hash = hashlib.md5(combined_string.encode()).hexdigest()
         return int(hex_hash, 16)
 
-    def _load_raw_data(self, batter_file: str, pitcher_file: str) -> None:
+    @staticmethod
+    def create_hashes(names: pd.Series, role: str) -> pd.Series:
         """
-        Load raw CSV data for all seasons without projection.
+        Hashcode for every name in a column, hashing each distinct name once.
+        Nothing is kept between calls, the pipeline uses ``self.hash_cache`` for that.
 
-        Loads batting and pitching data for all seasons in load_seasons,
-        stores them for threshold detection before projection.
+        :param names: Player names.
+        :param role: ``'Hitter'`` or ``'Pitcher'``, passed to ``create_hash``.
+        :return: Series of hashcodes aligned with ``names``.
         """
-        self.raw_batting_data = None
-        self.raw_pitching_data = None
+        return salary.HashCache(BaseballStatsPreProcess.create_hash).hashes(names, role)
 
-        for season in self.load_seasons:
-            # Load batting data
-            bdf = pd.read_csv(str(season) + f" {batter_file}")
-            bdf["Season"] = season
-            self.raw_batting_data = pd.concat([self.raw_batting_data, bdf], axis=0)
+    def read_season_csvs(self, file_name: str, seasons: List[int]) -> List[DataFrame]:
+        """
+        Read one raw CSV per season on a thread pool (the CSV parser releases the GIL).
 
-            # Load pitching data
-            pdf = pd.read_csv(str(season) + f" {pitcher_file}")
-            pdf["Season"] = season
-            self.raw_pitching_data = pd.concat([self.raw_pitching_data, pdf], axis=0)
+        Text columns get an explicit ``str`` dtype so an all-digit ``Pos`` column
+        cannot be parsed as numbers. A ``Season`` column is added to each frame.
+
+        :param file_name: Base filename (year prefix added automatically).
+        :param seasons: Season years to read.
+        :return: One DataFrame per season, in the order of ``seasons``.
+        """
+
+        def read_season(season: int) -> DataFrame:
+            df = pd.read_csv(str(season) + f" {file_name}", dtype=RAW_CSV_DTYPES)
+            df["Season"] = season
+            return df
+
+        if len(seasons) <= 1:
+            return [read_season(season) for season in seasons]
+        with ThreadPoolExecutor(max_workers=min(len(seasons), max(1, self.workers))) as pool:
+            return list(pool.map(read_season, seasons))
+
+    def _load_raw_data(self, batter_file: str, pitcher_file: str) -> None:
+        """
+        Load raw CSV data for the max season without projection.
+
+        Threshold detection only looks at the most recent season, so older
+        seasons are left for the cleaning pipeline to read.
+        """
+        max_season = [max(self.load_seasons)]
+        self.raw_batting_data = pd.concat(self.read_season_csvs(batter_file, max_season), axis=0)
+        self.raw_pitching_data = pd.concat(self.read_season_csvs(pitcher_file, max_season), axis=0)
 
     def _detect_projection_seasons(self) -> None:
         """
@@ -360,6 +427,11 @@ class BaseballStatsPreProcess:
         print(f"Saved aggregated files: {seasons_str} {f_pname_aggr} and {f_bname_aggr}")
 
         # Save historical year-by-year data (new)
+        if self.history_dir is not None:  # stream the store to csv a season at a time
+            for side, f_hist_name in [("pitching", "historical-Pitching.csv"), ("batting", "historical-Batting.csv")]:
+                self.historical_store(side).to_csv(f"{seasons_str} {f_hist_name}", self.load_seasons)
+                print(f"Saved historical {side} data: {seasons_str} {f_hist_name}")
+
         if self.pitching_data_historical is not None:
             f_hist_pname = "random-historical-Pitching.csv" if self.generate_random_data else "historical-Pitching.csv"
             self.pitching_data_historical.index.name = "Player_Season_Key"
@@ -417,6 +489,32 @@ class BaseballStatsPreProcess:
             self.new_season_batting_data.to_csv(new_season_batting_file, index=True, header=True)
         return
 
+    def check_integrity(self) -> ProjectionIntegrity:
+        """
+        Check the projections against history without re-reading the saved files.
+
+        Only the columns the checks use are read from the history store.
+
+        :return: Checker holding the report, ``passed`` is False if any check failed.
+        """
+        checker = ProjectionIntegrity()
+        projected, historical, names = {}, {}, {}
+        for side, cols in [("batting", BATTING_COLS), ("pitching", PITCHING_COLS)]:
+            projected[side] = self.pitching_data if side == "pitching" else self.batting_data
+            if self.history_dir is not None:
+                store = self.historical_store(side)
+                historical[side] = pd.concat(
+                    [store.read_season(season, ["Season"] + cols) for season in store.seasons()]
+                )
+            else:
+                historical[side] = (
+                    self.pitching_data_historical if side == "pitching" else self.batting_data_historical
+                )
+            names[side] = projected[side]["Player"].set_axis(projected[side].index.astype(str))
+        checker.check(projected, historical)
+        checker.print_report(names)
+        return checker
+
     @staticmethod
     def group_col_to_list(df: DataFrame, key_col: str, col: str, new_col: str) -> DataFrame:
         """
@@ -425,7 +523,7 @@ class BaseballStatsPreProcess:
         Iterates the DataFrame and builds a set of unique values in ``col`` for
         each unique value of ``key_col``. Comma-separated strings (e.g. position
         strings like ``"P,SS,2B"``) are split into individual tokens before
-        collecting. The result is stored as a Python list in ``new_col``.
+        collecting. The result is stored as a sorted Python list in ``new_col``.
 
         Used to combine team and position data for players who appeared on
         multiple teams in a season (mid-season trades).
@@ -468,7 +566,8 @@ class BaseballStatsPreProcess:
                 groups[key].add(val)
 
         df[new_col] = df[key_col].map(groups)  # Create a new column to store grouped unique values
-        df[new_col] = df[new_col].apply(list)  # Convert sets to lists for easier handling in DataFrame
+        # Convert sets to sorted lists, set order of strings changes from process to process (hash seed)
+        df[new_col] = df[new_col].apply(lambda values: sorted(values, key=str))
         return df
 
     @staticmethod
@@ -499,6 +598,17 @@ class BaseballStatsPreProcess:
         """
         return "".join(char for char in text if char.isdigit())
 
+    def team_leagues(self, teams: pd.Series) -> pd.Series:
+        """
+        League for each team abbreviation: ``'NL'``, ``'AL'`` or ``''`` when unknown.
+
+        :param teams: Team abbreviations.
+        :return: Series of league names aligned with ``teams``.
+        """
+        return pd.Series(
+            np.select([teams.isin(self.nl), teams.isin(self.al)], ["NL", "AL"], default=""), index=teams.index
+        )
+
     def translate_pos(self, digit_string):
         """
         Convert a string of numeric position codes to comma-separated abbreviations.
@@ -512,7 +622,8 @@ class BaseballStatsPreProcess:
         """
         return "".join(self.digit_pos_map.get(digit, digit) + "," for digit in digit_string).rstrip(",")
 
-    def calculate_league_averages(self, historical_df: pd.DataFrame, is_pitching: bool = False) -> dict:
+    @staticmethod
+    def calculate_league_averages(historical_df: pd.DataFrame, is_pitching: bool = False) -> dict:
         """
         Calculates weighted league average rates to use as the 'Mean' for Bayesian regression.
 
@@ -675,64 +786,167 @@ class BaseballStatsPreProcess:
         # Missed 2+ years? They are effectively retired for sim purposes.
         return False
 
-    def get_pitching_seasons(self, pitcher_file: str, load_seasons: List[int], projection_seasons: List[int]) -> tuple:
+    def cleaned_seasons(self, side: str, file_name: str, load_seasons: List[int], clean_season) -> Iterator[tuple]:
         """
-        Load, clean, and project pitcher data for the specified seasons.
+        Read and clean one raw CSV per season, reusing cached frames for unchanged seasons.
+
+        Cleaning only combines rows of the same season (hashing, salary merge,
+        team filter, mid-season trade de-dup by ``Player_Season_Key``), so a
+        season's frames depend only on its CSV and the salary file. Those files
+        are the manifest inputs; a season is rebuilt when either hash changes.
+        With ``cache_dir`` set to None every season is rebuilt and nothing is cached.
+        Stale CSVs are read ``workers`` at a time, so at most that many raw seasons
+        are held while the seasons are yielded in order.
+
+        :param side: ``'pitching'`` or ``'batting'``, names the manifest and cache entries.
+        :param file_name: Base filename for the raw CSVs (year prefix added automatically).
+        :param load_seasons: Season years to load.
+        :param clean_season: Callable taking one raw season DataFrame and returning
+            ``(cleaned_rows, historical_rows)``.
+        :return: Iterator of ``(season, (cleaned_rows, historical_rows))`` in season order.
+        """
+        manifest = PreprocessManifest(side, self.cache_dir) if self.cache_dir is not None else None
+        inputs = {season: [str(season) + f" {file_name}", SALARY_FILE] for season in load_seasons}
+        stale = [
+            season for season in load_seasons
+            if manifest is None or not manifest.is_current(f"{side} {season}", inputs[season])
+        ]
+        raw = {}
+        for season in load_seasons:
+            frames = manifest.load(f"{side} {season}", inputs[season]) if season not in stale else None
+            if frames is None:
+                if season not in raw:
+                    batch = stale[stale.index(season):][: max(1, self.workers)] if season in stale else [season]
+                    raw.update(zip(batch, self.read_season_csvs(file_name, batch)))
+                frames = clean_season(raw.pop(season))
+                if manifest is not None:
+                    manifest.store(f"{side} {season}", inputs[season], frames)
+            yield season, frames
+        if manifest is not None:
+            manifest.save()
+            self.hash_cache.save()  # only this side's role, another process may be saving the other
+            print(f"{side.capitalize()}: {manifest.hits} seasons from cache, {len(load_seasons) - manifest.hits} rebuilt")
+        return
 
-        Reads one CSV file per season, concatenates them, drops irrelevant
-        columns (FIP, HR9, etc.), creates an MD5 Hashcode from the player
-        name, merges salary data, and filters out multi-team summary rows.
+    def load_cleaned_seasons(self, side: str, file_name: str, load_seasons: List[int], clean_season) -> tuple:
+        """
+        All cleaned seasons in memory, see ``cleaned_seasons``.
 
-        Produces two outputs:
-        - **Historical DataFrame** (indexed by ``Player_Season_Key``): one row
-          per player per season, de-duplicated across mid-season trades.
-        - **Aggregated DataFrame** (indexed by ``Hashcode``): trend-projected
-          stats for the upcoming season via ``PlayerProjector``, filtered to
-          active candidates only (played recently or star with injury gap).
+        :param side: ``'pitching'`` or ``'batting'``.
+        :param file_name: Base filename for the raw CSVs.
+        :param load_seasons: Season years to load.
+        :param clean_season: Callable returning ``(cleaned_rows, historical_rows)`` for one raw season.
+        :return: Tuple of ``(cleaned_rows, historical_rows)`` across all seasons.
+        """
+        frames = [frame for _, frame in self.cleaned_seasons(side, file_name, load_seasons, clean_season)]
+        return (
+            pd.concat([rows for rows, _ in frames], axis=0, ignore_index=True),
+            pd.concat([historical for _, historical in frames], axis=0, ignore_index=True),
+        )
 
-        Derived columns added to aggregated data: ``AB``, ``2B``, ``3B``,
-        ``HBP``, ``OBP``, ``Total_OB``, ``Total_Outs``, ``AVG_faced``,
-        ``Game_Fatigue_Factor``, ``Condition``, ``Status``, ``BS``, ``HLD``,
-        ``Injury_Rate_Adj``, ``Injury_Perf_Adj``, ``Streak_Adjustment``,
-        ``Projection_Trusted``.
+    def store_cleaned_seasons(
+        self, side: str, file_name: str, load_seasons: List[int], clean_season, finish_historical
+    ) -> HistoricalStore:
+        """
+        Clean one season at a time into the on-disk history store under ``history_dir``.
+
+        The cleaned rows go to ``{history_dir}/{side}`` for projections. The historical
+        rows get their ``Player_Season_Key`` index, team remapping and ``finish_historical``
+        and go to ``{history_dir}/{side}-historical`` for the historical CSV and Def_WAR.
+
+        :param side: ``'pitching'`` or ``'batting'``.
+        :param file_name: Base filename for the raw CSVs.
+        :param load_seasons: Season years to load.
+        :param clean_season: Callable returning ``(cleaned_rows, historical_rows)`` for one raw season.
+        :param finish_historical: Callable adding derived columns to one season of historical rows.
+        :return: Store of the cleaned rows.
+        """
+        store = HistoricalStore(os.path.join(self.history_dir, side))
+        historical_store = self.historical_store(side)
+        for season, (rows, historical) in self.cleaned_seasons(side, file_name, load_seasons, clean_season):
+            store.write_season(season, rows)
+            historical = historical.set_index("Player_Season_Key")
+            historical["Team"] = historical["Team"].replace(self.team_remapping)
+            historical_store.write_season(season, finish_historical(historical))
+        return store
+
+    def historical_store(self, side: str) -> HistoricalStore:
+        """on-disk historical rows for ``'pitching'`` or ``'batting'``, only used with ``history_dir``"""
+        return HistoricalStore(os.path.join(self.history_dir, f"{side}-historical"))
+
+    def historical_season(self, side: str, season: int) -> Optional[DataFrame]:
+        """
+        Historical rows of one season from memory or the history store.
 
-        .. caution::
-            WAR and salary columns are summed across seasons during the merge;
-            interpret career totals accordingly.
+        :param side: ``'pitching'`` or ``'batting'``.
+        :param season: Season year.
+        :return: Copy of the season's rows, None if there is no historical data.
+        """
+        if self.history_dir is not None:
+            store = self.historical_store(side)
+            return store.read_season(season) if season in store.seasons() else None
+        historical = self.pitching_data_historical if side == "pitching" else self.batting_data_historical
+        return historical[historical["Season"] == season].copy() if historical is not None else None
 
-        :param pitcher_file: Base filename for raw pitcher CSVs
-            (year prefix added automatically).
-        :param load_seasons: List of ALL season years to load (for historical data).
-        :param projection_seasons: List of season years to use for projections.
-        :return: Tuple of ``(aggregated_df, historical_df)``.
+    @staticmethod
+    def stored_rookies(store: HistoricalStore, load_seasons: List[int]) -> tuple:
         """
-        # Returns tuple of (aggregated_df, historical_df)
-        # caution war and salary cols will get aggregated across multiple seasons
-        pitching_data = None
-        stats_pcols_sum = [
-            "G",
-            "PA",
-            "GS",
-            "CG",
-            "SHO",
-            "IP",
-            "H",
-            "ER",
-            "SO",
-            "BB",
-            "HR",
-            "W",
-            "L",
-            "SV",
-            "HBP",
-            "BK",
-            "WP",
-        ]
-        for season in load_seasons:
-            df = pd.read_csv(str(season) + f" {pitcher_file}")
-            df["Season"] = season  # Add season before concatenating
-            pitching_data = pd.concat([pitching_data, df], axis=0)
+        Players who only appear in the max season, read one season's ids at a time.
+
+        :param store: Store of cleaned rows.
+        :param load_seasons: Loaded season years.
+        :return: Tuple of ``(rookie hashcodes, number of distinct players)``.
+        """
+        max_season = max(load_seasons)
+        earlier = set().union(*(store.unique_keys(season) for season in load_seasons if season != max_season))
+        latest = store.unique_keys(max_season)
+        return sorted(latest - earlier), len(earlier | latest)
+
+    @staticmethod
+    def project_in_chunks(
+        projector: "player_projector.PlayerProjector", chunks: Iterable[DataFrame], stats: List[str], is_p: bool
+    ) -> DataFrame:
+        """
+        Project chunks of complete player histories and put the players back in order of first appearance.
+
+        Every chunk must hold all rows of its players, indexed by row position across all
+        seasons. A single in-memory frame is one chunk and projects exactly as before.
+
+        :param projector: Projector with the league averages set.
+        :param chunks: Player history frames, e.g. ``HistoricalStore.player_histories``.
+        :param stats: Stat columns to project.
+        :param is_p: True for pitchers, False for batters.
+        :return: Projected stats indexed by Hashcode.
+        """
+        projections = []
+        first_rows = []
+        for chunk in chunks:
+            projected = projector.calculate_projected_stats(history=chunk, stats=stats, is_p=is_p)
+            if projected.empty:
+                continue
+            first_row = pd.Series(chunk.index, index=chunk["Hashcode"].to_numpy()).groupby(level=0).min()
+            projections.append(projected)
+            first_rows.append(first_row.reindex(projected["Hashcode"].to_numpy()).to_numpy())
+        if len(projections) == 1:
+            return projections[0].set_index("Hashcode")
+        if not projections:
+            return pd.DataFrame(columns=["Hashcode"]).set_index("Hashcode")
+        combined = pd.concat(projections, ignore_index=True)
+        order = np.argsort(np.concatenate(first_rows), kind="stable")
+        return combined.iloc[order].set_index("Hashcode")
+
+    def clean_pitching_season(self, pitching_data: DataFrame, stats_pcols_sum: List[str]) -> tuple:
+        """
+        Clean one season of raw pitcher rows and build its historical rows.
+
+        Drops irrelevant columns, removes position players pitching, adds
+        Hashcode, salary, league, division, ``Player_Season_Key`` and PA, then
+        collapses mid-season trades into one historical row per player.
 
+        :param pitching_data: Raw pitcher rows for one season with a ``Season`` column.
+        :param stats_pcols_sum: Counting columns summed across a traded player's rows.
+        :return: Tuple of ``(cleaned_rows, historical_rows)``.
+        """
         # drop unwanted cols
         pitching_data.drop(
             [
@@ -759,26 +973,24 @@ class BaseballStatsPreProcess:
         # remove pos players pitching
         pitching_data = pitching_data[~((pitching_data["IP"] < 10) & (pitching_data["G"] < 5))]
         pitching_data["Player"] = pitching_data["Player"].str.replace("*", "").str.replace("#", "")
-        pitching_data["Hashcode"] = pitching_data["Player"].apply(lambda x: self.create_hash(x, "Pitcher"))
+        pitching_data["Hashcode"] = self.hash_cache.hashes(pitching_data["Player"], "Pitcher")
 
         # Filter salary to only Pitchers before merging
         pitcher_salaries = self.df_salary[self.df_salary["Role"] == "Pitcher"]
         pitching_data = pd.merge(pitching_data, pitcher_salaries, on="Hashcode", how="left")
         pitching_data = salary.fill_nan_salary(pitching_data, "Salary")  # set league min for missing data
-        pitching_data["Team"] = pitching_data["Team"].apply(lambda x: x if x in self.nl + self.al else "")
+        pitching_data["Team"] = pitching_data["Team"].where(pitching_data["Team"].isin(self.nl + self.al), "")
 
         # players with multiple teams have a 2TM or 3TM line that is the total of all stats.  Drop rows since we total
         pitching_data = pitching_data[pitching_data["Team"] != ""]  # drop rows without a formal team name
-        pitching_data["League"] = pitching_data["Team"].apply(
-            lambda x: "NL" if x in self.nl else ("AL" if x in self.al else "")
-        )
+        pitching_data["League"] = self.team_leagues(pitching_data["Team"])
         pitching_data["Division"] = pitching_data["Team"].map(self.team_division).fillna("")
 
         # Create Player_Season_Key BEFORE de-duplication
         pitching_data["Player_Season_Key"] = (
             pitching_data["Hashcode"].astype(str) + "_" + pitching_data["Season"].astype(str)
         )
-        outs = (pitching_data["IP"].astype(int) * 3) + np.round((pitching_data["IP"] % 1) * 10)
+        outs = bbinnings.ip_to_outs(pitching_data["IP"].to_numpy())
         pitching_data["PA"] = outs + pitching_data["H"] + pitching_data["BB"] + pitching_data.get("HBP", 0)
 
         # *** Create HISTORICAL data (year-by-year) - one row per player per season ***
@@ -798,17 +1010,147 @@ class BaseballStatsPreProcess:
             stats_cols_to_sum=stats_pcols_sum,
             drop_dups=True,
         )
-        historical_data = historical_data.set_index("Player_Season_Key")
+        return pitching_data, historical_data
 
-        # *** Create AGGREGATED data (trend-based projections) - one row per player ***
-        # Filter to projection_seasons for league averages, note this may not include a partial season (2026)
-        league_avg_data = pitching_data[pitching_data["Season"].isin(projection_seasons)].copy()
-        max_season = max(load_seasons)
+    def clean_batting_season(self, batting_data: DataFrame, stats_bcols_sum: List[str]) -> tuple:
+        """
+        Clean one season of raw batter rows and build its historical rows.
+
+        Drops irrelevant columns, adds Hashcode, salary, translated positions,
+        league, division, ``Player_Season_Key`` and PA, then collapses
+        mid-season trades into one historical row per player.
+
+        :param batting_data: Raw batter rows for one season with a ``Season`` column.
+        :param stats_bcols_sum: Counting columns summed across a traded player's rows.
+        :return: Tuple of ``(cleaned_rows, historical_rows)``.
+        """
+        # drop unwanted cols
+        batting_data.drop(
+            ["Rk", "Lg", "OPS+", "rOBA", "Rbat+", "TB", "IBB", "Awards", "Player-additional"], inplace=True, axis=1
+        )
+        batting_data["Player"] = batting_data["Player"].str.replace("#", "").str.replace("*", "")
+        batting_data["Hashcode"] = self.hash_cache.hashes(batting_data["Player"], "Hitter")
+
+        # Filter salary to only Hitters before merging
+        hitter_salaries = self.df_salary[self.df_salary["Role"] == "Hitter"]
+        batting_data = pd.merge(batting_data, hitter_salaries, on="Hashcode", how="left")
+        batting_data = salary.fill_nan_salary(batting_data, "Salary")  # set league min for missing data
+        raw_positions = batting_data["Pos"].unique()  # few distinct codes, translate each once
+        batting_data["Pos"] = batting_data["Pos"].map(
+            pd.Series([self.translate_pos(self.remove_non_numeric(pos)) for pos in raw_positions], index=raw_positions)
+        )
+        # DON'T group by Hashcode yet - we need year-by-year data for historical file
+        batting_data["Team"] = batting_data["Team"].where(batting_data["Team"].isin(self.nl + self.al), "")
+        batting_data["League"] = self.team_leagues(batting_data["Team"])
+        batting_data["Division"] = batting_data["Team"].map(self.team_division).fillna("")
+        # players with multiple teams have a 2TM or 3TM line that is the total of all stats.  Drop rows since we total
+        batting_data = batting_data[batting_data["Team"] != ""]  # drop rows without a formal team name
+        # Create Player_Season_Key BEFORE de-duplication
+        batting_data["Player_Season_Key"] = (
+            batting_data["Hashcode"].astype(str) + "_" + batting_data["Season"].astype(str)
+        )
+        batting_data["PA"] = batting_data["AB"] + batting_data["BB"] + batting_data["HBP"] + batting_data["SF"]
+
+        # *** Create HISTORICAL data (year-by-year) - one row per player per season ***
+        # Must do this BEFORE grouping by Hashcode to preserve year-by-year data
+        historical_data = batting_data.copy()
+        historical_data = self.group_col_to_list(
+            df=historical_data, key_col="Player_Season_Key", col="Pos", new_col="Pos"
+        )
+        historical_data = self.group_col_to_list(
+            df=historical_data, key_col="Player_Season_Key", col="Team", new_col="Teams"
+        )
+        historical_data = self.group_col_to_list(
+            df=historical_data, key_col="Player_Season_Key", col="League", new_col="Leagues"
+        )
+        # For historical, only de-dup within same season (mid-season trades)
+        historical_data = self.de_dup_df(
+            df=historical_data,
+            key_name="Player_Season_Key",
+            dup_column_names="Player_Season_Key",
+            stats_cols_to_sum=stats_bcols_sum,
+            drop_dups=True,
+        )
+        return batting_data, historical_data
+
+    def get_pitching_seasons(self, pitcher_file: str, load_seasons: List[int], projection_seasons: List[int]) -> tuple:
+        """
+        Load, clean, and project pitcher data for the specified seasons.
 
-        # Identify rookies: players who only appear in max season
-        all_seasons_data = pitching_data.copy()
-        player_seasons = all_seasons_data.groupby("Hashcode")["Season"].apply(set)
-        rookies = player_seasons[player_seasons.apply(lambda x: len(x) == 1 and max_season in x)].index.tolist()
+        Reads one CSV file per season, concatenates them, drops irrelevant
+        columns (FIP, HR9, etc.), creates an MD5 Hashcode from the player
+        name, merges salary data, and filters out multi-team summary rows.
+
+        Produces two outputs:
+        - **Historical DataFrame** (indexed by ``Player_Season_Key``): one row
+          per player per season, de-duplicated across mid-season trades.
+        - **Aggregated DataFrame** (indexed by ``Hashcode``): trend-projected
+          stats for the upcoming season via ``PlayerProjector``, filtered to
+          active candidates only (played recently or star with injury gap).
+
+        Derived columns added to aggregated data: ``AB``, ``2B``, ``3B``,
+        ``HBP``, ``OBP``, ``Total_OB``, ``Total_Outs``, ``AVG_faced``,
+        ``Game_Fatigue_Factor``, ``Condition``, ``Status``, ``BS``, ``HLD``,
+        ``Injury_Rate_Adj``, ``Injury_Perf_Adj``, ``Streak_Adjustment``,
+        ``Projection_Trusted``.
+
+        .. caution::
+            WAR and salary columns are summed across seasons during the merge;
+            interpret career totals accordingly.
+
+        :param pitcher_file: Base filename for raw pitcher CSVs
+            (year prefix added automatically).
+        :param load_seasons: List of ALL season years to load (for historical data).
+        :param projection_seasons: List of season years to use for projections.
+        :return: Tuple of ``(aggregated_df, historical_df)``.
+        """
+        # Returns tuple of (aggregated_df, historical_df)
+        # caution war and salary cols will get aggregated across multiple seasons
+        stats_pcols_sum = [
+            "G",
+            "PA",
+            "GS",
+            "CG",
+            "SHO",
+            "IP",
+            "H",
+            "ER",
+            "SO",
+            "BB",
+            "HR",
+            "W",
+            "L",
+            "SV",
+            "HBP",
+            "BK",
+            "WP",
+        ]
+        clean_season = partial(self.clean_pitching_season, stats_pcols_sum=stats_pcols_sum)
+        max_season = max(load_seasons)
+        if self.history_dir is None:
+            pitching_data, historical_data = self.load_cleaned_seasons(
+                "pitching", pitcher_file, load_seasons, clean_season
+            )
+            historical_data = historical_data.set_index("Player_Season_Key")
+
+            # *** Create AGGREGATED data (trend-based projections) - one row per player ***
+            # Filter to projection_seasons for league averages, note this may not include a partial season (2026)
+            league_avg_data = pitching_data[pitching_data["Season"].isin(projection_seasons)].copy()
+
+            # Identify rookies: players who only appear in max season
+            all_seasons_data = pitching_data.copy()
+            player_seasons = all_seasons_data.groupby("Hashcode")["Season"].apply(set)
+            rookies = player_seasons[player_seasons.apply(lambda x: len(x) == 1 and max_season in x)].index.tolist()
+            players_before_filter = len(pitching_data["Hashcode"].unique())
+            projection_chunks = [pitching_data]
+        else:  # one season in memory at a time, projections read player histories a bucket at a time
+            store = self.store_cleaned_seasons(
+                "pitching", pitcher_file, load_seasons, clean_season, self.finish_pitching_historical
+            )
+            historical_data = None
+            league_avg_data = store.read_season(max(projection_seasons))  # league averages use the latest only
+            rookies, players_before_filter = self.stored_rookies(store, load_seasons)
+            projection_chunks = store.player_histories(load_seasons)
 
         stats_to_project = [
             "G",
@@ -831,19 +1173,13 @@ class BaseballStatsPreProcess:
         league_averages = self.calculate_league_averages(historical_df=league_avg_data, is_pitching=True)
 
         # ensure data is clean (no NaN, no inf)
-        players_before_filter = len(pitching_data["Hashcode"].unique())
-        projection_data_clean = pitching_data.copy()
-        projection_data_clean = projection_data_clean.replace([np.inf, -np.inf], np.nan)
-        projection_data_clean = projection_data_clean.dropna(subset=["IP", "H", "BB", "SO"])
-
-        valid_players = projection_data_clean["Hashcode"].unique()
-        projection_data_filtered = projection_data_clean[projection_data_clean["Hashcode"].isin(valid_players)]
+        projection_data_filtered = (
+            chunk.replace([np.inf, -np.inf], np.nan).dropna(subset=["IP", "H", "BB", "SO"])
+            for chunk in projection_chunks
+        )
 
         projector = player_projector.PlayerProjector(league_averages)
-        pitching_data = projector.calculate_projected_stats(
-            history=projection_data_filtered, stats=stats_to_project, is_p=True
-        )
-        pitching_data = pitching_data.set_index("Hashcode")
+        pitching_data = self.project_in_chunks(projector, projection_data_filtered, stats_to_project, is_p=True)
         # most_recent_season = max(projection_seasons) if projection_seasons else max(load_seasons)
         # pitching_data["Should_Retain"] = pitching_data.apply(
         #     lambda row: self.is_active_candidate(
@@ -873,14 +1209,14 @@ class BaseballStatsPreProcess:
             print(f"         {rookie_count} x-ref players (only in {max_season})")
 
         # Apply random data jigger if needed (to both datasets)
-        if self.generate_random_data:
+        if self.generate_random_data:  # random data always runs in memory, see __init__
             for stats_col in stats_pcols_sum:
                 pitching_data[stats_col] = pitching_data[stats_col].apply(self.jigger_data)
                 historical_data[stats_col] = historical_data[stats_col].apply(self.jigger_data)
 
         # Calculate derived stats for AGGREGATED data
         # 1. Convert .1/.2 format to total outs
-        outs = (pitching_data["IP"].astype(int) * 3) + np.round((pitching_data["IP"] % 1) * 10)
+        outs = bbinnings.ip_to_outs(pitching_data["IP"].to_numpy())
         pitching_data["AB"] = outs + pitching_data["H"]
         pitching_data["2B"] = 0
         pitching_data["3B"] = 0
@@ -890,7 +1226,7 @@ class BaseballStatsPreProcess:
         )  # Projected year (e.g., 2026)
         pitching_data["OBP"] = pitching_data["WHIP"] / (3 + pitching_data["WHIP"])  # bat reached / number faced
         pitching_data["Total_OB"] = pitching_data["H"] + pitching_data["BB"]  # + pitching_data['HBP']
-        pitching_data["Total_Outs"] = pitching_data["IP"] * 3  # 3 outs per inning
+        pitching_data["Total_Outs"] = outs
         pitching_data = pitching_data[
             pitching_data["IP"] >= 1
         ]  # drop pitchers without any meaningful innings (reduced from 5 to 1)
@@ -909,6 +1245,19 @@ class BaseballStatsPreProcess:
         if "Streak_Adjustment" not in pitching_data.columns:
             pitching_data["Streak_Adjustment"] = 0.0  # Always 0 for aggregated data
 
+        if historical_data is not None:  # the history store finishes each season as it is written
+            historical_data = self.finish_pitching_historical(historical_data)
+        return pitching_data, historical_data
+
+    @staticmethod
+    def finish_pitching_historical(historical_data: DataFrame) -> DataFrame:
+        """
+        Add the simulation columns to historical pitcher rows. Works row by row, so it
+        can run on all seasons at once or on one season at a time.
+
+        :param historical_data: Historical rows indexed by ``Player_Season_Key``.
+        :return: The rows with ``Injury_Rate_Adj``, ``Streak_Adjustment`` and ``Projection_Trusted``.
+        """
         if "Injury_Rate_Adj" not in historical_data.columns:
             historical_data["Injury_Rate_Adj"] = 0
             historical_data["Injury_Perf_Adj"] = 0
@@ -916,7 +1265,7 @@ class BaseballStatsPreProcess:
             historical_data["Streak_Adjustment"] = 0.0  # Always 0 for historical data
         if "Projection_Trusted" not in historical_data.columns:
             historical_data["Projection_Trusted"] = True  # Historical data is always trusted
-        return pitching_data, historical_data
+        return historical_data
 
     def get_batting_seasons(self, batter_file: str, load_seasons: List[int], projection_seasons: List[int]) -> tuple:
         """
@@ -951,7 +1300,6 @@ class BaseballStatsPreProcess:
         :return: Tuple of ``(aggregated_df, historical_df)``.
         """
         # Returns tuple of (aggregated_df, historical_df)
-        batting_data = None
         stats_bcols_sum = [
             "G",
             "PA",
@@ -971,68 +1319,30 @@ class BaseballStatsPreProcess:
             "HBP",
             "GIDP",
         ]
-        for season in load_seasons:
-            df = pd.read_csv(str(season) + f" {batter_file}")
-            df["Season"] = season  # Add season before concatenating
-            batting_data = pd.concat([batting_data, df], axis=0)
-
-        # drop unwanted cols
-        batting_data.drop(
-            ["Rk", "Lg", "OPS+", "rOBA", "Rbat+", "TB", "IBB", "Awards", "Player-additional"], inplace=True, axis=1
-        )
-        batting_data["Player"] = batting_data["Player"].str.replace("#", "").str.replace("*", "")
-        batting_data["Hashcode"] = batting_data["Player"].apply(lambda x: self.create_hash(x, "Hitter"))
-
-        # Filter salary to only Hitters before merging
-        hitter_salaries = self.df_salary[self.df_salary["Role"] == "Hitter"]
-        batting_data = pd.merge(batting_data, hitter_salaries, on="Hashcode", how="left")
-        batting_data = salary.fill_nan_salary(batting_data, "Salary")  # set league min for missing data
-        batting_data["Pos"] = batting_data["Pos"].apply(self.remove_non_numeric).apply(self.translate_pos)
-        # DON'T group by Hashcode yet - we need year-by-year data for historical file
-        batting_data["Team"] = batting_data["Team"].apply(lambda x: x if x in self.nl + self.al else "")
-        batting_data["League"] = batting_data["Team"].apply(
-            lambda x: "NL" if x in self.nl else ("AL" if x in self.al else "")
-        )
-        batting_data["Division"] = batting_data["Team"].map(self.team_division).fillna("")
-        # players with multiple teams have a 2TM or 3TM line that is the total of all stats.  Drop rows since we total
-        batting_data = batting_data[batting_data["Team"] != ""]  # drop rows without a formal team name
-        # Create Player_Season_Key BEFORE de-duplication
-        batting_data["Player_Season_Key"] = (
-            batting_data["Hashcode"].astype(str) + "_" + batting_data["Season"].astype(str)
-        )
-        batting_data["PA"] = batting_data["AB"] + batting_data["BB"] + batting_data["HBP"] + batting_data["SF"]
-
-        # *** Create HISTORICAL data (year-by-year) - one row per player per season ***
-        # Must do this BEFORE grouping by Hashcode to preserve year-by-year data
-        historical_data = batting_data.copy()
-        historical_data = self.group_col_to_list(
-            df=historical_data, key_col="Player_Season_Key", col="Pos", new_col="Pos"
-        )
-        historical_data = self.group_col_to_list(
-            df=historical_data, key_col="Player_Season_Key", col="Team", new_col="Teams"
-        )
-        historical_data = self.group_col_to_list(
-            df=historical_data, key_col="Player_Season_Key", col="League", new_col="Leagues"
-        )
-        # For historical, only de-dup within same season (mid-season trades)
-        historical_data = self.de_dup_df(
-            df=historical_data,
-            key_name="Player_Season_Key",
-            dup_column_names="Player_Season_Key",
-            stats_cols_to_sum=stats_bcols_sum,
-            drop_dups=True,
-        )
-        historical_data = historical_data.set_index("Player_Season_Key")
-
-        # *** Create AGGREGATED data (trend-based projections) - one row per player ***
-        # Filter to projection_seasons for league averages and projections, note may not include partial years (2026)
-        league_average_data = batting_data[batting_data["Season"].isin(projection_seasons)].copy()
+        clean_season = partial(self.clean_batting_season, stats_bcols_sum=stats_bcols_sum)
         max_season = max(load_seasons)
-
-        # Identify rookies: players who only appear in max season
-        all_seasons_data = batting_data.copy()
-        player_seasons = all_seasons_data.groupby("Hashcode")["Season"].apply(set)
-        rookies = player_seasons[player_seasons.apply(lambda x: len(x) == 1 and max_season in x)].index.tolist()
+        if self.history_dir is None:
+            batting_data, historical_data = self.load_cleaned_seasons("batting", batter_file, load_seasons, clean_season)
+            historical_data = historical_data.set_index("Player_Season_Key")
+
+            # *** Create AGGREGATED data (trend-based projections) - one row per player ***
+            # Filter to projection_seasons for league averages and projections, may not include partial years (2026)
+            league_average_data = batting_data[batting_data["Season"].isin(projection_seasons)].copy()
+
+            # Identify rookies: players who only appear in max season
+            all_seasons_data = batting_data.copy()
+            player_seasons = all_seasons_data.groupby("Hashcode")["Season"].apply(set)
+            rookies = player_seasons[player_seasons.apply(lambda x: len(x) == 1 and max_season in x)].index.tolist()
+            players_before = len(batting_data["Hashcode"].unique())
+            projection_chunks = [batting_data]
+        else:  # one season in memory at a time, projections read player histories a bucket at a time
+            store = self.store_cleaned_seasons(
+                "batting", batter_file, load_seasons, clean_season, self.finish_batting_historical
+            )
+            historical_data = None
+            league_average_data = store.read_season(max(projection_seasons))  # league averages use the latest only
+            rookies, players_before = self.stored_rookies(store, load_seasons)
+            projection_chunks = store.player_histories(load_seasons)
         rookie_count = len(rookies)
 
         stats_to_project = [
@@ -1056,13 +1366,8 @@ class BaseballStatsPreProcess:
         ]
         league_averages = self.calculate_league_averages(league_average_data, is_pitching=False)
 
-        # Filter projection_data to only include players with valid history for projection
-        players_before = len(batting_data["Hashcode"].unique())
-        projection_data_filtered = batting_data.copy()
         projector = player_projector.PlayerProjector(league_averages=league_averages)
-        batting_data = projector.calculate_projected_stats(
-            history=projection_data_filtered, stats=stats_to_project, is_p=False
-        )
+        batting_data = self.project_in_chunks(projector, projection_chunks, stats_to_project, is_p=False)
 
         # most_recent_season = max(projection_seasons) if projection_seasons else max(load_seasons)
         # Apply the probability logic instead of the hard 'In_Recent_Season' check
@@ -1084,7 +1389,6 @@ class BaseballStatsPreProcess:
         # Add Projection_Trusted flag
         # batting_data["Projection_Trusted"] = ~batting_data.index.isin(rookies)
 
-        batting_data = batting_data.set_index("Hashcode")
         print(
             f"Batters: Retained {len(batting_data)} players (Filtered {players_before - len(batting_data)} retired/inactive)"
         )
@@ -1094,7 +1398,7 @@ class BaseballStatsPreProcess:
             print(f"         {rookie_count} x-ref players (only in {max_season})")
 
         # Apply random data jigger if needed (to both datasets)
-        if self.generate_random_data:
+        if self.generate_random_data:  # random data always runs in memory, see __init__
             for stats_col in stats_bcols_sum:
                 batting_data[stats_col] = batting_data[stats_col].apply(self.jigger_data)
                 historical_data[stats_col] = historical_data[stats_col].apply(self.jigger_data)
@@ -1147,7 +1451,19 @@ class BaseballStatsPreProcess:
         if "Streak_Adjustment" not in batting_data.columns:
             batting_data["Streak_Adjustment"] = 0.0  # Always 0 for aggregated data
 
-        # Calculate derived stats for HISTORICAL data
+        if historical_data is not None:  # the history store finishes each season as it is written
+            historical_data = self.finish_batting_historical(historical_data)
+        return batting_data, historical_data
+
+    def finish_batting_historical(self, historical_data: DataFrame) -> DataFrame:
+        """
+        Add derived rate stats and simulation columns to historical batter rows and drop
+        rows under 10 AB. Works row by row, so it can run on all seasons at once or on
+        one season at a time.
+
+        :param historical_data: Historical rows indexed by ``Player_Season_Key``.
+        :return: The finished rows.
+        """
         # Season is already set per row from the loop
         historical_data["OBP"] = self.trunc_col(
             np.nan_to_num(
@@ -1194,7 +1510,7 @@ class BaseballStatsPreProcess:
         if "Projection_Trusted" not in historical_data.columns:
             historical_data["Projection_Trusted"] = True  # Historical data is always trusted
 
-        return batting_data, historical_data
+        return historical_data
 
     def get_seasons(self, batter_file: str, pitcher_file: str) -> None:
         """
@@ -1204,15 +1520,27 @@ class BaseballStatsPreProcess:
         the results in ``self.pitching_data``, ``self.pitching_data_historical``,
         ``self.batting_data``, and ``self.batting_data_historical``.
 
+        The two pipelines share no state, so with more than one worker they run
+        in separate processes (a copy of this instance each) and the results are
+        assigned back in a fixed order, making the output identical to a serial run.
+
         :param batter_file: Base filename for raw batter CSV files.
         :param pitcher_file: Base filename for raw pitcher CSV files.
         """
-        self.pitching_data, self.pitching_data_historical = self.get_pitching_seasons(
-            pitcher_file, self.load_seasons, self.projection_seasons
-        )
-        self.batting_data, self.batting_data_historical = self.get_batting_seasons(
-            batter_file, self.load_seasons, self.projection_seasons
-        )
+        if self.workers <= 1:
+            self.pitching_data, self.pitching_data_historical = self.get_pitching_seasons(
+                pitcher_file, self.load_seasons, self.projection_seasons
+            )
+            self.batting_data, self.batting_data_historical = self.get_batting_seasons(
+                batter_file, self.load_seasons, self.projection_seasons
+            )
+            return
+
+        with ProcessPoolExecutor(max_workers=min(2, self.workers)) as pool:
+            pitching = pool.submit(self.get_pitching_seasons, pitcher_file, self.load_seasons, self.projection_seasons)
+            batting = pool.submit(self.get_batting_seasons, batter_file, self.load_seasons, self.projection_seasons)
+            self.pitching_data, self.pitching_data_historical = pitching.result()
+            self.batting_data, self.batting_data_historical = batting.result()
         return
 
     def apply_team_remapping(self) -> None:
@@ -1273,8 +1601,8 @@ class BaseballStatsPreProcess:
         print(f"Calculating Def_WAR from {prior_season} season data...")
 
         # === PITCHERS ===
-        if self.pitching_data_historical is not None:
-            prior_p = self.pitching_data_historical[self.pitching_data_historical["Season"] == prior_season].copy()
+        prior_p = self.historical_season("pitching", prior_season)
+        if prior_p is not None:
             prior_p = prior_p[prior_p["IP"] >= 5].copy()
 
             if not prior_p.empty:
@@ -1299,8 +1627,8 @@ class BaseballStatsPreProcess:
                 self.pitching_data["Def_WAR"] = 0.0
 
         # === BATTERS ===
-        if self.batting_data_historical is not None:
-            prior_b = self.batting_data_historical[self.batting_data_historical["Season"] == prior_season].copy()
+        prior_b = self.historical_season("batting", prior_season)
+        if prior_b is not None:
             prior_b = prior_b[prior_b["AB"] >= 100].copy()
 
             if not prior_b.empty:
@@ -1490,12 +1818,12 @@ class BaseballStatsPreProcess:
         # load new names and reset hashcode index for AGGREGATED data
         self.batting_data["Player"] = random_names[: len(self.batting_data)]  # grab first x rows of list
         self.batting_data = self.batting_data.reset_index()
-        self.batting_data["Hashcode"] = self.batting_data["Player"].apply(lambda x: self.create_hash(x, "Hitter"))
+        self.batting_data["Hashcode"] = self.create_hashes(self.batting_data["Player"], "Hitter")
         self.batting_data = self.batting_data.set_index("Hashcode")
 
         self.pitching_data["Player"] = random_names[-len(self.pitching_data) :]  # next x rows list
         self.pitching_data = self.pitching_data.reset_index()
-        self.pitching_data["Hashcode"] = self.pitching_data["Player"].apply(lambda x: self.create_hash(x, "Pitcher"))
+        self.pitching_data["Hashcode"] = self.create_hashes(self.pitching_data["Player"], "Pitcher")
         self.pitching_data = self.pitching_data.set_index("Hashcode")
 
         # Update HISTORICAL data with same player names (need to map old hashcode to new)
@@ -1512,8 +1840,8 @@ class BaseballStatsPreProcess:
             )
             self.batting_data_historical["Player"] = self.batting_data_historical["Old_Hashcode"].map(old_to_new_player)
             # Recalculate hashcode and Player_Season_Key
-            self.batting_data_historical["Hashcode"] = self.batting_data_historical["Player"].apply(
-                lambda x: self.create_hash(x, "Hitter")
+            self.batting_data_historical["Hashcode"] = self.create_hashes(
+                self.batting_data_historical["Player"], "Hitter"
             )
             self.batting_data_historical["Player_Season_Key"] = (
                 self.batting_data_historical["Hashcode"].astype(str)
@@ -1534,8 +1862,8 @@ class BaseballStatsPreProcess:
             self.pitching_data_historical["Player"] = self.pitching_data_historical["Old_Hashcode"].map(
                 old_to_new_player
             )
-            self.pitching_data_historical["Hashcode"] = self.pitching_data_historical["Player"].apply(
-                lambda x: self.create_hash(x, "Pitcher")
+            self.pitching_data_historical["Hashcode"] = self.create_hashes(
+                self.pitching_data_historical["Player"], "Pitcher"
             )
             self.pitching_data_historical["Player_Season_Key"] = (
                 self.pitching_data_historical["Hashcode"].astype(str)
@@ -1585,92 +1913,32 @@ class BaseballStatsPreProcess:
         # IP can be decimal (e.g., 12.1 = 12 1/3 innings), change column to float
         self.new_season_pitching_data["IP"] = self.new_season_pitching_data["IP"].astype(float)
 
-        # Calculate projected rate stats from counting stats before zeroing
+        # Calculate projected rate stats from counting stats before zeroing, IP notation is converted to innings
         pp = self.new_season_pitching_data
-        pp["ERA"] = self.trunc_col(np.nan_to_num(np.divide(pp["ER"] * 9, pp["IP"]), nan=0.0, posinf=0.0), 2)
-        pp["WHIP"] = self.trunc_col(np.nan_to_num(np.divide(pp["BB"] + pp["H"], pp["IP"]), nan=0.0, posinf=0.0), 3)
+        innings = bbinnings.ip_to_outs(pp["IP"].to_numpy()) / 3
+        pp["ERA"] = self.trunc_col(np.nan_to_num(np.divide(pp["ER"] * 9, innings), nan=0.0, posinf=0.0), 2)
+        pp["WHIP"] = self.trunc_col(np.nan_to_num(np.divide(pp["BB"] + pp["H"], innings), nan=0.0, posinf=0.0), 3)
         pp["OBP"] = self.trunc_col(np.nan_to_num(np.divide(pp["WHIP"], 3 + pp["WHIP"]), nan=0.0, posinf=0.0), 3)
 
         # Merge partial season stats if available
         if partial_season_data is not None and "pitching" in partial_season_data:
-            partial_pitch = partial_season_data["pitching"]
-            for idx in self.new_season_pitching_data.index:
-                if idx in partial_pitch.index:
-                    partial_row = partial_pitch.loc[idx]
-                    g_val = partial_row["G"] if "G" in partial_row.index else None
-                    if (
-                        g_val is not None and pd.notna(g_val).any()
-                        if hasattr(pd.notna(g_val), "any")
-                        else pd.notna(g_val)
-                    ):
-                        # Update team info from partial data (in case of mid-season trades)
-                        if "Team" in partial_row.index and pd.notna(partial_row.get("Team")):
-                            self.new_season_pitching_data.loc[idx, "Team"] = partial_row["Team"]
-                        if "League" in partial_row.index and pd.notna(partial_row.get("League")):
-                            self.new_season_pitching_data.loc[idx, "League"] = partial_row["League"]
-                        if "Division" in partial_row.index and pd.notna(partial_row.get("Division")):
-                            self.new_season_pitching_data.loc[idx, "Division"] = partial_row["Division"]
-                        self.new_season_pitching_data.loc[idx, "G"] = int(partial_row.get("G", 0))
-                        self.new_season_pitching_data.loc[idx, "GS"] = int(partial_row.get("GS", 0))
-                        ip_val = partial_row.get("IP", 0)
-                        if pd.notna(ip_val):
-                            self.new_season_pitching_data.at[idx, "IP"] = float(ip_val)
-                        self.new_season_pitching_data.loc[idx, "H"] = int(partial_row.get("H", 0))
-                        self.new_season_pitching_data.loc[idx, "ER"] = int(partial_row.get("ER", 0))
-                        self.new_season_pitching_data.loc[idx, "BB"] = int(partial_row.get("BB", 0))
-                        self.new_season_pitching_data.loc[idx, "SO"] = int(partial_row.get("SO", 0))
-                        self.new_season_pitching_data.loc[idx, "HR"] = int(partial_row.get("HR", 0))
-                        self.new_season_pitching_data.loc[idx, "W"] = int(partial_row.get("W", 0))
-                        self.new_season_pitching_data.loc[idx, "L"] = int(partial_row.get("L", 0))
-                        self.new_season_pitching_data.loc[idx, "SV"] = int(partial_row.get("SV", 0))
-                    else:
-                        # Player in partial data but no valid games - zero out
-                        self.new_season_pitching_data.loc[idx, self.numeric_pcols] = 0
-                        self.new_season_pitching_data.loc[
-                            idx,
-                            [
-                                "ERA",
-                                "WHIP",
-                                "OBP",
-                                "AVG_faced",
-                                "Total_OB",
-                                "Total_Outs",
-                                "AB",
-                                "HLD",
-                                "BS",
-                                "Injured Days",
-                            ],
-                        ] = 0
-                else:
-                    # Player not in partial data - zero out (hasn't pitched yet)
-                    self.new_season_pitching_data.loc[idx, self.numeric_pcols] = 0
-                    self.new_season_pitching_data.loc[
-                        idx,
-                        [
-                            "ERA",
-                            "WHIP",
-                            "OBP",
-                            "AVG_faced",
-                            "Total_OB",
-                            "Total_Outs",
-                            "AB",
-                            "HLD",
-                            "BS",
-                            "Injured Days",
-                        ],
-                    ] = 0
+            self.merge_partial_season_stats(
+                season_df=self.new_season_pitching_data,
+                partial=partial_season_data["pitching"],
+                count_cols=["G", "GS", "H", "ER", "BB", "SO", "HR", "W", "L", "SV"],
+                zero_cols=self.numeric_pcols + PITCHING_ZERO_COLS,
+                float_cols=["IP"],
+            )
 
             # Recalculate derived stats from partial data
             pp = self.new_season_pitching_data
-            pp["ERA"] = self.trunc_col(
-                np.nan_to_num(np.divide(pp["ER"] * 9, pp["IP"].replace(0, np.nan)), nan=0.0, posinf=0.0), 2
-            )
-            pp["WHIP"] = self.trunc_col(
-                np.nan_to_num(np.divide(pp["BB"] + pp["H"], pp["IP"].replace(0, np.nan)), nan=0.0, posinf=0.0), 3
-            )
+            outs = pd.Series(bbinnings.ip_to_outs(pp["IP"].to_numpy()), index=pp.index)
+            innings = outs.replace(0, np.nan) / 3
+            pp["ERA"] = self.trunc_col(np.nan_to_num(np.divide(pp["ER"] * 9, innings), nan=0.0, posinf=0.0), 2)
+            pp["WHIP"] = self.trunc_col(np.nan_to_num(np.divide(pp["BB"] + pp["H"], innings), nan=0.0, posinf=0.0), 3)
             pp["OBP"] = self.trunc_col(np.nan_to_num(np.divide(pp["WHIP"], 3 + pp["WHIP"]), nan=0.0, posinf=0.0), 3)
             pp["Total_OB"] = pp["H"] + pp["BB"]
-            pp["Total_Outs"] = pp["IP"] * 3
+            pp["Total_Outs"] = outs
             pp["AVG_faced"] = self.trunc_col(
                 np.nan_to_num(
                     np.divide(pp["Total_OB"] + pp["Total_Outs"], pp["G"].replace(0, np.nan)), nan=0.0, posinf=0.0
@@ -1681,9 +1949,7 @@ class BaseballStatsPreProcess:
         else:
             # Zero counting stats for simulation tracking (no partial data)
             self.new_season_pitching_data[self.numeric_pcols] = 0
-            self.new_season_pitching_data[
-                ["ERA", "WHIP", "OBP", "AVG_faced", "Total_OB", "Total_Outs", "AB", "HLD", "BS", "Injured Days"]
-            ] = 0
+            self.new_season_pitching_data[PITCHING_ZERO_COLS] = 0
 
         self.new_season_pitching_data["Condition"] = 100
         self.new_season_pitching_data["Streak_Adjustment"] = 0.0
@@ -1721,53 +1987,13 @@ class BaseballStatsPreProcess:
 
         # Merge partial season stats if available
         if partial_season_data is not None and "batting" in partial_season_data:
-            partial_bat = partial_season_data["batting"]
-            for idx in self.new_season_batting_data.index:
-                if idx in partial_bat.index:
-                    partial_row = partial_bat.loc[idx]
-                    g_val = partial_row["G"] if "G" in partial_row.index else None
-                    if (
-                        g_val is not None and pd.notna(g_val).any()
-                        if hasattr(pd.notna(g_val), "any")
-                        else pd.notna(g_val)
-                    ):
-                        self.new_season_batting_data.loc[idx, "G"] = int(partial_row.get("G", 0))
-                        self.new_season_batting_data.loc[idx, "PA"] = int(partial_row.get("PA", 0))
-                        self.new_season_batting_data.loc[idx, "AB"] = int(partial_row.get("AB", 0))
-                        self.new_season_batting_data.loc[idx, "H"] = int(partial_row.get("H", 0))
-                        self.new_season_batting_data.loc[idx, "R"] = int(partial_row.get("R", 0))
-                        self.new_season_batting_data.loc[idx, "HR"] = int(partial_row.get("HR", 0))
-                        self.new_season_batting_data.loc[idx, "RBI"] = int(partial_row.get("RBI", 0))
-                        self.new_season_batting_data.loc[idx, "BB"] = int(partial_row.get("BB", 0))
-                        self.new_season_batting_data.loc[idx, "SO"] = int(partial_row.get("SO", 0))
-                        self.new_season_batting_data.loc[idx, "SB"] = int(partial_row.get("SB", 0))
-                        self.new_season_batting_data.loc[idx, "CS"] = int(partial_row.get("CS", 0))
-                        self.new_season_batting_data.loc[idx, "2B"] = int(partial_row.get("2B", 0))
-                        self.new_season_batting_data.loc[idx, "3B"] = int(partial_row.get("3B", 0))
-                        self.new_season_batting_data.loc[idx, "SH"] = int(partial_row.get("SH", 0))
-                        self.new_season_batting_data.loc[idx, "SF"] = int(partial_row.get("SF", 0))
-                        self.new_season_batting_data.loc[idx, "HBP"] = int(partial_row.get("HBP", 0))
-                        self.new_season_batting_data.loc[idx, "GIDP"] = int(partial_row.get("GIDP", 0))
-                        # Preserve team info from partial data (handles mid-season trades)
-                        team_val = partial_row.get("Team")
-                        if pd.notna(team_val):
-                            self.new_season_batting_data.loc[idx, "Team"] = team_val
-                        league_val = partial_row.get("League")
-                        if pd.notna(league_val):
-                            self.new_season_batting_data.loc[idx, "League"] = league_val
-                        division_val = partial_row.get("Division")
-                        if pd.notna(division_val):
-                            self.new_season_batting_data.loc[idx, "Division"] = division_val
-                    else:
-                        # Player in partial data but no valid games - zero out
-                        self.new_season_batting_data.loc[idx, self.numeric_bcols] = 0
-                        self.new_season_batting_data.loc[
-                            idx, ["AVG", "OBP", "SLG", "OPS", "Total_OB", "Total_Outs"]
-                        ] = 0
-                else:
-                    # Player not in partial data - zero out (hasn't played yet)
-                    self.new_season_batting_data.loc[idx, self.numeric_bcols] = 0
-                    self.new_season_batting_data.loc[idx, ["AVG", "OBP", "SLG", "OPS", "Total_OB", "Total_Outs"]] = 0
+            self.merge_partial_season_stats(
+                season_df=self.new_season_batting_data,
+                partial=partial_season_data["batting"],
+                count_cols=["G", "PA", "AB", "H", "R", "HR", "RBI", "BB", "SO", "SB", "CS", "2B", "3B", "SH", "SF",
+                            "HBP", "GIDP"],
+                zero_cols=self.numeric_bcols + BATTING_ZERO_COLS,
+            )
 
             # Recalculate derived stats from partial data
             bp = self.new_season_batting_data
@@ -1798,7 +2024,7 @@ class BaseballStatsPreProcess:
         else:
             # Zero counting stats for simulation tracking (no partial data)
             self.new_season_batting_data[self.numeric_bcols] = 0
-            self.new_season_batting_data[["AVG", "OBP", "SLG", "OPS", "Total_OB", "Total_Outs"]] = 0
+            self.new_season_batting_data[BATTING_ZERO_COLS] = 0
 
         self.new_season_batting_data["Condition"] = 100
         self.new_season_batting_data["Streak_Adjustment"] = 0.0
@@ -1810,6 +2036,88 @@ class BaseballStatsPreProcess:
 
         return
 
+    @staticmethod
+    def collapse_traded_rows(partial: DataFrame) -> DataFrame:
+        """
+        One row per player in a partial season file.  A traded player has a 2TM or 3TM total line plus one
+        line per team, keep the total line's stats and the team from the last team line (the current club).
+        Rows sharing a hashcode without a total line are different players with the same name, e.g. two Max
+        Muncys on different teams.  Neither can be told apart from the other, so both are left out and the
+        merge zeroes them like players without partial season games.
+
+        :param partial: partial season rows indexed by hashcode
+        :return: df with a unique index
+        """
+        if partial.empty or not partial.index.has_duplicates:
+            return partial
+        if "Team" in partial.columns:
+            is_total = partial["Team"].astype(str).str.fullmatch(r"\d+TM").to_numpy()
+        else:
+            is_total = np.zeros(len(partial), dtype=bool)
+        namesakes = partial.index.duplicated(keep=False) & ~partial.index.isin(partial.index[is_total])
+        if namesakes.any():
+            names = partial.loc[namesakes, "Player"] if "Player" in partial.columns else partial.index[namesakes]
+            logger.warning("Partial season rows share a hashcode without a traded total line, stats left out for: {}",
+                           sorted(set(names.astype(str))))
+            partial, is_total = partial[~namesakes], is_total[~namesakes]
+        if not partial.index.has_duplicates:
+            return partial
+        ordered = partial.iloc[np.argsort(~is_total, kind="stable")]  # total lines first
+        collapsed = ordered[~ordered.index.duplicated(keep="first")].copy()
+        current_team = partial.loc[~is_total, "Team"].groupby(level=0).last()
+        collapsed["Team"] = current_team.reindex(collapsed.index).fillna(collapsed["Team"])
+        return collapsed
+
+    @staticmethod
+    def check_collapse_traded_rows() -> bool:
+        """
+        Two namesakes on different teams without a total line are both left out, a traded player keeps the
+        total line's stats and the current team.
+
+        :return: True if both cases collapse as expected
+        """
+        partial = pd.DataFrame(
+            {"Player": ["Max Muncy", "Max Muncy", "Traded Player", "Traded Player", "Traded Player"],
+             "Team": ["LAD", "ATH", "2TM", "NYM", "BOS"], "G": [60, 12, 50, 30, 20]},
+            index=[1, 1, 2, 2, 2],
+        )
+        collapsed = BaseballStatsPreProcess.collapse_traded_rows(partial)
+        return list(collapsed.index) == [2] and collapsed.loc[2, "Team"] == "BOS" and collapsed.loc[2, "G"] == 50
+
+    def merge_partial_season_stats(self, season_df: DataFrame, partial: DataFrame, count_cols: List[str],
+                                   zero_cols: List[str], float_cols: Optional[List[str]] = None) -> None:
+        """
+        Overlay partial season stats on the new season with one index aligned join.  Players with games in the
+        partial season get its counting stats and team info, everyone else has their counting stats zeroed.
+
+        :param season_df: new season df indexed by hashcode, updated in place
+        :param partial: partial season rows indexed by hashcode
+        :param count_cols: counting stats copied as ints, 0 if the partial file lacks the col
+        :param zero_cols: cols zeroed for players without partial season games
+        :param float_cols: cols copied as floats where present, e.g. IP, otherwise the projection is kept
+        :return: None
+        """
+        partial = self.collapse_traded_rows(partial).reindex(season_df.index)
+        if "G" in partial.columns:
+            played = partial["G"].notna().to_numpy()
+        else:
+            played = np.zeros(len(season_df), dtype=bool)
+
+        for col in ["Team", "League", "Division"]:  # team info changes with mid-season trades
+            if col in partial.columns:
+                update = played & partial[col].notna().to_numpy()
+                season_df.loc[update, col] = partial.loc[update, col]
+        for col in count_cols:
+            season_df.loc[played, col] = (
+                partial.loc[played, col].fillna(0).astype(int) if col in partial.columns else 0
+            )
+        for col in float_cols or []:
+            if col in partial.columns:
+                update = played & partial[col].notna().to_numpy()
+                season_df.loc[update, col] = partial.loc[update, col].astype(float)
+        season_df.loc[~played, list(dict.fromkeys(zero_cols))] = 0  # zero_cols may repeat a col
+        return
+
     def _load_partial_season_data(self, batter_file: str, pitcher_file: str, season: int) -> dict:
         """
         Load partial season data for merging into new season file.
@@ -1822,7 +2130,7 @@ class BaseballStatsPreProcess:
             pdf = pd.read_csv(f"{season} {pitcher_file}")
             pdf["Season"] = season
             pdf["Player"] = pdf["Player"].str.replace("*", "").str.replace("#", "")
-            pdf["Hashcode"] = pdf["Player"].apply(lambda x: self.create_hash(x, "Pitcher"))
+            pdf["Hashcode"] = self.hash_cache.hashes(pdf["Player"], "Pitcher")
             pdf = pdf.set_index("Hashcode")
             partial_data["pitching"] = pdf
         except FileNotFoundError:
@@ -1832,7 +2140,7 @@ class BaseballStatsPreProcess:
             bdf = pd.read_csv(f"{season} {batter_file}")
             bdf["Season"] = season
             bdf["Player"] = bdf["Player"].str.replace("*", "").str.replace("#", "")
-            bdf["Hashcode"] = bdf["Player"].apply(lambda x: self.create_hash(x, "Hitter"))
+            bdf["Hashcode"] = self.hash_cache.hashes(bdf["Player"], "Hitter")
             bdf = bdf.set_index("Hashcode")
             partial_data["batting"] = bdf
         except FileNotFoundError:
@@ -1849,7 +2157,7 @@ class BaseballStatsPreProcess:
 
         if "pitching" in partial_data and not partial_data["pitching"].empty:
             # Drop existing rows for the partial season (they'll be replaced)
-            if "Season" in self.pitching_data_historical.columns:
+            if self.history_dir is None and "Season" in self.pitching_data_historical.columns:
                 self.pitching_data_historical = self.pitching_data_historical[
                     self.pitching_data_historical["Season"] != max_season
                 ]
@@ -1862,11 +2170,16 @@ class BaseballStatsPreProcess:
                 partial_data["pitching"].index.astype(str) + "_" + str(max_season)
             )
             partial_data["pitching"] = partial_data["pitching"].set_index("Player_Season_Key")
-            self.pitching_data_historical = pd.concat([self.pitching_data_historical, partial_data["pitching"]], axis=0)
+            if self.history_dir is not None:
+                self.historical_store("pitching").write_season(max_season, partial_data["pitching"])
+            else:
+                self.pitching_data_historical = pd.concat(
+                    [self.pitching_data_historical, partial_data["pitching"]], axis=0
+                )
 
         if "batting" in partial_data and not partial_data["batting"].empty:
             # Drop existing rows for the partial season (they'll be replaced)
-            if "Season" in self.batting_data_historical.columns:
+            if self.history_dir is None and "Season" in self.batting_data_historical.columns:
                 self.batting_data_historical = self.batting_data_historical[
                     self.batting_data_historical["Season"] != max_season
                 ]
@@ -1879,7 +2192,10 @@ class BaseballStatsPreProcess:
                 partial_data["batting"].index.astype(str) + "_" + str(max_season)
             )
             partial_data["batting"] = partial_data["batting"].set_index("Player_Season_Key")
-            self.batting_data_historical = pd.concat([self.batting_data_historical, partial_data["batting"]], axis=0)
+            if self.history_dir is not None:
+                self.historical_store("batting").write_season(max_season, partial_data["batting"])
+            else:
+                self.batting_data_historical = pd.concat([self.batting_data_historical, partial_data["batting"]], axis=0)
 
     @staticmethod
     def trunc_col(df_n: ndarray, d: int = 3) -> ndarray:
@@ -1901,94 +2217,9 @@ class BaseballStatsPreProcess:
 # =============================================================================
 
 
-def _safe_rate(num, denom, default=0.0):
-    return num / denom if denom and denom > 0 else default
-
-
-def projection_integrity_check(load_seasons: list = None, new_season: int = None):
-    """Compare projected rates vs historical baselines in a single compact table."""
-    if load_seasons is None:
-        load_seasons = [2023, 2024, 2025]
-    ss = " ".join(str(s) for s in load_seasons)
-
-    b_proj = pd.read_csv(f"{ss} player-projected-stats-pp-Batting.csv")
-    b_hist = pd.read_csv(f"{ss} historical-Batting.csv")
-    p_proj = pd.read_csv(f"{ss} player-projected-stats-pp-Pitching.csv")
-    p_hist = pd.read_csv(f"{ss} historical-Pitching.csv")
-
-    prior = load_seasons[-1]
-    if new_season is None:
-        new_season = prior + 1
-    b_prior = b_hist[b_hist["Season"] == prior]
-    b_all = b_hist[b_hist["Season"].isin(load_seasons)]
-    p_prior = p_hist[p_hist["Season"] == prior]
-    p_all = p_hist[p_hist["Season"].isin(load_seasons)]
-
-    def r(df, nc, dc):
-        return _safe_rate(df[nc].sum(), df[dc].sum())
-
-    def _singles(df):
-        return df["H"] - df.get("2B", 0).fillna(0) - df.get("3B", 0).fillna(0) - df.get("HR", 0).fillna(0)
-
-    def _slg(df):
-        tb = (
-            _singles(df) + 2 * df.get("2B", 0).fillna(0) + 3 * df.get("3B", 0).fillna(0) + 4 * df.get("HR", 0).fillna(0)
-        )
-        return _safe_rate(tb.sum(), df["AB"].sum())
-
-    def _babip(df):
-        bip = df["PA"] - df["SO"] - df["BB"]
-        return _safe_rate(df["H"].sum(), bip.sum())
-
-    def _obp_b(df):
-        return _safe_rate((df["H"] + df["BB"]).sum(), df["PA"].sum())
-
-    rows = [
-        ("Batters:", None, None, None, None, None),
-        ("  AVG", r(b_all, "H", "AB"), r(b_prior, "H", "AB"), r(b_proj, "H", "AB"), None, None),
-        ("  OBP", _obp_b(b_all), _obp_b(b_prior), _obp_b(b_proj), None, None),
-        ("  BB/PA", r(b_all, "BB", "PA"), r(b_prior, "BB", "PA"), r(b_proj, "BB", "PA"), None, None),
-        ("  SO/PA", r(b_all, "SO", "PA"), r(b_prior, "SO", "PA"), r(b_proj, "SO", "PA"), None, None),
-        ("  SLG", _slg(b_all), _slg(b_prior), _slg(b_proj), None, None),
-        ("Pitchers:", None, None, None, None, None),
-        ("  H/PA", r(p_all, "H", "PA"), r(p_prior, "H", "PA"), r(p_proj, "H", "PA"), None, None),
-        ("  BB/PA", r(p_all, "BB", "PA"), r(p_prior, "BB", "PA"), r(p_proj, "BB", "PA"), None, None),
-        ("  SO/PA", r(p_all, "SO", "PA"), r(p_prior, "SO", "PA"), r(p_proj, "SO", "PA"), None, None),
-        ("  OBP Against", _obp_b(p_all), _obp_b(p_prior), _obp_b(p_proj), None, None),
-        ("  BABIP", _babip(p_all), _babip(p_prior), _babip(p_proj), None, None),
-    ]
-
-    rows = [
-        (
-            label,
-            a,
-            b,
-            c,
-            _safe_rate(c - a, 1) if c is not None and a is not None else None,
-            _safe_rate(c - b, 1) if c is not None and b is not None else None,
-        )
-        for label, a, b, c, _, _ in rows
-    ]
-
-    first_season = load_seasons[0]
-    blend_hdr = f"{first_season}-{prior} Blend"
-    prior_hdr = f"{prior} Prior"
-    proj_hdr = f"{new_season} Proj"
-    vs_prior_hdr = f"vs {prior}"
-
-    print("\n" + "=" * 95)
-    print(f"{'INTEGRITY CHECK: PROJECTION vs HISTORICAL BASELINES':^95}")
-    print("=" * 95)
-    print(f"{'':<20} {blend_hdr:>16} {prior_hdr:>14} {proj_hdr:>14} {'vs Blend':>12} {vs_prior_hdr:>12}")
-    print("-" * 95)
-    for label, a, b, c, d_blend, d_prior in rows:
-        if label.endswith(":"):
-            print(f"\n{label}")
-        else:
-            print(
-                f"  {label:<18} {a:.4f}               {b:.4f}             {c:.4f}         {d_blend:+.4f}          {d_prior:+.4f}"
-            )
-    print("-" * 95)
+def projection_integrity_check(load_seasons: list = None) -> ProjectionIntegrity:
+    """Check the saved projection files against the saved historical files, see ``bbintegrity``."""
+    return load_and_check(load_seasons if load_seasons is not None else [2023, 2024, 2025])
 
 
 if __name__ == "__main__":
@@ -1996,7 +2227,10 @@ if __name__ == "__main__":
     print("BASEBALL STATISTICS PREPROCESSING")
     print("=" * 90)
 
-    print("\n[1/2] Running preprocessing to generate projection files...")
+    traded_rows_ok = BaseballStatsPreProcess.check_collapse_traded_rows()
+    print(f"\nTraded and namesake partial season rows: {'ok' if traded_rows_ok else 'FAILED'}")
+
+    print("\nRunning preprocessing and integrity checks...")
     baseball_data = BaseballStatsPreProcess(
         load_seasons=[2020, 2021, 2022, 2023, 2024, 2025, 2026],
         new_season=2026,
@@ -2006,10 +2240,9 @@ if __name__ == "__main__":
         load_pitcher_file="player-stats-Pitching.csv",
     )
 
-    print("\n[2/2] Running integrity checks...")
-    projection_integrity_check(load_seasons=[2020, 2021, 2022, 2023, 2024, 2025, 2026], new_season=2026)
-
     print("\n")
     print("=" * 90)
-    print("PREPROCESSING COMPLETE")
+    passed = baseball_data.integrity.passed and traded_rows_ok
+    print("PREPROCESSING COMPLETE" + ("" if passed else ", INTEGRITY CHECK FAILED"))
     print("=" * 90)
+    sys.exit(0 if passed else 1)
@@ -14,10 +14,17 @@ import pandas as pd
 class PlayerProjector:
     """Multi-strategy statistical engine for projecting MLB player performance."""
 
-    def __init__(self, league_averages: Dict[str, float], gate_pa: int = 400):
-        """Initialize the projector with league context."""
+    def __init__(self, league_averages: Dict[str, float], gate_pa: int = 400, aging_scale: float = 1.0):
+        """
+        Initialize the projector with league context.
+
+        :param league_averages: League rates used as the regression mean.
+        :param gate_pa: Volume above which a player's own rate is trusted.
+        :param aging_scale: Stretches the aging curves around 1.0, 0 turns aging off (tuned by bbbacktest).
+        """
         self.lg_avgs = league_averages
         self.gate = gate_pa
+        self.aging_scale = aging_scale
 
         # Higher K = Stronger pull toward league average (less trust in small samples)
         self.k_vals_batter = {
@@ -43,9 +50,39 @@ class PlayerProjector:
         """
         Project stats for every player in the historical DataFrame.
 
-        iterates unique Hashcodes, and
-        calls _project_single_player for each. Players with zero career PA
-        are skipped. Returns one projected row per player.
+        Sorts the history once by Hashcode and Season and runs every projection
+        step (recency-weighted volume, strategy selection, aging, tax, Bayesian
+        regression and sanity caps) as array operations over all players at once.
+        Matches calculate_projected_stats_per_player within float tolerance.
+
+        :param history: Multi-season historical DataFrame with a 'Hashcode' column.
+        :param stats: Stat columns to project (used by dispatcher routing).
+        :param is_p: True for pitchers, False for batters.
+        :return: DataFrame of projected stats, one row per player in order of first appearance.
+        """
+        groups = _PlayerGroups(history)
+        if groups.num_players == 0:
+            return pd.DataFrame()
+        if is_p:
+            return self._project_pitchers_grouped(groups)
+
+        # Pitchers-at-the-plate get the fixed zeroed line, everyone else the batter engine
+        pitcher_hitting = groups.first("Role").astype(str).str.contains("Pitcher", regex=False).to_numpy()
+        if not pitcher_hitting.any():
+            return self._project_batters_grouped(groups)
+        projections = [self._project_pitcher_hitting_grouped(groups, pitcher_hitting, stats)]
+        if not pitcher_hitting.all():
+            projections.insert(0, self._project_batters_grouped(groups.subset(~pitcher_hitting)))
+        player_order = np.concatenate([np.flatnonzero(~pitcher_hitting), np.flatnonzero(pitcher_hitting)])
+        combined = pd.concat(projections, ignore_index=True)
+        return combined.iloc[np.argsort(player_order, kind="stable")].reset_index(drop=True)
+
+    def calculate_projected_stats_per_player(self, history: pd.DataFrame, stats: List[str], is_p: bool) -> pd.DataFrame:
+        """
+        Reference per-player projection, one pandas pass per Hashcode.
+
+        Iterates the unique Hashcodes and calls _project_single_player for each. Kept to check the grouped engine
+        in calculate_projected_stats; quadratic in player count, so avoid for full leagues.
 
         :param history: Multi-season historical DataFrame with a 'Hashcode' column.
         :param stats: Stat columns to project (used by dispatcher routing).
@@ -69,6 +106,34 @@ class PlayerProjector:
         # Return a full DataFrame ready for bbstats_preprocess
         return pd.DataFrame(all_projections)
 
+    def check_projected_stats(
+        self, history: pd.DataFrame, stats: List[str], is_p: bool, tolerance: float = 1e-6
+    ) -> List[str]:
+        """
+        Compare the grouped engine against the per-player reference path.
+
+        :param history: Multi-season historical DataFrame with a 'Hashcode' column.
+        :param stats: Stat columns to project.
+        :param is_p: True for pitchers, False for batters.
+        :param tolerance: Relative and absolute tolerance for numeric columns.
+        :return: Names of columns that differ, empty when the two paths agree.
+        """
+        fast = self.calculate_projected_stats(history, stats, is_p)
+        slow = self.calculate_projected_stats_per_player(history, stats, is_p)
+        mismatched = sorted(set(fast.columns) ^ set(slow.columns))
+        if len(fast) != len(slow):
+            return mismatched + ["<row count>"]
+        for col in [c for c in slow.columns if c in fast.columns]:
+            a, b = fast[col], slow[col]
+            if pd.api.types.is_numeric_dtype(a) and pd.api.types.is_numeric_dtype(b):
+                same = np.isclose(a.to_numpy(dtype=float), b.to_numpy(dtype=float), rtol=tolerance,
+                                  atol=tolerance, equal_nan=True).all()
+            else:
+                same = all(x == y or (pd.isna(x) is True and pd.isna(y) is True) for x, y in zip(a, b))
+            if not same:
+                mismatched.append(col)
+        return mismatched
+
     def _get_projection_batter(self, player_history: pd.DataFrame, stat_col: str, vol_col: str) -> float:
         """
         Project a single per-vol rate for a batter and apply aging/tax.
@@ -649,7 +714,8 @@ class PlayerProjector:
         1.02 from 25-30, mild decline 0.99 at 31-34, accelerating thereafter.
         Pitchers: slower development to ~28 (peak ~1.04), flat prime 1.01 from
         27-30, then quadratic decline (steeper after 34). Result is clipped
-        to [0.80, 1.10] to prevent extreme swings.
+        to [0.80, 1.10] to prevent extreme swings. aging_scale stretches the
+        curve around 1.0 before the clip.
 
         :param age: Player's projected age.
         :param is_p: True for pitchers, False for hitters.
@@ -680,6 +746,8 @@ class PlayerProjector:
                 # Late-career decline (slightly more punishing after 34)
                 decay_factor = 0.0035 if age < 34 else 0.005
                 m = 1.0 - (decay_factor * (age - 30) ** 2)
+        if self.aging_scale != 1.0:
+            m = 1.0 + (m - 1.0) * self.aging_scale
 
         # Sanity clip to prevent wild swings (80% floor, 110% ceiling)
         return np.clip(m, 0.80, 1.10)
@@ -795,6 +863,479 @@ class PlayerProjector:
 
         return rate
 
+    # ------------------------------------------------------------------
+    # Grouped engine: the same steps as above over every player at once.
+    # Per-player arrays are indexed by group, per-season arrays by sorted row.
+    # ------------------------------------------------------------------
+    def _project_batters_grouped(self, groups: _PlayerGroups) -> pd.DataFrame:
+        """
+        Grouped version of _project_batter, one projected row per player.
+
+        :param groups: Sorted player histories.
+        :return: DataFrame of projected batter stat lines.
+        """
+        num_years = groups.counts
+        pa_values = groups.column("PA").fillna(0).to_numpy(dtype=float)
+        weights = groups.recency_weights([1, 3, 6])
+        raw_vol = groups.sum(pa_values * weights, skipna=False) / groups.sum(weights, skipna=False)
+        proj_vol = np.minimum(np.maximum(150, raw_vol), 700)
+
+        result = groups.last_rows()
+        result["PA"] = proj_vol
+        result["Years_Included"] = groups.season_lists()
+        result["Projection_Method"] = np.where(num_years >= 2, "Trend", "Regressed")
+
+        result["BB"] = self._get_projection_batter_grouped(groups, "BB", "PA") * proj_vol
+        result["SO"] = self._get_projection_batter_grouped(groups, "SO", "PA") * proj_vol
+
+        extra = result["BB"] + self._last_or_zero(result, "HBP") + self._last_or_zero(result, "SF")
+        result["AB"] = proj_vol - extra
+        proj_ba = self._get_projection_batter_grouped(groups, "H", "AB")
+        result["H"] = result["AB"] * proj_ba
+
+        proj_h_count = np.maximum(0.1, result["H"])
+        for stat in ["2B", "3B"]:
+            result[stat] = proj_h_count * self._get_projection_batter_grouped(groups, stat, "H")
+
+        result["HR"] = result["AB"] * self._get_projection_batter_grouped(groups, "HR", "AB")
+        result["AVG"] = result["H"] / np.maximum(1, result["AB"])
+        result["OBP"] = (result["H"] + result["BB"]) / proj_vol
+        return result
+
+    def _project_pitchers_grouped(self, groups: _PlayerGroups) -> pd.DataFrame:
+        """
+        Grouped version of _project_pitcher, one projected row per pitcher.
+
+        :param groups: Sorted pitcher histories.
+        :return: DataFrame of projected pitcher stat lines.
+        """
+        num_years = groups.counts
+        ip = groups.column("IP")
+        groups.df["IP_Dec"] = np.trunc(ip) + (ip % 1) * 3.333
+        groups.df["BIP"] = (groups.column("PA") - groups.column("SO") - groups.column("BB")).clip(lower=1)
+
+        last_ip = groups.last(ip.to_numpy(dtype=float))
+        raw_ip = groups.last(groups.column("IP_Dec").to_numpy(dtype=float))
+        is_workhorse = (num_years >= 2) & (last_ip >= 150)
+        proj_ip_true = np.where(
+            is_workhorse, np.maximum(150, np.minimum(raw_ip * 1.02, 210)), np.maximum(50, np.minimum(raw_ip, 170))
+        )
+
+        result = groups.last_rows()
+        result["IP"] = proj_ip_true
+        result["IP_True"] = proj_ip_true
+        result["Years_Included"] = groups.season_lists()
+        result["Projection_Method"] = np.where(num_years >= 2, "Trend", "Regressed")
+
+        for stat in ["BB", "SO", "HR", "PA"]:
+            result[stat] = self._get_projection_pitcher_grouped(groups, stat, "IP") * result["IP"]
+        result["H"] = self._get_projection_pitcher_grouped(groups, "H", "PA") * result["PA"]
+        proj_outs = result["IP"] * 3
+
+        lg_era_per_ip = self.lg_avgs.get("ER_per_IP", 4.25) / 9
+        er_per_ip = np.maximum(self._get_projection_pitcher_grouped(groups, "ER", "IP"), lg_era_per_ip * 0.35)
+        result["ER"] = er_per_ip * result["IP"] / 9
+        result["IP_True"] = result["IP"]
+
+        result["ERA"] = (result["ER"] * 9) / result["IP"]
+        result["WHIP"] = (result["H"] + result["BB"]) / result["IP"]
+        result["AB"] = result["H"] + proj_outs
+        return result
+
+    @staticmethod
+    def _project_pitcher_hitting_grouped(groups: _PlayerGroups, mask: np.ndarray, stats: List[str]) -> pd.DataFrame:
+        """
+        Grouped version of the pitcher-at-the-plate line from _project_single_player.
+
+        :param groups: Sorted player histories.
+        :param mask: Per-player flag, True for the pitchers to project.
+        :param stats: Stat columns zeroed in the projection.
+        :return: DataFrame with one zeroed batting line per flagged player.
+        """
+        pa = groups.last(groups.column("PA").to_numpy())[mask]
+        result = pd.DataFrame({s: np.zeros(len(pa)) for s in stats})
+        result["PA"] = pa
+        result["AB"], result["SO"], result["AVG"] = pa, pa * 0.50, 0.0
+        result["Projection_Method"] = "Pitcher-Hitting"
+        return result
+
+    @staticmethod
+    def _last_or_zero(result: pd.DataFrame, col: str):
+        """Most recent season value of col per player, 0 when the column is missing."""
+        return result[col] if col in result.columns else 0
+
+    def _get_projection_batter_grouped(self, groups: _PlayerGroups, stat_col: str, vol_col: str) -> np.ndarray:
+        """
+        Grouped version of _get_projection_batter.
+
+        :param groups: Sorted player histories.
+        :param stat_col: Stat column to project (e.g. 'H', 'BB', 'SO').
+        :param vol_col: Volume denominator column (e.g. 'PA', 'AB', 'H').
+        :return: Projected per-vol rate per player, clipped to [0, 0.480] and capped.
+        """
+        num_years = groups.counts
+        career_vol = groups.sum(groups.column(vol_col).to_numpy(dtype=float))
+        age_sim = groups.last(groups.column("Age").to_numpy(dtype=float)).astype(int) + 1
+        stat = groups.column(stat_col).to_numpy(dtype=float)
+        vol = groups.column(vol_col).to_numpy(dtype=float)
+
+        # 1. STRATEGY SELECTION - every strategy is evaluated, then picked per player
+        with np.errstate(divide="ignore", invalid="ignore"):
+            single_year = (num_years == 1) & (career_vol >= 300)
+            low_volume = ((career_vol / num_years) < 100) | (num_years < 2)
+        w_avg_rate = self._weighted_career_average_grouped(groups, stat_col, vol_col)
+        trend = (
+            ~single_year & ~low_volume & self._is_consistent_trend_grouped(groups, stat_col, vol_col) & (num_years >= 2)
+        )
+        trend_rate = self._linear_regression_grouped(groups, stat_col, vol_col, w_avg_rate)
+        is_proven = (num_years >= 3) & (career_vol >= 1000)
+        if stat_col == "HR":
+            trend_choice = np.where(is_proven, w_avg_rate, trend_rate)
+            use_max = ~is_proven & ((age_sim <= 25) | ((age_sim >= 27) & (age_sim <= 32)))
+        else:
+            trend_choice = trend_rate
+            use_max = (age_sim <= 25) | ((age_sim >= 27) & (age_sim <= 32))
+        trend_choice = np.where(use_max, np.maximum(trend_rate, w_avg_rate), trend_choice)
+
+        average_rate = w_avg_rate
+        if stat_col in ["H", "BB"]:
+            recent_rate = groups.last(stat) / np.maximum(1, groups.last(vol))
+            anchored = (age_sim >= 27) & (age_sim <= 33) & (career_vol >= 600)
+            average_rate = np.where(anchored, np.maximum(w_avg_rate, recent_rate * 0.93), w_avg_rate)
+
+        player_rate = np.select(
+            [single_year, low_volume, trend],
+            [
+                self._single_year_starter_grouped(groups, stat_col, vol_col),
+                self._regress_to_mean_grouped(groups, stat_col, vol_col),
+                trend_choice,
+            ],
+            default=average_rate,
+        )
+
+        # 2. AGING, 3. UNPROVEN TAX
+        trust = np.minimum(career_vol / self.gate, 1.0)
+        multiplier = 1.0 + (self._get_aging_multiplier_grouped(age_sim, False) - 1.0) * trust
+        if vol_col == "H":
+            multiplier = 1.0 + (multiplier - 1.0) * 0.5
+        player_rate = player_rate * multiplier
+        unproven_factor = np.clip(1.0 - (career_vol / 500), 0, 1)
+        tax = 1.0 - (0.04 * unproven_factor) if stat_col != "SO" else 1.0 + (0.06 * unproven_factor)
+        player_rate = player_rate * tax
+
+        # 4. BAYESIAN REGRESSION
+        k = self.k_vals_batter.get(stat_col, self.k_vals_batter["default"])
+        lg_rate = self.lg_avgs.get(
+            f"{stat_col}_per_{vol_col}",
+            self.lg_avgs.get("H_per_AB", 0.258) if stat_col == "H" and vol_col == "AB" else 0.240,
+        )
+        final_rate = (player_rate * career_vol + k * lg_rate) / (career_vol + k)
+        return self._apply_sanity_caps_grouped(np.clip(final_rate, 0, 0.480), stat_col, False, groups, vol_col)
+
+    def _get_projection_pitcher_grouped(self, groups: _PlayerGroups, stat_col: str, vol_col: str) -> np.ndarray:
+        """
+        Grouped version of _get_projection_pitcher.
+
+        :param groups: Sorted pitcher histories.
+        :param stat_col: Stat column to project (e.g. 'H', 'BB', 'SO', 'ER').
+        :param vol_col: Volume denominator column (e.g. 'PA', 'IP').
+        :return: Projected per-vol rate per pitcher.
+        """
+        num_years = groups.counts
+        career_vol = groups.sum(groups.column(vol_col).to_numpy(dtype=float))
+        age_sim = groups.last(groups.column("Age").to_numpy(dtype=float)).astype(int) + 1
+        is_proven = (num_years >= 3) & (career_vol >= 1000)
+
+        # 1. STRATEGY SELECTION
+        w_avg_rate = self._weighted_career_average_grouped(groups, stat_col, vol_col)
+        trend_rate = self._linear_regression_grouped(groups, stat_col, vol_col, w_avg_rate)
+        blended = (trend_rate * 0.5) + (w_avg_rate * 0.5)
+        if stat_col == "SO":
+            blended = np.where(is_proven, w_avg_rate, blended)
+        player_rate = np.where(
+            (num_years < 2) | (career_vol < 150), self._regress_to_mean_grouped(groups, stat_col, vol_col), blended
+        )
+
+        # 2. AGING
+        raw_m = self._get_aging_multiplier_grouped(age_sim, True)
+        if stat_col in ["H", "BB", "ER"]:
+            declining = ((1.0 + (1.0 - raw_m)) + (1.0 / raw_m)) / 2 if stat_col == "BB" else 1.0 / raw_m
+            multiplier = np.where(raw_m < 1.0, declining, raw_m)
+        elif stat_col == "SO":
+            multiplier = np.where(is_proven, 1.0, raw_m)
+        else:
+            multiplier = raw_m
+        player_rate = player_rate * multiplier
+
+        # 3. UNPROVEN TAX
+        unproven_factor = np.clip(1.0 - (career_vol / 250), 0, 1)
+        tax = 1.0 + (0.05 * unproven_factor) if stat_col in ["H", "BB", "ER"] else 1.0 - (0.05 * unproven_factor)
+        player_rate = player_rate * tax
+
+        # 4. OBP Anchor
+        if stat_col in ["H", "BB"]:
+            lg_target = self.lg_avgs.get(f"{stat_col}_per_{vol_col}", 0.240)
+            player_rate = np.where(
+                player_rate < (lg_target * 0.87), (player_rate * 0.70) + (lg_target * 0.30), player_rate
+            )
+
+        # 5. BAYESIAN REGRESSION
+        k = self.k_vals_pitcher.get(stat_col, self.k_vals_pitcher["default"])
+        lg_rate = self.lg_avgs.get(f"{stat_col}_per_{vol_col}", 0.240)
+        final_rate = (player_rate * career_vol + k * lg_rate) / (career_vol + k)
+
+        # 6. Gravity anchor, 7. outlier brake
+        if stat_col == "ER":
+            final_rate = np.where(final_rate < 0.085, (final_rate + 0.108) / 2, final_rate)
+        if stat_col == "ER" and vol_col == "IP_Dec":
+            lg_er_per_ip = self.lg_avgs.get("ER_per_IP", 4.25) / 9
+            final_rate = np.maximum(final_rate, np.where(career_vol < 150, lg_er_per_ip * 0.9, lg_er_per_ip * 0.4))
+
+        return self._apply_sanity_caps_grouped(final_rate, stat_col, True, groups, vol_col)
+
+    def _single_year_starter_grouped(self, groups: _PlayerGroups, stat_col: str, vol_col: str) -> np.ndarray:
+        """Grouped version of _project_single_year_starter, uses each player's most recent season."""
+        stat = groups.last(groups.column(stat_col).to_numpy(dtype=float))
+        vol = groups.last(groups.column(vol_col).to_numpy(dtype=float))
+        actual_rate = stat / np.maximum(1, vol)
+        lg_rate = self.lg_avgs.get(f"{stat_col}_per_{vol_col}", 0.10)
+        blend_weight = 0.90 if stat_col in ["HR", "2B", "3B"] else 0.80
+        return (actual_rate * blend_weight) + (lg_rate * (1 - blend_weight))
+
+    def _regress_to_mean_grouped(self, groups: _PlayerGroups, stat_col: str, vol_col: str) -> np.ndarray:
+        """Grouped version of _regress_to_mean: career totals regressed with a volume-scaled K."""
+        career_total = groups.sum(groups.column(stat_col).to_numpy(dtype=float))
+        career_vol = groups.sum(groups.column(vol_col).to_numpy(dtype=float))
+        is_p = "IP" in groups.df.columns
+
+        k_map = self.k_vals_pitcher if is_p else self.k_vals_batter
+        k = 800 * (1 - np.clip(career_vol / 3000, 0, 1)) + k_map.get(stat_col, k_map.get("default", 150))
+
+        if stat_col in ["2B", "3B", "HR"] and not is_p and vol_col == "H":
+            career_h = groups.sum(groups.column("H").to_numpy(dtype=float))
+            lg_ratio = self.lg_avgs.get(f"{stat_col}_per_{vol_col}")
+            if lg_ratio is None:
+                lg_ratio = {"HR": 0.14, "2B": 0.19, "3B": 0.015}.get(stat_col, 0.10)
+            return (career_total + 10 * lg_ratio) / (career_h + 10)
+
+        lg_rate = self.lg_avgs.get(f"{stat_col}_per_{vol_col}")
+        if lg_rate is None:
+            if stat_col == "H" and vol_col == "AB":
+                lg_rate = self.lg_avgs.get("H_per_AB", 0.258)
+            elif stat_col == "H" and vol_col == "BIP":
+                lg_rate = self.lg_avgs.get("H_per_BIP", 0.306)
+            else:
+                lg_rate = self.lg_avgs.get(f"{stat_col}_per_PA", 0.10)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            regressed = (career_total + k * lg_rate) / (career_vol + k)
+        return np.where(career_vol + k == 0, lg_rate, regressed)
+
+    def _linear_regression_grouped(
+        self, groups: _PlayerGroups, stat_col: str, vol_col: str, w_avg: np.ndarray
+    ) -> np.ndarray:
+        """
+        Grouped version of _linear_regression using the closed-form least squares fit per player.
+        Players whose rates are not all finite fall back to the weighted average, as polyfit would.
+
+        :param groups: Sorted player histories.
+        :param stat_col: Stat column to project.
+        :param vol_col: Volume denominator column.
+        :param w_avg: Weighted career average per player from _weighted_career_average_grouped.
+        :return: Projected per-vol rate per player from the trend line.
+        """
+        rates = groups.rates(stat_col, vol_col)
+        num_years = groups.counts
+        career_vol = groups.sum(groups.column(vol_col).to_numpy(dtype=float))
+
+        x = groups.positions.astype(float)
+        x_mean = (num_years - 1) / 2.0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            y_mean = groups.sum(rates, skipna=False) / num_years
+            dx = x - groups.expand(x_mean)
+            sxx = groups.sum(dx * dx, skipna=False)
+            slope = np.where(sxx > 0, groups.sum(dx * (rates - groups.expand(y_mean)), skipna=False) / sxx, 0.0)
+        intercept = y_mean - slope * x_mean
+        fit_failed = ~np.isfinite(groups.sum(rates, skipna=False))
+
+        is_proven = (num_years >= 3) & (career_vol >= 1000)
+        dampener = np.where(is_proven, 0.95, 0.8 * np.clip(career_vol / 1000, 0, 1))
+        if stat_col == "HR":
+            max_slope = np.where(is_proven, 0.035, 0.020)
+        elif stat_col in ["2B", "H"]:
+            max_slope = np.where(is_proven, 0.035, 0.012)
+        else:
+            max_slope = np.full(len(num_years), 0.012)
+        clipped_slope = np.clip(slope, -max_slope, max_slope)
+        slope_was_clipped = np.abs(clipped_slope - slope) > 0.001
+        proj = (clipped_slope * dampener * num_years) + intercept
+
+        use_w_avg = slope_was_clipped & (clipped_slope < 0) & (proj > 0) & (proj > w_avg * 1.2)
+        proj = np.where(use_w_avg, w_avg, proj)
+
+        max_allowed = groups.max(rates) * np.where(is_proven, 1.20, 1.12)
+        return np.where(fit_failed, w_avg, np.maximum(0.0, np.minimum(proj, max_allowed)))
+
+    def _weighted_career_average_grouped(self, groups: _PlayerGroups, stat_col: str, vol_col: str) -> np.ndarray:
+        """
+        Grouped version of _weighted_career_average: recency weights, or volume weights when one
+        tiny season would otherwise dominate.
+        """
+        vol_values = groups.column(vol_col).to_numpy(dtype=float)
+        rates = groups.rates(stat_col, vol_col)
+        lg_rate = self.lg_avgs.get(f"{stat_col}_per_{vol_col}", 0.240)
+        rates = np.where(np.isfinite(rates), rates, lg_rate)
+        vol_values = np.where(np.isfinite(vol_values), vol_values, 1)
+
+        min_vol = groups.min(vol_values)
+        total_vol = groups.sum(vol_values, skipna=False)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            by_volume = (min_vol < 50) & (groups.counts >= 2) & ((min_vol / total_vol) < 0.10)
+        weights = np.where(groups.expand(by_volume), vol_values, groups.recency_weights([2, 4, 6]))
+        return groups.sum(rates * weights, skipna=False) / groups.sum(weights, skipna=False)
+
+    def _is_consistent_trend_grouped(self, groups: _PlayerGroups, stat_col: str, vol_col: str) -> np.ndarray:
+        """Grouped version of _is_consistent_trend, True where every season-over-season change has one sign."""
+        rates = groups.rates(stat_col, vol_col)
+        diffs = np.diff(rates, prepend=np.nan)
+        within = groups.positions > 0  # the first season of a player has no prior season to compare
+        falls = within & ~(diffs >= 0)
+        rises = within & ~(diffs <= 0)
+        return (groups.counts >= 2) & ((groups.sum(falls) == 0) | (groups.sum(rises) == 0))
+
+    def _get_aging_multiplier_grouped(self, age: np.ndarray, is_p: bool) -> np.ndarray:
+        """Grouped version of _get_aging_multiplier, same curves and [0.80, 1.10] clip."""
+        age = np.asarray(age, dtype=float)
+        if not is_p:
+            m = np.select(
+                [age <= 24, age <= 30, age <= 34],
+                [-0.0025 * (age - 27) ** 2 + 1.02, 1.00, 0.99],
+                default=1.0 - (0.004 * (age - 34) ** 2),
+            )
+        else:
+            decay_factor = np.where(age < 34, 0.0035, 0.005)
+            m = np.select(
+                [age <= 26, age <= 30],
+                [-0.0015 * (age - 28) ** 2 + 1.02, 1.00],
+                default=1.0 - (decay_factor * (age - 30) ** 2),
+            )
+        if self.aging_scale != 1.0:
+            m = 1.0 + (m - 1.0) * self.aging_scale
+        return np.clip(m, 0.80, 1.10)
+
+    @staticmethod
+    def _apply_sanity_caps_grouped(
+        rate: np.ndarray, stat_col: str, is_p: bool, groups: _PlayerGroups, vol_col: str
+    ) -> np.ndarray:
+        """Grouped version of _apply_sanity_caps, the ISO gate uses career totals per player."""
+        if not is_p:
+            caps = {"HBP": 0.035, "BB": 0.220, "H": 0.380}
+            if stat_col in caps:
+                rate = np.minimum(rate, caps[stat_col])
+            if stat_col == "HR":
+                h = groups.sum(groups.column("H").to_numpy(dtype=float))
+                tb = groups.sum(
+                    (groups.column("H") + groups.column("2B") + 2 * groups.column("3B") + 3 * groups.column("HR"))
+                    .to_numpy(dtype=float)
+                )
+                ab = groups.sum(groups.column("AB").to_numpy(dtype=float))
+                career_iso = (tb - h) / np.maximum(1, ab)
+                rate = np.where(career_iso < 0.100, np.minimum(rate, 0.040), rate)
+        else:
+            if stat_col == "SO":
+                rate = np.maximum(rate, 0.100 if vol_col == "IP" else 0.080)
+            if stat_col == "BB" and vol_col != "IP":
+                rate = np.minimum(rate, 0.130)
+            if stat_col == "H":
+                rate = np.minimum(rate, 1.000 if vol_col == "IP" else 0.330)
+        return rate
+
+
+class _PlayerGroups:
+    """
+    Player histories sorted once by Hashcode (first appearance order) and Season.
+
+    Attributes:
+        df: history rows in sorted order with a fresh RangeIndex
+        starts: first sorted row of each player
+        counts: seasons (rows) per player
+        positions: position of each row within its player's history, 0 is the oldest season
+    """
+
+    def __init__(self, history: pd.DataFrame) -> None:
+        """
+        :param history: Multi-season historical DataFrame with 'Hashcode' and 'Season' columns.
+        """
+        codes, _ = pd.factorize(history["Hashcode"])
+        keep = codes >= 0
+        order = np.lexsort((history["Season"].to_numpy()[keep], codes[keep]))  # lexsort is stable
+        self.df = history[keep].iloc[order].reset_index(drop=True)
+        sorted_codes = codes[keep][order]
+        self.num_players = int(sorted_codes.max()) + 1 if len(sorted_codes) > 0 else 0
+        self.counts = np.bincount(sorted_codes, minlength=self.num_players)
+        self.starts = np.concatenate([[0], np.cumsum(self.counts)[:-1]]).astype(np.int64)
+        self.row_counts = np.repeat(self.counts, self.counts)
+        self.positions = np.arange(len(self.df)) - np.repeat(self.starts, self.counts)
+        return
+
+    def subset(self, mask: np.ndarray) -> _PlayerGroups:
+        """Groups for the players where mask is True, order kept."""
+        return _PlayerGroups(self.df[np.repeat(mask, self.counts)])
+
+    def column(self, col: str) -> pd.Series:
+        """Sorted per-season column."""
+        return self.df[col]
+
+    def expand(self, per_player: np.ndarray) -> np.ndarray:
+        """Broadcast a per-player array to the player's season rows."""
+        return np.repeat(per_player, self.counts)
+
+    def sum(self, values: np.ndarray, skipna: bool = True) -> np.ndarray:
+        """Per-player sum, NaN counts as 0 like pandas Series.sum unless skipna is False."""
+        values = np.asarray(values, dtype=float)
+        if skipna:
+            values = np.where(np.isnan(values), 0.0, values)
+        return np.add.reduceat(values, self.starts)
+
+    def min(self, values: np.ndarray) -> np.ndarray:
+        """Per-player minimum."""
+        return np.minimum.reduceat(np.asarray(values, dtype=float), self.starts)
+
+    def max(self, values: np.ndarray) -> np.ndarray:
+        """Per-player maximum, NaN propagates like ndarray.max."""
+        return np.maximum.reduceat(np.asarray(values, dtype=float), self.starts)
+
+    def first(self, col: str) -> pd.Series:
+        """Oldest season value of col per player."""
+        return self.df[col].iloc[self.starts].reset_index(drop=True)
+
+    def last(self, values: np.ndarray) -> np.ndarray:
+        """Most recent season value per player."""
+        return np.asarray(values)[self.starts + self.counts - 1]
+
+    def last_rows(self) -> pd.DataFrame:
+        """Most recent season row per player, the base of each projected line."""
+        return self.df.iloc[self.starts + self.counts - 1].reset_index(drop=True)
+
+    def season_lists(self) -> List[list]:
+        """Seasons per player, oldest first."""
+        seasons = self.df["Season"].tolist()
+        return [seasons[start : start + count] for start, count in zip(self.starts, self.counts)]
+
+    def rates(self, stat_col: str, vol_col: str) -> np.ndarray:
+        """Per-season stat / vol, zero volume counts as 1."""
+        return (self.df[stat_col] / self.df[vol_col].replace(0, 1)).to_numpy(dtype=float)
+
+    def recency_weights(self, base: List[float]) -> np.ndarray:
+        """
+        Per-season weights taken from the tail of base, cycling base when a player has more seasons than
+        weights, the same as np.resize(base[-n:], n) in the per-player path.
+        """
+        base = np.asarray(base, dtype=float)
+        size = len(base)
+        index = np.where(self.row_counts >= size, self.positions % size, size - self.row_counts + self.positions)
+        return base[index]
+
 
 if __name__ == "__main__":
     import numpy as np
@@ -914,23 +1455,19 @@ if __name__ == "__main__":
     )
 
     # 3. Process Volume/Role
-    processed_rows = []
-    for _, row in raw_data.iterrows():
-        r = row.to_dict()
-        if "IP" in r and pd.notnull(r["IP"]):
-            outs = (int(r["IP"]) * 3) + np.round((r["IP"] % 1) * 10)
-            r["PA"] = outs + r["H"] + r.get("BB", 0)
-            r["is_pitcher"] = True
-        else:
-            r["PA"] = r.get("AB", 0) + r.get("BB", 0) + r.get("HBP", 0) + r.get("SF", 0)
-            r["is_pitcher"] = False
-        processed_rows.append(r)
-
-    df_ready = pd.DataFrame(processed_rows)
+    df_ready = raw_data.copy()
+    df_ready["is_pitcher"] = df_ready["IP"].notna()
+    outs = np.trunc(df_ready["IP"]) * 3 + np.round((df_ready["IP"] % 1) * 10)
+    batter_pa = df_ready[["AB", "BB", "HBP", "SF"]].fillna(0).sum(axis=1)
+    df_ready["PA"] = np.where(df_ready["is_pitcher"], outs + df_ready["H"] + df_ready["BB"].fillna(0), batter_pa)
+    last_season = df_ready.drop_duplicates("Player", keep="last").set_index("Player")[["H", "BB", "PA"]]
 
     # 4. RUN PROJECTIONS
     h_proj = projector.calculate_projected_stats(df_ready[~df_ready["is_pitcher"]], [], is_p=False)
     p_proj = projector.calculate_projected_stats(df_ready[df_ready["is_pitcher"]], [], is_p=True)
+    for label, is_pitcher in [("Hitters", False), ("Pitchers", True)]:
+        diffs = projector.check_projected_stats(df_ready[df_ready["is_pitcher"] == is_pitcher], [], is_p=is_pitcher)
+        print(f"{label}: grouped engine matches per-player path: {not diffs} {diffs if diffs else ''}")
 
     # 5. DIAGNOSTIC OUTPUT: HITTERS (OBP Focus)
     print("\n" + "=" * 115)
@@ -938,13 +1475,13 @@ if __name__ == "__main__":
     print("=" * 115)
     print(f"{'Player':<18} | {'PA':<5} | {'BA':<6} | {'BB/PA':<6} | {'OBP':<6} | {'HR':<5} | {'25 OBP':<6} | {'Delta'}")
     print("-" * 115)
-    for _, row in h_proj.iterrows():
-        p_25 = df_ready[df_ready["Player"] == row["Player"]].iloc[-1]
-        obp_25 = (p_25["H"] + p_25["BB"]) / p_25["PA"]
-        bb_pa = row["BB"] / row["PA"]
-        delta = row["OBP"] - obp_25
+    hitters = h_proj.join(last_season, on="Player", rsuffix="_25")  # one join instead of a lookup per player
+    hitters["OBP_25"] = (hitters["H_25"] + hitters["BB_25"]) / hitters["PA_25"]
+    hitters["BB_PA"] = hitters["BB"] / hitters["PA"]
+    for row in hitters.itertuples(index=False):
         print(
-            f"{row['Player']:<18} | {int(row['PA']):<5} | {row['AVG']:<6.3f} | {bb_pa:<6.3f} | {row['OBP']:<6.3f} | {int(row['HR']):<5} | {obp_25:<6.3f} | {delta:+.3f}"
+            f"{row.Player:<18} | {int(row.PA):<5} | {row.AVG:<6.3f} | {row.BB_PA:<6.3f} | {row.OBP:<6.3f} | "
+            f"{int(row.HR):<5} | {row.OBP_25:<6.3f} | {row.OBP - row.OBP_25:+.3f}"
         )
 
     # 6. DIAGNOSTIC OUTPUT: PITCHERS (OBP Against Focus)
@@ -956,20 +1493,14 @@ if __name__ == "__main__":
         f"{'Player':<18} | {'IP':<6} | {'H/PA':<6} | {'BB/PA':<6} | {'OBP-AG':<6} | {'WHIP':<6} | {'25 OBP-AG':<8} | {'Delta'}"
     )
     print("-" * 115)
-    for _, row in p_proj.iterrows():
-        p_25 = df_ready[df_ready["Player"] == row["Player"]].iloc[-1]
-
-        # Calculate 2025 OBP-Against (Baserunners / Batters Faced)
-        obp_ag_25 = (p_25["H"] + p_25["BB"]) / p_25["PA"]
-
-        # Projection Rates
-        h_pa = row["H"] / row["PA"]
-        bb_pa = row["BB"] / row["PA"]
-        obp_ag_proj = (row["H"] + row["BB"]) / row["PA"]
-
-        delta = obp_ag_proj - obp_ag_25
-
+    pitchers = p_proj.join(last_season, on="Player", rsuffix="_25")
+    pitchers["OBP_AG_25"] = (pitchers["H_25"] + pitchers["BB_25"]) / pitchers["PA_25"]  # baserunners / batters faced
+    pitchers["H_PA"] = pitchers["H"] / pitchers["PA"]
+    pitchers["BB_PA"] = pitchers["BB"] / pitchers["PA"]
+    pitchers["OBP_AG"] = (pitchers["H"] + pitchers["BB"]) / pitchers["PA"]
+    for row in pitchers.itertuples(index=False):
         print(
-            f"{row['Player']:<18} | {row['IP']:<6.1f} | {h_pa:<6.3f} | {bb_pa:<6.3f} | {obp_ag_proj:<6.3f} | {row['WHIP']:<6.2f} | {obp_ag_25:<8.3f} | {delta:+.3f}"
+            f"{row.Player:<18} | {row.IP:<6.1f} | {row.H_PA:<6.3f} | {row.BB_PA:<6.3f} | {row.OBP_AG:<6.3f} | "
+            f"{row.WHIP:<6.2f} | {row.OBP_AG_25:<8.3f} | {row.OBP_AG - row.OBP_AG_25:+.3f}"
         )
     print("=" * 115)
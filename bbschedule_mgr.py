@@ -13,6 +13,23 @@ import pandas as pd
 from bblogger import logger
 
 
+def read_schedule_csv(csv_path: str) -> Optional[pd.DataFrame]:
+    """Read a downloaded schedule file, None if it does not exist.
+
+    Does not need the player data, so it can run on another thread while the stats load.
+
+    Args:
+        csv_path: Schedule CSV path, e.g. "2026 MLB Schedule.csv"
+
+    Returns:
+        Schedule rows (Date, Time, Away_Team, Home_Team, Away_Score, Home_Score) or None
+    """
+    if not os.path.exists(csv_path):
+        logger.debug(f"Schedule CSV not found: {csv_path}")
+        return None
+    return pd.read_csv(csv_path)
+
+
 class ScheduleManager:
     """Manages baseball schedule loading, parsing, and date calculations.
 
@@ -43,7 +60,7 @@ class ScheduleManager:
         self._playoff_dates = []  # ["2026-10-01", ...] for playoffs
         self._series_winners = {}  # {(away, home): winner_team} for completed series
 
-    def load_from_csv(self, csv_path: str = None) -> bool:
+    def load_from_csv(self, csv_path: str = None, df: Optional[pd.DataFrame] = None) -> bool:
         """Load schedule from downloaded CSV file.
 
         Priority:
@@ -51,53 +68,61 @@ class ScheduleManager:
         2. Check for default file "{new_season} MLB Schedule.csv"
         3. Return False if not found
 
+        Args:
+            csv_path: Schedule CSV path
+            df: The file already read with read_schedule_csv(), read here when None
+
         Returns:
             True if loaded successfully, False otherwise
         """
         if csv_path is None:
             csv_path = f"{self.new_season} MLB Schedule.csv"
 
-        if not os.path.exists(csv_path):
-            logger.debug(f"Schedule CSV not found: {csv_path}")
+        if df is None:
+            df = read_schedule_csv(csv_path)
+        if df is None:
             return False
 
-        df = pd.read_csv(csv_path)
         valid_teams = set(self.baseball_data.get_all_team_names())
 
         self.schedule = []
         self._schedule_dates = []
         self._schedule_times = {}
+        times_12hr = {}  # each distinct start time is converted once
 
-        # Load ALL games from CSV
-        for date in sorted(df["Date"].unique()):
-            day_games = df[df["Date"] == date]
+        # Load ALL games from CSV, one group of rows per date in date order
+        for date, day_games in df.groupby("Date", sort=True):
             day_schedule = ScheduleDay(date)
 
-            for _, row in day_games.iterrows():
-                away, home = row["Away_Team"], row["Home_Team"]
-
+            for away, home, time_24h, away_score, home_score in zip(
+                day_games["Away_Team"].tolist(),
+                day_games["Home_Team"].tolist(),
+                day_games["Time"].tolist(),
+                day_games["Away_Score"].tolist(),
+                day_games["Home_Score"].tolist(),
+            ):
                 # Skip if teams don't match sim data
                 if away not in valid_teams or home not in valid_teams:
                     logger.warning(f"Skipping game: {away} @ {home} - team not found")
                     continue
 
                 # Check if game already played (has score or no time)
-                is_completed = (pd.isna(row["Time"]) or not row["Time"]) or (
-                        row["Away_Score"] > 0 or row["Home_Score"] > 0
-                )
+                is_completed = (pd.isna(time_24h) or not time_24h) or (away_score > 0 or home_score > 0)
 
                 # Get time for future games
                 game_time = None
-                if not is_completed and pd.notna(row["Time"]) and row["Time"]:
-                    game_time = self._convert_time_12hr(str(row["Time"]))
+                if not is_completed:
+                    if time_24h not in times_12hr:
+                        times_12hr[time_24h] = self._convert_time_12hr(str(time_24h))
+                    game_time = times_12hr[time_24h]
                     self._schedule_times[(away, home)] = game_time
 
                 # Create GameMatchup object
                 game = GameMatchup(home=home, away=away, time=game_time)
                 if is_completed:
                     game.completed = True
-                    game.home_score = row["Home_Score"]
-                    game.away_score = row["Away_Score"]
+                    game.home_score = home_score
+                    game.away_score = away_score
 
                 day_schedule.games.append(game)
 
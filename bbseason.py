@@ -11,6 +11,7 @@ Classes:
 import datetime
 import queue
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
@@ -19,6 +20,7 @@ import pandas as pd
 import bb_aigm_manager
 import bbgame
 from bbgame import GameResult
+from bboutput import OutputDispatcher
 import bbschedule_mgr
 import bbstats
 from bblogger import logger
@@ -34,10 +36,11 @@ class OutputCategory:
     # Season lifecycle
     SEASON_START = "season_start"
     SEASON_END = "season_end"
+    SEASON_REPORT = "season_report"  # end of season team stats, one team section per call
 
     # Day simulation
     DAY_SCHEDULE = "day_schedule"
-    DAY_PROGRESS = "day_progress"
+    DAY_PROGRESS = "day_progress"  # a dot per game started, may be dropped by async output
     DAY_STANDINGS = "day_standings"
 
     # Game results
@@ -57,6 +60,7 @@ class OutputCategory:
 
     # Progress
     SIM_PROGRESS = "sim_progress"
+    LOAD_PROGRESS = "load_progress"  # metadata: step, done, total
 
 
 def console_output_handler(category: str, text: str, metadata: Optional[Dict] = None) -> None:
@@ -129,16 +133,26 @@ class BaseballSeason:
         season_team_to_follow: Optional[List[str]] = None,
         load_batter_file: str = "player-projected-stats-pp-Batting.csv",
         load_pitcher_file: str = "player-projected-stats-pp-Pitching.csv",
+        load_historical_batter_file: str = "historical-Batting.csv",
+        load_historical_pitcher_file: str = "historical-Pitching.csv",
         schedule: Optional[list] = None,
         load_schedule_file: Optional[str] = None,
         suppress_console_output: bool = False,
         obp_adjustment: Optional[float] = None,
         output_handler: Optional[OutputHandlerType] = None,
         play_by_play_callback_factory: Optional[PlayByPlayCallbackFactory] = None,
+        async_output: bool = False,
     ) -> None:
-        """Initialize season with data loading, schedule creation, and GM setup."""
+        """
+        Initialize season with data loading, schedule creation, and GM setup.
+        async_output calls the output handler on a dispatch thread (see bboutput), so slow output does not stall
+        the simulation, the per game progress dots are dropped rather than waited for when the output falls far
+        behind. It is ignored in interactive mode, where lineups and prompts are printed from the game threads.
+        """
         self.standings_lock = threading.Lock()  # safely modify standings in a threaded environment
         self.output_handler = output_handler if output_handler is not None else console_output_handler
+        if async_output and not season_interactive and self.output_handler is not null_output_handler:
+            self.output_handler = OutputDispatcher(self.output_handler, drop_categories=[OutputCategory.DAY_PROGRESS])
         self.play_by_play_callback_factory = play_by_play_callback_factory
         self.season_day_num = 0  # placeholder, will be set after partial standings
         self.season_length = season_length
@@ -156,14 +170,23 @@ class BaseballSeason:
         self.team_to_follow = season_team_to_follow if season_team_to_follow is not None else []
         self.obp_adjustment = obp_adjustment
         logger.debug("Initializing BaseballSeason with seasons: {}, new season: {}", load_seasons, new_season)
-        self.baseball_data = bbstats.BaseballStats(
-            load_seasons=self.load_seasons,
-            new_season=new_season,
-            include_leagues=include_leagues,
-            load_batter_file=load_batter_file,
-            load_pitcher_file=load_pitcher_file,
-            suppress_console_output=suppress_console_output,
-        )
+        # the schedule file does not depend on the player data, read it while the stats load
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="schedule-load") as executor:
+            schedule_file = None
+            if schedule is None:
+                schedule_path = load_schedule_file or f"{new_season} MLB Schedule.csv"
+                schedule_file = executor.submit(bbschedule_mgr.read_schedule_csv, schedule_path)
+            self.baseball_data = bbstats.BaseballStats(
+                load_seasons=self.load_seasons,
+                new_season=new_season,
+                include_leagues=include_leagues,
+                load_batter_file=load_batter_file,
+                load_pitcher_file=load_pitcher_file,
+                suppress_console_output=suppress_console_output,
+                load_historical_batter_file=load_historical_batter_file,
+                load_historical_pitcher_file=load_historical_pitcher_file,
+            )
+        self._load_progress("player stats", 1)
         self.teams = (
             list(self.baseball_data.batting_data.Team.unique()) if team_list == [] or team_list is None else team_list
         )
@@ -175,7 +198,8 @@ class BaseballSeason:
 
         self.schedule = [] if schedule is None else schedule
         if schedule is None:
-            self.create_schedule(csv_path=load_schedule_file)
+            self.create_schedule(csv_path=load_schedule_file, schedule_file=schedule_file.result())
+        self._load_progress("schedule", 2)
 
         # Initialize team standings from partial season data
         self.team_win_loss = {}
@@ -191,6 +215,7 @@ class BaseballSeason:
 
         # Link team_games_played to baseball_data for prorated 2025 stats (Phase 2: Stats Enhancement)
         self.baseball_data.team_games_played = self.team_games_played
+        self._load_progress("standings", 3)
 
         self.team_city_dict = self.baseball_data.get_all_team_city_names()
 
@@ -204,9 +229,25 @@ class BaseballSeason:
                     assessment_frequency=30,  # Will assess every 30 games
                 )
         logger.info(f"Initialized {len(self.gm_managers)} AI General Managers")
+        self._load_progress("general managers", 4)
 
         return
 
+    def _load_progress(self, step: str, done: int, total: int = 4) -> None:
+        """
+        report a finished startup step to the output handler
+        :param step: what was loaded, e.g. "schedule"
+        :param done: steps finished so far
+        :param total: steps in __init__
+        :return: None
+        """
+        self.output_handler(
+            OutputCategory.LOAD_PROGRESS,
+            f"Loaded {step} ({done}/{total})\n",
+            metadata={"step": step, "done": done, "total": total},
+        )
+        return
+
     def get_team_names(self) -> List[str]:
         return self.teams
 
@@ -243,7 +284,12 @@ class BaseballSeason:
         """Return today's date formatted for display."""
         return datetime.datetime.now().strftime("%B %d, %Y")
 
-    def create_schedule(self, schedule: Optional[list] = None, csv_path: Optional[str] = None) -> None:
+    def create_schedule(
+        self,
+        schedule: Optional[list] = None,
+        csv_path: Optional[str] = None,
+        schedule_file: Optional[pd.DataFrame] = None,
+    ) -> None:
         """
         Create or load schedule for the season.
 
@@ -255,6 +301,7 @@ class BaseballSeason:
         Args:
             schedule: Optional pre-built schedule (pass-through, uses as-is)
             csv_path: Optional path to CSV schedule file
+            schedule_file: csv_path already read by bbschedule_mgr.read_schedule_csv(), read here when None
         """
         # 1. If schedule list provided, use it
         if schedule is not None:
@@ -262,7 +309,7 @@ class BaseballSeason:
             return
 
         # 2. Try to load from CSV via schedule_manager
-        if self.schedule_manager.load_from_csv(csv_path):
+        if self.schedule_manager.load_from_csv(csv_path, schedule_file):
             # Sync schedule data from manager
             self.schedule = self.schedule_manager.schedule
             self.schedule_dates = self.schedule_manager.schedule_dates
@@ -329,6 +376,8 @@ class BaseballSeason:
 
     def print_standings(self) -> None:
         """Print current standings (W-L, Pct, GB) in compact 3-column format."""
+        if self.output_handler is null_output_handler:
+            return  # nobody reads them, skip building them
         teaml, winl, lossl = [], [], []
         for team in self.team_win_loss:
             if team != "OFF DAY":
@@ -414,6 +463,8 @@ class BaseballSeason:
         :param game_results: List of GameResult objects.
         :return: None
         """
+        if self.output_handler is null_output_handler:
+            return  # nobody reads them, skip building them
         followed_games = []
         compact_summaries = []
 
@@ -677,6 +728,8 @@ class BaseballSeason:
 
                 # Determine if this team should print
                 should_print = teams_to_print is None or team_name in teams_to_print
+                if should_print:
+                    self.flush_output(before_print=True)
 
                 # Run GM assessment
                 # logger.info(
@@ -730,17 +783,39 @@ class BaseballSeason:
         self.output_handler(
             OutputCategory.SEASON_END, f"\n{self.new_season} Season Stats\n", metadata={"season": self.new_season}
         )
-        self.baseball_data.print_current_season(teams=self.team_to_follow, summary_only_b=False)
-        self.baseball_data.print_current_season(teams=self.teams, summary_only_b=not self.season_chatty)
+        # followed teams in full, then the other teams, each team is reported once
+        report = self._season_report_sink()
+        other_teams = [team for team in self.teams if team not in self.team_to_follow]
+        self.baseball_data.print_current_season(teams=self.team_to_follow, summary_only_b=False, sink=report)
+        self.baseball_data.print_current_season(teams=other_teams, summary_only_b=not self.season_chatty, sink=report)
 
         # Perform AI GM end-of-season evaluations
         self.output_handler(
             OutputCategory.SEASON_END, "\n\n****** AI GM End-of-Season Evaluations ******\n", metadata=None
         )
+        self.flush_output(before_print=True)
         self._perform_gm_evaluations()
 
+        # Print the player stats of the teams not already shown in full
+        self.output_handler(OutputCategory.SEASON_END, "\n\n****** Complete Player Statistics ******\n", metadata=None)
+        shown_in_full = set(self.teams) if self.season_chatty else set(self.team_to_follow)
+        self.baseball_data.print_current_season(
+            teams=[team for team in self.baseball_data.batting_data.Team.unique() if team not in shown_in_full],
+            summary_only_b=False,
+            sink=report,
+        )
+        self.flush_output()
         return
 
+    def _season_report_sink(self) -> Optional[Callable[[str], None]]:
+        """
+        where the end of season stats reports go
+        :return: sends each team section to the output handler, None when nobody reads them so they are not built
+        """
+        if self.output_handler is null_output_handler or self.baseball_data.suppress_console_output:
+            return None
+        return lambda section: self.output_handler(OutputCategory.SEASON_REPORT, section + "\n", metadata=None)
+
     def _perform_gm_evaluations(self) -> None:
         """
         Perform end-of-season evaluations for all AI GMs.
@@ -784,10 +859,6 @@ class BaseballSeason:
                     should_print=should_print,
                 )
 
-        # Print all player stats after GM evaluations
-        self.output_handler(OutputCategory.SEASON_END, "\n\n****** Complete Player Statistics ******\n", metadata=None)
-        self.baseball_data.print_current_season(teams=None, summary_only_b=False)
-
         return
 
     def sim_day_threaded(self, season_day_num: int) -> None:
@@ -811,14 +882,18 @@ class BaseballSeason:
             todays_games = self.schedule_manager.get_games_for_day(season_day_num)
             schedule_for_meta = todays_games
 
-        self.output_handler(
-            OutputCategory.DAY_SCHEDULE,
-            self.print_day_schedule(season_day_num) + "\n",
-            metadata={"day": season_day_num + 1, "schedule": schedule_for_meta},
-        )
+        if self.output_handler is not null_output_handler:
+            self.output_handler(
+                OutputCategory.DAY_SCHEDULE,
+                self.print_day_schedule(season_day_num) + "\n",
+                metadata={"day": season_day_num + 1, "schedule": schedule_for_meta},
+            )
         # Pass team_to_follow list (if not empty) to show hot/cold players
         teams_list = self.team_to_follow if len(self.team_to_follow) > 0 else None
-        self.baseball_data.new_game_day(teams_to_follow=teams_list)  # update rest, injury, and print lists
+        self.flush_output(before_print=True)  # new_game_day prints the injury and hot/cold lists
+        perf = self.baseball_data.perf  # phase timers are no-ops unless the performance dashboard is shown
+        with perf.timer("daily update"):
+            self.baseball_data.new_game_day(teams_to_follow=teams_list)  # update rest, injury, and print lists
         date_str = self.get_date_for_day(season_day_num)
         self.output_handler(
             OutputCategory.SIM_PROGRESS,
@@ -845,27 +920,28 @@ class BaseballSeason:
                 team in [game.away, game.home] for team in self.team_to_follow
             )
 
-            game_sim = bbgame.Game(
-                away_team_name=game.away,
-                home_team_name=game.home,
-                baseball_data=self.baseball_data,
-                game_num=season_day_num,
-                rotation_len=self.rotation_len,
-                print_lineup=self.print_lineup_b,
-                chatty=self.season_chatty,
-                print_box_score_b=self.print_box_score_b,
-                team_to_follow=self.team_to_follow,
-                interactive=self.interactive,
-                play_by_play_callback=pbp_callback,
-                obp_adjustment=self.obp_adjustment,
-            )
+            with perf.timer("team setup"):
+                game_sim = bbgame.Game(
+                    away_team_name=game.away,
+                    home_team_name=game.home,
+                    baseball_data=self.baseball_data,
+                    game_num=season_day_num,
+                    rotation_len=self.rotation_len,
+                    print_lineup=self.print_lineup_b,
+                    chatty=self.season_chatty,
+                    print_box_score_b=self.print_box_score_b,
+                    team_to_follow=self.team_to_follow,
+                    interactive=self.interactive,
+                    play_by_play_callback=pbp_callback,
+                    obp_adjustment=self.obp_adjustment,
+                )
             q = queue.Queue()
-            thread = threading.Thread(target=game_sim.sim_game_threaded, args=(q,))
+            thread = threading.Thread(target=perf.run_timed, args=("at-bats", game_sim.sim_game_threaded, q))
             threads.append(thread)
             queues.append(q)
             match_ups.append(game)
             thread.start()
-            self.output_handler(OutputCategory.SIM_PROGRESS, ".", metadata=None)
+            self.output_handler(OutputCategory.DAY_PROGRESS, ".", metadata=None)
         self.output_handler(OutputCategory.SIM_PROGRESS, "\n", metadata=None)
 
         # Collect game results
@@ -875,16 +951,27 @@ class BaseballSeason:
             thread.join()
             game_result: GameResult = queues[ii].get()
             game_obj = match_ups[ii]
-            self.update_win_loss(away_team_name=game_obj.away, home_team_name=game_obj.home, win_loss=game_result.win_loss)
-            self.baseball_data.game_results_to_season(box_score_class=game_result.away_box_score)
-            self.baseball_data.game_results_to_season(box_score_class=game_result.home_box_score)
+            with perf.timer("box score commit"):
+                self.update_win_loss(
+                    away_team_name=game_obj.away, home_team_name=game_obj.home, win_loss=game_result.win_loss
+                )
+                self.baseball_data.game_results_to_season(box_score_class=game_result.away_box_score)
+                self.baseball_data.game_results_to_season(box_score_class=game_result.home_box_score)
 
-            # Mark game as completed and store scores
-            self.schedule_manager.mark_game_completed(game_obj.home, game_obj.away, game_result.score[1], game_result.score[0])
+                # Mark game as completed and store scores
+                self.schedule_manager.mark_game_completed(
+                    game_obj.home, game_obj.away, game_result.score[1], game_result.score[0]
+                )
 
             # Store results for processing
             game_results.append(game_result)
 
+        with perf.timer("box score commit"):
+            self.baseball_data.refresh_rate_stats()  # day commit, one rate stat pass for everyone who played today
+            self.baseball_data.update_league_leaders()
+        if perf.enabled:
+            perf.add_games(len(game_results))
+
         # Process and print all game results
         self._process_and_print_game_results(game_results)
 
@@ -903,11 +990,27 @@ class BaseballSeason:
         self.print_standings()
 
         # Check if any teams are due for GM assessment (every 30 games)
-        self.check_gm_assessments()
+        perf = self.baseball_data.perf
+        with perf.timer("GM assessments"):
+            self.check_gm_assessments()
+        if perf.enabled:
+            perf.end_day()
 
         self.season_day_num = self.season_day_num + 1
         return
 
+    def flush_output(self, before_print: bool = False) -> None:
+        """
+        wait until the output dispatched so far has been handled, a no-op without async_output
+        :param before_print: the engine is about to print directly, only wait if that reaches the console
+        :return: None
+        """
+        if not isinstance(self.output_handler, OutputDispatcher):
+            return
+        if not (before_print and self.baseball_data.suppress_console_output):
+            self.output_handler.flush()
+        return
+
     def get_playoff_seeds(self, league: str) -> List[str]:
         """
         Calculates seeds 1-6 for a given league based on Division Winners and Wild Cards.
@@ -917,6 +1020,8 @@ class BaseballSeason:
         # Create a mapping of Team -> (W, L, Pct, Division)
         team_data = self.baseball_data.batting_data[["Team", "League", "Division"]].drop_duplicates()
         league_teams = team_data[team_data["League"] == league].copy()
+        if league_teams.empty:  # e.g. a synthetic league with one league
+            return []
 
         records = []
         for team in league_teams["Team"].values:
@@ -992,6 +1097,7 @@ class BaseballSeason:
             self.update_win_loss(away_team_name=game.away, home_team_name=game.home, win_loss=game_result.win_loss)
             self.baseball_data.game_results_to_season(box_score_class=game_result.away_box_score)
             self.baseball_data.game_results_to_season(box_score_class=game_result.home_box_score)
+            self.baseball_data.refresh_rate_stats()
 
             # Use structured_game.final_score as authoritative source if available, else score list
             if game_result.structured_game is not None:
@@ -1175,6 +1281,16 @@ class BaseballSeason:
 
         # Run World Series if this was a full regular season
         self.run_playoffs()
+        self.close()
+        return
+
+    def close(self) -> None:
+        """
+        handle the queued output and stop the output dispatch thread, later output is handled synchronously
+        :return: None
+        """
+        if isinstance(self.output_handler, OutputDispatcher):
+            self.output_handler.close()
         return
 
 
@@ -1389,6 +1505,7 @@ if __name__ == "__main__":
             load_batter_file="player-projected-stats-pp-Batting.csv",  # 'random-player-projected-stats-pp-Batting.csv',
             load_pitcher_file="player-projected-stats-pp-Pitching.csv",
             load_schedule_file="2026 MLB Schedule.csv",
+            async_output=not interactive,  # interactive lineups and prompts print from the game threads
         )
         # schedule=series_schedule)
         bbseasonSS.sim_full_season()
@@ -188,6 +188,7 @@ def main(
         season_print_box_score_b=True,
         season_team_to_follow="MIL",
         show_startup_dialog=False,
+        lookahead_days=1,
 ):
     """
     Main entry point for the UI application.
@@ -206,6 +207,7 @@ def main(
         season_print_box_score_b: Print box scores (default True)
         season_team_to_follow: Team to follow (default 'MIL')
         show_startup_dialog: Show startup dialog (default False)
+        lookahead_days: Days the simulation may run ahead of the display (default 1, waits for every day)
     """
     if load_seasons is None:
         load_seasons = [2020, 2021, 2022, 2023, 2024, 2025, 2026]
@@ -229,6 +231,7 @@ def main(
             season_print_lineup_b,
             season_print_box_score_b,
             season_team_to_follow,
+            lookahead_days=lookahead_days,
         )
     except Exception as e:
         logger.error(f"Error creating main window: {e}")
@@ -255,6 +258,7 @@ Examples:
   python bbseason_ui.py --dialog            # Show startup dialog first
   python bbseason_ui.py --team NYM --games 81  # Follow NYM, 81 games
   python bbseason_ui.py --seasons 2024,2025  # Load stats from 2024 and 2025
+  python bbseason_ui.py --lookahead 5        # Simulate up to 5 days ahead of the display
         """,
     )
     parser.add_argument("--dialog", "-d", action="store_true", help="Show startup dialog for team and games selection")
@@ -268,6 +272,12 @@ Examples:
         help="Years to load stats from (default: 2020, 2021, 2022, 2023,2024,2025,2026)",
     )
     parser.add_argument("--new-season", "-n", type=int, default=2026, help="Season to simulate (default: 2026)")
+    parser.add_argument(
+        "--lookahead",
+        type=int,
+        default=1,
+        help="Days the simulation may run ahead of the display (default: 1, waits for every day)",
+    )
 
     args = parser.parse_args()
 
@@ -290,6 +300,7 @@ Examples:
         season_print_box_score_b=True,
         season_team_to_follow=args.team.upper(),
         show_startup_dialog=args.dialog,
+        lookahead_days=args.lookahead,
     )
 
     end_time = datetime.datetime.now()
@@ -0,0 +1,113 @@
+"""
+Copyright (c) 2024 Jim Maastricht
+
+Rolling-window split stats (last 7/15/30 games) kept in per-player ring buffers.
+Each box score is written into the buffer in O(1) per player and running window sums are
+adjusted in place, so recent-form queries never scan the season history.
+"""
+
+from typing import Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+from pandas.core.frame import DataFrame
+
+ROLLING_WINDOWS = (7, 15, 30)  # games; the largest window sets the ring buffer depth
+ROLLING_BATTING_COLS = ["PA", "AB", "H", "2B", "3B", "HR", "BB", "SO", "HBP", "SF", "SB"]
+ROLLING_PITCHING_COLS = ["Total_Outs", "H", "2B", "3B", "HR", "ER", "BB", "SO"]
+
+
+class RollingSplits:
+    """
+    Ring buffer of the last K games of counting stats for every player in a league.
+
+    Attributes:
+        stat_cols: counting stat columns tracked per game
+        windows: window lengths (games) with maintained running sums
+        depth: ring buffer depth, equal to the largest window
+        games: number of games recorded per player row
+    """
+
+    def __init__(self, player_index: Sequence, stat_cols: List[str], windows: Sequence[int] = ROLLING_WINDOWS) -> None:
+        """
+        :param player_index: hashcodes of the players to track, more are added on first appearance
+        :param stat_cols: counting stat columns to track from each box score
+        :param windows: window lengths in games
+        """
+        self.stat_cols = list(stat_cols)
+        self.windows = tuple(sorted(windows))
+        self.depth = self.windows[-1]
+        self.index = pd.Index(player_index)
+        n_players, n_stats = len(self.index), len(self.stat_cols)
+        self.buffer = np.zeros((n_players, self.depth, n_stats), dtype=np.float64)
+        self.games = np.zeros(n_players, dtype=np.int64)
+        self.sums: Dict[int, np.ndarray] = {w: np.zeros((n_players, n_stats), dtype=np.float64) for w in self.windows}
+        return
+
+    def _rows_for(self, hashcodes: pd.Index) -> np.ndarray:
+        """Map hashcodes to buffer rows, growing the buffer for players not seen before."""
+        rows = self.index.get_indexer(hashcodes)
+        missing = rows < 0
+        if missing.any():
+            new_codes = pd.Index(hashcodes[missing]).unique()
+            n_new, n_stats = len(new_codes), len(self.stat_cols)
+            self.index = self.index.append(new_codes)
+            self.buffer = np.concatenate([self.buffer, np.zeros((n_new, self.depth, n_stats))])
+            self.games = np.concatenate([self.games, np.zeros(n_new, dtype=np.int64)])
+            for w in self.windows:
+                self.sums[w] = np.concatenate([self.sums[w], np.zeros((n_new, n_stats))])
+            rows = self.index.get_indexer(hashcodes)
+        return rows
+
+    def record_game(self, box_df: DataFrame) -> None:
+        """
+        Push one game of counting stats per player into the ring buffer and update the window sums.
+        Cost is O(players in the box score), independent of season length.
+        :param box_df: game box score indexed by hashcode, missing stat columns count as zero
+        :return: None
+        """
+        if len(box_df) == 0:
+            return
+        values = box_df.reindex(columns=self.stat_cols).fillna(0).to_numpy(dtype=np.float64)
+        rows = self._rows_for(box_df.index)
+        played = self.games[rows]
+        for w in self.windows:  # subtract the game that falls out of each window before the slot is overwritten
+            leaving = np.where((played >= w)[:, None], self.buffer[rows, (played - w) % self.depth], 0.0)
+            self.sums[w][rows] += values - leaving
+        self.buffer[rows, played % self.depth] = values
+        self.games[rows] = played + 1
+        return
+
+    def window_totals(self, window: int) -> DataFrame:
+        """
+        Counting stat totals over each player's last `window` games, G is the number of games in the window
+        :param window: one of self.windows
+        :return: df indexed by hashcode
+        """
+        if window not in self.sums:
+            raise ValueError(f"Rolling window {window} not tracked, choose from {self.windows}")
+        df = pd.DataFrame(self.sums[window], index=self.index, columns=self.stat_cols)
+        df.insert(0, "G", np.minimum(self.games, window))
+        return df
+
+    def drop_players(self, hashcodes: Sequence) -> None:
+        """Forget players removed from the league (retired)."""
+        keep = ~self.index.isin(hashcodes)
+        self.index = self.index[keep]
+        self.buffer = self.buffer[keep]
+        self.games = self.games[keep]
+        for w in self.windows:
+            self.sums[w] = self.sums[w][keep]
+        return
+
+
+if __name__ == "__main__":
+    splits = RollingSplits([101, 202], ROLLING_BATTING_COLS)
+    rng = np.random.default_rng(1)
+    for _ in range(40):
+        box = pd.DataFrame(rng.integers(0, 3, size=(2, len(ROLLING_BATTING_COLS))), index=[101, 202],
+                           columns=ROLLING_BATTING_COLS)
+        splits.record_game(box)
+    for w in ROLLING_WINDOWS:
+        print(f"Last {w} games:")
+        print(splits.window_totals(w).to_string())
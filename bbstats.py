@@ -8,8 +8,7 @@ Thread-safe for multi-game simulations.
 
 import ast
 import re
-import threading
-from typing import List, Optional, Union
+from typing import Callable, Iterator, List, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -18,6 +17,10 @@ from pandas.core.frame import DataFrame
 from pandas.core.series import Series
 
 import bbinjuries
+import bbinnings
+import bbleaders
+import bbperf
+import bbsplits
 from bblogger import logger
 
 # PERFORMANCE: Pre-compile regex patterns for ~2-5x speedup in safe_literal_eval
@@ -33,12 +36,22 @@ DYNAMIC_FIELDS = [
     "Streak_Adjustment",
 ]
 
+# Numeric dynamic fields updated together by the fused daily update, order matters to daily_update_block
+DAILY_BLOCK_FIELDS = ["Condition", "Injured Days", "Injury_Rate_Adj", "Injury_Perf_Adj", "Streak_Adjustment"]
+
 # Columns used when computing per-player stat differences (current vs historical)
 BATTER_DIFF_COUNT_COLS = ["AB", "R", "H", "2B", "3B", "HR", "RBI", "BB", "SO"]
 BATTER_DIFF_RATE_COLS = ["AVG", "OBP", "SLG", "OPS"]
 PITCHER_DIFF_COUNT_COLS = ["G", "GS", "W", "L", "IP", "H", "R", "ER", "HR", "BB", "SO", "SV"]
 PITCHER_DIFF_RATE_COLS = ["ERA", "WHIP"]
 
+# Rate stat columns derived from counting stats by team_batting_stats and team_pitching_stats
+BATTING_RATE_COLS = ["AVG", "OBP", "SLG", "OPS"]
+PITCHING_RATE_COLS = ["WHIP", "ERA", "OBP", "AVG", "SLG", "OPS"]
+
+# Streak_Adjustment at or beyond +/- this is a hot or cold streak
+HOT_COLD_STREAK = 0.025
+
 
 class BaseballStats:
     def __init__(
@@ -49,15 +62,21 @@ class BaseballStats:
             load_batter_file: str = "player-projected-stats-pp-Batting.csv",
             load_pitcher_file: str = "player-projected-stats-pp-Pitching.csv",
             suppress_console_output: bool = False,
+            load_historical_batter_file: str = "historical-Batting.csv",
+            load_historical_pitcher_file: str = "historical-Pitching.csv",
     ) -> None:
         """Load aggregated and new-season player data, compute league totals."""
+        # year by year career files, the seasons are added to the front of the name like the projected files
+        self.load_historical_batter_file = load_historical_batter_file
+        self.load_historical_pitcher_file = load_historical_pitcher_file
         # Add caches for prior season historical data (Phase 1: Stats Enhancement)
         self.historical_prior_year_batting = None  # Lazy-loaded cache
         self.historical_prior_year_pitching = None  # Lazy-loaded cache
         self.prorated_prior_year_cache = {}  # {team_name_games: (batting_df, pitching_df)}
 
         self.suppress_console_output = suppress_console_output
-        self.thread_lock = threading.Lock()  # one thread can update games stats at a time
+        self.perf = bbperf.PerfMonitor()  # performance dashboard counters, recorded only while it is shown
+        self.thread_lock = bbperf.TimedLock(self.perf)  # one thread can update games stats at a time
         self._rng_instance = np.random.default_rng()  # PERFORMANCE: Create RNG instance once, reuse for ~29x speedup
         self.rnd = lambda: self._rng_instance.uniform(low=0.0, high=1.001)
 
@@ -89,6 +108,30 @@ class BaseballStats:
         self.projected_batting_data = None  # Full-season projections (frozen at load time)
         self.projected_pitching_data = None  # Full-season projections (frozen at load time)
         self.get_seasons(load_batter_file, load_pitcher_file)  # get existing data file
+        # rolling last 7/15/30 game splits, fed from each box score in game_results_to_season
+        self.batting_splits = bbsplits.RollingSplits(self.new_season_batting_data.index, bbsplits.ROLLING_BATTING_COLS)
+        self.pitching_splits = bbsplits.RollingSplits(
+            self.new_season_pitching_data.index, bbsplits.ROLLING_PITCHING_COLS
+        )
+        self.recent_form_window = 15  # games used when lineups blend in recent form
+        self.recent_form_weight = 0.0  # 0 disables recent form in lineup construction, 1 uses only the rolling OPS
+        # projection data counting stats are static once loaded, so rate stats are calculated once here
+        self.batting_data = team_batting_stats(self.batting_data, filter_stats=False)
+        self.pitching_data = team_pitching_stats(self.pitching_data, filter_stats=False)
+        # new season rate stats are maintained incrementally, box scores mark rows dirty and
+        # refresh_rate_stats recalculates only those rows at the end of each sim day
+        self.dirty_batters = set()
+        self.dirty_pitchers = set()
+        self.rate_stats_verify_mode = False  # True checks each refresh against a full recompute, debugging only
+        # league leader boards, fed with the rows changed by each rate stat refresh
+        self.league_leaders = bbleaders.LeagueLeaders(self.new_season_batting_data, self.new_season_pitching_data)
+        self.leader_changed_batters = set()
+        self.leader_changed_pitchers = set()
+        # rows whose stats, condition, injury, streak or team changed since the ui last read them, see get_changed_rows
+        self.ui_changed_batters = set()
+        self.ui_changed_pitchers = set()
+        self.ui_changed_all = False  # every row changed, e.g. a full rate stat refresh
+        self.refresh_rate_stats(full=True)
         self._log_historical_baselines()  # log historical season totals for prior year for comparision and debugging
         self.get_all_team_names = lambda: self.batting_data.Team.unique()
         self.get_all_league_names = lambda: self.batting_data.League.unique()
@@ -245,23 +288,24 @@ class BaseballStats:
         :return: dataframe of seasons data (always a copy - safe for concurrent access)
         """
         if prior_season:
-            # batting_data is static after load - no lock needed, but copy for consistency
-            if team_name is None:
-                df = self.batting_data.copy()
-            else:
-                with self.thread_lock:
-                    df_new = self.new_season_batting_data[self.new_season_batting_data["Team"] == team_name].copy()
-                df = self.batting_data[self.batting_data.index.isin(df_new.index)].copy()
+            # batting_data stats are static after load, its dynamic fields are owned by new_season_batting_data
+            with self.thread_lock:
+                if team_name is None:
+                    df = self.batting_data.copy()
+                else:
+                    team_index = self.new_season_batting_data.index[self.new_season_batting_data["Team"] == team_name]
+                    df = self.batting_data[self.batting_data.index.isin(team_index)].copy()
+                self._sync_fields(self.new_season_batting_data, df, DYNAMIC_FIELDS)  # current condition, injuries
         else:
             # new_season_batting_data is mutated by game threads - snapshot under lock
             with self.thread_lock:
+                self._refresh_rate_stats()  # flush rows changed since the last day commit
                 if team_name is None:
                     df = self.new_season_batting_data.copy()
                 else:
                     df = self.new_season_batting_data[self.new_season_batting_data["Team"] == team_name].copy()
         logger.debug("Getting batting data for team: {}", team_name)
-        df = team_batting_stats(df, filter_stats=False)
-        df = self.add_missing_cols(df)
+        df = self.add_missing_cols(df)  # rate stats are already current, see refresh_rate_stats
 
         return df
 
@@ -278,12 +322,12 @@ class BaseballStats:
             DataFrame with accumulated game stats
         """
         with self.thread_lock:
+            self._refresh_rate_stats()  # flush rows changed since the last day commit
             if team_name is None:
                 df = self.new_season_batting_data.copy()
             else:
                 df = self.new_season_batting_data[self.new_season_batting_data["Team"] == team_name].copy()
 
-        df = team_batting_stats(df, filter_stats=False)
         df = self.add_missing_cols(df)
         return df
 
@@ -300,12 +344,12 @@ class BaseballStats:
             DataFrame with accumulated game stats
         """
         with self.thread_lock:
+            self._refresh_rate_stats()  # flush rows changed since the last day commit
             if team_name is None:
                 df = self.new_season_pitching_data.copy()
             else:
                 df = self.new_season_pitching_data[self.new_season_pitching_data["Team"] == team_name].copy()
 
-        df = team_pitching_stats(df, filter_stats=False)
         df = self.add_missing_cols(df)
         return df
 
@@ -317,22 +361,23 @@ class BaseballStats:
         :return: df with seasons data (always a copy - safe for concurrent access)
         """
         if prior_season:
-            # pitching_data is static after load - no lock needed, but copy for consistency
-            if team_name is None:
-                df = self.pitching_data.copy()
-            else:
-                with self.thread_lock:
-                    df_new = self.new_season_pitching_data[self.new_season_pitching_data["Team"] == team_name].copy()
-                df = self.pitching_data[self.pitching_data.index.isin(df_new.index)].copy()
+            # pitching_data stats are static after load, its dynamic fields are owned by new_season_pitching_data
+            with self.thread_lock:
+                if team_name is None:
+                    df = self.pitching_data.copy()
+                else:
+                    team_index = self.new_season_pitching_data.index[self.new_season_pitching_data["Team"] == team_name]
+                    df = self.pitching_data[self.pitching_data.index.isin(team_index)].copy()
+                self._sync_fields(self.new_season_pitching_data, df, DYNAMIC_FIELDS)  # current condition, injuries
         else:
             # new_season_pitching_data is mutated by game threads - snapshot under lock
             with self.thread_lock:
+                self._refresh_rate_stats()  # flush rows changed since the last day commit
                 if team_name is None:
                     df = self.new_season_pitching_data.copy()
                 else:
                     df = self.new_season_pitching_data[self.new_season_pitching_data["Team"] == team_name].copy()
-        # Don't filter stats - include pitchers with 0 IP (important for roster display at season start)
-        df = team_pitching_stats(df, filter_stats=False)
+        # rate stats are already current for all pitchers incl. 0 IP, see refresh_rate_stats
         df = self.add_missing_cols(df)
         return df
 
@@ -347,8 +392,8 @@ class BaseballStats:
         try:
             # Build file name for historical data
             seasons_str = " ".join(str(season) for season in self.load_seasons)
-            data_type = "Batting" if is_batter else "Pitching"
-            historical_file = f"{seasons_str} historical-{data_type}.csv"
+            historical_file = self.load_historical_batter_file if is_batter else self.load_historical_pitcher_file
+            historical_file = f"{seasons_str} {historical_file}"
 
             # Load historical data
             historical_df = pd.read_csv(historical_file, index_col="Player_Season_Key")
@@ -402,6 +447,37 @@ class BaseballStats:
             logger.error(f"Error retrieving projected data for {player_name}: {e}")
             return None
 
+    def get_rolling_batting_stats(self, window: int = 15, team_name: Optional[str] = None) -> DataFrame:
+        """
+        rolling split for batters over their last N games, rate stats are computed across the league in one pass
+        :param window: number of games, one of bbsplits.ROLLING_WINDOWS
+        :param team_name: single team name is optional, alt is full league
+        :return: df indexed by hashcode with Player, Team, counting stats and AVG, OBP, SLG, OPS
+        """
+        with self.thread_lock:
+            df = self.batting_splits.window_totals(window)
+            players = self.new_season_batting_data[["Player", "Team"]]
+        df = players.join(df, how="inner")
+        if team_name is not None:
+            df = df[df["Team"] == team_name]
+        return team_batting_stats(df, filter_stats=False)
+
+    def get_rolling_pitching_stats(self, window: int = 15, team_name: Optional[str] = None) -> DataFrame:
+        """
+        rolling split for pitchers over their last N games, rate stats are computed across the league in one pass
+        :param window: number of games, one of bbsplits.ROLLING_WINDOWS
+        :param team_name: single team name is optional, alt is full league
+        :return: df indexed by hashcode with Player, Team, counting stats, IP and ERA, WHIP
+        """
+        with self.thread_lock:
+            df = self.pitching_splits.window_totals(window)
+            players = self.new_season_pitching_data[["Player", "Team"]]
+        df = players.join(df, how="inner")
+        if team_name is not None:
+            df = df[df["Team"] == team_name]
+        df["IP"] = bbinnings.outs_to_ip(df["Total_Outs"].to_numpy())
+        return team_pitching_stats(df, filter_stats=False)
+
     def populate_standings_from_partial_season(self) -> dict:
         """Calculate team wins/losses from 2026 partial season pitcher records.
         Returns dict in format: {team: [wins, losses]}
@@ -422,8 +498,8 @@ class BaseballStats:
         if self.historical_prior_year_batting is None:
             try:
                 seasons_str = " ".join(str(s) for s in self.load_seasons)
-                hist_batting_file = f"{seasons_str} historical-Batting.csv"
-                hist_pitching_file = f"{seasons_str} historical-Pitching.csv"
+                hist_batting_file = f"{seasons_str} {self.load_historical_batter_file}"
+                hist_pitching_file = f"{seasons_str} {self.load_historical_pitcher_file}"
 
                 logger.debug(f"Loading prior_year historical data from {hist_batting_file} and {hist_pitching_file}")
 
@@ -516,7 +592,7 @@ class BaseballStats:
                 )
 
         if not self.historical_prior_year_pitching.empty:
-            raw_ip = self.historical_prior_year_pitching["IP"].apply(lambda x: int(x) + (x % 1 * 10 / 3)).sum()
+            raw_ip = bbinnings.ip_to_outs(self.historical_prior_year_pitching["IP"].to_numpy()).sum() / 3
             logger.info(f"RAW prior_year PITCHING IP: {raw_ip:,.1f}")
         return
 
@@ -609,7 +685,7 @@ class BaseballStats:
             # 4. Pitching Proration (Base-3 IP logic with Trade Aggregation)
             if not df_p.empty:
                 # First, convert IP to Total Outs
-                df_p["Total_Outs_Calc"] = (df_p["IP"].astype(float) * 3) + ((df_p["IP"] % 1) * 10).round()
+                df_p["Total_Outs_Calc"] = bbinnings.ip_to_outs(df_p["IP"].to_numpy())
                 # Add 'AB' to the pitch_cols so it isn't dropped during groupby
                 # Pitchers need 'AB' (at-bats AGAINST them) to calculate OBP and AVG_faced
                 pitch_cols = [
@@ -639,21 +715,14 @@ class BaseballStats:
                 df_p = df_p.groupby("Hashcode").agg(agg_dict)
 
                 # Calculate rate stats from FULL prior_year season (not prorated) for accurate comparison
+                # df_p is not prorated yet, so its sums are already the full season
                 df_p_full = df_p.copy()
-                df_p_full["IP"] = (
-                        df_p_full["Total_Outs_Calc"].apply(lambda x: int(x) + (round(x % 1 * 3) / 10)) / prorate_factor
-                )
-                existing_pitch_cols_full = [col for col in pitch_cols if col in df_p_full.columns]
-                df_p_full[existing_pitch_cols_full] = (
-                        df_p_full[existing_pitch_cols_full] / prorate_factor
-                )  # undo proration
+                df_p_full["IP"] = bbinnings.outs_to_ip(df_p_full["Total_Outs_Calc"].to_numpy())
                 df_p_full = team_pitching_stats(df_p_full, filter_stats=False)
 
-                # Keep as floats for accurate comparison
-                total_outs_prorated = df_p["Total_Outs_Calc"] * prorate_factor
-                df_p["IP"] = (total_outs_prorated / 3).apply(
-                    lambda x: int(x) + (round(x % 1 * 3) / 10)
-                )  # Total Outs to IP
+                # Keep as floats for accurate comparison, IP is rounded to whole outs before the base-3 notation
+                total_outs_prorated = np.round(df_p["Total_Outs_Calc"].to_numpy() * prorate_factor)
+                df_p["IP"] = bbinnings.outs_to_ip(total_outs_prorated)  # Total Outs to IP
                 existing_pitch_cols = [col for col in pitch_cols if col in df_p.columns]
                 df_p[existing_pitch_cols] = df_p[existing_pitch_cols] * prorate_factor  # Prorate without rounding
                 df_p = team_pitching_stats(df_p, filter_stats=False)
@@ -810,6 +879,7 @@ class BaseballStats:
         """
         Synchronize dynamic state fields from new_season data to target dataframes.
         Dynamic fields include: condition, injuries, streaks - anything that changes during the season.
+        get_pitching_data and get_batting_data already do this for prior season data, use for other copies.
 
         :param target_pitching_df: DataFrame to update with current pitching dynamic state
         :param target_batting_df: DataFrame to update with current batting dynamic state
@@ -856,6 +926,10 @@ class BaseballStats:
                 self.new_season_batting_data.loc[batter_indices, "Injured Days"] = batting_box_score.loc[
                     batter_indices, "Injured Days"
                 ].astype("int64")
+                self.batting_splits.record_game(batting_box_score)
+                self.dirty_batters.update(batter_indices)
+                if self.perf.enabled:
+                    self.perf.add_plate_appearances(int(batting_box_score["PA"].sum()))
 
             # VECTORIZED: Update all pitchers who played in the game at once (no loop!)
             if len(pitching_box_score) > 0:
@@ -873,6 +947,8 @@ class BaseballStats:
                 self.new_season_pitching_data.loc[pitcher_indices, "Injured Days"] = pitching_box_score.loc[
                     pitcher_indices, "Injured Days"
                 ].astype("int64")
+                self.pitching_splits.record_game(pitching_box_score)
+                self.dirty_pitchers.update(pitcher_indices)
 
             # Invalidate prorated prior_year cache for team that played (Phase 1: Stats Enhancement)
             team = box_score_class.team_name
@@ -888,6 +964,263 @@ class BaseballStats:
 
         return
 
+    def refresh_rate_stats(self, full: bool = False) -> None:
+        """
+        day commit for rate stats, recalculates AVG, OBP, ERA, WHIP, etc. for every player whose counting stats
+        changed since the last refresh in one vectorized pass per df.  thread safe
+        :param full: recalculate every player instead of only the changed rows
+        :return: None
+        """
+        with self.thread_lock:
+            self._refresh_rate_stats(full=full)
+            if self.rate_stats_verify_mode and not full:
+                self._check_rate_stats()
+        return
+
+    def check_rate_stats(self) -> bool:
+        """
+        verification mode for the incremental rate stats, compares them to a full recompute of every player
+        :return: True if the maintained rate stats match the full recompute
+        """
+        with self.thread_lock:
+            return self._check_rate_stats()
+
+    def _refresh_rate_stats(self, full: bool = False) -> None:
+        """
+        recalculate rate stats for dirty rows in place, caller must hold thread_lock
+        :param full: recalculate every player instead of only the changed rows
+        :return: None
+        """
+        for df, dirty_rows, leader_rows, ui_rows, stats_func, rate_cols in (
+            (self.new_season_batting_data, self.dirty_batters, self.leader_changed_batters, self.ui_changed_batters,
+             team_batting_stats, BATTING_RATE_COLS),
+            (self.new_season_pitching_data, self.dirty_pitchers, self.leader_changed_pitchers,
+             self.ui_changed_pitchers, team_pitching_stats, PITCHING_RATE_COLS),
+        ):
+            if full:
+                df[rate_cols] = stats_func(df, filter_stats=False)[rate_cols]
+            elif len(dirty_rows) > 0:
+                rows = df.index[df.index.isin(dirty_rows)]  # retired players may still be in the dirty set
+                df.loc[rows, rate_cols] = stats_func(df.loc[rows], filter_stats=False)[rate_cols]
+                leader_rows.update(rows)
+                ui_rows.update(rows)
+            dirty_rows.clear()
+        if full:
+            self.league_leaders.invalidate()
+            self.ui_changed_all = True
+        return
+
+    def get_changed_rows(self) -> Optional[tuple]:
+        """
+        rows changed since the last call, so a view can update only the players whose stats, condition, injury,
+        streak or team changed instead of copying the whole season.  thread safe
+        :return: (batting rows, pitching rows, hashcodes no longer in the season) or None if every row changed and
+            the caller should reload the full season
+        """
+        with self.thread_lock:
+            self._refresh_rate_stats()  # flush rows changed since the last day commit
+            changed_all, self.ui_changed_all = self.ui_changed_all, False
+            changed = []
+            for df, ui_rows in (
+                (self.new_season_batting_data, self.ui_changed_batters),
+                (self.new_season_pitching_data, self.ui_changed_pitchers),
+            ):
+                rows = df.index[df.index.isin(ui_rows)]
+                changed.append((df.loc[rows].copy(), ui_rows.difference(rows)))
+                ui_rows.clear()
+        if changed_all:
+            return None
+        (batting_df, removed_batters), (pitching_df, removed_pitchers) = changed
+        return self.add_missing_cols(batting_df), self.add_missing_cols(pitching_df), removed_batters | removed_pitchers
+
+    def update_league_leaders(self) -> None:
+        """
+        apply players with new stats to the league leader boards, thread safe.  called at the end of each sim day,
+        leader queries also apply any pending players
+        :return: None
+        """
+        with self.thread_lock:
+            self._update_league_leaders()
+        return
+
+    def get_league_leaders(self, stat: str, league: Optional[str] = None, count: int = 10) -> DataFrame:
+        """
+        top players for a stat among those qualified, see bbleaders.LEADER_STATS for stats and thresholds
+        :param stat: AVG, OBP, OPS, HR, W, ERA, WHIP, SO, or SV
+        :param league: league name, None is the full league
+        :param count: number of leaders
+        :return: df of leaders best first with Player, Team, League, the stat, and PA or IP
+        """
+        is_batting = bbleaders.LEADER_STATS[stat][0] == "batting"
+        volume_col = bbleaders.LEADER_STATS[stat][2]
+        with self.thread_lock:
+            self._update_league_leaders()
+            hashcodes = self.league_leaders.top(
+                stat, self.new_season_batting_data, self.new_season_pitching_data, league=league, count=count
+            )
+            df = self.new_season_batting_data if is_batting else self.new_season_pitching_data
+            cols = [col for col in dict.fromkeys(["Player", "Team", "League", stat, volume_col]) if col in df.columns]
+            df = df.loc[hashcodes, cols].copy()
+        return df
+
+    def get_leader_qualification(self) -> tuple:
+        """
+        :return: minimum PA for batting rate leaders and minimum IP for ERA and WHIP leaders, and team games played
+        """
+        with self.thread_lock:
+            min_pa, min_ip = self.league_leaders.qualification()
+            return min_pa, min_ip, self.league_leaders.games_played
+
+    def _update_league_leaders(self) -> None:
+        """
+        update the leader boards from changed players, caller must hold thread_lock
+        :return: None
+        """
+        self._refresh_rate_stats()
+        games_played = max(self.team_games_played.values()) if getattr(self, "team_games_played", None) else 0
+        self.league_leaders.update(
+            self.new_season_batting_data,
+            self.new_season_pitching_data,
+            self.leader_changed_batters,
+            self.leader_changed_pitchers,
+            games_played=games_played,
+        )
+        self.leader_changed_batters.clear()
+        self.leader_changed_pitchers.clear()
+        return
+
+    def _check_rate_stats(self) -> bool:
+        """
+        compare maintained rate stats with a full recompute, caller must hold thread_lock
+        :return: True if every rate stat matches
+        """
+        matches = True
+        for df, stats_func, rate_cols in (
+            (self.new_season_batting_data, team_batting_stats, BATTING_RATE_COLS),
+            (self.new_season_pitching_data, team_pitching_stats, PITCHING_RATE_COLS),
+        ):
+            expected = stats_func(df, filter_stats=False)[rate_cols].to_numpy(dtype=float)
+            drift = ~np.isclose(df[rate_cols].to_numpy(dtype=float), expected, equal_nan=True)
+            if drift.any():
+                matches = False
+                bad_rows = df.index[drift.any(axis=1)]
+                logger.error(
+                    "Rate stats out of date for {} players, first few: {}",
+                    len(bad_rows),
+                    df.loc[bad_rows[:5], "Player"].tolist(),
+                )
+        return matches
+
+    def daily_update_block(self, block: ndarray, ages: ndarray, played: ndarray, is_pitcher: bool) -> ndarray:
+        """
+        fused daily update kernel for one df, works only on numpy arrays so it can be timed on its own.
+        1. injuries: count down the IL, roll new injuries for healthy players with age and injury history adjusted
+           odds, serious injuries (30+ days) raise future odds 10-20% and lower performance 0-20%
+        2. streaks: random walk with 4% regression to the mean for players not injured, bounded at +/- 10%
+        3. condition: age adjusted power curve recovery, players without playing time get a rest day bonus
+        :param block: DAILY_BLOCK_FIELDS x players float array, each field row is contiguous, updated in place
+        :param ages: player ages
+        :param played: True for players with playing time
+        :param is_pitcher: pitcher or batter injury rates and catalog
+        :return: injury description code per player, -1 is unchanged, 0 is no injury, > 0 is a new injury
+        """
+        rng = self._rng_instance
+        condition, injured_days, rate_adj, perf_adj, streak = block
+        n_players = block.shape[1]
+        injury_rate = self.pitching_injury_rate if is_pitcher else self.batting_injury_rate
+        injury_avg_len = self.pitching_injury_avg_len if is_pitcher else self.batting_injury_avg_len
+
+        # 1. injuries, players already on the IL count down and descriptions clear when they are healthy
+        healthy = injured_days == 0
+        injury_odds = self.calculate_per_game_injury_odds(ages, injury_rate, rate_adj)
+        new_injury = healthy & (rng.random(n_players) <= injury_odds)
+        injured_days[~healthy] -= 1
+        codes = np.where(injured_days == 0, 0, -1)
+        n_new = int(new_injury.sum())
+        if n_new > 0:
+            severity_days = np.abs(rng.normal(loc=injury_avg_len, scale=injury_avg_len / 2, size=n_new)).astype(
+                np.int64
+            )
+            serious = severity_days >= 30
+            rate_adj[new_injury] += np.where(serious, rng.uniform(0.1, 0.2, n_new), 0.0)
+            perf_adj[new_injury] -= np.where(serious, rng.uniform(0, 0.2, n_new), 0.0)
+            codes[new_injury], injured_days[new_injury] = self.injury_system.sample_injuries(
+                severity_days, is_pitcher=is_pitcher, rng=rng
+            )
+
+        # 2. streaks for players who are not injured, injured players' streaks are frozen
+        active = injured_days == 0
+        current_streaks = streak[active]
+        streak[active] = np.clip(
+            current_streaks + rng.normal(loc=0.0, scale=0.004, size=len(current_streaks)) - 0.04 * current_streaks,
+            -0.10,
+            0.10,
+        )
+
+        # 3. condition recovery: base * (1 - ((age - peak) / 40) ^ 2), floored at recovery_min_factor
+        age_factor = np.maximum(self.recovery_min_factor, 1 - ((ages - self.recovery_age_peak) / 40) ** 2)
+        recovery = np.clip(
+            rng.normal(loc=self.condition_change_per_day * age_factor, scale=self.condition_change_per_day / 3,
+                       size=n_players),
+            self.condition_change_per_day / 2,  # floor at 50% of base, prevents unnatural jumps from np.abs
+            None,
+        )
+        recovery[~played] += self.rest_day_bonus
+        np.clip(condition + recovery, 0, 100, out=condition)
+        return codes
+
+    def _daily_update_df(self, df: DataFrame, is_pitcher: bool) -> None:
+        """
+        run the fused daily update kernel on a new season df: one block read, one write back per field,
+        descriptions and IL status are set from the kernel's description codes
+        :param df: new season pitching or batting df, updated in place
+        :param is_pitcher: pitching or batting df
+        :return: None
+        """
+        block = df[DAILY_BLOCK_FIELDS].to_numpy(dtype=np.float64).T.copy()  # C order, one contiguous row per field
+        before = block.copy()
+        played = (df["IP"] if is_pitcher else df["AB"]).to_numpy() > 0
+        codes = self.daily_update_block(block, df["Age"].to_numpy(dtype=np.float64), played, is_pitcher)
+        self._mark_daily_changes(df, before, block, is_pitcher)
+
+        for field, values in zip(DAILY_BLOCK_FIELDS, block):
+            df[field] = values.astype(np.int64) if field == "Injured Days" else values
+        descriptions = df["Injury Description"].to_numpy(dtype=object).copy()
+        changed = codes >= 0
+        descriptions[changed] = self.injury_system.descriptions[codes[changed]]
+        df["Injury Description"] = descriptions
+
+        injured_days = block[DAILY_BLOCK_FIELDS.index("Injured Days")]
+        df["Status"] = np.where(
+            injured_days == 0,
+            "Active",
+            np.where(
+                self.injury_system.is_concussion_array(descriptions),
+                "7-Day IL",
+                np.where(injured_days >= 60, "60-Day IL", "15-Day IL" if is_pitcher else "10-Day IL"),
+            ),
+        )
+        return
+
+    def _mark_daily_changes(self, df: DataFrame, before: ndarray, after: ndarray, is_pitcher: bool) -> None:
+        """
+        add players whose condition or injury changed, or whose streak became or stopped being hot or cold, to the
+        rows the ui has not read yet
+        :param df: new season pitching or batting df
+        :param before: daily block before the update
+        :param after: daily block after the update
+        :param is_pitcher: pitching or batting df
+        :return: None
+        """
+        condition, injured_days, streak = (DAILY_BLOCK_FIELDS.index(field) for field in
+                                           ("Condition", "Injured Days", "Streak_Adjustment"))
+        streak_before = (before[streak] >= HOT_COLD_STREAK).astype(np.int8) - (before[streak] <= -HOT_COLD_STREAK)
+        streak_after = (after[streak] >= HOT_COLD_STREAK).astype(np.int8) - (after[streak] <= -HOT_COLD_STREAK)
+        changed = ((before[condition] != after[condition]) | (before[injured_days] != after[injured_days])
+                   | (streak_before != streak_after))
+        (self.ui_changed_pitchers if is_pitcher else self.ui_changed_batters).update(df.index[changed])
+        return
+
     def calculate_per_game_injury_odds(self, age: int, injury_rate: float, injury_rate_adjustment: float) -> float:
         """Calculates the per-game probability of injury based on a season-long rate adjusted for age and 162-games
         Formula (P_game = 1 - (1 - P_season) ** (1 / 162))
@@ -906,128 +1239,11 @@ class BaseballStats:
         per_game_odds = 1 - (probability_of_not_getting_hurt_season) ** (1 / 162)
         return per_game_odds
 
-    def is_injured(self) -> None:
+    def print_disabled_lists(self) -> None:
         """
-        determine if a pitcher or hitter is injured and severity.  older players get injured more often
-        add that data to the active seasons df and assign appropriate injury descriptions
-        It is assumed that once a player has a substantial injury that player is 10-20% more likely
-        to be injured again.  Also there is a cumulative downward effect on performance
-
-        VECTORIZED: Uses vectorized operations for ~10-50x speedup
+        print the pitchers and batters on the IL grouped by IL type, status is set by the daily update
         :return: None
         """
-        # Process pitcher injuries - VECTORIZED
-        healthy_pitchers = self.new_season_pitching_data["Injured Days"] == 0
-        injured_pitchers = ~healthy_pitchers
-
-        # Generate random rolls for all healthy pitchers at once
-        n_healthy_p = healthy_pitchers.sum()
-        if n_healthy_p > 0:
-            random_rolls = np.random.uniform(0, 1, n_healthy_p)
-
-            # Calculate injury odds for all healthy pitchers vectorized
-            healthy_df = self.new_season_pitching_data[healthy_pitchers]
-            injury_odds = healthy_df.apply(
-                lambda row: self.calculate_per_game_injury_odds(
-                    row["Age"], self.pitching_injury_rate, row["Injury_Rate_Adj"]
-                ),
-                axis=1,
-            ).values
-
-            # Determine which players get injured
-            new_injuries = random_rolls <= injury_odds
-            newly_injured_indices = healthy_df.index[new_injuries]
-
-            # Process each newly injured player (still need individual processing for injury descriptions)
-            for idx in newly_injured_indices:
-                row = self.new_season_pitching_data.loc[idx]
-                injury_days = int(self.rnd_p_inj(row["Age"]))
-                injury_rate_adjustment = (
-                    self._rng_instance.uniform(low=0.1, high=0.2) + row["Injury_Rate_Adj"]
-                    if injury_days >= 30
-                    else row["Injury_Rate_Adj"]
-                )
-                injury_perf_adj = self.injury_perf_f(injury_days, row["Injury_Perf_Adj"])
-                injury_desc = self.injury_system.get_pitcher_injury(injury_days)
-                refined_injury_days = self.injury_system.get_injury_days_from_description(injury_desc, is_pitcher=True)
-
-                self.new_season_pitching_data.at[idx, "Injured Days"] = refined_injury_days
-                self.new_season_pitching_data.at[idx, "Injury Description"] = injury_desc
-                self.new_season_pitching_data.at[idx, "Injury_Rate_Adj"] = injury_rate_adjustment
-                self.new_season_pitching_data.at[idx, "Injury_Perf_Adj"] = injury_perf_adj
-
-        # Vectorized: Decrement all currently injured pitchers at once
-        if injured_pitchers.sum() > 0:
-            self.new_season_pitching_data.loc[injured_pitchers, "Injured Days"] -= 1
-            # Clear descriptions for players who just recovered (Injured Days now 0)
-            recovered = self.new_season_pitching_data["Injured Days"] == 0
-            self.new_season_pitching_data.loc[recovered, "Injury Description"] = ""
-
-        # Process batter injuries - VECTORIZED (same logic)
-        healthy_batters = self.new_season_batting_data["Injured Days"] == 0
-        injured_batters = ~healthy_batters
-
-        n_healthy_b = healthy_batters.sum()
-        if n_healthy_b > 0:
-            random_rolls = np.random.uniform(0, 1, n_healthy_b)
-            healthy_df = self.new_season_batting_data[healthy_batters]
-            injury_odds = healthy_df.apply(
-                lambda row: self.calculate_per_game_injury_odds(
-                    row["Age"], self.batting_injury_rate, row["Injury_Rate_Adj"]
-                ),
-                axis=1,
-            ).values
-
-            new_injuries = random_rolls <= injury_odds
-            newly_injured_indices = healthy_df.index[new_injuries]
-
-            for idx in newly_injured_indices:
-                row = self.new_season_batting_data.loc[idx]
-                injury_days = int(self.rnd_b_inj(row["Age"]))
-                injury_rate_adjustment = (
-                    self._rng_instance.uniform(low=0.1, high=0.2) + row["Injury_Rate_Adj"]
-                    if injury_days >= 30
-                    else row["Injury_Rate_Adj"]
-                )
-                injury_perf_adj = self.injury_perf_f(injury_days, row["Injury_Perf_Adj"])
-                injury_desc = self.injury_system.get_batter_injury(injury_days)
-                refined_injury_days = self.injury_system.get_injury_days_from_description(injury_desc, is_pitcher=False)
-
-                self.new_season_batting_data.at[idx, "Injured Days"] = refined_injury_days
-                self.new_season_batting_data.at[idx, "Injury Description"] = injury_desc
-                self.new_season_batting_data.at[idx, "Injury_Rate_Adj"] = injury_rate_adjustment
-                self.new_season_batting_data.at[idx, "Injury_Perf_Adj"] = injury_perf_adj
-
-        if injured_batters.sum() > 0:
-            self.new_season_batting_data.loc[injured_batters, "Injured Days"] -= 1
-            recovered = self.new_season_batting_data["Injured Days"] == 0
-            self.new_season_batting_data.loc[recovered, "Injury Description"] = ""
-
-        # Update status - vectorize using np.where for better performance
-        # Vectorized status updates (avoid apply with lambda)
-        def get_status_vectorized(df, is_pitcher):
-            """Vectorized status calculation"""
-            injured_days = df["Injured Days"].values
-            injury_desc = df["Injury Description"].values
-
-            # Check for concussions vectorized
-            is_concussion = np.array([self.injury_system.is_concussion(desc) for desc in injury_desc])
-
-            # Build status array
-            status = np.where(
-                injured_days == 0,
-                "Active",
-                np.where(
-                    is_concussion,
-                    "7-Day IL",
-                    np.where(injured_days >= 60, "60-Day IL", np.where(is_pitcher, "15-Day IL", "10-Day IL")),
-                ),
-            )
-            return status
-
-        self.new_season_pitching_data["Status"] = get_status_vectorized(self.new_season_pitching_data, True)
-        self.new_season_batting_data["Status"] = get_status_vectorized(self.new_season_batting_data, False)
-
         # Print the disabled lists in compact format (only if not suppressed)
         if not self.suppress_console_output:
             print("Season Disabled Lists:")
@@ -1137,54 +1353,6 @@ class BaseballStats:
         if players:
             print(", ".join(players) + "\n")
 
-    def update_streaks(self) -> None:
-        """
-        Update streak adjustments for all non-injured players.
-        Streaks slowly drift toward 0 (regression to mean) with small random changes.
-        Only updates players who are not injured (Injured Days == 0).
-        Injured players' streaks are frozen until they return to action.
-
-        Logic:
-        - Small random walk: ±0.4% to ±1.2% per game (mean 0%, std 0.004, reduced from 0.005)
-        - Regression to mean: Pull streak toward 0 by 4% of current value (increased from 2%)
-        - Bounds checking: Enforce -10% to +10% limits
-
-        VECTORIZED: Processes all active players at once for ~20-100x speedup
-        :return: None
-        """
-        # Update pitchers (vectorized - only those not injured)
-        active_pitchers = self.new_season_pitching_data["Injured Days"] == 0
-        n_active_pitchers = active_pitchers.sum()
-
-        if n_active_pitchers > 0:
-            # Get current streaks for active pitchers
-            current_streaks = self.new_season_pitching_data.loc[active_pitchers, "Streak_Adjustment"]
-
-            # Generate all random changes at once (reduced volatility: 0.005 -> 0.004)
-            random_changes = np.random.normal(loc=0.0, scale=0.004, size=n_active_pitchers)
-
-            # Vectorized regression calculation (increased regression: 0.02 -> 0.04)
-            regression = -0.04 * current_streaks
-
-            # Calculate new streaks and enforce bounds
-            new_streaks = np.clip(current_streaks + random_changes + regression, -0.10, 0.10)
-
-            # Update all at once
-            self.new_season_pitching_data.loc[active_pitchers, "Streak_Adjustment"] = new_streaks
-
-        # Update batters (vectorized - same logic, only non-injured)
-        active_batters = self.new_season_batting_data["Injured Days"] == 0
-        n_active_batters = active_batters.sum()
-
-        if n_active_batters > 0:
-            current_streaks = self.new_season_batting_data.loc[active_batters, "Streak_Adjustment"]
-            random_changes = np.random.normal(loc=0.0, scale=0.004, size=n_active_batters)
-            regression = -0.04 * current_streaks
-            new_streaks = np.clip(current_streaks + random_changes + regression, -0.10, 0.10)
-            self.new_season_batting_data.loc[active_batters, "Streak_Adjustment"] = new_streaks
-
-        return
-
     def new_game_day(self, teams_to_follow: Optional[List[str]] = None) -> None:
         """
         Set up the next day, check if injured and reduce number of days on dl.  improve player condition
@@ -1193,60 +1361,12 @@ class BaseballStats:
         :return: None
         """
         with self.thread_lock:
-            self.is_injured()
-            self.update_streaks()  # Update streaks for active players only
+            # one fused pass per df for injuries, streaks, and condition recovery
+            self._daily_update_df(self.new_season_pitching_data, is_pitcher=True)
+            self._daily_update_df(self.new_season_batting_data, is_pitcher=False)
+            self.print_disabled_lists()
             self.print_hot_cold_players(teams_to_follow)  # Print hot/cold players for followed teams
-
-            # Identify players who played yesterday (for rest day bonus)
-            played_pitcher_idx = self.new_season_pitching_data[self.new_season_pitching_data["IP"] > 0].index
-            played_batter_idx = self.new_season_batting_data[self.new_season_batting_data["AB"] > 0].index
-
-            # VECTORIZED: Update pitcher condition with age-adjusted power curve recovery
-            pitcher_ages = self.new_season_pitching_data["Age"].values
-            # Recovery formula: base * (1 - ((age - peak) / 40) ^ 2), floored at 20%
-            age_factor = 1 - ((pitcher_ages - self.recovery_age_peak) / 40) ** 2
-            age_factor = np.maximum(self.recovery_min_factor, age_factor)
-            loc_values = self.condition_change_per_day * age_factor
-
-            # Generate recovery with floor (prevents unnatural jumps from np.abs)
-            raw_recovery = self._rng_instance.normal(
-                loc=loc_values, scale=self.condition_change_per_day / 3, size=len(pitcher_ages)
-            )
-            random_changes = np.clip(
-                raw_recovery,
-                self.condition_change_per_day / 2,  # Floor at 50% of base
-                None,
-            )
-
-            # Apply rest day bonus to non-playing pitchers
-            non_players = ~self.new_season_pitching_data.index.isin(played_pitcher_idx)
-            random_changes[non_players] += self.rest_day_bonus
-
-            self.new_season_pitching_data["Condition"] = (
-                    self.new_season_pitching_data["Condition"] + random_changes
-            ).clip(lower=0, upper=100)
-
-            # VECTORIZED: Update batter condition with age-adjusted power curve recovery
-            batter_ages = self.new_season_batting_data["Age"].values
-            age_factor = 1 - ((batter_ages - self.recovery_age_peak) / 40) ** 2
-            age_factor = np.maximum(self.recovery_min_factor, age_factor)
-            loc_values = self.condition_change_per_day * age_factor
-
-            raw_recovery = self._rng_instance.normal(
-                loc=loc_values, scale=self.condition_change_per_day / 3, size=len(batter_ages)
-            )
-            random_changes = np.clip(raw_recovery, self.condition_change_per_day / 2, None)
-
-            # Apply rest day bonus to non-playing batters
-            non_players = ~self.new_season_batting_data.index.isin(played_batter_idx)
-            random_changes[non_players] += self.rest_day_bonus
-
-            self.new_season_batting_data["Condition"] = (
-                    self.new_season_batting_data["Condition"] + random_changes
-            ).clip(lower=0, upper=100)
-
-            # copy over results in new season to prior season for game management
-            self.sync_dynamic_fields(self.pitching_data, self.batting_data)
+            # no copy to pitching_data and batting_data, get_*_data overlays the dynamic fields when read
         return
 
     def update_season_stats(self) -> None:
@@ -1256,18 +1376,10 @@ class BaseballStats:
         :return: None
         """
         with self.thread_lock:
-            logger.debug("Calculating team pitching stats...")
-            # self.new_season_pitching_data = \
-            #     team_pitching_stats(self.new_season_pitching_data[self.new_season_pitching_data['IP'] > 0].fillna(0))
-            self.new_season_pitching_data = team_pitching_stats(
-                self.new_season_pitching_data.fillna(0), filter_stats=False
-            )
-            logger.debug("Calculating team batting stats...")
-            # self.new_season_batting_data = \
-            #     team_batting_stats(self.new_season_batting_data[self.new_season_batting_data['AB'] > 0].fillna(0))
-            self.new_season_batting_data = team_batting_stats(
-                self.new_season_batting_data.fillna(0), filter_stats=False
-            )
+            logger.debug("Calculating team pitching and batting stats...")
+            self.new_season_pitching_data = self.new_season_pitching_data.fillna(0)
+            self.new_season_batting_data = self.new_season_batting_data.fillna(0)
+            self._refresh_rate_stats(full=True)  # end of season, recalculate every player
             logger.debug("Updated season pitching stats:\n{}", self.new_season_pitching_data.to_string(justify="right"))
 
             # Note: Sim WAR is calculated only during AI GM assessments (not after every game)
@@ -1297,7 +1409,7 @@ class BaseballStats:
 
         NOTE: This function must be called from within a lock-protected context
         (caller holds self.thread_lock). It does NOT acquire its own lock to avoid
-        deadlock on the non-reentrant threading.Lock().
+        deadlock on the non-reentrant lock.
 
         :return: None (modifies dataframes in place)
         """
@@ -1393,9 +1505,11 @@ class BaseballStats:
         if is_batter:
             self.move_player_in_df(self.batting_data, player_index, new_team)
             self.move_player_in_df(self.new_season_batting_data, player_index, new_team)
+            self.ui_changed_batters.add(player_index)
         if is_pitcher:
             self.move_player_in_df(self.pitching_data, player_index, new_team)
             self.move_player_in_df(self.new_season_pitching_data, player_index, new_team)
+            self.ui_changed_pitchers.add(player_index)
         return
 
     @staticmethod
@@ -1452,6 +1566,8 @@ class BaseballStats:
                 player_name = self.new_season_batting_data.loc[player_index, "Player"]
                 player_type = "Batter"
                 self.new_season_batting_data = self.new_season_batting_data.drop(player_index)
+                self.batting_splits.drop_players([player_index])
+                self.ui_changed_batters.add(player_index)
                 logger.info(f"Retired batter {player_name} ({player_index})")
 
         if is_pitcher:
@@ -1459,6 +1575,8 @@ class BaseballStats:
                 player_name = self.new_season_pitching_data.loc[player_index, "Player"]
                 player_type = "Pitcher"
                 self.new_season_pitching_data = self.new_season_pitching_data.drop(player_index)
+                self.pitching_splits.drop_players([player_index])
+                self.ui_changed_pitchers.add(player_index)
                 logger.info(f"Retired pitcher {player_name} ({player_index})")
 
         return (True, player_name, player_type)
@@ -1495,6 +1613,7 @@ class BaseballStats:
                 self.new_season_pitching_data.loc[player_index, "Condition"] = max(
                     0, self.new_season_pitching_data.loc[player_index, "Condition"] - 30
                 )
+                self.ui_changed_pitchers.add(player_index)
                 logger.info(
                     f"Placed pitcher {self.new_season_pitching_data.loc[player_index, 'Player']} "
                     f"on IL with {injury_desc} ({injury_days} days)"
@@ -1509,6 +1628,7 @@ class BaseballStats:
                 self.new_season_batting_data.loc[player_index, "Condition"] = max(
                     0, self.new_season_batting_data.loc[player_index, "Condition"] - 30
                 )
+                self.ui_changed_batters.add(player_index)
                 logger.info(
                     f"Placed batter {self.new_season_batting_data.loc[player_index, 'Player']} "
                     f"on IL with {injury_desc} ({injury_days} days)"
@@ -1516,42 +1636,58 @@ class BaseballStats:
 
         return (True, injury_desc, injury_days, player_type)
 
-    def print_current_season(self, teams: Optional[List[str]] = None, summary_only_b: bool = False) -> None:
+    def print_current_season(
+            self,
+            teams: Optional[List[str]] = None,
+            summary_only_b: bool = False,
+            sink: Optional[Callable[[str], None]] = print,
+    ) -> None:
         """
         prints the current season being played
         :param teams: option list of team names
         :param summary_only_b: print team totals or entire roster stats
+        :param sink: receives the report one team section at a time, None or print with console output suppressed
+            skips the report without building it
         :return: None
         """
         logger.debug("In print_current_season")
         logger.debug("Teams: {}", teams)
-        logger.debug("Current season batting data:\n{}", self.new_season_batting_data.head(5).to_string())
-        logger.debug(
-            "Current season batting stats:\n{}", team_batting_stats(self.new_season_batting_data).head(5).to_string()
-        )
+        if sink is None or (sink is print and self.suppress_console_output):
+            return
         teams = list(self.batting_data.Team.unique()) if teams is None else teams
         self.print_season(
             team_batting_stats(self.new_season_batting_data, filter_stats=False),
             team_pitching_stats(self.new_season_pitching_data, filter_stats=False),
             teams=teams,
             summary_only_b=summary_only_b,
+            sink=sink,
         )
         return
 
-    def print_prior_season(self, teams: Optional[List[str]] = None, summary_only_b: bool = False) -> None:
+    def print_prior_season(
+            self,
+            teams: Optional[List[str]] = None,
+            summary_only_b: bool = False,
+            sink: Optional[Callable[[str], None]] = print,
+    ) -> None:
         """
         useful to look back at the prior season to see the trend in the current one or just look at last years to
         start the season
         :param teams: option list of team names
         :param summary_only_b: print team totals or entire roster stats
+        :param sink: receives the report one team section at a time, None or print with console output suppressed
+            skips the report without building it
         :return: None
         """
+        if sink is None or (sink is print and self.suppress_console_output):
+            return
         teams = list(self.batting_data.Team.unique()) if teams is None else teams
         self.print_season(
             team_batting_stats(self.batting_data),
             team_pitching_stats(self.pitching_data),
             teams=teams,
             summary_only_b=summary_only_b,
+            sink=sink,
         )
         return
 
@@ -1639,6 +1775,7 @@ class BaseballStats:
             summary_only_b: bool = False,
             condition_text: bool = True,
             show_prior_year_comparison: bool = False,
+            sink: Optional[Callable[[str], None]] = print,
     ) -> None:
         """
         print a season either in flight or prior season, called from current and prior season methods
@@ -1648,114 +1785,109 @@ class BaseballStats:
         :param summary_only_b: print team totals or entire roster stats
         :param condition_text: print the condition of the player as text
         :param show_prior_year_comparison: If True, show three-row format with prior_year prorated and difference
+        :param sink: receives the report one team section at a time, e.g. print, None skips the report
         :return:
         """
-        if condition_text:
-            df_p["Condition"] = df_p["Condition"].apply(condition_txt_f)  # apply condition_txt static func
-            df_b["Condition"] = df_b["Condition"].apply(condition_txt_f)  # apply condition_txt static func
+        if sink is None:
+            return
+        for section in self.season_report(
+                df_b, df_p, teams, summary_only_b, condition_text, show_prior_year_comparison
+        ):
+            sink(section)
+        return
 
-        # Apply streak status text
-        df_p["Streak Status"] = df_p["Streak_Adjustment"].apply(streak_txt_f)
-        df_b["Streak Status"] = df_b["Streak_Adjustment"].apply(streak_txt_f)
+    def season_report(
+            self,
+            df_b: DataFrame,
+            df_p: DataFrame,
+            teams: List[str],
+            summary_only_b: bool = False,
+            condition_text: bool = True,
+            show_prior_year_comparison: bool = False,
+    ) -> Iterator[str]:
+        """
+        season report generated one team section at a time, a team is formatted only when its section is read
+        :param df_b: batter data
+        :param df_p: pitcher data
+        :param teams: list of team names
+        :param summary_only_b: team totals only or entire roster stats as well
+        :param condition_text: show the condition of the player as text
+        :param show_prior_year_comparison: If True, show three-row format with prior_year prorated and difference
+        :return: text of each team with data, without a trailing newline, as print() would write it
+        """
+        # format the report's teams once, instead of the whole league or once per team
+        df_p = df_p[df_p["Team"].isin(teams)].rename(columns={"Injured Days": "Estimated Days Remaining"})
+        df_b = df_b[df_b["Team"].isin(teams)].rename(columns={"Injured Days": "Estimated Days Remaining"})
+        df_p = df_p.rename_axis(None)  # Rename index to remove the separate "Hashcode" line
+        df_b = df_b.rename_axis(None)
+        if condition_text:
+            df_p["Condition"] = condition_txt_series(df_p["Condition"])
+            df_b["Condition"] = condition_txt_series(df_b["Condition"])
+        df_p["Streak Status"] = streak_txt_series(df_p["Streak_Adjustment"])
+        df_b["Streak Status"] = streak_txt_series(df_b["Streak_Adjustment"])
+        if "Pos" in df_b.columns:  # Format positions to remove brackets and quotes
+            df_b["Pos"] = df_b["Pos"].map(format_positions)
+        p_teams = dict(tuple(df_p.groupby("Team", sort=False)))
+        b_teams = dict(tuple(df_b.groupby("Team", sort=False)))
 
-        # Loop through each team to display stats
         for team in teams:
-            # Filter data for this team
-            df_p_team = df_p[df_p["Team"] == team].copy()
-            df_b_team = df_b[df_b["Team"] == team].copy()
-
+            df_p_team = p_teams.get(team, df_p.iloc[:0])
+            df_b_team = b_teams.get(team, df_b.iloc[:0])
             if len(df_p_team) == 0 and len(df_b_team) == 0:
                 continue  # Skip teams with no data
 
-            # Rename 'Injured Days' to 'Estimated Days Remaining'
-            if "Injured Days" in df_p_team.columns:
-                df_p_team = df_p_team.rename(columns={"Injured Days": "Estimated Days Remaining"})
-            if "Injured Days" in df_b_team.columns:
-                df_b_team = df_b_team.rename(columns={"Injured Days": "Estimated Days Remaining"})
-
-            # Format positions to remove brackets and quotes, but keep commas
-            if "Pos" in df_b_team.columns:
-                df_b_team["Pos"] = df_b_team["Pos"].apply(format_positions)
-
-            # Rename index to remove the separate "Hashcode" line
-            df_p_team = df_p_team.rename_axis(None)
-            df_b_team = df_b_team.rename_axis(None)
-
-            # Print individual player stats if not summary only
+            lines = []
+            # Individual player stats if not summary only
             if summary_only_b is False:
                 if len(df_p_team) > 0:
-                    print(f"\n{team} Pitchers:")
-                    print(df_p_team[self.pcols_to_print].to_string(justify="right", index_names=False))
+                    lines += [f"\n{team} Pitchers:",
+                              df_p_team[self.pcols_to_print].to_string(justify="right", index_names=False)]
                 if len(df_b_team) > 0:
-                    print(f"\n{team} Batters:")
-                    print(df_b_team[self.bcols_to_print].to_string(justify="right", index_names=False))
-
-            # Display team totals with optional prior_year comparison
-            if show_prior_year_comparison and hasattr(self, "team_games_played"):
-                games_played = self.team_games_played.get(team, 0)
-
-                if games_played > 0:
-                    # Get prorated prior_year stats
-                    batting_prior_year, pitching_prior_year = self.calculate_prorated_prior_year_stats(team,
-                                                                                                       games_played)
-
-                    # Calculate totals for all three rows
-                    current_p_totals = team_pitching_totals(df_p_team)
-                    current_b_totals = team_batting_totals(df_b_team)
-
-                    if len(pitching_prior_year) > 0:
-                        prorated_p_totals = team_pitching_totals(pitching_prior_year)
-                        diff_p_totals = self._calculate_difference_row(
-                            current_p_totals, prorated_p_totals, is_batting=False
-                        )
-
-                        # Display three-row format for pitching
-                        print(f"\n{team} Pitching Totals (Games: {games_played}):")
-                        print("Current:        ", current_p_totals[self.numeric_pcols_to_print].to_string(index=False))
-                        print("prior_year (Prorated):",
-                              prorated_p_totals[self.numeric_pcols_to_print].to_string(index=False))
-                        print("Difference:     ", diff_p_totals[self.numeric_pcols_to_print].to_string(index=False))
-                    else:
-                        # No prior_year data available for pitchers
-                        print(f"\n{team} Pitching Totals (Games: {games_played}):")
-                        print(current_p_totals[self.numeric_pcols_to_print].to_string(index=False))
-
-                    if len(batting_prior_year) > 0:
-                        prorated_b_totals = team_batting_totals(batting_prior_year)
-                        diff_b_totals = self._calculate_difference_row(
-                            current_b_totals, prorated_b_totals, is_batting=True
-                        )
-
-                        # Display three-row format for batting
-                        print(f"\n{team} Batting Totals (Games: {games_played}):")
-                        print("Current:        ", current_b_totals[self.numeric_bcols_to_print].to_string(index=False))
-                        print("prior_year (Prorated):",
-                              prorated_b_totals[self.numeric_bcols_to_print].to_string(index=False))
-                        print("Difference:     ", diff_b_totals[self.numeric_bcols_to_print].to_string(index=False))
-                    else:
-                        # No prior_year data available for batters
-                        print(f"\n{team} Batting Totals (Games: {games_played}):")
-                        print(current_b_totals[self.numeric_bcols_to_print].to_string(index=False))
-
-                else:
-                    # No games played yet, show standard display
-                    print(f"\n{team} Pitching Totals:")
-                    print(team_pitching_totals(df_p_team)[self.numeric_pcols_to_print].to_string(index=False))
-
-                    print(f"\n{team} Batting Totals:")
-                    print(team_batting_totals(df_b_team)[self.numeric_bcols_to_print].to_string(index=False))
+                    lines += [f"\n{team} Batters:",
+                              df_b_team[self.bcols_to_print].to_string(justify="right", index_names=False)]
+
+            # Team totals with optional prior_year comparison
+            games_played = self.team_games_played.get(team, 0) \
+                if show_prior_year_comparison and hasattr(self, "team_games_played") else 0
+            if games_played > 0:
+                batting_prior_year, pitching_prior_year = self.calculate_prorated_prior_year_stats(team, games_played)
+                lines += self._totals_lines(
+                    f"\n{team} Pitching Totals (Games: {games_played}):",
+                    team_pitching_totals(df_p_team), pitching_prior_year, is_batting=False
+                )
+                lines += self._totals_lines(
+                    f"\n{team} Batting Totals (Games: {games_played}):",
+                    team_batting_totals(df_b_team), batting_prior_year, is_batting=True
+                )
             else:
-                # Standard display (existing behavior)
-                print(f"\n{team} Pitching Totals:")
-                print(team_pitching_totals(df_p_team)[self.numeric_pcols_to_print].to_string(index=False))
-
-                print(f"\n{team} Batting Totals:")
-                print(team_batting_totals(df_b_team)[self.numeric_bcols_to_print].to_string(index=False))
-
-            print("\n")  # Add spacing between teams
+                lines += [f"\n{team} Pitching Totals:",
+                          team_pitching_totals(df_p_team)[self.numeric_pcols_to_print].to_string(index=False),
+                          f"\n{team} Batting Totals:",
+                          team_batting_totals(df_b_team)[self.numeric_bcols_to_print].to_string(index=False)]
+            lines.append("\n")  # Add spacing between teams
+            yield "\n".join(lines)
 
         return
 
+    def _totals_lines(self, heading: str, current: DataFrame, prior_year: DataFrame, is_batting: bool) -> List[str]:
+        """
+        report lines for team totals, with prorated prior year and difference rows when there is prior year data
+        :param heading: section heading
+        :param current: current team totals
+        :param prior_year: prorated prior year player stats of the team
+        :param is_batting: True for batting stats, False for pitching stats
+        :return: lines of the section
+        """
+        cols = self.numeric_bcols_to_print if is_batting else self.numeric_pcols_to_print
+        if len(prior_year) == 0:  # No prior_year data available
+            return [heading, current[cols].to_string(index=False)]
+        prorated = team_batting_totals(prior_year) if is_batting else team_pitching_totals(prior_year)
+        diff = self._calculate_difference_row(current, prorated, is_batting=is_batting)
+        return [heading,
+                "Current:         " + current[cols].to_string(index=False),
+                "prior_year (Prorated): " + prorated[cols].to_string(index=False),
+                "Difference:      " + diff[cols].to_string(index=False)]
+
 
 def injured_list_f(idays: int, is_pitcher: bool = False, is_concussion: bool = False) -> str:
     """
@@ -1814,6 +1946,30 @@ def streak_txt_f(streak: float) -> str:
         return "Normal"
 
 
+def condition_txt_series(condition: Series) -> Series:
+    """
+    condition_txt_f for a column at once
+    :param condition: condition levels, or text if already converted
+    :return: condition text
+    """
+    if condition.dtype == object:  # already converted to a string
+        return condition.map(condition_txt_f)
+    text = np.select([condition > 75, condition > 51, condition > 33], ["Peak", "Healthy", "Tired"], "Exhausted")
+    return Series(text, index=condition.index, dtype=object)
+
+
+def streak_txt_series(streak: Series) -> Series:
+    """
+    streak_txt_f for a column at once
+    :param streak: streak adjustment values, or text if already converted
+    :return: streak status text
+    """
+    if streak.dtype == object:  # already converted to a string
+        return streak.map(streak_txt_f)
+    text = np.select([streak >= HOT_COLD_STREAK, streak <= -HOT_COLD_STREAK], ["Hot", "Cold"], "Normal")
+    return Series(text, index=streak.index, dtype=object)
+
+
 def remove_non_print_cols(df: DataFrame) -> DataFrame:
     """
     Remove df columns that are for internal use only
@@ -2151,3 +2307,16 @@ if __name__ == "__main__":
     df_b, df_p = baseball_data.calculate_prorated_prior_year_stats(team_name=None, current_games_played=162)
     print("*****")
     print(df_b["AB"].sum())
+
+    # time the fused daily update kernel on its own, a full season of days for the pitching block
+    import time
+
+    pitchers = baseball_data.new_season_pitching_data
+    kernel_block = pitchers[DAILY_BLOCK_FIELDS].to_numpy(dtype=np.float64).T.copy()
+    kernel_ages = pitchers["Age"].to_numpy(dtype=np.float64)
+    kernel_played = pitchers["IP"].to_numpy() > 0
+    start_time = time.perf_counter()
+    for _ in range(162):
+        baseball_data.daily_update_block(kernel_block, kernel_ages, kernel_played, is_pitcher=True)
+    elapsed = time.perf_counter() - start_time
+    print(f"daily_update_block: {len(pitchers)} pitchers, {elapsed / 162 * 1e6:.0f} microseconds per day")
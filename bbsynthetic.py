@@ -0,0 +1,458 @@
+"""
+Copyright (c) 2024 Jim Maastricht
+
+Synthetic league generator for load testing the season engine, standings, leaderboards and UI well past MLB size,
+e.g. 300 teams and 20k players in 4 leagues of 5 divisions.
+Every synthetic player is a real player's projected line and career drawn with replacement from the files written by
+bbplayer_projections.py, so rates keep their historical joint distribution.  Playing time and outcome rates are
+jittered per player and the player gets a new name, age and team.  Rosters are filled position by position so every
+team can field a lineup and a rotation.  Writes matching projected, New-Season and historical files plus a random
+schedule, load them with BaseballSeason(**league.season_files()) so prior season stats come from the synthetic careers.
+"""
+
+import itertools
+import string
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from pandas.core.frame import DataFrame
+
+import bbinnings
+import city_names as city
+from bbplayer_projections import BATTING_ZERO_COLS, PITCHING_ZERO_COLS, BaseballStatsPreProcess
+from bbschedule_mgr import ScheduleManager
+
+SYNTHETIC_PREFIX = "synthetic-"
+LEAGUE_NAMES = ["AL", "NL", "SOL", "NNL"]  # AL and NL first, the playoffs seed those two, then Some Other / No Name
+DIVISION_NAMES = ["East", "Central", "West", "North", "South"]
+BATTING_COUNT_COLS = ["G", "PA", "AB", "R", "H", "2B", "3B", "HR", "RBI", "SB", "CS", "BB", "SO", "SH", "SF", "GIDP",
+                      "HBP"]
+PITCHING_COUNT_COLS = ["G", "GS", "CG", "SHO", "AB", "PA", "H", "2B", "3B", "HR", "ER", "R", "SO", "BB", "W", "L",
+                       "SV", "WP", "HBP", "BK", "HLD", "BS"]
+BATTING_OUTCOME_COLS = ["H", "2B", "3B", "HR", "BB", "SO", "SB"]  # get a per player rate jitter on top of playing time
+PITCHING_OUTCOME_COLS = ["H", "HR", "ER", "BB", "SO"]
+BATTING_MIN_ROSTER = {"C": 2, "1B": 1, "2B": 1, "3B": 1, "SS": 1, "LF": 1, "CF": 1, "RF": 1}  # per team
+PITCHING_MIN_ROSTER = {"SP": 5, "RP": 7}
+PLAYING_TIME_JITTER = 0.15  # sigma of the log playing time factor
+RATE_JITTER = 0.08  # sigma of the log factor on each outcome rate
+AGE_JITTER = 2  # years either side of the template's age
+
+
+def league_structure(teams: int, leagues: int, divisions: int, rng: np.random.Generator) -> DataFrame:
+    """
+    teams spread evenly over leagues and each league's divisions, with unique cities, mascots and 3 letter codes
+    :param teams: number of teams
+    :param leagues: number of leagues
+    :param divisions: divisions per league
+    :param rng: random generator
+    :return: df with Team, City, Mascot, League and Division, one row per team
+    """
+    if teams < leagues * divisions * 2:
+        raise ValueError(f"{teams} teams cannot fill {leagues} leagues of {divisions} divisions")
+    cities = np.array(sorted(set(city.names)), dtype=object)
+    picks = rng.permutation(np.arange(teams) % len(cities))
+    rounds = np.arange(teams) // len(cities)  # more teams than cities, reuse them as 'Springfield 2'
+    city_col = pd.Series(cities[picks]) + pd.Series(np.where(rounds > 0, " " + (rounds + 1).astype(str), ""))
+    with open("animals.txt", "r") as f:
+        animals = np.array([animal.strip() for animal in f if animal.strip()], dtype=object)
+    mascots = rng.choice(animals, teams, replace=teams > len(animals))
+
+    abbrevs = city_col.str.replace(r"[^A-Za-z]", "", regex=True).str[:3].str.upper()
+    # the first city keeps its abbreviation, repeats and short ones get a spare code
+    taken = abbrevs.duplicated() | abbrevs.isin(["OFF"]) | (abbrevs.str.len() < 3)
+    spare = sorted(set("".join(code) for code in itertools.product(string.ascii_uppercase, repeat=3))
+                   - set(abbrevs) - {"OFF"})
+    abbrevs[taken] = rng.choice(np.array(spare, dtype=object), int(taken.sum()), replace=False)
+
+    league = np.arange(teams) * leagues // teams
+    first_of_league = np.searchsorted(league, league)
+    league_size = np.bincount(league)[league]
+    division = (np.arange(teams) - first_of_league) * divisions // league_size
+    league_names = LEAGUE_NAMES + [f"L{i + 1}" for i in range(len(LEAGUE_NAMES), leagues)]
+    division_names = DIVISION_NAMES + [f"Division {i + 1}" for i in range(len(DIVISION_NAMES), divisions)]
+    return pd.DataFrame({
+        "Team": abbrevs.to_numpy(),
+        "City": city_col.to_numpy(),
+        "Mascot": mascots,
+        "League": np.array(league_names, dtype=object)[league],
+        "Division": np.array(division_names, dtype=object)[division],
+    })
+
+
+def unique_names(first_names: np.ndarray, last_names: np.ndarray, count: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    random first and last name pairs, repeats get a Jr., II, ... suffix so every name (and hashcode) is unique
+    :param first_names: pool of first names
+    :param last_names: pool of last names
+    :param count: names to draw
+    :param rng: random generator
+    :return: array of names
+    """
+    names = pd.Series(rng.choice(first_names, count)) + " " + pd.Series(rng.choice(last_names, count))
+    repeat = names.groupby(names).cumcount()
+    suffixes = np.array(["", " Jr.", " II", " III", " IV", " V"], dtype=object)
+    suffix = np.where(repeat < len(suffixes), suffixes[np.minimum(repeat, len(suffixes) - 1)],
+                      " " + (repeat + 1).astype(str))
+    return (names + suffix).to_numpy()
+
+
+def roster_strata(df: DataFrame, is_p: bool) -> pd.Series:
+    """
+    roster slot of each player: first listed position for batters (DH without one), SP or RP for pitchers
+    :param df: projected df
+    :param is_p: True for pitchers
+    :return: series of slot names aligned with df
+    """
+    if is_p:
+        return pd.Series(np.where(df["GS"] * 2 >= df["G"].clip(lower=1), "SP", "RP"), index=df.index)
+    first = df["Pos"].fillna("DH").astype(str).str.split(",").str[0].str.strip("[]' ").str.upper()
+    return first.replace("", "DH")
+
+
+def roster_counts(shares: pd.Series, per_team: float, teams: int, minimums: Dict[str, int],
+                  rng: np.random.Generator) -> np.ndarray:
+    """
+    players per team per slot, each team gets the real share of every slot plus random slots for the remainder
+    :param shares: fraction of players in each slot
+    :param per_team: players per team on this side
+    :param teams: number of teams
+    :param minimums: slot to the fewest players a team can play with
+    :param rng: random generator
+    :return: teams x slots array of counts
+    """
+    base = np.floor(shares.to_numpy() * per_team).astype(int)
+    leftover = max(int(round(per_team)) - int(base.sum()), 0)
+    counts = np.tile(base, (teams, 1))
+    extra = rng.choice(len(shares), size=teams * leftover, p=shares.to_numpy())
+    np.add.at(counts, (np.repeat(np.arange(teams), leftover), extra), 1)
+    floor = np.array([minimums.get(slot, 0) for slot in shares.index])
+    return np.maximum(counts, floor)
+
+
+def jitter_counts(df: DataFrame, cols: List[str], factor: np.ndarray) -> None:
+    """
+    scale counting stats in place by a per row factor, int columns stay int
+    :param df: df to update
+    :param cols: columns to scale, missing ones are skipped
+    :param factor: one factor per row
+    :return: None
+    """
+    for col in cols:
+        if col in df.columns:
+            values = df[col].to_numpy(dtype=float) * factor
+            df[col] = np.round(values).astype(int) if df[col].dtype.kind in "iu" else values
+    return
+
+
+def batting_rates(df: DataFrame) -> None:
+    """recompute batting rate stats in place from the counting stats, only for the columns the df has"""
+    ab = df["AB"].replace(0, np.nan)
+    total_bases = df["H"] + df["2B"] + df["3B"] * 2 + df["HR"] * 3
+    obp = (df["H"] + df["BB"] + df["HBP"]) / (df["AB"] + df["BB"] + df["HBP"] + df["SF"]).replace(0, np.nan)
+    rates = {"BA": df["H"] / ab, "AVG": df["H"] / ab, "OBP": obp, "SLG": total_bases / ab,
+             "OPS": obp + total_bases / ab}
+    for col, values in rates.items():
+        if col in df.columns:
+            df[col] = values.fillna(0.0).round(3)
+    if "Total_OB" in df.columns:
+        df["Total_OB"] = df["H"] + df["BB"] + df["HBP"]
+        df["Total_Outs"] = df["AB"] - df["H"]
+    return
+
+
+def pitching_rates(df: DataFrame, innings: pd.Series) -> None:
+    """
+    recompute pitching rate stats in place from the counting stats, only for the columns the df has
+    :param df: df to update
+    :param innings: innings as a true decimal, not the .1/.2 notation
+    :return: None
+    """
+    innings = innings.replace(0, np.nan)
+    df["ERA"] = (df["ER"] * 9 / innings).fillna(0.0).round(2)
+    df["WHIP"] = ((df["BB"] + df["H"]) / innings).fillna(0.0).round(3)
+    if "OBP" in df.columns:
+        df["OBP"] = (df["WHIP"] / (3 + df["WHIP"])).round(3)
+    if "Total_OB" in df.columns:
+        df["Total_OB"] = df["H"] + df["BB"]
+        df["Total_Outs"] = df["IP"] * 3
+        df["AVG_faced"] = ((df["Total_OB"] + df["Total_Outs"]) / df["G"].replace(0, np.nan)).fillna(0.0)
+    return
+
+
+class SyntheticLeague:
+    """
+    Generates and saves a synthetic league built from the real projected and historical files.
+
+    Attributes:
+        load_seasons: seasons in the names of the real files, the synthetic files use the same seasons
+        new_season: season being simulated
+        structure: df with Team, City, Mascot, League and Division, one row per team
+        batting_data, pitching_data: synthetic projected dfs indexed by Hashcode
+        new_season_batting_data, new_season_pitching_data: projected dfs with counting stats zeroed
+        batting_data_historical, pitching_data_historical: synthetic careers indexed by Player_Season_Key
+        schedule: df with Date, Time, Away_Team, Home_Team, Away_Score and Home_Score
+    """
+
+    def __init__(self, load_seasons: List[int], new_season: int, teams: int = 300, players: int = 20000,
+                 leagues: int = 2, divisions: int = 3, season_length: int = 162, series_length: int = 3,
+                 seed: Optional[int] = None) -> None:
+        """
+        :param load_seasons: seasons in the real file names written by bbplayer_projections.py
+        :param new_season: season to simulate
+        :param teams: number of teams
+        :param players: players over all teams, batters and pitchers split in the real proportion
+        :param leagues: number of leagues
+        :param divisions: divisions per league
+        :param season_length: games per team in the random schedule
+        :param series_length: games per series
+        :param seed: random seed, None for a different league every run
+        """
+        self.load_seasons = load_seasons
+        self.new_season = new_season
+        self.teams = teams
+        self.players = players
+        self.season_length = season_length
+        self.series_length = series_length
+        self.rng = np.random.default_rng(seed)
+        self.structure = league_structure(teams, leagues, divisions, self.rng)
+        self.batting_data = None
+        self.pitching_data = None
+        self.new_season_batting_data = None
+        self.new_season_pitching_data = None
+        self.batting_data_historical = None
+        self.pitching_data_historical = None
+        self.schedule = None
+        return
+
+    def real_file(self, name: str) -> str:
+        """file name of a real file written by bbplayer_projections.py for the load seasons"""
+        return f"{' '.join(str(season) for season in self.load_seasons)} {name}"
+
+    def generate(self) -> None:
+        """
+        build both sides and the schedule
+        :return: None
+        """
+        real_b = pd.read_csv(self.real_file("player-projected-stats-pp-Batting.csv"), dtype={"Hashcode": str})
+        real_p = pd.read_csv(self.real_file("player-projected-stats-pp-Pitching.csv"), dtype={"Hashcode": str})
+        split_names = pd.concat([real_b["Player"], real_p["Player"]]).str.split(pat=" ", n=1, expand=True).dropna()
+        batters = int(round(self.players * len(real_b) / (len(real_b) + len(real_p))))
+        minimums = sum(BATTING_MIN_ROSTER.values()) + sum(PITCHING_MIN_ROSTER.values())
+        names = unique_names(split_names[0].unique(), split_names[1].unique(), self.players + self.teams * minimums,
+                             self.rng)  # roster minimums can add up to this many players
+
+        self.batting_data, self.batting_data_historical = self.synthesize_side(
+            real_b, self.real_file("historical-Batting.csv"), batters, names, is_p=False
+        )
+        self.pitching_data, self.pitching_data_historical = self.synthesize_side(
+            real_p, self.real_file("historical-Pitching.csv"), self.players - batters, names[len(self.batting_data):],
+            is_p=True
+        )
+        self.new_season_batting_data = self.new_season_frame(self.batting_data, False)
+        self.new_season_pitching_data = self.new_season_frame(self.pitching_data, True)
+        self.schedule = self.random_schedule()
+        return
+
+    def synthesize_side(self, real: DataFrame, historical_file: str, count: int, names: np.ndarray,
+                        is_p: bool) -> tuple:
+        """
+        projected and historical dfs for one side of the synthetic league
+        :param real: real projected df with Hashcode as a str column
+        :param historical_file: real historical file for the same side
+        :param count: players wanted on this side, the roster minimums can add a few
+        :param names: unique names, enough for count plus the roster minimums
+        :param is_p: True for pitchers
+        :return: tuple of projected df indexed by Hashcode and historical df indexed by Player_Season_Key
+        """
+        strata = roster_strata(real, is_p)
+        shares = strata.value_counts(normalize=True)
+        counts = roster_counts(shares, count / self.teams, self.teams,
+                               PITCHING_MIN_ROSTER if is_p else BATTING_MIN_ROSTER, self.rng)
+        templates, team_ids = [], []
+        for j, slot in enumerate(shares.index):  # draw each slot from the real players in that slot
+            templates.append(self.rng.choice(np.flatnonzero(strata.to_numpy() == slot), counts[:, j].sum()))
+            team_ids.append(np.repeat(np.arange(self.teams), counts[:, j]))
+        team_ids = np.concatenate(team_ids)
+        order = np.argsort(team_ids, kind="stable")  # keep each roster together
+        templates, team_ids = np.concatenate(templates)[order], team_ids[order]
+        players = len(templates)
+        names = names[:players]
+
+        role = "Pitcher" if is_p else "Hitter"
+        hashcodes = BaseballStatsPreProcess.create_hashes(pd.Series(names), role).to_numpy()
+        playing_time = self.rng.lognormal(0.0, PLAYING_TIME_JITTER, players)
+        outcome_cols = PITCHING_OUTCOME_COLS if is_p else BATTING_OUTCOME_COLS
+        outcomes = self.rng.lognormal(0.0, RATE_JITTER, (players, len(outcome_cols)))
+        ages = self.rng.integers(-AGE_JITTER, AGE_JITTER + 1, players)
+
+        projected = real.iloc[templates].reset_index(drop=True)
+        historical = pd.read_csv(historical_file, dtype={"Hashcode": str})
+        career_keys = historical["Player_Season_Key"].str.split("_").str[0]  # partial season rows lack a Hashcode
+        owner, rows = self.career_rows(career_keys.to_numpy(dtype=str), projected["Hashcode"].to_numpy(dtype=str))
+        historical = historical.iloc[rows].reset_index(drop=True)
+
+        for df, player, is_projected in [(projected, np.arange(players), True), (historical, owner, False)]:
+            team = self.structure.iloc[team_ids[player]]
+            df["Player"] = names[player]
+            df["Hashcode"] = hashcodes[player]
+            df["Age"] = (df["Age"] + ages[player]).clip(lower=18)
+            for col in ["Team", "City", "Mascot", "League", "Division"]:
+                df[col] = team[col].to_numpy()
+            df["Teams"] = df["Team"].apply(lambda x: [x])
+            df["Leagues"] = df["League"].apply(lambda x: [x])
+            jitter_counts(df, PITCHING_COUNT_COLS if is_p else BATTING_COUNT_COLS, playing_time[player])
+            for k, col in enumerate(outcome_cols):
+                jitter_counts(df, [col], outcomes[player, k])
+            self.make_consistent(df, is_p)
+            if is_p:
+                pitching_rates(df, self.scale_innings(df, playing_time[player], is_projected))
+            else:
+                batting_rates(df)
+
+        projected["Player_Season_Key"] = projected["Hashcode"].astype(str) + "_" + projected[
+            "Player_Season_Key"].str.split("_").str[-1]
+        projected = projected.set_index("Hashcode")
+        historical["Player_Season_Key"] = historical["Hashcode"].astype(str) + "_" + historical["Season"].astype(str)
+        historical = historical.sort_values("Season", kind="stable").set_index("Player_Season_Key")
+        return projected, historical
+
+    @staticmethod
+    def career_rows(real_keys: np.ndarray, template_keys: np.ndarray) -> tuple:
+        """
+        historical rows of every template player, in file order, without a python loop over players
+        :param real_keys: Hashcode of each real historical row
+        :param template_keys: real Hashcode each synthetic player was drawn from
+        :return: tuple of (synthetic player of each row, real historical row position)
+        """
+        order = np.argsort(real_keys, kind="stable")
+        uniq, start, size = np.unique(real_keys[order], return_index=True, return_counts=True)
+        pos = np.minimum(np.searchsorted(uniq, template_keys), len(uniq) - 1)
+        size = np.where(uniq[pos] == template_keys, size[pos], 0)
+        owner = np.repeat(np.arange(len(template_keys)), size)
+        offset = np.arange(size.sum()) - np.repeat(np.cumsum(size) - size, size)
+        return owner, order[np.repeat(start[pos], size) + offset]
+
+    @staticmethod
+    def make_consistent(df: DataFrame, is_p: bool) -> None:
+        """keep jittered counts possible: extra base hits within hits, hits within at bats, earned runs within runs"""
+        if is_p:
+            df["R"] = np.maximum(df["R"], np.round(df["ER"])).astype(df["R"].dtype)
+            return
+        df["HR"] = np.minimum(df["HR"], df["H"])
+        df["3B"] = np.minimum(df["3B"], df["H"] - df["HR"])
+        df["2B"] = np.minimum(df["2B"], df["H"] - df["HR"] - df["3B"])
+        df["H"] = np.minimum(df["H"], df["AB"])
+        df["PA"] = np.maximum(df["PA"], df["AB"] + df["BB"] + df["HBP"] + df["SF"] + df["SH"])
+        return
+
+    @staticmethod
+    def scale_innings(df: DataFrame, factor: np.ndarray, projected: bool) -> pd.Series:
+        """
+        scale innings in place, projected files hold a true decimal and historical ones the .1/.2 notation
+        :param df: pitching df
+        :param factor: playing time factor per row
+        :param projected: True for the projected df
+        :return: scaled innings as a true decimal
+        """
+        if not projected:
+            outs = np.round(bbinnings.ip_to_outs(df["IP"].to_numpy()) * factor)
+            df["IP"] = bbinnings.outs_to_ip(outs)
+            return pd.Series(outs / 3, index=df.index)
+        true_innings = df["IP"] * factor
+        df["IP"] = true_innings
+        df["IP_True"] = true_innings
+        df["IP_Dec"] = np.trunc(true_innings) + (true_innings % 1) * 3.333
+        df["BIP"] = (df["PA"] - df["SO"] - df["BB"]).clip(lower=1)
+        return true_innings
+
+    def new_season_frame(self, projected: DataFrame, is_p: bool) -> DataFrame:
+        """
+        New-Season df, the projected df with every counting stat zeroed as in create_new_season_from_existing
+        :param projected: synthetic projected df
+        :param is_p: True for pitchers
+        :return: df indexed by Hashcode
+        """
+        new_season = projected.copy()
+        zero_cols = (PITCHING_COUNT_COLS + ["IP"] + PITCHING_ZERO_COLS) if is_p else (
+            BATTING_COUNT_COLS + BATTING_ZERO_COLS)
+        new_season[[col for col in dict.fromkeys(zero_cols) if col in new_season.columns]] = 0
+        new_season["Season"] = self.new_season
+        new_season["Condition"] = 100
+        new_season["Streak_Adjustment"] = 0.0
+        new_season["Injured Days"] = 0
+        if self.new_season not in self.load_seasons:
+            new_season["Age"] = new_season["Age"] + 1
+        return new_season
+
+    def random_schedule(self) -> DataFrame:
+        """
+        round robin schedule from ScheduleManager.create_random in the downloaded schedule's csv layout
+        :return: df with Date, Time, Away_Team, Home_Team, Away_Score and Home_Score
+        """
+        manager = ScheduleManager(None, self.new_season)
+        manager.create_random(list(self.structure["Team"]), self.season_length, self.series_length)
+        games = [(day.date, game.away, game.home) for day in manager.schedule for game in day.games
+                 if not game.is_off_day]
+        schedule = pd.DataFrame(games, columns=["Date", "Away_Team", "Home_Team"])
+        schedule.insert(1, "Time", "19:05")  # a start time marks the game as not played yet
+        schedule["Away_Score"] = 0
+        schedule["Home_Score"] = 0
+        return schedule
+
+    def file_names(self) -> Dict[str, str]:
+        """
+        synthetic file names, the load_ entries are the BaseballSeason file parameters, see season_files()
+        :return: dict of file kind to file name
+        """
+        seasons_str = " ".join(str(season) for season in self.load_seasons)
+        return {
+            "load_batter_file": f"{SYNTHETIC_PREFIX}player-projected-stats-pp-Batting.csv",
+            "load_pitcher_file": f"{SYNTHETIC_PREFIX}player-projected-stats-pp-Pitching.csv",
+            "projected_batting": f"{seasons_str} {SYNTHETIC_PREFIX}player-projected-stats-pp-Batting.csv",
+            "projected_pitching": f"{seasons_str} {SYNTHETIC_PREFIX}player-projected-stats-pp-Pitching.csv",
+            "new_season_batting": f"{self.new_season} New-Season-{SYNTHETIC_PREFIX}stats-pp-Batting.csv",
+            "new_season_pitching": f"{self.new_season} New-Season-{SYNTHETIC_PREFIX}stats-pp-Pitching.csv",
+            "historical_batting": f"{seasons_str} {SYNTHETIC_PREFIX}historical-Batting.csv",
+            "historical_pitching": f"{seasons_str} {SYNTHETIC_PREFIX}historical-Pitching.csv",
+            "load_historical_batter_file": f"{SYNTHETIC_PREFIX}historical-Batting.csv",
+            "load_historical_pitcher_file": f"{SYNTHETIC_PREFIX}historical-Pitching.csv",
+            "load_schedule_file": f"{self.new_season} {SYNTHETIC_PREFIX}Schedule.csv",
+        }
+
+    def season_files(self) -> Dict[str, str]:
+        """
+        file parameters for BaseballSeason, projected, historical and schedule files of the synthetic league
+        :return: dict of BaseballSeason parameter to file name
+        """
+        return {key: name for key, name in self.file_names().items() if key.startswith("load_")}
+
+    def save(self) -> None:
+        """
+        write the synthetic files next to the real ones
+        :return: None
+        """
+        files = self.file_names()
+        self.batting_data.to_csv(files["projected_batting"], index=True, header=True)
+        self.pitching_data.to_csv(files["projected_pitching"], index=True, header=True)
+        self.new_season_batting_data.to_csv(files["new_season_batting"], index=True, header=True)
+        self.new_season_pitching_data.to_csv(files["new_season_pitching"], index=True, header=True)
+        self.batting_data_historical.to_csv(files["historical_batting"], index=True, header=True)
+        self.pitching_data_historical.to_csv(files["historical_pitching"], index=True, header=True)
+        self.schedule.to_csv(files["load_schedule_file"], index=False)
+        print(f"Saved synthetic league: {files['projected_batting']}, {files['projected_pitching']} and "
+              f"{files['load_schedule_file']}")
+        return
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    league = SyntheticLeague(load_seasons=[2020, 2021, 2022, 2023, 2024, 2025, 2026], new_season=2026,
+                             teams=300, players=20000, leagues=4, divisions=5, seed=7)
+    league.generate()
+    print(f"generated {league.teams} teams, {len(league.batting_data)} batters, {len(league.pitching_data)} "
+          f"pitchers, {len(league.schedule)} games in {time.perf_counter() - start:.1f}s")
+    print(league.structure.groupby(["League", "Division"]).size().unstack())
+    league.save()
+    print(f"saved in {time.perf_counter() - start:.1f}s")
@@ -161,9 +161,7 @@ class Team:
                 self.baseball_data.new_season_pitching_data["Condition"].dtype == float
                 or self.baseball_data.new_season_pitching_data["Condition"].dtype == int
         ):  # action already been performed
-            # Sync all dynamic fields (condition, injuries, streaks) from new season to gameplay dataframes
-            self.baseball_data.sync_dynamic_fields(self.gameplay_pitchers_df, self.gameplay_pos_players_df)
-
+            # gameplay dataframes already carry the current dynamic fields (condition, injuries, streaks)
             # Apply condition to AVG_faced for pitchers
             self.gameplay_pitchers_df["AVG_faced"] = self.gameplay_pitchers_df["AVG_faced"] * (
                     self.gameplay_pitchers_df["Condition"] / 100
@@ -325,6 +323,7 @@ class Team:
         position_list = ["C", "2B", "3B", "SS", "LF", "CF", "RF", "1B", "DH"]
         pos_index_list = []
         pos_index_dict = {}
+        ops_criteria = self.set_recent_form_ops()  # OPS or Form_OPS if recent form is weighted in
 
         for position in position_list:
             pos_index_dict.update({position: position})
@@ -335,7 +334,7 @@ class Team:
                 # We pass a custom criteria name that search_for_pos will need to handle
                 criteria = "DEF_ADJ_OPS"
             else:
-                criteria = "OPS"
+                criteria = ops_criteria
 
             pos_index = self.search_for_pos(position=position, lineup_index_list=pos_index_list, stat_criteria=criteria)
 
@@ -347,7 +346,7 @@ class Team:
         sb_index_list = self.best_at_stat(pos_index_list, "SB", count=1)  # list of index#,scans master df
         slg_index_list = self.best_at_stat(pos_index_list, "SLG", count=2, exclude=sb_index_list)  # excl sb
         self.cur_lineup_index_list = self.best_at_stat(
-            pos_index_list, "OPS", count=6, exclude=sb_index_list + slg_index_list
+            pos_index_list, ops_criteria, count=6, exclude=sb_index_list + slg_index_list
         )  # setup initial list
 
         # insert players into lineup. 1st spot is the best SB, 4th and 5th are best SLG
@@ -356,6 +355,25 @@ class Team:
         self.insert_player_in_lineup(player_hashcode=slg_index_list[1], target_batting_order_pos=5)
         return pos_index_dict
 
+    def set_recent_form_ops(self) -> str:
+        """
+        blend each hitter's OPS with their rolling OPS over the last few games into a Form_OPS column
+        only players with enough recent plate appearances are blended, everyone else keeps their OPS
+        :return: column name to sort hitters by, OPS when recent form is turned off
+        """
+        weight = self.baseball_data.recent_form_weight
+        if weight <= 0:
+            if "Form_OPS" in self.gameplay_pos_players_df.columns:  # form was turned off, DEF_ADJ_OPS falls back to OPS
+                del self.gameplay_pos_players_df["Form_OPS"]
+            return "OPS"
+        window = self.baseball_data.recent_form_window
+        rolling_df = self.baseball_data.get_rolling_batting_stats(window=window, team_name=self.team_name)
+        rolling_df = rolling_df[rolling_df["PA"] >= 2 * window]  # 2 PA per game in the window to count as form
+        rolling_ops = rolling_df["OPS"].reindex(self.gameplay_pos_players_df.index)
+        base_ops = self.gameplay_pos_players_df["OPS"]
+        self.gameplay_pos_players_df["Form_OPS"] = (base_ops * (1 - weight) + rolling_ops * weight).fillna(base_ops)
+        return "Form_OPS"
+
     def set_initial_starting_rotation(self, force_starting_pitcher: None = None) -> None:
         """
         set the initial starting rotation or use the pitcher provided
@@ -738,7 +756,8 @@ class Team:
 
         # 5. Execute Sort (Stat Logic)
         if stat_criteria == "DEF_ADJ_OPS":
-            eligible_subset["DEF_ADJ_OPS"] = eligible_subset["OPS"] + (eligible_subset["Def_WAR"] * 0.100)
+            ops = eligible_subset["Form_OPS"] if "Form_OPS" in eligible_subset.columns else eligible_subset["OPS"]
+            eligible_subset["DEF_ADJ_OPS"] = ops + (eligible_subset["Def_WAR"] * 0.100)
             df_players = eligible_subset.sort_values("DEF_ADJ_OPS", ascending=False)
         else:
             df_players = eligible_subset.sort_values(stat_criteria, ascending=False)
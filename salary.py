@@ -6,8 +6,14 @@ MLB salary data loading, hashcode matching, and league-minimum fill.
 
 import pandas as pd
 import hashlib
+import os
+import pickle
+from typing import Callable, Dict, Optional, Union
+
 import numpy as np
 
+HASH_PROBE = ("Probe Player", "Hitter")  # fixed input, its hashcode tells whether the hash function changed
+
 
 def compare_strings(str1, str2):
     """Compare two strings and print character-level differences."""
@@ -19,7 +25,87 @@ def compare_strings(str1, str2):
     return
 
 
-def retrieve_salary(war_file_name, hashfunc, debug=False):
+class HashCache:
+    """
+    Hashcodes of (name, role) pairs, each distinct pair is hashed once and the codes are kept on disk between runs.
+
+    Attributes:
+        hashfunc: function of (name, role) returning the hashcode, cached codes from another function, or from an
+            edited version of it that hashes HASH_PROBE differently, are ignored
+        cache_dir: directory for one pickle per role, so pipelines in different processes never write the same file,
+            None keeps the codes in memory only
+        codes: role to {name: hashcode}
+    """
+
+    def __init__(self, hashfunc: Callable, cache_dir: Optional[str] = None) -> None:
+        self.hashfunc = hashfunc
+        self.cache_dir = cache_dir
+        self.codes: Dict[str, Dict[str, object]] = {}
+        self._dirty = set()
+        self._func_name = f"{hashfunc.__module__}.{hashfunc.__qualname__}"
+        self._probe = hashfunc(*HASH_PROBE) if cache_dir is not None else None
+        return
+
+    def _path(self, role: str) -> str:
+        return os.path.join(self.cache_dir, f"hashcodes-{role}.pkl")
+
+    def _load(self, role: str) -> Dict[str, object]:
+        """codes saved for role by this hash function, empty if none"""
+        if self.cache_dir is None or not os.path.exists(self._path(role)):
+            return {}
+        try:
+            with open(self._path(role), "rb") as f:
+                saved = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return {}
+        if saved.get("hashfunc") != self._func_name or saved.get("probe") != self._probe:
+            return {}
+        return saved["codes"]
+
+    def hashes(self, names: pd.Series, roles: Union[str, pd.Series]) -> pd.Series:
+        """
+        hashcode of every name, only names never seen before for their role are hashed
+        :param names: player names
+        :param roles: one role for all names or a role per name, e.g. 'Hitter' or 'Pitcher'
+        :return: series of hashcodes aligned with names
+        """
+        roles = pd.Series(roles, index=names.index) if isinstance(roles, str) else roles
+        result = pd.Series(index=names.index, dtype=object)
+        for role in roles.unique():
+            in_role = (roles == role).to_numpy()
+            if role not in self.codes:
+                self.codes[role] = self._load(role)
+            codes = self.codes[role]
+            new_names = [name for name in names[in_role].unique() if name not in codes]
+            if new_names:
+                codes.update((name, self.hashfunc(name, role)) for name in new_names)
+                self._dirty.add(role)
+            result[in_role] = names[in_role].map(codes).to_numpy()
+        return result
+
+    def save(self) -> None:
+        """write the roles with new codes, merged with what other processes saved since they were read"""
+        if self.cache_dir is None:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        for role in self._dirty:
+            codes = self._load(role)
+            codes.update((name, code) for name, code in self.codes[role].items() if isinstance(name, str))  # no NaN
+            temp = self._path(role) + f".{os.getpid()}"
+            with open(temp, "wb") as f:
+                pickle.dump({"hashfunc": self._func_name, "probe": self._probe, "codes": codes}, f)
+            os.replace(temp, self._path(role))  # readers never see a half written file
+        self._dirty.clear()
+        return
+
+
+def normalize_names(names: pd.Series) -> pd.Series:
+    """'Last, First' to 'First Last' for a whole column"""
+    parts = names.str.split(",", expand=True)
+    return parts[1].str.strip() + " " + parts[0].str.strip()
+
+
+def retrieve_salary(war_file_name, hashfunc, debug=False, hash_cache: Optional[HashCache] = None):
     # war files include full seasons up to and including 2023
     try:
         df = pd.read_csv(war_file_name)
@@ -27,12 +113,9 @@ def retrieve_salary(war_file_name, hashfunc, debug=False):
         return None
 
     df = df.drop(["Unnamed: 4", "Unnamed: 5", "Unnamed: 6"], axis=1)
-    df["Player"] = df["Player"].apply(
-        lambda x: x.split(",")[1].lstrip().rstrip() + " " + x.split(",")[0].lstrip().rstrip()
-    )
+    df["Player"] = normalize_names(df["Player"])
     df = df.rename(columns={"Player": "Player_S", df.columns[2]: "Salary"})  # col 2 is 2024 -> salary
-    df["Salary"] = df["Salary"].astype(str)
-    df["Salary"] = df["Salary"].apply(lambda x: x.replace("$", "").replace(",", "").replace("nan", "0"))
+    df["Salary"] = df["Salary"].astype(str).str.replace(r"[$,]", "", regex=True).str.replace("nan", "0")
     df = df.dropna(subset=["Salary"])
     df["Salary"] = df["Salary"].astype(float).astype(int)
 
@@ -40,7 +123,9 @@ def retrieve_salary(war_file_name, hashfunc, debug=False):
     hitter_positions = ["dh", "1b", "2b", "3b", "ss", "c", "lf", "rf", "cf"]
     # 2. Use np.where to assign the role (Vectorized & Fast)
     df["Role"] = np.where(df["Pos'n"].str.lower().isin(hitter_positions), "Hitter", "Pitcher")
-    df["Hashcode"] = df.apply(lambda row: hashfunc(row["Player_S"], row["Role"]), axis=1)
+    # 3. Hash each distinct (name, role) pair once and map back
+    hash_cache = HashCache(hashfunc) if hash_cache is None else hash_cache
+    df["Hashcode"] = hash_cache.hashes(df["Player_S"], df["Role"])
     df.drop(["Player_S"], axis=1, inplace=True)
     df = df.set_index("Hashcode")
     return df
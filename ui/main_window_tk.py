@@ -5,11 +5,13 @@ Main Tkinter window for season simulation UI with modular widget components.
 """
 
 import queue
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
 
 from bblogger import logger
 from ui.controllers import SimulationController
+from ui.models.view_models import ViewModelCache
 from ui.theme import setup_dark_theme, BG_DARK, TEXT_PRIMARY, TEXT_SECONDARY, ACCENT_BLUE
 from ui.widgets import (
     ToolbarWidget,
@@ -24,8 +26,30 @@ from ui.widgets import (
     LeagueStatsWidget,
     LeagueLeadersWidget,
     PlayoffWidget,
+    LoadingSplash,
 )
 
+POLL_INTERVAL_MS = 16  # idle poll period, about one frame
+POLL_BUDGET_MS = 12  # time for handling messages per poll before control goes back to Tk
+# polled queues, named by the message tag; day_processed is the reply queue read by the worker
+DISPLAY_SIGNALS = (
+    "load_progress",
+    "season_loaded",
+    "day_started",
+    "game_completed",
+    "day_completed",
+    "gm_assessment",
+    "injury_update",
+    "play_by_play",
+    "world_series_started",
+    "world_series_completed",
+    "season_complete",
+    "simulation_complete",
+    "error",
+    "pause_state",
+)
+SUPERSEDED_SIGNALS = ("injury_update", "pause_state")  # full snapshots, a newer one replaces an older one
+
 
 class SeasonMainWindow:
     """
@@ -46,6 +70,7 @@ class SeasonMainWindow:
         season_print_lineup_b,
         season_print_box_score_b,
         season_team_to_follow,
+        lookahead_days=1,
     ):
         """
         Initialize the main window and UI components.
@@ -61,6 +86,7 @@ class SeasonMainWindow:
             season_print_lineup_b: Print lineup flag
             season_print_box_score_b: Print box score flag
             season_team_to_follow: Team to follow (string)
+            lookahead_days: Days the simulation may run ahead of the display (1 = wait for every day)
         """
         self.root = root
         self.load_seasons = load_seasons
@@ -80,6 +106,13 @@ class SeasonMainWindow:
         self.world_series_teams = set()  # Track which teams are in World Series
         self.simulation_start_time = None  # Track simulation start time for elapsed time
         self._sim_start_day = None  # Schedule day index when simulation began (for ETA)
+        self._signal_source = None  # SeasonSignals the queue heads below were taken from
+        self._signal_heads = {}  # signal name -> message taken off its queue, not yet handled
+        self.loading_splash = None  # shown from start_season until season_loaded
+        self._pending_standings = None  # latest day_completed standings, refreshed once per poll
+        self._pending_day_acks = []  # days to acknowledge to the worker after the refresh
+        self._live_stats_stale = False  # roster and league stats wait for the worker to reach a day boundary
+        self.view_models = ViewModelCache()  # roster and league stats rows, prepared off the Tk thread
 
         self.root.title("Baseball Season Simulator")
         self.root.geometry("1500x900")
@@ -100,6 +133,7 @@ class SeasonMainWindow:
             season_chatty,
             season_print_lineup_b,
             season_print_box_score_b,
+            lookahead_days=lookahead_days,
         )
 
         # Create widgets (order matters for packing!)
@@ -319,11 +353,11 @@ F1     - Show this help"""
         self.team_notebook.bind("<<NotebookTabChanged>>", self._on_team_tab_changed)
 
         # Team Sub-tab 1: Roster
-        self.roster_widget = RosterWidget(self.team_notebook, self.comparison_mode)
+        self.roster_widget = RosterWidget(self.team_notebook, self.comparison_mode, self.view_models)
         self.team_notebook.add(self.roster_widget.get_frame(), text="Roster")
 
         # Team Sub-tab 2: Games Played
-        self.games_played_widget = GamesPlayedWidget(self.team_notebook)
+        self.games_played_widget = GamesPlayedWidget(self.team_notebook, self.new_season)
         self.team_notebook.add(self.games_played_widget.get_frame(), text="Games Played")
 
         # Team Sub-tab 3: GM Assessment
@@ -335,7 +369,7 @@ F1     - Show this help"""
         self.notebook.add(self.league_leaders_widget.get_frame(), text="MLB Leaders")
 
         # Tab 5: Stats
-        self.league_stats_widget = LeagueStatsWidget(self.notebook, self.comparison_mode)
+        self.league_stats_widget = LeagueStatsWidget(self.notebook, self.comparison_mode, self.view_models)
         self.notebook.add(self.league_stats_widget.get_frame(), text="MLB Stats")
 
         # Tab 6: IL (Injured List)
@@ -582,7 +616,8 @@ F1     - Show this help"""
                 worker.signals.main_window = self
                 logger.debug("Set signals.main_window reference for synchronous updates")
 
-            # Reset progress indicators
+            # Reset progress indicators, views of the previous season are dropped
+            self.view_models.new_day()
             self.current_day = 0
             self.progress_bar["value"] = 0
             self.progress_label.config(text="0%")
@@ -628,15 +663,10 @@ F1     - Show this help"""
                     self.notebook.tab(i, text=selected_team)
                     break
 
-            # Initialize widgets after delay
-            self.root.after(1000, self.admin_widget.load_players)
-            self.root.after(1000, self._populate_injuries_teams)
-            self.root.after(2000, self._update_roster)
-            self.root.after(2000, self._update_league_stats)
-            self.root.after(2000, self._update_league_leaders)
-
-            # Initialize schedule display for day 1
-            self.root.after(1500, self._init_schedule_display)
+            # Widgets populate on season_loaded, the splash shows the load steps until then
+            if self.loading_splash:
+                self.loading_splash.close()
+            self.loading_splash = LoadingSplash(self.root)
 
             # Update UI state based on whether we started paused
             if should_start_paused:
@@ -712,18 +742,26 @@ F1     - Show this help"""
     # =================================================================
     # QUEUE POLLING AND EVENT HANDLING
     # =================================================================
-    # The main thread polls all signal queues every 100ms via root.after().
-    # Each queue is checked with get_nowait() (non-blocking). Only one message
-    # is processed per queue per poll cycle, providing natural throttling.
+    # The main thread polls the signal queues via root.after(). Every message carries
+    # a sequence number (see ui.signals), so the heads of all queues are merged and
+    # handled in emission order. Each poll handles messages for up to POLL_BUDGET_MS,
+    # then yields to Tk so the window stays responsive, and polls again right away
+    # while messages remain or after POLL_INTERVAL_MS when idle.
     #
     # Signal flow:
     #   Worker thread -> SeasonSignals.emit_*() -> queue.put() -> this polling loop
     #
+    # Coalescing within a poll:
+    #   - consecutive play_by_play and game_completed messages are handled as one batch
+    #   - an injury_update or pause_state snapshot is dropped when a newer one is queued
+    #   - standings, roster and league stats are refreshed once, from the latest day
+    #
     # The critical synchronization point is day_completed:
     #   1. Worker emits day_completed with all game results + standings
-    #   2. This method processes it, updates all widgets
-    #   3. Then emits day_processed(day_num) back to the worker
-    #   4. Worker unblocks and proceeds to the next day
+    #   2. This method processes it, updates the games widget
+    #   3. At the end of the poll the standings and stats are refreshed once
+    #   4. Then day_processed(day_num) is emitted back to the worker for each day
+    #   5. Worker unblocks and proceeds to the next day
     #
     # World Series handling:
     #   When world_series_started arrives, this method drains the play_by_play_queue
@@ -734,128 +772,171 @@ F1     - Show this help"""
         """
         Poll all signal queues for messages from the worker thread.
 
-        Called every 100ms via root.after(). Each queue is checked non-blocking
-        with get_nowait(). One message is processed per queue per cycle. This
-        method is the bridge between the worker thread and the Tkinter main loop.
+        Messages are handled in emission order until the queues are empty or
+        POLL_BUDGET_MS has passed. This method is the bridge between the worker
+        thread and the Tkinter main loop, and also shows the roster and league
+        stats rows prepared in the background (see ViewModelCache).
         """
+        self.view_models.poll()
+        backlog = False
         worker = self.controller.get_worker()
         if worker:
-            signals = worker.signals
-
-            # Check day_started queue
+            if worker.signals is not self._signal_source:  # a new worker has new queues
+                self._signal_source = worker.signals
+                self._signal_heads = {}
+            deadline = time.perf_counter() + POLL_BUDGET_MS / 1000
             try:
-                msg = signals.day_started_queue.get_nowait()
-                self._on_day_started(msg[1], msg[2])
-            except queue.Empty:
-                pass
-            except Exception as e:
-                logger.error(f"Error handling day_started: {e}")
+                self._drain_signals(worker.signals, deadline)
+            finally:
+                self._flush_day_refresh()
+            backlog = self._next_signal(worker.signals) is not None
 
-            # Check game_completed queue
-            try:
-                msg = signals.game_completed_queue.get_nowait()
-                self._on_game_completed(msg[1])
-            except queue.Empty:
-                pass
-            except Exception as e:
-                import traceback
+        # Schedule next poll, at once if the budget ran out with messages left
+        self.root.after(1 if backlog else POLL_INTERVAL_MS, self._poll_queues)
 
-                logger.error(f"Error handling game_completed: {e}")
-                logger.error(f"Stack: {traceback.format_exc()}")
+    def _next_signal(self, signals):
+        """
+        Name of the earliest emitted message among the queue heads.
 
-            # Check day_completed queue
-            try:
-                msg = signals.day_completed_queue.get_nowait()
-                # msg = ('day_completed', game_results, standings_data, day_number)
-                self._on_day_completed(msg[1], msg[2], msg[3])
-            except queue.Empty:
-                pass
-            except Exception as e:
-                logger.error(f"Error handling day_completed: {e}")
+        Args:
+            signals: SeasonSignals of the current worker
 
-            # Check GM assessment queue
-            try:
-                msg = signals.gm_assessment_queue.get_nowait()
-                self._on_gm_assessment(msg[1])
-            except queue.Empty:
-                pass
-            except Exception as e:
-                logger.error(f"Error handling gm_assessment: {e}")
+        Returns:
+            Signal name, or None when every queue is empty
+        """
+        for name in DISPLAY_SIGNALS:
+            if name not in self._signal_heads:
+                try:
+                    self._signal_heads[name] = getattr(signals, f"{name}_queue").get_nowait()
+                except queue.Empty:
+                    pass
+        return min(self._signal_heads, key=lambda name: self._signal_heads[name][-1], default=None)
+
+    def _drain_signals(self, signals, deadline: float):
+        """
+        Handle queued messages in emission order until the queues are empty or the deadline passes.
 
-            # Check injury update queue
+        Args:
+            signals: SeasonSignals of the current worker
+            deadline: time.perf_counter() value at which to stop
+        """
+        handlers = {
+            "load_progress": lambda msg: self._on_load_progress(msg[1], msg[2], msg[3]),
+            "season_loaded": lambda msg: self._on_season_loaded(),
+            "day_started": lambda msg: self._on_day_started(msg[1], msg[2]),
+            # msg = ('day_completed', game_results, standings_data, day_number, sequence)
+            "day_completed": lambda msg: self._on_day_completed(msg[1], msg[2], msg[3]),
+            "gm_assessment": lambda msg: self._on_gm_assessment(msg[1]),
+            "injury_update": lambda msg: self._on_injury_update(msg[1]),
+            "world_series_started": lambda msg: self._on_world_series_started(msg[1]),
+            "world_series_completed": lambda msg: self._on_world_series_completed(msg[1]),
+            "season_complete": lambda msg: self._on_season_complete(),
+            "simulation_complete": lambda msg: self._on_simulation_complete(),
+            "error": lambda msg: self._on_error(msg[1]),
+            "pause_state": lambda msg: self._on_pause_state(msg[1]),
+        }
+        batch_handlers = {
+            "game_completed": self._on_games_completed,
+            "play_by_play": self._on_play_by_plays,
+        }
+        while time.perf_counter() < deadline:
+            name = self._next_signal(signals)
+            if name is None:
+                break
+            msg = self._signal_heads.pop(name)
             try:
-                msg = signals.injury_update_queue.get_nowait()
-                self._on_injury_update(msg[1])
-            except queue.Empty:
-                pass
+                if name in batch_handlers:
+                    batch = [msg[1]]
+                    while time.perf_counter() < deadline and self._next_signal(signals) == name:
+                        batch.append(self._signal_heads.pop(name)[1])
+                    batch_handlers[name](batch)
+                elif name in SUPERSEDED_SIGNALS and self._next_signal(signals) and name in self._signal_heads:
+                    continue  # a newer snapshot is queued, only it is shown
+                else:
+                    handlers[name](msg)
             except Exception as e:
-                logger.error(f"Error handling injury_update: {e}")
+                import traceback
 
-            # Check play-by-play queue
-            try:
-                msg = signals.play_by_play_queue.get_nowait()
-                self._on_play_by_play(msg[1])
-            except queue.Empty:
-                pass
-            except Exception as e:
-                logger.error(f"Error handling play_by_play: {e}")
+                logger.error(f"Error handling {name}: {e}")
+                logger.error(f"Stack: {traceback.format_exc()}")
 
-            # Check world_series_started queue
-            try:
-                msg = signals.world_series_started_queue.get_nowait()
-                self._on_world_series_started(msg[1])
-            except queue.Empty:
-                pass
-            except Exception as e:
-                logger.error(f"Error handling world_series_started: {e}")
+    def _flush_day_refresh(self):
+        """
+        Refresh standings, roster and league stats from the latest completed day, then acknowledge the days.
 
-            # Check world_series_completed queue
+        Called once per poll, so days completed within one poll share a single refresh.
+        Roster and league stats read the live season, so while the worker runs ahead
+        they wait for it to reach a day boundary (see SeasonWorker.try_read_season).
+        """
+        worker = self.controller.get_worker()
+        refresh_start = time.thread_time()  # phase times are CPU time, see bbperf
+        refreshed = False
+        if self._pending_standings is not None:
+            refreshed = True
+            standings_data, self._pending_standings = self._pending_standings, None
+            self._live_stats_stale = True
             try:
-                msg = signals.world_series_completed_queue.get_nowait()
-                self._on_world_series_completed(msg[1])
-            except queue.Empty:
-                pass
-            except Exception as e:
-                logger.error(f"Error handling world_series_completed: {e}")
+                # Update standings widget
+                followed_team = worker.team_to_follow if worker else ""
+                self.standings.set_followed_team(followed_team)
+                self.standings.update_standings(standings_data, followed_team)
 
-            # Check season complete queue (regular season ended, prompt for playoffs)
-            try:
-                msg = signals.season_complete_queue.get_nowait()
-                self._on_season_complete()
-            except queue.Empty:
-                pass
+                # Update status message based on actual controller pause state
+                # This is called after the day completes, so the worker has updated its pause flag
+                self._update_status_from_controller()
             except Exception as e:
-                logger.error(f"Error handling season_complete: {e}")
+                logger.error(f"Error refreshing standings: {e}")
 
-            # Check simulation complete queue
+        if self._live_stats_stale and (worker is None or worker.try_read_season()):
+            self._live_stats_stale = False
+            refreshed = True
+            self.view_models.new_day()
             try:
-                msg = signals.simulation_complete_queue.get_nowait()
-                self._on_simulation_complete()
-            except queue.Empty:
-                pass
-            except Exception as e:
-                logger.error(f"Error handling simulation_complete: {e}")
+                # Only the players changed since the last refresh, None reloads everything
+                changes = worker.season.baseball_data.get_changed_rows() if worker and worker.season else None
 
-            # Check error queue
-            try:
-                msg = signals.error_queue.get_nowait()
-                self._on_error(msg[1])
-            except queue.Empty:
-                pass
-            except Exception as e:
-                logger.error(f"Error handling error: {e}")
+                # Update roster for followed team
+                self._update_roster(changes)
 
-            # Check pause state queue
-            try:
-                msg = signals.pause_state_queue.get_nowait()
-                self._on_pause_state(msg[1])
-            except queue.Empty:
-                pass
+                # Update league stats and leaders
+                self._update_league_stats(changes)
+                self._update_league_leaders()
             except Exception as e:
-                logger.error(f"Error handling pause_state: {e}")
+                logger.error(f"Error refreshing league stats: {e}")
+            finally:
+                if worker is not None:
+                    worker.season_lock.release()
+
+        perf = worker.season.baseball_data.perf if worker and worker.season else None
+        if refreshed and perf is not None and perf.enabled:
+            perf.add_phase("UI refresh", time.thread_time() - refresh_start)
+
+        # Signal back to worker that UI has finished processing these days
+        # This ensures the worker waits for UI to catch up before running further ahead
+        days, self._pending_day_acks = self._pending_day_acks, []
+        if worker:
+            for day_number in days:
+                worker.signals.emit_day_processed(day_number)
+
+    def _on_load_progress(self, step: str, done: int, total: int):
+        """Handle load_progress message: show the finished load step on the splash."""
+        if self.loading_splash:
+            self.loading_splash.update_progress(step, done, total)
+
+    def _on_season_loaded(self):
+        """
+        Handle season_loaded message: populate the widgets that read the season data.
 
-        # Schedule next poll
-        self.root.after(100, self._poll_queues)
+        Roster, league stats and leaders load through _flush_day_refresh() at the end
+        of this poll, which reads the live season between days.
+        """
+        if self.loading_splash:
+            self.loading_splash.close()
+            self.loading_splash = None
+        self.admin_widget.load_players()
+        self._populate_injuries_teams()
+        self._init_schedule_display()
+        self._live_stats_stale = True
 
     def _init_schedule_display(self):
         """Initialize schedule display when season starts in paused state."""
@@ -967,12 +1048,26 @@ F1     - Show this help"""
                 days_remaining = total_days - day_num - 1
                 self._update_eta(time_per_day * days_remaining)
 
+    def _on_games_completed(self, games: list):
+        """Handle a run of consecutive game_completed messages, adding their recaps in one update."""
+        recaps = []
+        for game_data in games:
+            recap = self._on_game_completed(game_data)
+            if recap:
+                recaps.append(recap)
+        self.games_played_widget.add_game_recaps(recaps)
+
     def _on_game_completed(self, game_data: dict):
-        """Handle game_completed message."""
+        """
+        Handle game_completed message.
+
+        Returns:
+            Recap tuple for games_played_widget.add_game_recaps(), or None
+        """
         # Handle edge cases: game_data could be None, wrong type, or missing keys
         if not game_data or not isinstance(game_data, dict):
             logger.warning("game_completed received invalid data")
-            return
+            return None
 
         away_team = game_data.get("away_team", "?")
         home_team = game_data.get("home_team", "?")
@@ -982,7 +1077,7 @@ F1     - Show this help"""
         if game_data.get("is_playoff"):
             if hasattr(self, "playoff_widget"):
                 self.playoff_widget.add_game_result(game_data)
-            return
+            return None
 
         # Update games widget (progressive update) - regular season only
         self.games_widget.on_game_completed(game_data)
@@ -1009,7 +1104,7 @@ F1     - Show this help"""
             except Exception:
                 pass  # Ignore date lookup errors
 
-            self.games_played_widget.add_game_recap(
+            return (
                 game_data["day_num"],
                 game_data["away_team"],
                 game_data["home_team"],
@@ -1017,14 +1112,16 @@ F1     - Show this help"""
                 game_data.get("structured_game"),
                 date_str,
             )
+        return None
 
     def _on_day_completed(self, game_results: list, standings_data: dict, day_number: int):
         """Handle day_completed message.
 
         This is the critical synchronization point in the signal flow:
-        1. Process all game results and update widgets
-        2. Emit day_processed(day_number) back to the worker thread
-        3. Worker receives this and unblocks to process the next day
+        1. Process all game results and update the games widget
+        2. Queue the standings and the day for _flush_day_refresh() at the end of the poll
+        3. That emits day_processed(day_number) back to the worker thread,
+           which receives this and unblocks to process the next day
 
         If this handler fails or is slow, the worker thread will wait
         (up to 30 seconds) before proceeding anyway.
@@ -1041,28 +1138,9 @@ F1     - Show this help"""
         # Update games widget (batch update for non-followed games)
         self.games_widget.on_day_completed(game_results, standings_data, day_number)
 
-        # Update standings widget
-        worker = self.controller.get_worker()
-        followed_team = worker.team_to_follow if worker else ""
-        self.standings.set_followed_team(followed_team)
-        self.standings.update_standings(standings_data, followed_team)
-
-        # Update roster for followed team
-        self._update_roster()
-
-        # Update league stats and leaders
-        self._update_league_stats()
-        self._update_league_leaders()
-
-        # Update status message based on actual controller pause state
-        # This is called after the day completes, so the worker has updated its pause flag
-        self._update_status_from_controller()
-
-        # Signal back to worker that UI has finished processing this day
-        # This ensures the worker waits for UI to catch up before proceeding to next day
-        worker = self.controller.get_worker()
-        if worker:
-            worker.signals.emit_day_processed(day_number)
+        # Standings, roster and stats are refreshed once per poll from the latest day
+        self._pending_standings = standings_data
+        self._pending_day_acks.append(day_number)
 
     def _on_gm_assessment(self, assessment_data: dict):
         """Handle gm_assessment_ready message."""
@@ -1124,6 +1202,9 @@ F1     - Show this help"""
     def _on_error(self, error_message: str):
         """Handle error_occurred message."""
         logger.error(f"Simulation error: {error_message}")
+        if self.loading_splash:
+            self.loading_splash.close()
+            self.loading_splash = None
         messagebox.showerror("Simulation Error", error_message)
         self.toolbar.update_button_states(simulation_running=False, paused=False)
         self.status_label.config(text=self._format_status_with_day("Error occurred"))
@@ -1156,6 +1237,11 @@ F1     - Show this help"""
         if hasattr(self, "gm_assessment_widget") and self.gm_assessment_widget:
             self.gm_assessment_widget.update_assessment_btn.config(state=tk.NORMAL)
 
+    def _on_play_by_plays(self, plays: list):
+        """Handle a run of consecutive play_by_play messages."""
+        for play_data in plays:
+            self._on_play_by_play(play_data)
+
     def _on_play_by_play(self, play_data: dict):
         """Handle play_by_play message."""
         # During World Series, only show play-by-play from World Series teams
@@ -1195,6 +1281,8 @@ F1     - Show this help"""
                     cleared_count += 1
             except queue.Empty:
                 pass
+            if self._signal_heads.pop("play_by_play", None) is not None:  # already taken off the queue by the poll
+                cleared_count += 1
             logger.debug(f"Cleared {cleared_count} old play-by-play signals from queue before World Series")
 
         # Clear regular season game displays (they're finished)
@@ -1262,19 +1350,37 @@ F1     - Show this help"""
         else:
             self.status_label.config(text=self._format_status_with_day("Simulating..."))
 
-    def _update_roster(self):
-        """Update roster widget for followed team."""
+    def _update_roster(self, changes: tuple = None):
+        """
+        Update roster widget for followed team.
+
+        Args:
+            changes: BaseballStats.get_changed_rows() result to patch in, None reloads the roster
+        """
         worker = self.controller.get_worker()
         if worker and worker.season:
-            self.roster_widget.update_roster(
-                self.season_team_to_follow, worker.season.baseball_data, worker.season.team_win_loss
-            )
+            self.roster_widget.team_win_loss = worker.season.team_win_loss
+            if (
+                changes is None
+                or self.roster_widget.current_team != self.season_team_to_follow
+                or not self.roster_widget.apply_changed_rows(*changes)
+            ):
+                self.roster_widget.update_roster(
+                    self.season_team_to_follow, worker.season.baseball_data, worker.season.team_win_loss
+                )
+
+    def _update_league_stats(self, changes: tuple = None):
+        """
+        Update league stats widget with current season data.
 
-    def _update_league_stats(self):
-        """Update league stats widget with current season data."""
+        Args:
+            changes: BaseballStats.get_changed_rows() result to patch in, None reloads all players
+        """
         worker = self.controller.get_worker()
         if worker and worker.season:
-            self.league_stats_widget.update_stats(worker.season.baseball_data, worker.season.team_win_loss)
+            self.league_stats_widget.team_win_loss = worker.season.team_win_loss
+            if changes is None or not self.league_stats_widget.apply_changed_rows(*changes):
+                self.league_stats_widget.update_stats(worker.season.baseball_data, worker.season.team_win_loss)
 
     def _update_league_leaders(self):
         """Update league leaders widget with current season data."""
@@ -1296,6 +1402,7 @@ F1     - Show this help"""
 
     def _on_admin_change(self):
         """Callback when admin makes player changes - refresh stats and IL widgets."""
+        self.view_models.new_day()
         self._update_league_stats()
         self._update_league_leaders()
         self._populate_injuries_teams()
@@ -1352,4 +1459,6 @@ F1     - Show this help"""
     def on_close(self):
         """Handle window close event."""
         logger.info("Closing main window")
+        self.view_models.close()
+        self.games_played_widget.close()
         self.root.destroy()
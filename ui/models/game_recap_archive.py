@@ -0,0 +1,144 @@
+"""
+Copyright (c) 2024 Jim Maastricht
+
+Disk-backed archive of the followed team's game recaps.
+
+Every game is appended to one file per season as a zlib-compressed JSON record,
+and only the index (day, matchup, file offset) stays in memory. Recently added
+or viewed games are kept decoded in a small LRU, so the memory used by the
+Games Played tab stays flat over a season plus playoffs.
+"""
+
+import json
+import os
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from bbgame import GameRecap
+from bblogger import logger
+
+GAME_RECAP_DIR = "game-recaps"
+RECENT_GAMES = 8  # decoded games kept in memory
+
+
+class GameRecapArchive:
+    """Game recaps by day, stored on disk and read back when a day is viewed."""
+
+    def __init__(self, season: Optional[int] = None, directory: str = GAME_RECAP_DIR, recent_games: int = RECENT_GAMES):
+        """
+        Create an empty archive.
+
+        Args:
+            season: Season year, names the file
+            directory: Directory for the archive file, created if needed
+            recent_games: Decoded games kept in memory
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, f"{season if season else 'season'}.recaps")
+        self._file = open(self.path, "w+b")  # recaps of an earlier run are not kept
+        self._index: Dict[int, List[Tuple[str, str, int, int]]] = {}  # day -> [(away, home, offset, length)]
+        self._dates: Dict[int, str] = {}
+        self._recent: "OrderedDict[Tuple[int, int], tuple]" = OrderedDict()  # (day, game) -> recap tuple
+        self.recent_games = recent_games
+
+    def add(
+        self,
+        day_num: int,
+        away_team: str,
+        home_team: str,
+        game_recap: str,
+        structured_game: Any = None,
+        date_str: Optional[str] = None,
+    ) -> bool:
+        """
+        Append a game to the archive.
+
+        Args:
+            day_num: Day number (0-indexed)
+            away_team: Away team abbreviation
+            home_team: Home team abbreviation
+            game_recap: Play-by-play text
+            structured_game: GameRecap, a dict or None
+            date_str: Date of the day, e.g. "April 5"
+
+        Returns:
+            True if the day list changed: a new day, or a new date for a day
+        """
+        if isinstance(structured_game, BaseModel):
+            game, kind = structured_game.model_dump(mode="json"), "model"
+        else:
+            game, kind = structured_game, "raw"
+        record = zlib.compress(json.dumps({"recap": game_recap, "game": game, "kind": kind}).encode("utf-8"))
+        self._file.seek(0, os.SEEK_END)
+        offset = self._file.tell()
+        self._file.write(record)
+
+        changed = day_num not in self._index or (date_str is not None and self._dates.get(day_num) != date_str)
+        games = self._index.setdefault(day_num, [])
+        games.append((away_team, home_team, offset, len(record)))
+        if date_str:
+            self._dates[day_num] = date_str
+        self._remember((day_num, len(games) - 1), (away_team, home_team, game_recap, structured_game))
+        return changed
+
+    def days(self) -> List[int]:
+        """Days with games, most recent first."""
+        return sorted(self._index, reverse=True)
+
+    def date_of(self, day_num: int) -> Optional[str]:
+        """Date of a day, None if it was added without one."""
+        return self._dates.get(day_num)
+
+    def day_of(self, date_str: str) -> Optional[int]:
+        """Day number of a date shown in the day list."""
+        return next((day for day, date in self._dates.items() if date == date_str), None)
+
+    def games(self, day_num: int) -> List[tuple]:
+        """
+        Games of a day, read from disk unless recently added or viewed.
+
+        Args:
+            day_num: Day number (0-indexed)
+
+        Returns:
+            [(away, home, game_recap, structured_game)], structured_game is a GameRecap when one was added
+        """
+        games = []
+        for i, (away, home, offset, length) in enumerate(self._index.get(day_num, [])):
+            key = (day_num, i)
+            if key in self._recent:
+                self._recent.move_to_end(key)
+                games.append(self._recent[key])
+                continue
+            self._file.flush()
+            self._file.seek(offset)
+            record = json.loads(zlib.decompress(self._file.read(length)).decode("utf-8"))
+            game = record["game"]
+            if record["kind"] == "model":
+                try:
+                    game = GameRecap.model_validate(game)
+                except Exception as e:  # shown from the text recap instead
+                    logger.warning(f"Could not read archived game {away} @ {home} on day {day_num + 1}: {e}")
+                    game = None
+            games.append(self._remember(key, (away, home, record["recap"], game)))
+        return games
+
+    def _remember(self, key: Tuple[int, int], game: tuple) -> tuple:
+        """Keep a decoded game in the LRU, dropping the least recently used."""
+        self._recent[key] = game
+        self._recent.move_to_end(key)
+        while len(self._recent) > self.recent_games:
+            self._recent.popitem(last=False)
+        return game
+
+    def close(self):
+        """Close and delete the archive file."""
+        if not self._file.closed:
+            self._file.close()
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
@@ -0,0 +1,178 @@
+"""
+Copyright (c) 2024 Jim Maastricht
+
+View models for the roster and league stats tables.
+
+A view model is the display-ready form of a table: the displayed rows in order,
+difference values already calculated in difference mode, and the rows formatted
+as Treeview (values, tags) tuples. ViewModelCache prepares them on a background
+thread and keeps them for the current day, keyed by table, team, mode and the
+displayed players in order (which is what the filter and sort select). The Tk
+thread only hands finished rows to the tree, and going back to a team, mode,
+filter or sort already shown that day shows the cached rows at once.
+"""
+
+import queue
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+
+import pandas as pd
+
+from bblogger import logger
+
+PREFORMATTED_ROWS = 200  # rows formatted in the background, rows further down are formatted when scrolled into view
+MAX_VIEWS = 32  # cached view models of the current day, least recently used dropped first
+
+
+@dataclass
+class TableView:
+    """Display-ready rows of one table."""
+
+    frame: pd.DataFrame  # displayed rows in order, difference values in difference mode
+    rows: List[Tuple[tuple, tuple]]  # (values, tags) of the first rows of frame
+    format_row: Callable[[pd.Series], Tuple[tuple, tuple]]  # formats the rows after them
+
+    def row(self, position: int) -> Tuple[tuple, tuple]:
+        """(values, tags) of a displayed row, a VirtualTreeview row source."""
+        if position < len(self.rows):
+            return self.rows[position]
+        return self.format_row(self.frame.iloc[position])
+
+
+def build_table_view(
+        frame: pd.DataFrame, format_row: Callable[[pd.Series], Tuple[tuple, tuple]], count: int = PREFORMATTED_ROWS
+) -> TableView:
+    """
+    Format the first rows of a table.
+
+    Args:
+        frame: Displayed rows in order
+        format_row: Returns (values, tags) of a row
+        count: Rows to format now, see ViewModelCache.preformat_rows
+
+    Returns:
+        TableView over frame
+    """
+    rows = []
+    for player, row in frame.iloc[:count].iterrows():
+        try:
+            rows.append(format_row(row))
+        except Exception as e:
+            logger.warning(f"Error formatting row for {player}: {e}")
+            rows.append(((), ()))
+    return TableView(frame, rows, format_row)
+
+
+def frame_key(frame: pd.DataFrame) -> tuple:
+    """Cache key part for the rows of a table in display order."""
+    return len(frame), hash(tuple(frame.index))
+
+
+class ViewModelCache:
+    """
+    View models of the current day, prepared on one background thread.
+
+    All methods are called on the Tk thread. Prepare functions run on the background
+    thread, so they may only use the data passed to them and thread safe BaseballStats
+    methods. Results are handed over by poll(), which the main window calls each frame.
+    """
+
+    def __init__(self, background: bool = True, max_views: int = MAX_VIEWS):
+        """
+        Initialize the cache.
+
+        Args:
+            background: Prepare on a background thread, False prepares at once on the calling
+                thread and caches nothing, for widgets used without a main window
+            max_views: View models kept for the current day
+        """
+        self.max_views = max_views if background else 0
+        # rows build_table_view() formats ahead, without a background thread they are formatted when shown
+        self.preformat_rows = PREFORMATTED_ROWS if background else 0
+        self.day = 0  # increases with every new_day(), part of every key
+        self._views: "OrderedDict[tuple, Any]" = OrderedDict()
+        self._waiting: Dict[Hashable, tuple] = {}  # slot -> key of the view it waits for
+        self._callbacks: Dict[tuple, Dict[Hashable, Callable[[Any], None]]] = {}  # key -> slot -> on_ready
+        self._ready = queue.Queue()  # (key, view or None on error), put by the background thread
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="view-models") if background else None
+
+    def new_day(self):
+        """The season stats changed, e.g. a day was simulated: drop the views of earlier days."""
+        self.day += 1
+        self._views.clear()
+
+    def request(self, slot: Hashable, key: tuple, prepare: Callable[[], Any], on_ready: Callable[[Any], None]):
+        """
+        Show the view model for key in slot.
+
+        on_ready is called at once when the view is cached, otherwise from poll() once it is
+        prepared, unless slot requested another view in the meantime.
+
+        Args:
+            slot: Where the view is shown, e.g. the tree, only its latest request is shown
+            key: Identifies the view within the day
+            prepare: Builds the view, runs on the background thread
+            on_ready: Shows the view, runs on the Tk thread
+        """
+        key = (self.day,) + key
+        if key in self._views:
+            self._views.move_to_end(key)
+            self._waiting.pop(slot, None)
+            on_ready(self._views[key])
+            return
+        if self._executor is None:
+            self._waiting.pop(slot, None)
+            on_ready(prepare())
+            return
+
+        self._waiting[slot] = key
+        if key not in self._callbacks:
+            self._executor.submit(self._prepare, key, prepare)
+        self._callbacks.setdefault(key, {})[slot] = on_ready
+
+    def pending(self, slot: Hashable) -> bool:
+        """True while the latest view requested for slot is being prepared."""
+        return slot in self._waiting
+
+    def cancel(self, slot: Hashable):
+        """Stop waiting for the view requested for slot, e.g. because the slot now shows something else."""
+        self._waiting.pop(slot, None)
+
+    def _prepare(self, key: tuple, prepare: Callable[[], Any]):
+        """Background thread: build a view and queue it for poll()."""
+        try:
+            view = prepare()
+        except Exception as e:
+            import traceback
+
+            logger.error(f"Error preparing view {key[1:]}: {e}")
+            logger.error(traceback.format_exc())
+            view = None
+        self._ready.put((key, view))
+
+    def poll(self):
+        """Cache the views prepared since the last poll and show them in the slots waiting for them."""
+        while True:
+            try:
+                key, view = self._ready.get_nowait()
+            except queue.Empty:
+                return
+            for slot, on_ready in self._callbacks.pop(key, {}).items():
+                if self._waiting.get(slot) == key:
+                    del self._waiting[slot]
+                    if view is not None:
+                        try:
+                            on_ready(view)
+                        except Exception as e:
+                            logger.error(f"Error showing view {key[1:]}: {e}")
+            if view is not None and key[0] == self.day and self.max_views > 0:
+                self._views[key] = view
+                while len(self._views) > self.max_views:
+                    self._views.popitem(last=False)
+
+    def close(self):
+        """Stop the background thread, views still being prepared are dropped."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
@@ -17,20 +17,23 @@ SeasonSignals (queue.Queue objects) which are thread-safe.
             |  pause()/resume()/stop() ----->  | _handle_pause() checks flags
             |  step_one_day()/step_n_days() -> | advances N days then pauses
             |                                   |
-            |  _poll_queues() every 100ms -->  | signals emitted via queues
+            |  _poll_queues() every frame -->  | signals emitted via queues
             |  processes signals, updates UI   |
             |                                   |
             |  <--- day_processed(day) ------  | handshake: UI is done
             |                                   |
-            |                                   | BLOCKS on day_processed_queue
-            |                                   | until UI confirms (30s timeout)
+            |                                   | BLOCKS on day_processed_queue once
+            |                                   | lookahead_days are unconfirmed
+            |                                   | (30s timeout)
 
 SIGNAL EMISSION
 ===============
 
 The worker creates a SeasonSignals instance and passes it to UIBaseballSeason.
 UIBaseballSeason emits signals by calling signals.emit_*() methods which put
-tuples into the queues. The worker itself emits:
+tuples into the queues. Its output_handler emits load_progress while the season
+data loads. The worker itself emits:
+- season_loaded: once the season is created, before the first day
 - season_complete (line 168): when regular season ends
 - simulation_complete (line 178): when entire sim finishes
 - error (line 186): on unhandled exception
@@ -43,10 +46,22 @@ from sim_next_day() -> sim_day_threaded().
 SYNCHRONIZATION
 ===============
 
-After each day, the worker blocks on day_processed_queue.get(timeout=30.0).
-The main thread's _poll_queues() processes all signals, then emits
-day_processed(day_num) back. If the UI doesn't respond within 30 seconds,
-the worker logs a warning and proceeds anyway (prevents permanent hangs).
+The worker may run up to lookahead_days days ahead of what the UI has
+confirmed. Each day's messages are self-contained snapshots (results,
+standings, injuries), so queued days display correctly while the engine moves
+on. After each day, once lookahead_days days are unconfirmed, the worker blocks
+on day_processed_queue.get(timeout=30.0). The main thread's _poll_queues()
+processes the signals, then emits day_processed(day_num) back. If the UI
+doesn't respond within 30 seconds, the worker logs a warning and proceeds
+anyway (prevents permanent hangs). With lookahead_days=1 every day waits for
+the UI, as a strict handshake. Before the playoffs the worker waits for the UI
+to confirm every regular season day.
+
+While the worker runs ahead, the UI reads live season data (rosters, league
+stats) only between days: it holds season_lock, which the worker holds for
+the length of each simulated day. When the lock is busy the UI calls
+try_read_season() again on a later poll; the request makes the worker stop
+briefly at the next day boundary.
 
 Pause/resume uses threading.Event (_pause_event) and threading.Lock
 (_pause_lock). The lock protects atomic flag changes; the event blocks
@@ -55,11 +70,15 @@ the worker thread when paused.
 
 import queue
 import threading
+import time
 
 from bblogger import logger
 from ui.signals import SeasonSignals
 from ui.ui_baseball_season import UIBaseballSeason
 
+DAY_PROCESSED_TIMEOUT = 30.0  # seconds to wait for the UI before moving on anyway
+UI_READ_WAIT = 1.0  # longest stop at a day boundary for a UI read of the season
+
 
 class SeasonWorker(threading.Thread):
     """Background worker thread for season simulation."""
@@ -77,8 +96,15 @@ class SeasonWorker(threading.Thread):
         team_to_follow=None,
         start_paused=False,
         obp_adjustment=0.0,
+        lookahead_days=1,
     ):
-        """Initialize season worker with simulation parameters."""
+        """
+        Initialize season worker with simulation parameters.
+
+        Args:
+            lookahead_days: Days the worker may simulate beyond what the UI has confirmed
+                displaying, 1 waits for the UI after every day
+        """
         super().__init__()
 
         # Store simulation parameters
@@ -95,9 +121,10 @@ class SeasonWorker(threading.Thread):
         self.only_nl_b = False
         self.start_paused = start_paused
         self.obp_adjustment = obp_adjustment
+        self.lookahead_days = max(1, lookahead_days)
 
         # Create signal emitter — all emit_*() calls put tuples into queues
-        # that the main thread's _poll_queues() drains every 100ms
+        # that the main thread's _poll_queues() drains within a per-frame time budget
         self.signals = SeasonSignals()
 
         # Season instance (created in run())
@@ -120,6 +147,13 @@ class SeasonWorker(threading.Thread):
         self._playoff_decision_event = threading.Event()
         self._run_playoffs = False
 
+        # Lookahead: days simulated but not yet confirmed by the UI, oldest first
+        self._unconfirmed_days = []
+        # season_lock: held by the worker while simulating a day, by the UI while reading live season data
+        # _ui_read_requested: set by the UI when the lock was busy, the worker waits at the next day boundary
+        self.season_lock = threading.Lock()
+        self._ui_read_requested = threading.Event()
+
     def run(self):
         """Main thread execution method. Runs the season simulation loop."""
         try:
@@ -149,6 +183,7 @@ class SeasonWorker(threading.Thread):
 
             # Call sim_start for initialization
             self.season.sim_start()
+            self.signals.emit_season_loaded()  # the UI populates its widgets from self.season
 
             # If starting in paused state, set pause flag before loop begins
             if self.start_paused:
@@ -182,26 +217,21 @@ class SeasonWorker(threading.Thread):
                 # 2. Call print_standings() (suppressed)
                 # 3. Call check_gm_assessments() which emits gm_assessment_ready
                 # 4. Increment season_day_num
+                self._yield_to_ui_read()
                 current_day = self.season.season_day_num
-                self.season.sim_next_day()
+                perf = self.season.baseball_data.perf
+                day_start = time.perf_counter()
+                with self.season_lock:
+                    self.season.sim_next_day()
+                if perf.enabled:  # worker utilization on the performance dashboard
+                    perf.add_busy(time.perf_counter() - day_start)
+                self._unconfirmed_days.append(current_day)
                 logger.debug(f"Completed day {self.season.season_day_num}")
 
-                # Wait for UI to process all signals for this day before proceeding.
+                # Wait for UI to process the signals before running too far ahead.
                 # This is the critical back-pressure mechanism: the worker blocks here
                 # until the main thread emits day_processed(day_num) via the queue.
-                # 30-second timeout prevents permanent hangs if UI is unresponsive.
-                logger.debug(f"Waiting for UI to process day {current_day}")
-                while True:
-                    try:
-                        msg = self.signals.day_processed_queue.get(timeout=30.0)
-                        if msg[1] == current_day:
-                            logger.debug(f"UI finished processing day {current_day}")
-                            break
-                        else:
-                            logger.warning(f"Received day_processed for wrong day: {msg[1]} vs {current_day}")
-                    except queue.Empty:
-                        logger.warning(f"Timeout waiting for day_processed for day {current_day}")
-                        break
+                self._wait_for_ui(self.lookahead_days - 1)
 
                 # If in step mode, decrement counter and pause when done
                 if self._step_mode:
@@ -213,6 +243,7 @@ class SeasonWorker(threading.Thread):
 
             # Season complete
             if not self._stopped:
+                self._wait_for_ui(0)  # regular season fully displayed before the playoffs take over the UI
                 self.season.sim_end()
                 logger.info("Regular season simulation complete")
 
@@ -240,6 +271,52 @@ class SeasonWorker(threading.Thread):
             logger.error(traceback.format_exc())
             self.signals.emit_error(error_msg)
 
+    def _wait_for_ui(self, max_unconfirmed: int):
+        """
+        Block until the UI has confirmed all but max_unconfirmed simulated days.
+
+        Args:
+            max_unconfirmed (int): Days that may stay unconfirmed, 0 waits for all
+        """
+        while len(self._unconfirmed_days) > max_unconfirmed and not self._stopped:
+            waiting_for = self._unconfirmed_days[0]
+            logger.debug(f"Waiting for UI to process day {waiting_for}")
+            try:
+                msg = self.signals.day_processed_queue.get(timeout=DAY_PROCESSED_TIMEOUT)
+            except queue.Empty:
+                # Timeout prevents permanent hangs if UI is unresponsive
+                logger.warning(f"Timeout waiting for day_processed for day {waiting_for}")
+                msg = ("day_processed", waiting_for)
+            if msg[1] not in self._unconfirmed_days:
+                logger.warning(f"Received day_processed for unexpected day: {msg[1]} vs {self._unconfirmed_days}")
+                continue
+            # the UI confirms days in order, so earlier days are done as well
+            del self._unconfirmed_days[: self._unconfirmed_days.index(msg[1]) + 1]
+            logger.debug(f"UI finished processing day {msg[1]}")
+
+    def try_read_season(self) -> bool:
+        """
+        Take season_lock for reading live season data from the main thread, without blocking.
+
+        If the worker is mid-day, ask it to stop at the next day boundary so a later
+        call succeeds. The caller releases season_lock when done.
+
+        Returns:
+            bool: True if the lock was taken
+        """
+        if self.season_lock.acquire(blocking=False):
+            self._ui_read_requested.clear()
+            return True
+        self._ui_read_requested.set()
+        return False
+
+    def _yield_to_ui_read(self):
+        """Between days, give a waiting UI read a chance to take season_lock."""
+        deadline = time.monotonic() + UI_READ_WAIT
+        while self._ui_read_requested.is_set() and time.monotonic() < deadline and not self._stopped:
+            time.sleep(0.005)
+        self._ui_read_requested.clear()
+
     def _handle_pause(self):
         """Handle pause state by waiting on event."""
         with self._pause_lock:
@@ -36,13 +36,16 @@ SIGNAL FLOW PER DAY
    d. Emits injury_update(injury_list)
    e. Emits gm_assessment(data) if assessments are due
 3. Worker blocks on day_processed_queue.get(timeout=30)
-4. Main thread's _poll_queues() (called every 100ms) drains all queued signals
+4. Main thread's _poll_queues() drains the queued signals in emission order
+   within a per-frame time budget (see SeasonMainWindow._poll_queues)
 5. After processing day_completed, main thread emits day_processed(day_num)
 6. Worker receives day_processed, unblocks, proceeds to next day
 
 LIFECYCLE SIGNALS
 =================
 
+- load_progress: A startup load step finished, e.g. the schedule (emitted by UIBaseballSeason output_handler)
+- season_loaded: Season data is loaded, worker.season can be read (emitted by worker)
 - season_complete: Regular season ended, playoffs will start (emitted by worker)
 - simulation_complete: Entire sim finished including playoffs (emitted by worker)
 - world_series_started: World Series begins (emitted by UIBaseballSeason output_handler)
@@ -50,6 +53,13 @@ LIFECYCLE SIGNALS
 - error: Unhandled exception in worker thread (emitted by worker)
 - pause_state: "running", "pausing", or "paused" (emitted by worker)
 
+EMISSION ORDER
+==============
+
+The last element of every message is a sequence number shared by all queues.
+The UI merges the queue heads by it, so signals are handled in the order they
+were emitted even though each kind has its own queue.
+
 PAUSE/RESUME
 ============
 
@@ -70,6 +80,7 @@ set world_series_active and world_series_teams from the worker thread. This is
 the only place where the worker writes directly to the main window object.
 """
 
+import itertools
 import queue
 from typing import Dict, List
 
@@ -80,6 +91,7 @@ class SeasonSignals:
     def __init__(self):
         """Initialize all event queues."""
         self.main_window = None  # Will be set by main window for direct synchronous access
+        self._sequence = itertools.count()  # appended to every message, next() is atomic under the GIL
 
         # Day lifecycle queues
         self.day_started_queue = queue.Queue()
@@ -100,6 +112,12 @@ class SeasonSignals:
         # Message format: (injury_list: list)
 
         # Simulation lifecycle queues
+        self.load_progress_queue = queue.Queue()
+        # Message format: (step: str, done: int, total: int) - a startup load step finished
+
+        self.season_loaded_queue = queue.Queue()
+        # Message format: (None,) - season data loaded, widgets can populate
+
         self.season_complete_queue = queue.Queue()
         # Message format: (None,) - signals regular season ended, asking about playoffs
 
@@ -129,52 +147,62 @@ class SeasonSignals:
 
     def emit_day_started(self, day_number: int, schedule_text: str):
         """Emit day_started signal."""
-        self.day_started_queue.put(("day_started", day_number, schedule_text))
+        self.day_started_queue.put(("day_started", day_number, schedule_text, next(self._sequence)))
 
     def emit_day_completed(self, game_results: List[Dict], standings_data: Dict, day_number: int):
         """Emit day_completed signal."""
-        self.day_completed_queue.put(("day_completed", game_results, standings_data, day_number))
+        self.day_completed_queue.put(
+            ("day_completed", game_results, standings_data, day_number, next(self._sequence))
+        )
 
     def emit_game_completed(self, game_data: Dict):
         """Emit game_completed signal."""
-        self.game_completed_queue.put(("game_completed", game_data))
+        self.game_completed_queue.put(("game_completed", game_data, next(self._sequence)))
 
     def emit_gm_assessment_ready(self, assessment_data: Dict):
         """Emit gm_assessment_ready signal."""
-        self.gm_assessment_queue.put(("gm_assessment", assessment_data))
+        self.gm_assessment_queue.put(("gm_assessment", assessment_data, next(self._sequence)))
 
     def emit_injury_update(self, injury_list: List[Dict]):
         """Emit injury_update signal."""
-        self.injury_update_queue.put(("injury_update", injury_list))
+        self.injury_update_queue.put(("injury_update", injury_list, next(self._sequence)))
+
+    def emit_load_progress(self, step: str, done: int, total: int):
+        """Emit load_progress signal."""
+        self.load_progress_queue.put(("load_progress", step, done, total, next(self._sequence)))
+
+    def emit_season_loaded(self):
+        """Emit season_loaded signal (season data loaded, before the first day)."""
+        self.season_loaded_queue.put(("season_loaded", next(self._sequence)))
 
     def emit_season_complete(self):
         """Emit season_complete signal (regular season ended, before playoffs)."""
-        self.season_complete_queue.put(("season_complete",))
+        self.season_complete_queue.put(("season_complete", next(self._sequence)))
 
     def emit_simulation_complete(self):
         """Emit simulation_complete signal."""
-        self.simulation_complete_queue.put(("simulation_complete",))
+        self.simulation_complete_queue.put(("simulation_complete", next(self._sequence)))
 
     def emit_error(self, error_message: str):
         """Emit error_occurred signal."""
-        self.error_queue.put(("error", error_message))
+        self.error_queue.put(("error", error_message, next(self._sequence)))
 
     def emit_play_by_play(self, play_data: Dict):
         """Emit play_by_play signal."""
-        self.play_by_play_queue.put(("play_by_play", play_data))
+        self.play_by_play_queue.put(("play_by_play", play_data, next(self._sequence)))
 
     def emit_world_series_started(self, ws_data: Dict):
         """Emit world_series_started signal."""
-        self.world_series_started_queue.put(("world_series_started", ws_data))
+        self.world_series_started_queue.put(("world_series_started", ws_data, next(self._sequence)))
 
     def emit_world_series_completed(self, ws_data: Dict):
         """Emit world_series_completed signal."""
-        self.world_series_completed_queue.put(("world_series_completed", ws_data))
+        self.world_series_completed_queue.put(("world_series_completed", ws_data, next(self._sequence)))
 
     def emit_pause_state(self, state: str):
         """Emit pause_state signal."""
-        self.pause_state_queue.put(("pause_state", state))
+        self.pause_state_queue.put(("pause_state", state, next(self._sequence)))
 
     def emit_day_processed(self, day_number: int):
         """Emit day_processed signal - UI signals back after draining all signals for a day."""
-        self.day_processed_queue.put(("day_processed", day_number))
+        self.day_processed_queue.put(("day_processed", day_number, next(self._sequence)))
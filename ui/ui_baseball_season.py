@@ -108,6 +108,10 @@ class UIBaseballSeason(bbseason.BaseballSeason):
                 self.signals.emit_world_series_completed(metadata or {})
             elif category in (OutputCategory.SEASON_START, OutputCategory.SEASON_END):
                 logger.info(f"Season event: {text.strip()}")
+            elif category == OutputCategory.LOAD_PROGRESS:
+                # Emitted from BaseballSeason.__init__, before self.signals is set
+                meta = metadata or {}
+                signals.emit_load_progress(meta.get("step", ""), meta.get("done", 0), meta.get("total", 0))
 
             # Suppress all console output - UI handles display
             pass
@@ -14,6 +14,8 @@ from .gm_assessment_widget import GMAssessmentWidget
 from .league_stats_widget import LeagueStatsWidget
 from .league_leaders_widget import LeagueLeadersWidget
 from .playoff_widget import PlayoffWidget
+from .loading_splash import LoadingSplash
+from .performance_widget import PerformanceWidget
 
 __all__ = [
     "ToolbarWidget",
@@ -28,4 +30,6 @@ __all__ = [
     "LeagueStatsWidget",
     "LeagueLeadersWidget",
     "PlayoffWidget",
+    "LoadingSplash",
+    "PerformanceWidget",
 ]
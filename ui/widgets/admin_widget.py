@@ -10,6 +10,8 @@ from typing import Callable, Optional
 from bblogger import logger
 
 from ui.theme import BG_PANEL, BG_ELEVATED, TEXT_PRIMARY, TEXT_SECONDARY, TEXT_HEADING
+from ui.widgets.performance_widget import PerformanceWidget
+from ui.widgets.virtual_treeview import VirtualTreeview
 
 
 class AdminWidget:
@@ -84,7 +86,7 @@ class AdminWidget:
         tree_scroll_x.pack(side=tk.BOTTOM, fill=tk.X)
 
         # Treeview for players
-        self.admin_players_tree = ttk.Treeview(
+        self.admin_players_tree = VirtualTreeview(
             list_frame,
             columns=("player", "pos", "team", "age", "type", "hashcode"),
             show="headings",
@@ -214,6 +216,10 @@ class AdminWidget:
         )
         self.place_il_btn.pack(side=tk.LEFT, padx=10)
 
+        # Live performance dashboard
+        self.performance_widget = PerformanceWidget(self.frame, get_worker_callback)
+        self.performance_widget.get_frame().pack(fill=tk.X, padx=10, pady=(5, 0))
+
         # Status message
         self.admin_status_label = tk.Label(
             self.frame,
@@ -241,35 +247,25 @@ class AdminWidget:
 
             # Load batters
             batting_df = baseball_data.new_season_batting_data
-            for idx, row in batting_df.iterrows():
-                pos = row.get("Pos", "Unknown")
+            positions = batting_df["Pos"] if "Pos" in batting_df.columns else ["Unknown"] * len(batting_df)
+            ages = batting_df["Age"].fillna(0) if "Age" in batting_df.columns else [0] * len(batting_df)
+            for idx, player, pos, team, age in zip(
+                batting_df.index, batting_df["Player"], positions, batting_df["Team"], ages
+            ):
                 if isinstance(pos, list):
                     pos = pos[0] if pos else "Unknown"
                 pos = str(pos).replace("[", "").replace("]", "").replace("'", "").replace('"', "").strip()
 
                 self.admin_all_players.append(
-                    {
-                        "player": row["Player"],
-                        "pos": pos,
-                        "team": row["Team"],
-                        "age": int(row.get("Age", 0)),
-                        "type": "Batter",
-                        "hashcode": idx,
-                    }
+                    {"player": player, "pos": pos, "team": team, "age": int(age), "type": "Batter", "hashcode": idx}
                 )
 
             # Load pitchers
             pitching_df = baseball_data.new_season_pitching_data
-            for idx, row in pitching_df.iterrows():
+            ages = pitching_df["Age"].fillna(0) if "Age" in pitching_df.columns else [0] * len(pitching_df)
+            for idx, player, team, age in zip(pitching_df.index, pitching_df["Player"], pitching_df["Team"], ages):
                 self.admin_all_players.append(
-                    {
-                        "player": row["Player"],
-                        "pos": "P",
-                        "team": row["Team"],
-                        "age": int(row.get("Age", 0)),
-                        "type": "Pitcher",
-                        "hashcode": idx,
-                    }
+                    {"player": player, "pos": "P", "team": team, "age": int(age), "type": "Pitcher", "hashcode": idx}
                 )
 
             # Populate team dropdowns
@@ -318,10 +314,6 @@ class AdminWidget:
         search_text = self.admin_search_var.get().lower()
         team_filter = self.admin_team_filter_var.get()
 
-        # Clear current display
-        for item in self.admin_players_tree.get_children():
-            self.admin_players_tree.delete(item)
-
         # Filter players
         filtered_players = []
         for player in self.admin_all_players:
@@ -335,20 +327,14 @@ class AdminWidget:
 
             filtered_players.append(player)
 
-        # Display filtered players
-        for player in filtered_players:
-            self.admin_players_tree.insert(
-                "",
-                tk.END,
-                values=(
-                    player["player"],
-                    player["pos"],
-                    player["team"],
-                    player["age"],
-                    player["type"],
-                    player["hashcode"],
-                ),
-            )
+        # Display filtered players, only the rows scrolled into view are formatted
+        self.admin_players_tree.set_rows(
+            len(filtered_players),
+            lambda position: (
+                tuple(filtered_players[position][key] for key in ("player", "pos", "team", "age", "type", "hashcode")),
+                (),
+            ),
+        )
 
         # Update status with count
         if search_text or team_filter != "All Teams":
@@ -414,10 +400,8 @@ class AdminWidget:
                     player["team"] = dest_team
                     break
 
-            # Update treeview
-            self.admin_players_tree.item(
-                selected_item, values=(values[0], values[1], dest_team, values[3], values[4], values[5])
-            )
+            # Update treeview, the row source holds the same player dicts
+            self.admin_players_tree.refresh()
 
             self.admin_status_label.config(
                 text=f"Moved {player_name} from {current_team} to {dest_team}. Click 'Save Changes' to persist.",
@@ -9,6 +9,7 @@ from tkinter import ttk
 from typing import List, Tuple, Optional, Any
 from bblogger import logger
 
+from ui.models.game_recap_archive import GameRecapArchive
 from ui.theme import BG_PANEL, BG_WIDGET, BG_WIDGET_ALT, TEXT_PRIMARY, TEXT_SECONDARY, ACCENT_BLUE, ACCENT_GOLD
 
 
@@ -117,11 +118,12 @@ class ScrollableFrame(ttk.Frame):
 class CollapsibleSection:
     """A collapsible section with a clickable header."""
 
-    def __init__(self, parent, title: str, default_expanded: bool = True, on_toggle=None):
+    def __init__(self, parent, title: str, default_expanded: bool = True, on_toggle=None, build=None):
         self.parent = parent
         self.title = title
         self.expanded = default_expanded
         self.on_toggle = on_toggle
+        self.build = build  # fills self.frame the first time the section is expanded
 
         self.header_frame = tk.Frame(parent, bg=BG_WIDGET, cursor="hand2")
 
@@ -148,6 +150,14 @@ class CollapsibleSection:
         self.title_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
         self.frame = tk.Frame(parent, bg=BG_WIDGET)
+        if self.expanded:
+            self._build_content()
+
+    def _build_content(self):
+        """Fill the frame on first expand, collapsed sections never shown cost no widgets."""
+        if self.build:
+            build, self.build = self.build, None
+            build(self.frame)
 
     def pack_header(self, pady=(10, 0)):
         """Pack the header (call after all sections are created for proper ordering)."""
@@ -161,6 +171,7 @@ class CollapsibleSection:
         self.caret.config(text="▼" if self.expanded else "▶")
 
         if self.expanded:
+            self._build_content()
             self.frame.pack(fill=tk.X, padx=5, pady=(0, 5))
         else:
             self.frame.pack_forget()
@@ -210,21 +221,22 @@ class GamesPlayedWidget:
     - Formatted display with score by inning, box scores, and play-by-play
     - Uses structured GameRecap data when available
     - Falls back to text recap when no structured data
-    - Treeview grids for batting and pitching box scores
+    - Treeview grids for batting and pitching box scores, built when first expanded
+    - Games kept on disk by GameRecapArchive, so memory stays flat over the season
     """
 
-    def __init__(self, parent: tk.Widget):
+    def __init__(self, parent: tk.Widget, season: Optional[int] = None):
         """
         Initialize games played widget.
 
         Args:
             parent: Parent tkinter widget (notebook or frame)
+            season: Season year, names the recap archive file
         """
         self.frame = tk.Frame(parent, bg=BG_PANEL)
 
-        # Storage for game data by day
-        # Format: {day_num: [(away, home, game_recap, structured_game), ...]}
-        self.pbp_by_day = {}
+        # Game data by day: (away, home, game_recap, structured_game) per game
+        self.recaps = GameRecapArchive(season)
 
         # Control frame with day dropdown
         pbp_control_frame = tk.Frame(self.frame, bg=BG_PANEL)
@@ -437,27 +449,32 @@ class GamesPlayedWidget:
             structured_game: GameRecap Pydantic object (preferred)
             date_str: Date string for this game (e.g., "April 5, 2026")
         """
-        if day_num not in self.pbp_by_day:
-            self.pbp_by_day[day_num] = []
-
-        self.pbp_by_day[day_num].append((away_team, home_team, game_recap, structured_game))
-
-        # Store date if provided
-        if date_str:
-            if not hasattr(self, "_day_dates"):
-                self._day_dates = {}
-            self._day_dates[day_num] = date_str
-
-        # Update dropdown with date if available, otherwise use Day # (most recent first)
-        day_options = []
-        for d in sorted(self.pbp_by_day.keys(), reverse=True):
-            if hasattr(self, "_day_dates") and d in self._day_dates:
-                day_options.append(self._day_dates[d])
-            else:
-                day_options.append(f"Day {d + 1}")
-        self.pbp_day_combo["values"] = ["Select Day"] + day_options
+        if self._store_game_recap(day_num, away_team, home_team, game_recap, structured_game, date_str):
+            self._refresh_day_options()
+
+    def add_game_recaps(self, recaps: List[Tuple]):
+        """
+        Add several game recaps, rebuilding the day dropdown at most once.
 
+        Args:
+            recaps: (day_num, away_team, home_team, game_recap, structured_game, date_str) tuples
+        """
+        changed = False
+        for recap in recaps:
+            changed |= self._store_game_recap(*recap)
+        if changed:
+            self._refresh_day_options()
+
+    def _store_game_recap(self, day_num, away_team, home_team, game_recap, structured_game=None, date_str=None) -> bool:
+        """Store one recap by day without touching the dropdown, True if the dropdown needs a rebuild."""
+        changed = self.recaps.add(day_num, away_team, home_team, game_recap, structured_game, date_str)
         logger.debug(f"Added game recap for Day {day_num + 1}: {away_team} @ {home_team}")
+        return changed
+
+    def _refresh_day_options(self):
+        """Update dropdown with date if available, otherwise use Day # (most recent first)."""
+        day_options = [self.recaps.date_of(d) or f"Day {d + 1}" for d in self.recaps.days()]
+        self.pbp_day_combo["values"] = ["Select Day"] + day_options
 
     def _on_day_changed(self, event=None):
         """Handle day dropdown change."""
@@ -475,19 +492,15 @@ class GamesPlayedWidget:
                 logger.error(f"Invalid day selection: {selected}")
                 return
         else:
-            # It's a date string - look up day number from _day_dates
-            if hasattr(self, "_day_dates"):
-                for d, date_str in self._day_dates.items():
-                    if date_str == selected:
-                        day_num = d
-                        break
+            # It's a date string - look up its day number
+            day_num = self.recaps.day_of(selected)
 
         if day_num is None:
             logger.error(f"Could not find day number for: {selected}")
             return
 
-        # Get games for this day
-        games = self.pbp_by_day.get(day_num, [])
+        # Get games for this day, read back from the archive
+        games = self.recaps.games(day_num)
 
         if not games:
             self._clear_display()
@@ -568,25 +581,27 @@ class GamesPlayedWidget:
         # Create manager for collapsible sections
         section_manager = CollapsibleSectionManager(self.scrollable_frame.scrollable_frame)
 
-        # Box Score: Away Team (collapsed by default)
+        # Box Score: Away Team (collapsed by default, built when first expanded)
+        away_box_score = _get_attr(structured_game, "away_box_score", None)
         away_section = CollapsibleSection(
             self.scrollable_frame.scrollable_frame,
             f"Box Score: {away}",
             default_expanded=False,
             on_toggle=lambda: self.scrollable_frame.update_scrollregion(),
+            build=lambda frame: self._display_away_team_box_score(frame, away, away_box_score),
         )
         section_manager.add_section(away_section)
-        self._display_away_team_box_score(away_section.frame, away, _get_attr(structured_game, "away_box_score", None))
 
-        # Box Score: Home Team (collapsed by default)
+        # Box Score: Home Team (collapsed by default, built when first expanded)
+        home_box_score = _get_attr(structured_game, "home_box_score", None)
         home_section = CollapsibleSection(
             self.scrollable_frame.scrollable_frame,
             f"Box Score: {home}",
             default_expanded=False,
             on_toggle=lambda: self.scrollable_frame.update_scrollregion(),
+            build=lambda frame: self._display_home_team_box_score(frame, home, home_box_score),
         )
         section_manager.add_section(home_section)
-        self._display_home_team_box_score(home_section.frame, home, _get_attr(structured_game, "home_box_score", None))
 
         # Play-by-play (expanded by default)
         pbp_section = CollapsibleSection(
@@ -1240,3 +1255,7 @@ class GamesPlayedWidget:
     def get_frame(self) -> tk.Frame:
         """Get the main frame for adding to parent container."""
         return self.frame
+
+    def close(self):
+        """Close the recap archive, deleting its file."""
+        self.recaps.close()
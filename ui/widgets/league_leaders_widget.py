@@ -26,9 +26,7 @@ class LeagueLeadersWidget:
         self.baseball_data = None
         self.games_played = 0
 
-        # Cached raw DataFrames and minimums (for re-filtering without a full reload)
-        self._raw_batting_df = None
-        self._raw_pitching_df = None
+        # Qualification minimums from the leader boards
         self._min_pa = 50
         self._min_ip = 20.0
 
@@ -200,45 +198,19 @@ class LeagueLeadersWidget:
         self.games_played = games_played
 
         try:
-            # Use simulated stats only (accumulated during games), not projected + simulated combined
-            self._raw_batting_df = baseball_data.get_simulated_batting_data(team_name=None)
-            self._raw_pitching_df = baseball_data.get_simulated_pitching_data(team_name=None)
-
-            # DEBUG: Log data stats
-            # if not self._raw_batting_df.empty:
-            #     pa_max = (
-            #         self._raw_batting_df["PA"].max()
-            #         if "PA" in self._raw_batting_df.columns
-            #         else 0
-            #     )
-            #     pa_sum = (
-            #         self._raw_batting_df["PA"].sum()
-            #         if "PA" in self._raw_batting_df.columns
-            #         else 0
-            #     )
-            #     logger.info(
-            #         f"League leaders batting data: rows={len(self._raw_batting_df)}, max_PA={pa_max}, sum_PA={pa_sum}"
-            #     )
-            #     if pa_max > 0:
-            #         top_pa = self._raw_batting_df.nlargest(3, "PA")[
-            #             ["Player", "Team", "PA", "AB"]
-            #         ]
-            #         logger.info(f"Top PA players: {top_pa.to_string()}")
-
-            self._min_pa = int(games_played * 3.1) if games_played > 0 else 50
-            self._min_ip = float(games_played * 1.0) if games_played > 0 else 20.0
-
+            # Leader boards are maintained by baseball_data from each day's changed players (simulated stats only)
+            self._min_pa, self._min_ip, leader_games = baseball_data.get_leader_qualification()
             self.batting_qual_label.config(
-                text=f"Qualification: {self._min_pa} PA (3.1 per game × {games_played} games)"
+                text=f"Qualification: {self._min_pa} PA (3.1 per game × {leader_games} games)"
             )
             self.pitching_qual_label.config(
-                text=f"Qualification: {self._min_ip:.1f} IP (1.0 per game × {games_played} games)"
+                text=f"Qualification: {self._min_ip:.1f} IP (1.0 per game × {leader_games} games)"
             )
 
             self._apply_filter_and_update()
 
             logger.info(
-                f"League leaders updated (games={games_played}, min_pa={self._min_pa}, min_ip={self._min_ip:.1f})"
+                f"League leaders updated (games={leader_games}, min_pa={self._min_pa}, min_ip={self._min_ip:.1f})"
             )
 
         except Exception as e:
@@ -248,111 +220,54 @@ class LeagueLeadersWidget:
             logger.error(traceback.format_exc())
 
     def _apply_filter_and_update(self):
-        """Filter cached DataFrames by the selected league and repopulate trees."""
-        if self._raw_batting_df is None or self._raw_pitching_df is None:
+        """Query the leader boards for the selected league and repopulate trees."""
+        if self.baseball_data is None:
             return
 
         league = self._league_filter.get()
+        league = None if league == "All" else league
 
-        if league == "All" or "League" not in self._raw_batting_df.columns:
-            batting_df = self._raw_batting_df
-        else:
-            batting_df = self._raw_batting_df[self._raw_batting_df["League"] == league]
-
-        if league == "All" or "League" not in self._raw_pitching_df.columns:
-            pitching_df = self._raw_pitching_df
-        else:
-            pitching_df = self._raw_pitching_df[self._raw_pitching_df["League"] == league]
+        self._update_batting_leaders(league)
+        self._update_pitching_leaders(league)
 
-        self._update_batting_leaders(batting_df, self._min_pa)
-        self._update_pitching_leaders(pitching_df, self._min_ip)
-
-    def _update_batting_leaders(self, batting_df: pd.DataFrame, min_pa: int):
+    def _update_batting_leaders(self, league):
         """Update batting leader trees."""
-        if "PA" not in batting_df.columns:
-            batting_df = batting_df.copy()
-            batting_df["PA"] = (
-                batting_df.get("AB", 0)
-                + batting_df.get("BB", 0)
-                + batting_df.get("HBP", 0)
-                + batting_df.get("SF", 0)
-                + batting_df.get("SH", 0)
-            )
-
-        if "AVG" in batting_df.columns and "PA" in batting_df.columns:
-            avg_leaders = batting_df[batting_df["PA"] >= min_pa].copy()
-            avg_leaders["AVG"] = pd.to_numeric(avg_leaders["AVG"], errors="coerce")
-            avg_leaders = avg_leaders.sort_values("AVG", ascending=False).head(10)
-            self._populate_leader_tree(
-                self.avg_tree, avg_leaders, ["Player", "Team", "AVG", "PA"], format_rules={"AVG": ".3f"}
-            )
-
-        if "OBP" in batting_df.columns and "PA" in batting_df.columns:
-            obp_leaders = batting_df[batting_df["PA"] >= min_pa].copy()
-            obp_leaders["OBP"] = pd.to_numeric(obp_leaders["OBP"], errors="coerce")
-            obp_leaders = obp_leaders.sort_values("OBP", ascending=False).head(10)
-            self._populate_leader_tree(
-                self.obp_tree, obp_leaders, ["Player", "Team", "OBP", "PA"], format_rules={"OBP": ".3f"}
-            )
-
-        if "OPS" in batting_df.columns and "PA" in batting_df.columns:
-            ops_leaders = batting_df[batting_df["PA"] >= min_pa].copy()
-            ops_leaders["OPS"] = pd.to_numeric(ops_leaders["OPS"], errors="coerce")
-            ops_leaders = ops_leaders.sort_values("OPS", ascending=False).head(10)
-            self._populate_leader_tree(
-                self.ops_tree, ops_leaders, ["Player", "Team", "OPS", "PA"], format_rules={"OPS": ".3f"}
-            )
-
-        if "HR" in batting_df.columns and "PA" in batting_df.columns:
-            hr_leaders = batting_df[batting_df["PA"] > 0].copy()
-            hr_leaders["HR"] = pd.to_numeric(hr_leaders["HR"], errors="coerce")
-            hr_leaders = hr_leaders.sort_values("HR", ascending=False).head(10)
-            self._populate_leader_tree(self.hr_tree, hr_leaders, ["Player", "Team", "HR", "PA"], format_rules={})
+        leaders = self.baseball_data.get_league_leaders
+        self._populate_leader_tree(
+            self.avg_tree, leaders("AVG", league), ["Player", "Team", "AVG", "PA"], format_rules={"AVG": ".3f"}
+        )
+        self._populate_leader_tree(
+            self.obp_tree, leaders("OBP", league), ["Player", "Team", "OBP", "PA"], format_rules={"OBP": ".3f"}
+        )
+        self._populate_leader_tree(
+            self.ops_tree, leaders("OPS", league), ["Player", "Team", "OPS", "PA"], format_rules={"OPS": ".3f"}
+        )
+        self._populate_leader_tree(self.hr_tree, leaders("HR", league), ["Player", "Team", "HR", "PA"], format_rules={})
 
-    def _update_pitching_leaders(self, pitching_df: pd.DataFrame, min_ip: float):
+    def _update_pitching_leaders(self, league):
         """Update pitching leader trees."""
-        if "W" in pitching_df.columns and "IP" in pitching_df.columns:
-            wins_leaders = pitching_df[pitching_df["IP"] > 0].copy()
-            wins_leaders["W"] = pd.to_numeric(wins_leaders["W"], errors="coerce")
-            wins_leaders = wins_leaders.sort_values("W", ascending=False).head(10)
-            self._populate_leader_tree(
-                self.wins_tree, wins_leaders, ["Player", "Team", "W", "IP"], format_rules={"IP": ".1f"}
-            )
-
-        if "ERA" in pitching_df.columns and "IP" in pitching_df.columns:
-            era_leaders = pitching_df[pitching_df["IP"] >= min_ip].copy()
-            era_leaders["ERA"] = pd.to_numeric(era_leaders["ERA"], errors="coerce")
-            era_leaders = era_leaders.sort_values("ERA", ascending=True).head(10)
-            self._populate_leader_tree(
-                self.era_tree, era_leaders, ["Player", "Team", "ERA", "IP"], format_rules={"ERA": ".2f", "IP": ".1f"}
-            )
-
-        if "WHIP" in pitching_df.columns and "IP" in pitching_df.columns:
-            whip_leaders = pitching_df[pitching_df["IP"] >= min_ip].copy()
-            whip_leaders["WHIP"] = pd.to_numeric(whip_leaders["WHIP"], errors="coerce")
-            whip_leaders = whip_leaders.sort_values("WHIP", ascending=True).head(10)
-            self._populate_leader_tree(
-                self.whip_tree,
-                whip_leaders,
-                ["Player", "Team", "WHIP", "IP"],
-                format_rules={"WHIP": ".2f", "IP": ".1f"},
-            )
-
-        if "SO" in pitching_df.columns and "IP" in pitching_df.columns:
-            k_leaders = pitching_df[pitching_df["IP"] > 0].copy()
-            k_leaders["SO"] = pd.to_numeric(k_leaders["SO"], errors="coerce")
-            k_leaders = k_leaders.sort_values("SO", ascending=False).head(10)
-            self._populate_leader_tree(
-                self.k_tree, k_leaders, ["Player", "Team", "SO", "IP"], format_rules={"IP": ".1f"}
-            )
-
-        if "SV" in pitching_df.columns and "IP" in pitching_df.columns:
-            saves_leaders = pitching_df[pitching_df["IP"] > 0].copy()
-            saves_leaders["SV"] = pd.to_numeric(saves_leaders["SV"], errors="coerce")
-            saves_leaders = saves_leaders.sort_values("SV", ascending=False).head(10)
-            self._populate_leader_tree(
-                self.saves_tree, saves_leaders, ["Player", "Team", "SV", "IP"], format_rules={"IP": ".1f"}
-            )
+        leaders = self.baseball_data.get_league_leaders
+        self._populate_leader_tree(
+            self.wins_tree, leaders("W", league), ["Player", "Team", "W", "IP"], format_rules={"IP": ".1f"}
+        )
+        self._populate_leader_tree(
+            self.era_tree,
+            leaders("ERA", league),
+            ["Player", "Team", "ERA", "IP"],
+            format_rules={"ERA": ".2f", "IP": ".1f"},
+        )
+        self._populate_leader_tree(
+            self.whip_tree,
+            leaders("WHIP", league),
+            ["Player", "Team", "WHIP", "IP"],
+            format_rules={"WHIP": ".2f", "IP": ".1f"},
+        )
+        self._populate_leader_tree(
+            self.k_tree, leaders("SO", league), ["Player", "Team", "SO", "IP"], format_rules={"IP": ".1f"}
+        )
+        self._populate_leader_tree(
+            self.saves_tree, leaders("SV", league), ["Player", "Team", "SV", "IP"], format_rules={"IP": ".1f"}
+        )
 
     def _populate_leader_tree(self, tree: ttk.Treeview, data_df: pd.DataFrame, columns: list, format_rules: dict):
         """Populate a leader tree with data."""
@@ -362,25 +277,24 @@ class LeagueLeadersWidget:
         if data_df.empty:
             return
 
-        for idx, row in data_df.iterrows():
+        # Format column by column, then insert the rows
+        formatted = []
+        for col in columns:
+            values = data_df[col] if col in data_df.columns else pd.Series(0, index=data_df.index)
+            if col in format_rules:
+                formatted.append([f"{float(value):{format_rules[col]}}" for value in values])
+            elif col in ["Player", "Team"] or values.dtype.kind not in "biuf":
+                formatted.append(values.tolist())
+            elif col in ["IP"]:
+                formatted.append([f"{float(value):.1f}" for value in values])
+            else:
+                formatted.append([value if pd.isna(value) else int(value) for value in values])  # NaN kept
+
+        for player, values in zip(data_df.get("Player", data_df.index), zip(*formatted)):
             try:
-                values = []
-                for col in columns:
-                    value = row.get(col, 0)
-                    if col in format_rules:
-                        value = f"{float(value):{format_rules[col]}}"
-                    elif isinstance(value, (int, float)) and col not in ["Player", "Team"]:
-                        if col in ["PA", "W", "SV", "SO"]:
-                            value = int(value)
-                        elif col in ["IP"]:
-                            value = f"{float(value):.1f}"
-                        else:
-                            value = int(value)
-                    values.append(value)
-
-                tree.insert("", tk.END, values=tuple(values))
+                tree.insert("", tk.END, values=values)
             except Exception as e:
-                logger.warning(f"Error inserting leader row for {row.get('Player', 'Unknown')}: {e}")
+                logger.warning(f"Error inserting leader row for {player}: {e}")
 
     def get_frame(self) -> tk.Frame:
         """Get the main frame for adding to parent container."""
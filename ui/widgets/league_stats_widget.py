@@ -12,6 +12,7 @@ import pandas as pd
 import bbstats
 from bblogger import logger
 from bbstats import calculate_stats_difference
+from ui.models.view_models import ViewModelCache, build_table_view, frame_key
 from ui.theme import (
     BG_PANEL,
     BG_ELEVATED,
@@ -21,6 +22,7 @@ from ui.theme import (
     ACCENT_GOLD,
 )
 from ui.widgets.player_history_popup import show_history_popup
+from ui.widgets.virtual_treeview import VirtualTreeview, in_sort_order, patch_frame
 
 LEAGUE_MIN_SALARY = 740000
 
@@ -94,16 +96,20 @@ class LeagueStatsWidget:
     - Find player by name
     """
 
-    def __init__(self, parent: tk.Widget, comparison_mode_var: tk.StringVar = None):
+    def __init__(
+            self, parent: tk.Widget, comparison_mode_var: tk.StringVar = None, view_models: ViewModelCache = None
+    ):
         """
         Initialize league stats widget.
 
         Args:
             parent: Parent tkinter widget (notebook or frame)
             comparison_mode_var: StringVar for comparison mode ("current" or "difference")
+            view_models: Prepares the displayed rows off the Tk thread, None prepares them at once
         """
         self.frame = tk.Frame(parent, bg=BG_PANEL)
         self.baseball_data = None  # Will be set in update_stats
+        self.view_models = view_models or ViewModelCache(background=False)
 
         # Create our own comparison mode var if not provided
         if comparison_mode_var is None:
@@ -117,10 +123,6 @@ class LeagueStatsWidget:
         self.batters_df = None  # Currently displayed (filtered/sorted)
         self.pitchers_df = None  # Currently displayed (filtered/sorted)
 
-        # Cached 2025 prorated data for comparison (Phase 4: Stats Enhancement)
-        self.batters_df_2025 = None
-        self.pitchers_df_2025 = None
-
         # Track sort state for each tree: {tree_id: {'column': str, 'ascending': bool}}
         self.sort_state = {}
 
@@ -377,7 +379,7 @@ class LeagueStatsWidget:
                 "Str",
             )
 
-        tree = ttk.Treeview(parent, columns=columns, show="headings", height=17)
+        tree = VirtualTreeview(parent, columns=columns, show="headings", height=17)
 
         # Initialize sort state for this tree
         tree_id = str(id(tree))
@@ -482,6 +484,103 @@ class LeagueStatsWidget:
 
             logger.error(traceback.format_exc())
 
+    def apply_changed_rows(self, batting_rows: pd.DataFrame, pitching_rows: pd.DataFrame, removed: set) -> bool:
+        """
+        Update only the players changed since the last refresh, keeping filters, sort and scroll position.
+
+        Args:
+            batting_rows: Changed batters, see BaseballStats.get_changed_rows()
+            pitching_rows: Changed pitchers
+            removed: Hashcodes no longer in the season
+
+        Returns:
+            False if update_stats() is needed instead: no data yet, new players, the
+            difference view, which is recalculated as a whole, or rows still being
+            prepared from older data
+        """
+        if self.batters_df_full is None or self.pitchers_df_full is None:
+            return False
+        if self.comparison_mode_var and self.comparison_mode_var.get() == "difference":
+            return False
+        if self.view_models.pending(self.pos_players_tree) or self.view_models.pending(self.pitchers_tree):
+            return False
+        if not (
+            batting_rows.index.isin(self.batters_df_full.index).all()
+            and pitching_rows.index.isin(self.pitchers_df_full.index).all()
+        ):
+            return False
+
+        try:
+            self._patch_rows(batting_rows, removed, is_batter=True)
+            self._patch_rows(pitching_rows, removed, is_batter=False)
+            self._update_totals_display(is_batter=True)
+            self._update_totals_display(is_batter=False)
+            logger.debug(f"League stats patched: {len(batting_rows)} batters, {len(pitching_rows)} pitchers")
+        except Exception as e:
+            logger.error(f"Error patching league stats: {e}")
+            return False
+        return True
+
+    def _patch_rows(self, rows: pd.DataFrame, removed: set, is_batter: bool):
+        """
+        Copy changed players into the full data and redraw their rows.
+
+        The displayed rows are re-read from it in their current order. Changed rows still in
+        sort order are redrawn in place, otherwise the displayed rows are re-sorted. Removed
+        players, and team moves under a team filter, re-apply the filters.
+
+        Args:
+            rows: Changed players, all already in the full data
+            removed: Hashcodes no longer in the season
+            is_batter: True for batters, False for pitchers
+        """
+        full = self.batters_df_full if is_batter else self.pitchers_df_full
+        tree = self.pos_players_tree if is_batter else self.pitchers_tree
+        team = (self.batting_team_var if is_batter else self.pitching_team_var).get()
+        gone = full.index.intersection(list(removed))
+        moved = (rows["Team"] != full.loc[rows.index, "Team"]).any()
+        patch_frame(full, rows)
+        if len(gone) > 0 or (moved and team != "All Teams"):
+            full.drop(gone, inplace=True)
+            self._apply_filters(is_batter)
+            return
+
+        view = self.batters_df if is_batter else self.pitchers_df
+        shown = rows.index[rows.index.isin(view.index)]
+        if len(shown) == 0:
+            return
+        view = full.loc[view.index]  # the displayed rows re-read in their current order
+        positions = view.index.get_indexer(shown)
+        column, ascending = self._sort_column(is_batter)
+        resort = column in view.columns and not in_sort_order(view[column].to_numpy(), positions, ascending)
+        if resort:
+            view = view.sort_values(column, ascending=ascending, na_position="last", kind="stable")
+        if is_batter:
+            self.batters_df = view
+        else:
+            self.pitchers_df = view
+
+        if resort:
+            self._update_stats_tree(tree, view, is_batter)
+        else:
+            tree.update_rows(positions, self._row_source(view, "current", is_batter))
+
+    def _sort_column(self, is_batter: bool) -> tuple:
+        """
+        Column and direction of the displayed rows, as sorted by _apply_filters().
+
+        Args:
+            is_batter: True for batters, False for pitchers
+
+        Returns:
+            (DataFrame column, ascending): the user's sort, or OPS / IP descending
+        """
+        tree = self.pos_players_tree if is_batter else self.pitchers_tree
+        sort_state = self.sort_state.get(str(id(tree)), {})
+        if sort_state.get("column") is not None:
+            return {"K": "SO"}.get(sort_state["column"], sort_state["column"]), sort_state["ascending"]
+        return ("OPS" if is_batter else "IP"), False
+
     def _apply_filters(self, is_batter: bool):
         """
         Apply team filter and name search to the data.
@@ -575,147 +674,181 @@ class LeagueStatsWidget:
             data_df: DataFrame with player data
             is_batter: True for batters, False for pitchers
         """
-        # Clear existing
-        for item in tree.get_children():
-            tree.delete(item)
-
         # Handle empty DataFrame
         if data_df.empty:
             logger.debug(f"Empty league data for {'batter' if is_batter else 'pitcher'}")
+            self.view_models.cancel(tree)
+            tree.set_rows(0, lambda position: ((), ()))
             return
 
-        # Check comparison mode and calculate differences if needed
+        # Differences and the first rows' formatting are prepared off the Tk thread (see ViewModelCache),
+        # rows further down are formatted when they scroll into view
         mode = self.comparison_mode_var.get() if self.comparison_mode_var else "current"
-        display_df = data_df
-
-        if mode == "difference":
-            display_df = self._calculate_difference_df(data_df, is_batter)
-
-        # Insert rows
-        for idx, row in display_df.iterrows():
-            try:
-                if is_batter:
-                    # Clean up position formatting
-                    pos = row.get("Pos", "Unknown")
-                    if isinstance(pos, list):
-                        pos = pos[0] if pos else "Unknown"
-                    pos = str(pos).replace("[", "").replace("]", "").replace("'", "").replace('"', "").strip()
-
-                    # Get salary and calculate years remaining
-                    salary = row.get("Salary", LEAGUE_MIN_SALARY)
-                    age = row.get("Age", 30)
-                    years_rem = estimate_years_remaining(age, salary, is_pitcher=False)
-                    salary_display = f"${salary / 1e6:.1f}M" if salary else "-"
-
-                    if mode == "difference":
-                        # Format with +/- prefix for difference mode
-                        streak_text = get_streak_indicator(row.get("Streak_Adjustment"))
-                        values = (
-                            row.get("Player", "Unknown"),
-                            row.get("Team", ""),
-                            pos,
-                            self._format_diff_value(row.get("G", 0)),
-                            self._format_diff_value(row.get("AB", 0)),
-                            self._format_diff_value(row.get("R", 0)),
-                            self._format_diff_value(row.get("H", 0)),
-                            self._format_diff_value(row.get("2B", 0)),
-                            self._format_diff_value(row.get("3B", 0)),
-                            self._format_diff_value(row.get("HR", 0)),
-                            self._format_diff_value(row.get("RBI", 0)),
-                            self._format_diff_value(row.get("BB", 0)),
-                            self._format_diff_value(row.get("SO", 0)),
-                            self._format_diff_value(row.get("AVG", 0), decimals=3),
-                            self._format_diff_value(row.get("OBP", 0), decimals=3),
-                            self._format_diff_value(row.get("SLG", 0), decimals=3),
-                            self._format_diff_value(row.get("OPS", 0), decimals=3),
-                            salary_display,
-                            years_rem,
-                            streak_text,
-                        )
-                    else:
-                        # Standard format for current stats
-                        streak_text = get_streak_indicator(row.get("Streak_Adjustment"))
-                        values = (
-                            row.get("Player", "Unknown"),
-                            row.get("Team", ""),
-                            pos,
-                            int(row.get("G", 0)),
-                            int(row.get("AB", 0)),
-                            int(row.get("R", 0)),
-                            int(row.get("H", 0)),
-                            int(row.get("2B", 0)),
-                            int(row.get("3B", 0)),
-                            int(row.get("HR", 0)),
-                            int(row.get("RBI", 0)),
-                            int(row.get("BB", 0)),
-                            int(row.get("SO", 0)),
-                            f"{float(row.get('AVG', 0)):.3f}",
-                            f"{float(row.get('OBP', 0)):.3f}",
-                            f"{float(row.get('SLG', 0)):.3f}",
-                            f"{float(row.get('OPS', 0)):.3f}",
-                            salary_display,
-                            years_rem,
-                            streak_text,
-                        )
-                else:
-                    # Get salary and calculate years remaining
-                    salary = row.get("Salary", LEAGUE_MIN_SALARY)
-                    age = row.get("Age", 30)
-                    years_rem = estimate_years_remaining(age, salary, is_pitcher=True)
-                    salary_display = f"${salary / 1e6:.1f}M" if salary else "-"
-
-                    if mode == "difference":
-                        # Format with +/- prefix for difference mode
-                        streak_text = get_streak_indicator(row.get("Streak_Adjustment"))
-                        values = (
-                            row.get("Player", "Unknown"),
-                            row.get("Team", ""),
-                            self._format_diff_value(row.get("G", 0)),
-                            self._format_diff_value(row.get("GS", 0)),
-                            self._format_diff_value(row.get("W", 0)),
-                            self._format_diff_value(row.get("L", 0)),
-                            self._format_diff_value(row.get("IP", 0), decimals=1),
-                            self._format_diff_value(row.get("H", 0)),
-                            self._format_diff_value(row.get("R", 0)),
-                            self._format_diff_value(row.get("ER", 0)),
-                            self._format_diff_value(row.get("HR", 0)),
-                            self._format_diff_value(row.get("BB", 0)),
-                            self._format_diff_value(row.get("SO", 0)),
-                            self._format_diff_value(row.get("ERA", 0), decimals=2),
-                            self._format_diff_value(row.get("WHIP", 0), decimals=2),
-                            self._format_diff_value(row.get("SV", 0)),
-                            salary_display,
-                            years_rem,
-                            streak_text,
-                        )
-                    else:
-                        # Standard format for current stats
-                        streak_text = get_streak_indicator(row.get("Streak_Adjustment"))
-                        values = (
-                            row.get("Player", "Unknown"),
-                            row.get("Team", ""),
-                            int(row.get("G", 0)),
-                            int(row.get("GS", 0)),
-                            int(row.get("W", 0)),
-                            int(row.get("L", 0)),
-                            f"{float(row.get('IP', 0)):.1f}",
-                            int(row.get("H", 0)),
-                            int(row.get("R", 0)),
-                            int(row.get("ER", 0)),
-                            int(row.get("HR", 0)),
-                            int(row.get("BB", 0)),
-                            int(row.get("SO", 0)),
-                            f"{float(row.get('ERA', 0)):.2f}",
-                            f"{float(row.get('WHIP', 0)):.2f}",
-                            int(row.get("SV", 0)),
-                            salary_display,
-                            years_rem,
-                            streak_text,
-                        )
-
-                tree.insert("", tk.END, values=values)
-            except Exception as e:
-                logger.warning(f"Error inserting stats row for {row.get('Player', 'Unknown')}: {e}")
+        games_played = self._games_played() if mode == "difference" else 0
+
+        def prepare():
+            display_df = data_df
+            if mode == "difference":
+                display_df = self._calculate_difference_df(data_df, is_batter, games_played)
+            return build_table_view(
+                display_df,
+                lambda row: (self._format_stats_row(row, mode, is_batter), ()),
+                self.view_models.preformat_rows,
+            )
+
+        self.view_models.request(
+            tree,
+            ("league", is_batter, mode, games_played) + frame_key(data_df),
+            prepare,
+            lambda view: tree.set_rows(len(view.frame), view.row),
+        )
+
+    def _row_source(self, display_df: pd.DataFrame, mode: str, is_batter: bool):
+        """
+        Row source for the virtual tree, formats a displayed row when it scrolls into view.
+
+        Args:
+            display_df: Displayed rows in order
+            mode: "current" or "difference"
+            is_batter: True for batters, False for pitchers
+
+        Returns:
+            Function of a row position returning (values, tags)
+        """
+        return lambda position: (self._format_stats_row(display_df.iloc[position], mode, is_batter), ())
+
+    def _format_stats_row(self, row: pd.Series, mode: str, is_batter: bool) -> tuple:
+        """
+        Format one player's stats for display.
+
+        Args:
+            row: Player row from the displayed DataFrame
+            mode: "current" or "difference"
+            is_batter: True for batters, False for pitchers
+
+        Returns:
+            Tuple of display values in column order
+        """
+        if is_batter:
+            # Clean up position formatting
+            pos = row.get("Pos", "Unknown")
+            if isinstance(pos, list):
+                pos = pos[0] if pos else "Unknown"
+            pos = str(pos).replace("[", "").replace("]", "").replace("'", "").replace('"', "").strip()
+
+            # Get salary and calculate years remaining
+            salary = row.get("Salary", LEAGUE_MIN_SALARY)
+            age = row.get("Age", 30)
+            years_rem = estimate_years_remaining(age, salary, is_pitcher=False)
+            salary_display = f"${salary / 1e6:.1f}M" if salary else "-"
+
+            if mode == "difference":
+                # Format with +/- prefix for difference mode
+                streak_text = get_streak_indicator(row.get("Streak_Adjustment"))
+                values = (
+                    row.get("Player", "Unknown"),
+                    row.get("Team", ""),
+                    pos,
+                    self._format_diff_value(row.get("G", 0)),
+                    self._format_diff_value(row.get("AB", 0)),
+                    self._format_diff_value(row.get("R", 0)),
+                    self._format_diff_value(row.get("H", 0)),
+                    self._format_diff_value(row.get("2B", 0)),
+                    self._format_diff_value(row.get("3B", 0)),
+                    self._format_diff_value(row.get("HR", 0)),
+                    self._format_diff_value(row.get("RBI", 0)),
+                    self._format_diff_value(row.get("BB", 0)),
+                    self._format_diff_value(row.get("SO", 0)),
+                    self._format_diff_value(row.get("AVG", 0), decimals=3),
+                    self._format_diff_value(row.get("OBP", 0), decimals=3),
+                    self._format_diff_value(row.get("SLG", 0), decimals=3),
+                    self._format_diff_value(row.get("OPS", 0), decimals=3),
+                    salary_display,
+                    years_rem,
+                    streak_text,
+                )
+            else:
+                # Standard format for current stats
+                streak_text = get_streak_indicator(row.get("Streak_Adjustment"))
+                values = (
+                    row.get("Player", "Unknown"),
+                    row.get("Team", ""),
+                    pos,
+                    int(row.get("G", 0)),
+                    int(row.get("AB", 0)),
+                    int(row.get("R", 0)),
+                    int(row.get("H", 0)),
+                    int(row.get("2B", 0)),
+                    int(row.get("3B", 0)),
+                    int(row.get("HR", 0)),
+                    int(row.get("RBI", 0)),
+                    int(row.get("BB", 0)),
+                    int(row.get("SO", 0)),
+                    f"{float(row.get('AVG', 0)):.3f}",
+                    f"{float(row.get('OBP', 0)):.3f}",
+                    f"{float(row.get('SLG', 0)):.3f}",
+                    f"{float(row.get('OPS', 0)):.3f}",
+                    salary_display,
+                    years_rem,
+                    streak_text,
+                )
+        else:
+            # Get salary and calculate years remaining
+            salary = row.get("Salary", LEAGUE_MIN_SALARY)
+            age = row.get("Age", 30)
+            years_rem = estimate_years_remaining(age, salary, is_pitcher=True)
+            salary_display = f"${salary / 1e6:.1f}M" if salary else "-"
+
+            if mode == "difference":
+                # Format with +/- prefix for difference mode
+                streak_text = get_streak_indicator(row.get("Streak_Adjustment"))
+                values = (
+                    row.get("Player", "Unknown"),
+                    row.get("Team", ""),
+                    self._format_diff_value(row.get("G", 0)),
+                    self._format_diff_value(row.get("GS", 0)),
+                    self._format_diff_value(row.get("W", 0)),
+                    self._format_diff_value(row.get("L", 0)),
+                    self._format_diff_value(row.get("IP", 0), decimals=1),
+                    self._format_diff_value(row.get("H", 0)),
+                    self._format_diff_value(row.get("R", 0)),
+                    self._format_diff_value(row.get("ER", 0)),
+                    self._format_diff_value(row.get("HR", 0)),
+                    self._format_diff_value(row.get("BB", 0)),
+                    self._format_diff_value(row.get("SO", 0)),
+                    self._format_diff_value(row.get("ERA", 0), decimals=2),
+                    self._format_diff_value(row.get("WHIP", 0), decimals=2),
+                    self._format_diff_value(row.get("SV", 0)),
+                    salary_display,
+                    years_rem,
+                    streak_text,
+                )
+            else:
+                # Standard format for current stats
+                streak_text = get_streak_indicator(row.get("Streak_Adjustment"))
+                values = (
+                    row.get("Player", "Unknown"),
+                    row.get("Team", ""),
+                    int(row.get("G", 0)),
+                    int(row.get("GS", 0)),
+                    int(row.get("W", 0)),
+                    int(row.get("L", 0)),
+                    f"{float(row.get('IP', 0)):.1f}",
+                    int(row.get("H", 0)),
+                    int(row.get("R", 0)),
+                    int(row.get("ER", 0)),
+                    int(row.get("HR", 0)),
+                    int(row.get("BB", 0)),
+                    int(row.get("SO", 0)),
+                    f"{float(row.get('ERA', 0)):.2f}",
+                    f"{float(row.get('WHIP', 0)):.2f}",
+                    int(row.get("SV", 0)),
+                    salary_display,
+                    years_rem,
+                    streak_text,
+                )
+
+        return values
 
     def _apply_sort(self, df: pd.DataFrame, column: str, ascending: bool, is_batter: bool) -> pd.DataFrame:
         """
@@ -985,42 +1118,37 @@ class LeagueStatsWidget:
         if self.pitchers_df_full is not None:
             self._apply_filters(is_batter=False)
 
-    def _load_2025_data(self):
-        """Load and cache 2025 historical data for comparison (Phase 4: Stats Enhancement)."""
-        if self.baseball_data is None:
-            return
-
-        # Determine games played from W-L records (same logic as _update_totals_display)
-        games_played = 0
-        if self.team_win_loss:
-            games_played = max(
-                (wins + losses for team, (wins, losses) in self.team_win_loss.items() if team != "OFF DAY"), default=0
-            )
-
-        # Calculate prorated 2025 stats for league-wide view (no team filter)
-        self.batters_df_2025, self.pitchers_df_2025 = self.baseball_data.calculate_prorated_prior_year_stats(
-            team_name=None, current_games_played=games_played if games_played > 0 else None
-        )
-
-        logger.info(
-            f"Loaded 2025 league data: {len(self.batters_df_2025)} batters, {len(self.pitchers_df_2025)} pitchers (games_played={games_played})"
+    def _games_played(self) -> int:
+        """Most games played by a team, from the W-L records, the proration basis for 2025 stats."""
+        if not self.team_win_loss:
+            return 0
+        return max(
+            (wins + losses for team, (wins, losses) in self.team_win_loss.items() if team != "OFF DAY"), default=0
         )
 
-    def _calculate_difference_df(self, current_df: pd.DataFrame, is_batter: bool) -> pd.DataFrame:
+    def _calculate_difference_df(self, current_df: pd.DataFrame, is_batter: bool, games_played: int) -> pd.DataFrame:
         """
         Calculate current - prorated 2025 for each player (Phase 4: Stats Enhancement).
 
+        Runs on the view model thread, so it only reads its arguments and the thread safe
+        calculate_prorated_prior_year_stats().
+
         Args:
             current_df: Current season DataFrame
             is_batter: True for batters, False for pitchers
+            games_played: Proration basis, see _games_played()
 
         Returns:
             DataFrame with difference values
         """
-        # Always reload to get correct proration for current games_played
-        self._load_2025_data()
+        if self.baseball_data is None:
+            return current_df
 
-        hist_df = self.batters_df_2025 if is_batter else self.pitchers_df_2025
+        # Prorated 2025 stats for league-wide view (no team filter), cached by baseball_data per games played
+        batters_df_2025, pitchers_df_2025 = self.baseball_data.calculate_prorated_prior_year_stats(
+            team_name=None, current_games_played=games_played if games_played > 0 else None
+        )
+        hist_df = batters_df_2025 if is_batter else pitchers_df_2025
 
         if hist_df is None or hist_df.empty:
             logger.warning("No 2025 historical data available for comparison")
@@ -1114,12 +1242,7 @@ class LeagueStatsWidget:
         totals_scroll.pack(side=tk.RIGHT, fill=tk.Y)
 
         # Determine games played from W-L records (maximum games played across all teams)
-        games_played = 0
-        if self.team_win_loss:
-            # For league stats, use max games (W+L) across all teams
-            games_played = max(
-                (wins + losses for team, (wins, losses) in self.team_win_loss.items() if team != "OFF DAY"), default=0
-            )
+        games_played = self._games_played()
 
         # Get prorated 2025 stats for league (explicitly pass games_played so we know the proration basis)
         batting_2025, pitching_2025 = self.baseball_data.calculate_prorated_prior_year_stats(
@@ -1201,12 +1324,15 @@ class LeagueStatsWidget:
 
     def _copy_selected_rows(self, tree: ttk.Treeview):
         """Copy selected row(s) to clipboard as tab-separated values with column headers."""
-        selected = tree.selection()
+        if isinstance(tree, VirtualTreeview):  # includes selected rows scrolled out of view
+            selected = [tree.row_values(row) for row in tree.selected_rows()]
+        else:
+            selected = [tree.item(item, "values") for item in tree.selection()]
         if not selected:
             return
         columns = tree["columns"]
         header = "\t".join(columns)
-        rows = ["\t".join(str(v) for v in tree.item(item, "values")) for item in selected]
+        rows = ["\t".join(str(v) for v in values) for values in selected]
         tree.clipboard_clear()
         tree.clipboard_append(header + "\n" + "\n".join(rows))
 
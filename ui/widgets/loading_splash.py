@@ -0,0 +1,72 @@
+"""
+Copyright (c) 2024 Jim Maastricht
+
+Loading splash shown while the season data loads.
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+from ui.theme import BG_PANEL, TEXT_PRIMARY, TEXT_SECONDARY
+
+
+class LoadingSplash:
+    """
+    Small window with a progress bar for the startup load steps.
+
+    The main window updates it from load_progress signals and closes it on
+    season_loaded. It does not grab input, so the window stays usable.
+    """
+
+    def __init__(self, parent: tk.Tk, title: str = "Loading season"):
+        """
+        Create and center the splash over parent.
+
+        Args:
+            parent: Main window
+            title: Heading text
+        """
+        self.window = tk.Toplevel(parent)
+        self.window.title(title)
+        self.window.geometry("360x120")
+        self.window.resizable(False, False)
+        self.window.transient(parent)
+        self.window.configure(bg=BG_PANEL)
+
+        self.window.update_idletasks()
+        x = parent.winfo_x() + (parent.winfo_width() // 2) - 180
+        y = parent.winfo_y() + (parent.winfo_height() // 2) - 60
+        self.window.geometry(f"+{x}+{y}")
+
+        tk.Label(self.window, text=title, font=("Segoe UI", 12, "bold"), bg=BG_PANEL, fg=TEXT_PRIMARY).pack(
+            pady=(15, 5)
+        )
+        self.progress_bar = ttk.Progressbar(self.window, mode="indeterminate", length=300)
+        self.progress_bar.pack(pady=5)
+        self.progress_bar.start(15)
+        self.step_label = tk.Label(
+            self.window, text="Loading player stats...", font=("Segoe UI", 10), bg=BG_PANEL, fg=TEXT_SECONDARY
+        )
+        self.step_label.pack(pady=(0, 10))
+
+    def update_progress(self, step: str, done: int, total: int):
+        """
+        Show a finished load step.
+
+        Args:
+            step: What was loaded, e.g. "schedule"
+            done: Steps finished so far
+            total: Steps in all
+        """
+        if not self.window.winfo_exists():
+            return
+        if str(self.progress_bar.cget("mode")) != "determinate":
+            self.progress_bar.stop()
+            self.progress_bar.config(mode="determinate", maximum=max(1, total))
+        self.progress_bar["value"] = done
+        self.step_label.config(text=f"Loaded {step} ({done}/{total})")
+
+    def close(self):
+        """Close the splash, safe to call more than once."""
+        if self.window.winfo_exists():
+            self.window.destroy()
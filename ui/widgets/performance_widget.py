@@ -0,0 +1,125 @@
+"""
+Copyright (c) 2024 Jim Maastricht
+
+Live performance dashboard for the admin tab.
+"""
+
+import tkinter as tk
+from typing import Callable, Optional
+
+from bbperf import PHASES, PerfMonitor, PerfSnapshot
+from ui.theme import BG_ELEVATED, BG_PANEL, TEXT_PRIMARY, TEXT_SECONDARY
+
+REFRESH_MS = 1000  # dashboard update interval
+
+
+class PerformanceWidget:
+    """
+    Games/sec, plate appearances/sec, per phase time per day, worker utilization,
+    lock wait and memory of the running season.
+
+    The season's PerfMonitor records only while the dashboard is switched on and
+    on screen, so the simulation runs untimed the rest of the time.
+    """
+
+    def __init__(self, parent: tk.Widget, get_worker_callback: Callable):
+        """
+        Initialize performance widget.
+
+        Args:
+            parent: Parent tkinter widget
+            get_worker_callback: Callback function to get worker instance
+        """
+        self.get_worker = get_worker_callback
+        self._monitor: Optional[PerfMonitor] = None
+
+        self.frame = tk.LabelFrame(
+            parent,
+            text="Performance",
+            font=("Arial", 10, "bold"),
+            padx=10,
+            pady=5,
+            bg=BG_PANEL,
+            fg=TEXT_PRIMARY,
+        )
+        self.show_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            self.frame,
+            text="Show live performance (timing is recorded only while shown)",
+            variable=self.show_var,
+            command=self._refresh,
+            font=("Segoe UI", 9),
+            bg=BG_PANEL,
+            fg=TEXT_PRIMARY,
+            selectcolor=BG_ELEVATED,
+            activebackground=BG_PANEL,
+            activeforeground=TEXT_PRIMARY,
+        ).pack(anchor=tk.W)
+
+        self.summary_label = tk.Label(
+            self.frame, text="", font=("Consolas", 9), bg=BG_PANEL, fg=TEXT_PRIMARY, anchor=tk.W, justify=tk.LEFT
+        )
+        self.summary_label.pack(fill=tk.X)
+        self.phase_label = tk.Label(
+            self.frame, text="", font=("Consolas", 9), bg=BG_PANEL, fg=TEXT_SECONDARY, anchor=tk.W, justify=tk.LEFT
+        )
+        self.phase_label.pack(fill=tk.X)
+
+        self.frame.after(REFRESH_MS, self._tick)
+
+    def _tick(self):
+        """Refresh once a second for as long as the widget exists."""
+        if not self.frame.winfo_exists():
+            return
+        self._refresh()
+        self.frame.after(REFRESH_MS, self._tick)
+
+    def _refresh(self):
+        """Turn the season's monitor on while the dashboard is shown and draw its latest values."""
+        worker = self.get_worker()
+        season = worker.season if worker else None
+        monitor = season.baseball_data.perf if season is not None else None
+        if monitor is not self._monitor:  # new season, stop timing the old one
+            if self._monitor is not None:
+                self._monitor.set_enabled(False)
+            self._monitor = monitor
+
+        shown = self.show_var.get() and bool(self.frame.winfo_viewable())
+        if monitor is not None:
+            monitor.set_enabled(shown)
+        if not self.show_var.get():
+            self.summary_label.config(text="")
+            self.phase_label.config(text="")
+        elif monitor is None:
+            self.summary_label.config(text="Start a season to see its performance.")
+            self.phase_label.config(text="")
+        elif shown:
+            self._show(monitor.snapshot())
+
+    def _show(self, snapshot: PerfSnapshot):
+        """
+        Draw a snapshot.
+
+        Args:
+            snapshot: Values from the season's PerfMonitor
+        """
+        rss = f"{snapshot.rss_mb:,.0f} MB" if snapshot.rss_mb is not None else "n/a"
+        self.summary_label.config(
+            text=f"Games/sec {snapshot.games_per_sec:6.2f}   PAs/sec {snapshot.pas_per_sec:8.1f}   "
+            f"Worker busy {snapshot.worker_utilization:4.0%}   "
+            f"Lock wait {snapshot.lock_wait_ms:7.1f} ms/day   RSS {rss}"
+        )
+        if not snapshot.days:
+            self.phase_label.config(text="Per day phase times appear after the next simulated day.")
+            return
+        total = sum(snapshot.phase_ms.values()) or 1.0
+        lines = [f"CPU time per day, last {snapshot.days} day(s):"]
+        lines += [
+            f"  {phase:<17}{snapshot.phase_ms.get(phase, 0.0):9.1f} ms {snapshot.phase_ms.get(phase, 0.0) / total:6.1%}"
+            for phase in PHASES
+        ]
+        self.phase_label.config(text="\n".join(lines))
+
+    def get_frame(self) -> tk.LabelFrame:
+        """Get the widget's frame."""
+        return self.frame
@@ -10,6 +10,8 @@ from tkinter import ttk
 import pandas as pd
 
 from bblogger import logger
+from bbstats import calculate_stats_difference
+from ui.models.view_models import ViewModelCache, build_table_view, frame_key
 from ui.theme import (
     BG_PANEL,
     BG_ELEVATED,
@@ -21,6 +23,7 @@ from ui.theme import (
     ROW_IL,
 )
 from ui.widgets.player_history_popup import show_history_popup
+from ui.widgets.virtual_treeview import VirtualTreeview, in_sort_order, patch_frame
 
 LEAGUE_MIN_SALARY = 740000
 
@@ -101,16 +104,20 @@ class RosterWidget:
     - Color-codes injured players
     """
 
-    def __init__(self, parent: tk.Widget, comparison_mode_var: tk.StringVar = None):
+    def __init__(
+            self, parent: tk.Widget, comparison_mode_var: tk.StringVar = None, view_models: ViewModelCache = None
+    ):
         """
         Initialize roster widget.
 
         Args:
             parent: Parent tkinter widget (notebook or frame)
             comparison_mode_var: StringVar for comparison mode ("current" or "difference")
+            view_models: Prepares the displayed rows off the Tk thread, None prepares them at once
         """
         self.frame = tk.Frame(parent, bg=BG_PANEL)
         self.baseball_data = None  # Will be set in update_roster
+        self.view_models = view_models or ViewModelCache(background=False)
 
         # Create our own comparison mode var if not provided
         if comparison_mode_var is None:
@@ -122,9 +129,6 @@ class RosterWidget:
         self.batters_df = None
         self.pitchers_df = None
 
-        # Cached prior_year prorated data for comparison (Phase 5: Stats Enhancement)
-        self.team_batting_prior_year = None
-        self.team_pitching_prior_year = None
         self.current_team = None  # Track currently displayed team
 
         # Track sort state for each tree: {tree_id: {'column': str, 'ascending': bool}}
@@ -336,7 +340,7 @@ class RosterWidget:
                 "Str",
             )
 
-        tree = ttk.Treeview(parent, columns=columns, show="headings", height=15)
+        tree = VirtualTreeview(parent, columns=columns, show="headings", height=15)
 
         # Initialize sort state for this tree
         tree_id = str(id(tree))
@@ -461,7 +465,7 @@ class RosterWidget:
                 self.batters_df = sorted_batters.copy()
 
             # Update position players tree
-            self._update_roster_tree(self.pos_players_tree, sorted_batters, is_batter=True)
+            self._update_roster_tree(self.pos_players_tree, self.batters_df, is_batter=True)
 
             # Update sort indicators if there was a custom sort
             if tree_id in self.sort_state and self.sort_state[tree_id]["column"] is not None:
@@ -492,7 +496,7 @@ class RosterWidget:
                 self.pitchers_df = sorted_pitchers.copy()
 
             # Update pitchers tree
-            self._update_roster_tree(self.pitchers_tree, sorted_pitchers, is_batter=False)
+            self._update_roster_tree(self.pitchers_tree, self.pitchers_df, is_batter=False)
 
             # Update sort indicators if there was a custom sort
             if tree_id in self.sort_state and self.sort_state[tree_id]["column"] is not None:
@@ -515,6 +519,104 @@ class RosterWidget:
 
             logger.error(traceback.format_exc())
 
+    def apply_changed_rows(self, batting_rows: pd.DataFrame, pitching_rows: pd.DataFrame, removed: set) -> bool:
+        """
+        Update only the team's players changed since the last refresh, keeping filters, sort and scroll position.
+
+        Args:
+            batting_rows: Changed batters league wide, see BaseballStats.get_changed_rows()
+            pitching_rows: Changed pitchers league wide
+            removed: Hashcodes no longer in the season
+
+        Returns:
+            False if update_roster() is needed instead: no roster yet, players joined or
+            left the team, the difference view, which is recalculated as a whole, or rows
+            still being prepared from older data
+        """
+        if self.batters_df_full is None or self.pitchers_df_full is None or self.current_team is None:
+            return False
+        if self.comparison_mode_var and self.comparison_mode_var.get() == "difference":
+            return False
+        if self.view_models.pending(self.pos_players_tree) or self.view_models.pending(self.pitchers_tree):
+            return False
+        for rows, full in ((batting_rows, self.batters_df_full), (pitching_rows, self.pitchers_df_full)):
+            joined = ~rows.index[rows["Team"] == self.current_team].isin(full.index)
+            left = rows.loc[rows.index.isin(full.index), "Team"] != self.current_team
+            if joined.any() or left.any() or full.index.isin(list(removed)).any():
+                return False
+
+        try:
+            self._patch_rows(batting_rows, is_batter=True)
+            self._patch_rows(pitching_rows, is_batter=False)
+            self._update_totals_display(is_batter=True)
+            self._update_totals_display(is_batter=False)
+        except Exception as e:
+            logger.error(f"Error patching roster: {e}")
+            return False
+        return True
+
+    def _patch_rows(self, rows: pd.DataFrame, is_batter: bool):
+        """
+        Copy the team's changed players into the full data and redraw their rows.
+
+        The displayed rows are re-read from it in their current order. Changed rows still in
+        sort order are redrawn in place, otherwise the displayed rows are re-sorted.
+
+        Args:
+            rows: Changed players league wide
+            is_batter: True for batters, False for pitchers
+        """
+        full = self.batters_df_full if is_batter else self.pitchers_df_full
+        rows = rows[rows.index.isin(full.index)]
+        if rows.empty:
+            return
+        sorted_by = self._sort_column(is_batter)
+        patch_frame(full, rows)
+
+        view = self.batters_df if is_batter else self.pitchers_df
+        shown = rows.index[rows.index.isin(view.index)]
+        if len(shown) == 0:
+            return
+        view = full.loc[view.index]  # the displayed rows re-read in their current order
+        positions = view.index.get_indexer(shown)
+        column, ascending = self._sort_column(is_batter)  # the default sort column depends on the stats
+        resort = column in view.columns and (
+            (column, ascending) != sorted_by or not in_sort_order(view[column].to_numpy(), positions, ascending)
+        )
+        if resort:
+            view = view.sort_values(column, ascending=ascending, na_position="last", kind="stable")
+        if is_batter:
+            self.batters_df = view
+        else:
+            self.pitchers_df = view
+
+        tree = self.pos_players_tree if is_batter else self.pitchers_tree
+        if resort:
+            self._update_roster_tree(tree, view, is_batter)
+        else:
+            tree.update_rows(positions, self._row_source(view, "current", is_batter))
+
+    def _sort_column(self, is_batter: bool) -> tuple:
+        """
+        Column and direction of the displayed rows, as sorted by update_roster().
+
+        Args:
+            is_batter: True for batters, False for pitchers
+
+        Returns:
+            (DataFrame column, ascending): the user's sort, or PA / AB / G or IP descending
+            once the team has stats, column is None while the rows are unsorted
+        """
+        tree = self.pos_players_tree if is_batter else self.pitchers_tree
+        sort_state = self.sort_state.get(str(id(tree)), {})
+        if sort_state.get("column") is not None:
+            return {"K": "SO"}.get(sort_state["column"], sort_state["column"]), sort_state["ascending"]
+        full = self.batters_df_full if is_batter else self.pitchers_df_full
+        for column in ("PA", "AB", "G") if is_batter else ("IP",):
+            if column in full.columns and full[column].sum() > 0:
+                return column, False
+        return ("Player", True) if not is_batter else (None, False)
+
     @staticmethod
     def _condition_to_text(condition: int) -> str:
         """
@@ -546,168 +648,202 @@ class RosterWidget:
             data_df: DataFrame with player data
             is_batter: True for batters, False for pitchers
         """
-        # Clear existing
-        for item in tree.get_children():
-            tree.delete(item)
-
         # Handle empty DataFrame
         if data_df.empty:
             logger.debug(f"Empty roster data for {'batter' if is_batter else 'pitcher'}")
+            self.view_models.cancel(tree)
+            tree.set_rows(0, lambda position: ((), ()))
             return
 
-        # Check comparison mode and calculate differences if needed
+        # Differences and row formatting are prepared off the Tk thread (see ViewModelCache)
         mode = self.comparison_mode_var.get() if self.comparison_mode_var else "current"
-        display_df = data_df
-
-        if mode == "difference":
-            display_df = self._calculate_difference_df(data_df, is_batter)
-
-        # Insert rows
-        for idx, row in display_df.iterrows():
-            try:
-                # Determine injury days and condition display
-                injured_days = int(row.get("Injured Days", 0))
-                if injured_days > 0:
-                    condition_display = "Injured"
-                else:
-                    condition_display = self._condition_to_text(int(row.get("Condition", 100)))
-
-                if is_batter:
-                    # Clean up position formatting (remove brackets and quotes)
-                    pos = row.get("Pos", "Unknown")
-                    if isinstance(pos, list):
-                        pos = pos[0] if pos else "Unknown"
-                    pos = str(pos).replace("[", "").replace("]", "").replace("'", "").replace('"', "").strip()
-
-                    # Get salary and calculate years remaining
-                    salary = row.get("Salary", LEAGUE_MIN_SALARY)
-                    age = row.get("Age", 30)
-                    years_rem = estimate_years_remaining(age, salary, is_pitcher=False)
-                    salary_display = f"${salary / 1e6:.1f}M" if salary else "-"
-
-                    if mode == "difference":
-                        # Format with +/- prefix for difference mode
-                        streak_text = get_streak_indicator(row.get("Streak_Adjustment"))
-                        values = (
-                            row.get("Player", "Unknown"),
-                            row.get("Team", ""),
-                            pos,
-                            self._format_diff_value(row.get("G", 0)),
-                            self._format_diff_value(row.get("AB", 0)),
-                            self._format_diff_value(row.get("R", 0)),
-                            self._format_diff_value(row.get("H", 0)),
-                            self._format_diff_value(row.get("2B", 0)),
-                            self._format_diff_value(row.get("3B", 0)),
-                            self._format_diff_value(row.get("HR", 0)),
-                            self._format_diff_value(row.get("RBI", 0)),
-                            self._format_diff_value(row.get("BB", 0)),
-                            self._format_diff_value(row.get("SO", 0)),
-                            self._format_diff_value(row.get("AVG", 0), decimals=3),
-                            self._format_diff_value(row.get("OBP", 0), decimals=3),
-                            self._format_diff_value(row.get("SLG", 0), decimals=3),
-                            self._format_diff_value(row.get("OPS", 0), decimals=3),
-                            salary_display,
-                            years_rem,
-                            condition_display,
-                            row.get("Status", "Healthy"),
-                            streak_text,
-                        )
-                    else:
-                        # Standard format for current stats
-                        streak_text = get_streak_indicator(row.get("Streak_Adjustment"))
-                        values = (
-                            row.get("Player", "Unknown"),
-                            row.get("Team", ""),
-                            pos,
-                            int(row.get("G", 0)),
-                            int(row.get("AB", 0)),
-                            int(row.get("R", 0)),
-                            int(row.get("H", 0)),
-                            int(row.get("2B", 0)),
-                            int(row.get("3B", 0)),
-                            int(row.get("HR", 0)),
-                            int(row.get("RBI", 0)),
-                            int(row.get("BB", 0)),
-                            int(row.get("SO", 0)),
-                            f"{float(row.get('AVG', 0)):.3f}",
-                            f"{float(row.get('OBP', 0)):.3f}",
-                            f"{float(row.get('SLG', 0)):.3f}",
-                            f"{float(row.get('OPS', 0)):.3f}",
-                            salary_display,
-                            years_rem,
-                            condition_display,
-                            row.get("Status", "Healthy"),
-                            streak_text,
-                        )
-                else:
-                    # Get salary and calculate years remaining
-                    salary = row.get("Salary", LEAGUE_MIN_SALARY)
-                    age = row.get("Age", 30)
-                    years_rem = estimate_years_remaining(age, salary, is_pitcher=True)
-                    salary_display = f"${salary / 1e6:.1f}M" if salary else "-"
-
-                    if mode == "difference":
-                        # Format with +/- prefix for difference mode
-                        streak_text = get_streak_indicator(row.get("Streak_Adjustment"))
-                        values = (
-                            row.get("Player", "Unknown"),
-                            self._format_diff_value(row.get("G", 0)),
-                            self._format_diff_value(row.get("GS", 0)),
-                            self._format_diff_value(row.get("W", 0)),
-                            self._format_diff_value(row.get("L", 0)),
-                            self._format_diff_value(row.get("IP", 0), decimals=1),
-                            self._format_diff_value(row.get("H", 0)),
-                            self._format_diff_value(row.get("R", 0)),
-                            self._format_diff_value(row.get("ER", 0)),
-                            self._format_diff_value(row.get("HR", 0)),
-                            self._format_diff_value(row.get("BB", 0)),
-                            self._format_diff_value(row.get("SO", 0)),
-                            self._format_diff_value(row.get("ERA", 0), decimals=2),
-                            self._format_diff_value(row.get("WHIP", 0), decimals=2),
-                            self._format_diff_value(row.get("SV", 0)),
-                            salary_display,
-                            years_rem,
-                            condition_display,
-                            row.get("Status", "Healthy"),
-                            streak_text,
-                        )
-                    else:
-                        # Standard format for current stats
-                        streak_text = get_streak_indicator(row.get("Streak_Adjustment"))
-                        values = (
-                            row.get("Player", "Unknown"),
-                            int(row.get("G", 0)),
-                            int(row.get("GS", 0)),
-                            int(row.get("W", 0)),
-                            int(row.get("L", 0)),
-                            f"{float(row.get('IP', 0)):.1f}",
-                            int(row.get("H", 0)),
-                            int(row.get("R", 0)),
-                            int(row.get("ER", 0)),
-                            int(row.get("HR", 0)),
-                            int(row.get("BB", 0)),
-                            int(row.get("SO", 0)),
-                            f"{float(row.get('ERA', 0)):.2f}",
-                            f"{float(row.get('WHIP', 0)):.2f}",
-                            int(row.get("SV", 0)),
-                            salary_display,
-                            years_rem,
-                            condition_display,
-                            row.get("Status", "Healthy"),
-                            streak_text,
-                        )
-
-                # Determine injury tag based on Injured Days
-                tags = ()
-                if injured_days > 0:
-                    if injured_days < 10:
-                        tags = ("day_to_day",)
-                    else:
-                        tags = ("injured",)
+        team = self.current_team
+        games_played = 0
+        if mode == "difference" and self.baseball_data is not None:
+            games_played = getattr(self.baseball_data, "team_games_played", {}).get(team, 0)
+
+        def prepare():
+            display_df = data_df
+            if mode == "difference":
+                display_df = self._calculate_difference_df(data_df, is_batter, team, games_played)
+            return build_table_view(
+                display_df, lambda row: self._format_roster_row(row, mode, is_batter), self.view_models.preformat_rows
+            )
 
-                tree.insert("", tk.END, values=values, tags=tags)
-            except Exception as e:
-                logger.warning(f"Error inserting roster row for {row.get('Player', 'Unknown')}: {e}")
+        self.view_models.request(
+            tree,
+            ("roster", team, is_batter, mode, games_played) + frame_key(data_df),
+            prepare,
+            lambda view: tree.set_rows(len(view.frame), view.row),
+        )
+
+    def _row_source(self, display_df: pd.DataFrame, mode: str, is_batter: bool):
+        """
+        Row source for the virtual tree, formats a displayed row when it scrolls into view.
+
+        Args:
+            display_df: Displayed rows in order
+            mode: "current" or "difference"
+            is_batter: True for batters, False for pitchers
+
+        Returns:
+            Function of a row position returning (values, tags)
+        """
+        return lambda position: self._format_roster_row(display_df.iloc[position], mode, is_batter)
+
+    def _format_roster_row(self, row: pd.Series, mode: str, is_batter: bool) -> tuple:
+        """
+        Format one player's roster line for display.
+
+        Args:
+            row: Player row from the displayed DataFrame
+            mode: "current" or "difference"
+            is_batter: True for batters, False for pitchers
+
+        Returns:
+            (values, tags) with the display values in column order and the injury highlight tag
+        """
+        # Determine injury days and condition display
+        injured_days = int(row.get("Injured Days", 0))
+        if injured_days > 0:
+            condition_display = "Injured"
+        else:
+            condition_display = self._condition_to_text(int(row.get("Condition", 100)))
+
+        if is_batter:
+            # Clean up position formatting (remove brackets and quotes)
+            pos = row.get("Pos", "Unknown")
+            if isinstance(pos, list):
+                pos = pos[0] if pos else "Unknown"
+            pos = str(pos).replace("[", "").replace("]", "").replace("'", "").replace('"', "").strip()
+
+            # Get salary and calculate years remaining
+            salary = row.get("Salary", LEAGUE_MIN_SALARY)
+            age = row.get("Age", 30)
+            years_rem = estimate_years_remaining(age, salary, is_pitcher=False)
+            salary_display = f"${salary / 1e6:.1f}M" if salary else "-"
+
+            if mode == "difference":
+                # Format with +/- prefix for difference mode
+                streak_text = get_streak_indicator(row.get("Streak_Adjustment"))
+                values = (
+                    row.get("Player", "Unknown"),
+                    row.get("Team", ""),
+                    pos,
+                    self._format_diff_value(row.get("G", 0)),
+                    self._format_diff_value(row.get("AB", 0)),
+                    self._format_diff_value(row.get("R", 0)),
+                    self._format_diff_value(row.get("H", 0)),
+                    self._format_diff_value(row.get("2B", 0)),
+                    self._format_diff_value(row.get("3B", 0)),
+                    self._format_diff_value(row.get("HR", 0)),
+                    self._format_diff_value(row.get("RBI", 0)),
+                    self._format_diff_value(row.get("BB", 0)),
+                    self._format_diff_value(row.get("SO", 0)),
+                    self._format_diff_value(row.get("AVG", 0), decimals=3),
+                    self._format_diff_value(row.get("OBP", 0), decimals=3),
+                    self._format_diff_value(row.get("SLG", 0), decimals=3),
+                    self._format_diff_value(row.get("OPS", 0), decimals=3),
+                    salary_display,
+                    years_rem,
+                    condition_display,
+                    row.get("Status", "Healthy"),
+                    streak_text,
+                )
+            else:
+                # Standard format for current stats
+                streak_text = get_streak_indicator(row.get("Streak_Adjustment"))
+                values = (
+                    row.get("Player", "Unknown"),
+                    row.get("Team", ""),
+                    pos,
+                    int(row.get("G", 0)),
+                    int(row.get("AB", 0)),
+                    int(row.get("R", 0)),
+                    int(row.get("H", 0)),
+                    int(row.get("2B", 0)),
+                    int(row.get("3B", 0)),
+                    int(row.get("HR", 0)),
+                    int(row.get("RBI", 0)),
+                    int(row.get("BB", 0)),
+                    int(row.get("SO", 0)),
+                    f"{float(row.get('AVG', 0)):.3f}",
+                    f"{float(row.get('OBP', 0)):.3f}",
+                    f"{float(row.get('SLG', 0)):.3f}",
+                    f"{float(row.get('OPS', 0)):.3f}",
+                    salary_display,
+                    years_rem,
+                    condition_display,
+                    row.get("Status", "Healthy"),
+                    streak_text,
+                )
+        else:
+            # Get salary and calculate years remaining
+            salary = row.get("Salary", LEAGUE_MIN_SALARY)
+            age = row.get("Age", 30)
+            years_rem = estimate_years_remaining(age, salary, is_pitcher=True)
+            salary_display = f"${salary / 1e6:.1f}M" if salary else "-"
+
+            if mode == "difference":
+                # Format with +/- prefix for difference mode
+                streak_text = get_streak_indicator(row.get("Streak_Adjustment"))
+                values = (
+                    row.get("Player", "Unknown"),
+                    self._format_diff_value(row.get("G", 0)),
+                    self._format_diff_value(row.get("GS", 0)),
+                    self._format_diff_value(row.get("W", 0)),
+                    self._format_diff_value(row.get("L", 0)),
+                    self._format_diff_value(row.get("IP", 0), decimals=1),
+                    self._format_diff_value(row.get("H", 0)),
+                    self._format_diff_value(row.get("R", 0)),
+                    self._format_diff_value(row.get("ER", 0)),
+                    self._format_diff_value(row.get("HR", 0)),
+                    self._format_diff_value(row.get("BB", 0)),
+                    self._format_diff_value(row.get("SO", 0)),
+                    self._format_diff_value(row.get("ERA", 0), decimals=2),
+                    self._format_diff_value(row.get("WHIP", 0), decimals=2),
+                    self._format_diff_value(row.get("SV", 0)),
+                    salary_display,
+                    years_rem,
+                    condition_display,
+                    row.get("Status", "Healthy"),
+                    streak_text,
+                )
+            else:
+                # Standard format for current stats
+                streak_text = get_streak_indicator(row.get("Streak_Adjustment"))
+                values = (
+                    row.get("Player", "Unknown"),
+                    int(row.get("G", 0)),
+                    int(row.get("GS", 0)),
+                    int(row.get("W", 0)),
+                    int(row.get("L", 0)),
+                    f"{float(row.get('IP', 0)):.1f}",
+                    int(row.get("H", 0)),
+                    int(row.get("R", 0)),
+                    int(row.get("ER", 0)),
+                    int(row.get("HR", 0)),
+                    int(row.get("BB", 0)),
+                    int(row.get("SO", 0)),
+                    f"{float(row.get('ERA', 0)):.2f}",
+                    f"{float(row.get('WHIP', 0)):.2f}",
+                    int(row.get("SV", 0)),
+                    salary_display,
+                    years_rem,
+                    condition_display,
+                    row.get("Status", "Healthy"),
+                    streak_text,
+                )
+
+        # Determine injury tag based on Injured Days
+        tags = ()
+        if injured_days > 0:
+            if injured_days < 10:
+                tags = ("day_to_day",)
+            else:
+                tags = ("injured",)
+
+        return values, tags
 
     def _apply_sort(self, df: pd.DataFrame, column: str, ascending: bool, is_batter: bool) -> pd.DataFrame:
         """
@@ -972,7 +1108,7 @@ class RosterWidget:
                 filtered_df = self.batters_df_full
 
             self.batters_df = filtered_df.copy()
-            self._update_roster_tree(self.pos_players_tree, filtered_df, is_batter=True)
+            self._update_roster_tree(self.pos_players_tree, self.batters_df, is_batter=True)
         else:
             if self.pitchers_df_full is None:
                 return
@@ -985,7 +1121,7 @@ class RosterWidget:
                 filtered_df = self.pitchers_df_full
 
             self.pitchers_df = filtered_df.copy()
-            self._update_roster_tree(self.pitchers_tree, filtered_df, is_batter=False)
+            self._update_roster_tree(self.pitchers_tree, self.pitchers_df, is_batter=False)
 
     def _clear_filter(self, is_batter: bool = True):
         """Clear search filter."""
@@ -1027,84 +1163,38 @@ class RosterWidget:
         if self.current_team and self.baseball_data:
             self.update_roster(self.current_team, self.baseball_data)
 
-    def _load_team_prior_year_data(self, team_name: str, games_played: int):
-        """
-        Load and cache prior_year data for specific team (Phase 5: Stats Enhancement).
-
-        Args:
-            team_name: Team abbreviation
-            games_played: Games played by team
-        """
-        if self.baseball_data is None:
-            return
-
-        batting_prior_year, pitching_prior_year = self.baseball_data.calculate_prorated_prior_year_stats(team_name,
-                                                                                                         games_played)
-
-        self.team_batting_prior_year = batting_prior_year
-        self.team_pitching_prior_year = pitching_prior_year
-
-        logger.debug(
-            f"Loaded prior_year team data for {team_name}: {len(batting_prior_year)} batters, {len(pitching_prior_year)} pitchers"
-        )
-
-    def _calculate_difference_df(self, current_df: pd.DataFrame, is_batter: bool) -> pd.DataFrame:
+    def _calculate_difference_df(
+            self, current_df: pd.DataFrame, is_batter: bool, team: str, games_played: int
+    ) -> pd.DataFrame:
         """
         Calculate current - prorated prior_year for team players (Phase 5: Stats Enhancement).
 
+        Runs on the view model thread, so it only reads its arguments and the thread safe
+        calculate_prorated_prior_year_stats().
+
         Args:
             current_df: Current season DataFrame
             is_batter: True for batters, False for pitchers
+            team: Team abbreviation
+            games_played: Games played by team, the proration basis
 
         Returns:
             DataFrame with difference values
         """
-        # Load prior_year data if not cached (always recalculate to get correct proration)
-        if self.current_team and self.baseball_data:
-            if hasattr(self.baseball_data, "team_games_played"):
-                games_played = self.baseball_data.team_games_played.get(self.current_team, 0)
-                if games_played > 0:
-                    # Always reload to get correct prorated values for current games_played
-                    self._load_team_prior_year_data(self.current_team, games_played)
+        if self.baseball_data is None or games_played <= 0:
+            return current_df
 
-        hist_df = self.team_batting_prior_year if is_batter else self.team_pitching_prior_year
+        # Prorated to the current games_played, cached by baseball_data per team and games played
+        batting_prior_year, pitching_prior_year = self.baseball_data.calculate_prorated_prior_year_stats(
+            team, games_played
+        )
+        hist_df = batting_prior_year if is_batter else pitching_prior_year
 
         if hist_df is None or hist_df.empty:
-            logger.warning(f"No prior_year historical data available for {self.current_team}")
+            logger.warning(f"No prior_year historical data available for {team}")
             return current_df
 
-        diff_df = current_df.copy()
-
-        # Convert indices to strings for proper comparison (hashcodes may be int or str)
-        hist_index_str = set(hist_df.index.astype(str))
-
-        # Join on Hashcode (index)
-        for idx in diff_df.index:
-            idx_str = str(idx)
-            if idx_str in hist_index_str:
-                # Find the matching row in hist_df
-                hist_row = hist_df.loc[hist_df.index[hist_df.index.astype(str) == idx_str]].iloc[0]
-
-                # Counting stats: absolute difference
-                if is_batter:
-                    count_cols = ["AB", "R", "H", "2B", "3B", "HR", "RBI", "BB", "SO"]
-                    rate_cols = ["AVG", "OBP", "SLG", "OPS"]
-                else:
-                    count_cols = ["G", "GS", "W", "L", "IP", "H", "R", "ER", "HR", "BB", "SO", "SV"]
-                    rate_cols = ["ERA", "WHIP"]
-
-                for col in count_cols:
-                    if col in diff_df.columns and col in hist_row.index:
-                        diff_df[col] = diff_df[col].astype(float)
-                        diff_df.at[idx, col] = float(diff_df.at[idx, col]) - float(hist_row[col])
-
-                # Rate stats: difference
-                for col in rate_cols:
-                    if col in diff_df.columns and col in hist_row.index:
-                        diff_df[col] = diff_df[col].astype(float)
-                        diff_df.at[idx, col] = float(diff_df.at[idx, col]) - float(hist_row[col])
-
-        return diff_df
+        return calculate_stats_difference(current_df, hist_df, is_batter)
 
     def _format_diff_value(self, value, decimals=0):
         """
@@ -1290,12 +1380,15 @@ class RosterWidget:
 
     def _copy_selected_rows(self, tree: ttk.Treeview):
         """Copy selected row(s) to clipboard as tab-separated values with column headers."""
-        selected = tree.selection()
+        if isinstance(tree, VirtualTreeview):  # includes selected rows scrolled out of view
+            selected = [tree.row_values(row) for row in tree.selected_rows()]
+        else:
+            selected = [tree.item(item, "values") for item in tree.selection()]
         if not selected:
             return
         columns = tree["columns"]
         header = "\t".join(columns)
-        rows = ["\t".join(str(v) for v in tree.item(item, "values")) for item in selected]
+        rows = ["\t".join(str(v) for v in values) for values in selected]
         tree.clipboard_clear()
         tree.clipboard_append(header + "\n" + "\n".join(rows))
 
@@ -0,0 +1,290 @@
+"""
+Copyright (c) 2024 Jim Maastricht
+
+Virtualized Treeview for long player tables.
+
+A plain Treeview holds one item per row, so refreshing a league-wide table
+deletes and reinserts thousands of items and formats every cell. VirtualTreeview
+holds only as many items as fit on screen and fills them from a row source,
+formatting a row the first time it scrolls into view. Scrolling, sorting and
+filtering re-render the visible window only, so the cost of a refresh does not
+depend on the number of players. Rows changed in place, e.g. the players in a
+sim day's games, are re-formatted with update_rows().
+
+It is a drop-in ttk.Treeview: headings, columns, tags, bindings, selection()
+and item(values) work as before for the visible rows, and a scrollbar connects
+through yview/yscrollcommand as usual. selected_rows() and row_values() reach
+every selected row, including those scrolled out of view.
+"""
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from bblogger import logger
+
+WHEEL_ROWS = 3  # rows scrolled per mouse wheel notch
+
+
+def patch_frame(df: pd.DataFrame, rows: pd.DataFrame) -> np.ndarray:
+    """
+    Copy rows into the rows of df with the same index, in place.
+
+    Only columns with a changed value are written, a sim day changes the stats and
+    condition columns of a few hundred players and leaves names, salaries, etc.
+    alone. Much faster than df.loc[rows.index, columns] = rows on wide player frames.
+
+    Args:
+        df: Frame to update, must hold every row of rows
+        rows: Changed rows, columns df does not have are ignored
+
+    Returns:
+        Row positions of the changed rows in df
+    """
+    positions = df.index.get_indexer(rows.index)
+    for col in df.columns.intersection(rows.columns):
+        old = df[col].to_numpy()[positions]
+        new = rows[col].to_numpy()
+        same = old == new
+        if old.dtype.kind in "fO":
+            same |= pd.isna(old) & pd.isna(new)
+        if not np.all(same):
+            values = df[col].to_numpy(copy=True)
+            values[positions] = new
+            df[col] = values
+    return positions
+
+
+def in_sort_order(values, positions: Iterable[int], ascending: bool) -> bool:
+    """
+    Check whether rows changed in place are still in order with their neighbours.
+
+    The other rows were sorted before and did not move, so checking the pairs
+    next to each changed row is enough to know the whole column is still sorted.
+
+    Args:
+        values: Sort column in display order, missing values sort last
+        positions: Row positions that changed
+        ascending: Sort direction
+
+    Returns:
+        True if no re-sort is needed
+    """
+    try:
+        for position in positions:
+            for upper, lower in ((position - 1, position), (position, position + 1)):
+                if upper < 0 or lower >= len(values) or pd.isna(values[lower]):
+                    continue
+                if pd.isna(values[upper]) or (values[upper] > values[lower] if ascending
+                                              else values[upper] < values[lower]):
+                    return False
+    except TypeError:  # mixed types in a text column
+        return False
+    return True
+
+
+class VirtualTreeview(ttk.Treeview):
+    """Treeview showing a scrolling window over rows produced on demand."""
+
+    def __init__(self, master=None, **kw):
+        """
+        Initialize the treeview.
+
+        Args:
+            master: Parent widget
+            **kw: ttk.Treeview options, yscrollcommand receives the virtual scroll position
+        """
+        self._yscrollcommand = kw.pop("yscrollcommand", None)
+        super().__init__(master, **kw)
+        self._count = 0  # rows in the source
+        self._format_row: Optional[Callable[[int], Tuple[tuple, tuple]]] = None
+        self._formatted: Dict[int, Tuple[tuple, tuple]] = {}  # row position -> (values, tags)
+        self._first = 0  # row position shown in the top slot
+        self._slots = []  # item ids, top to bottom
+        self._selected_rows = set()  # row positions, kept while they are scrolled out of view
+
+        self.bind("<Configure>", lambda e: self._render(), add="+")
+        self.bind("<MouseWheel>", self._on_mousewheel)
+        self.bind("<Button-4>", lambda e: self._scroll_rows(-WHEEL_ROWS))  # X11 wheel up
+        self.bind("<Button-5>", lambda e: self._scroll_rows(WHEEL_ROWS))  # X11 wheel down
+        self.bind("<<TreeviewSelect>>", self._on_select, add="+")
+        for key, step in (("<Up>", -1), ("<Down>", 1), ("<Prior>", "page-"), ("<Next>", "page+")):
+            self.bind(key, lambda e, s=step: self._on_nav_key(s))
+        self.bind("<Home>", lambda e: self._on_nav_key("home"))
+        self.bind("<End>", lambda e: self._on_nav_key("end"))
+
+    # =================================================================
+    # ROW SOURCE
+    # =================================================================
+
+    def set_rows(self, count: int, format_row: Callable[[int], Tuple[tuple, tuple]]):
+        """
+        Show a new set of rows, keeping the scroll position where possible.
+
+        Args:
+            count: Number of rows
+            format_row: Called with a row position, returns (values, tags) for that row.
+                Only rows that scroll into view are formatted, each once until the next
+                set_rows() or refresh().
+        """
+        self._count = count
+        self._format_row = format_row
+        self._formatted = {}
+        self._selected_rows = set()
+        self._render()
+
+    def refresh(self):
+        """Re-format and redraw the visible rows after the source data changed in place."""
+        self._formatted = {}
+        self._render()
+
+    def update_rows(self, positions: Iterable[int], format_row: Optional[Callable[[int], Tuple[tuple, tuple]]] = None):
+        """
+        Re-format rows whose source data changed, redrawing only those that are visible.
+
+        Args:
+            positions: Row positions that changed, the other rows keep their formatting and
+                every row keeps its position and selection
+            format_row: New row source over the same rows in the same order, e.g. a re-read frame
+        """
+        if format_row is not None:
+            self._format_row = format_row
+        positions = set(positions)
+        for position in positions:
+            self._formatted.pop(position, None)
+        for i, item in enumerate(self._slots):
+            if self._first + i in positions:
+                values, tags = self._row(self._first + i)
+                self.item(item, values=values, tags=tags)
+
+    def row_count(self) -> int:
+        """Number of rows in the source, not just the visible ones."""
+        return self._count
+
+    def selected_rows(self) -> List[int]:
+        """Selected row positions in row order, including rows scrolled out of view."""
+        return sorted(row for row in self._selected_rows if row < self._count)
+
+    def row_values(self, position: int) -> tuple:
+        """Formatted values of any row, visible or not."""
+        return self._row(position)[0]
+
+    def row_of(self, item: str) -> Optional[int]:
+        """Row position shown by a visible item, None if the item is not a row slot."""
+        return self._first + self._slots.index(item) if item in self._slots else None
+
+    def _row(self, position: int) -> Tuple[tuple, tuple]:
+        """Formatted (values, tags) of a row, from the cache when already formatted."""
+        if position not in self._formatted:
+            try:
+                self._formatted[position] = self._format_row(position)
+            except Exception as e:
+                logger.warning(f"Error formatting row {position}: {e}")
+                self._formatted[position] = ((), ())
+        return self._formatted[position]
+
+    # =================================================================
+    # RENDERING
+    # =================================================================
+
+    def _visible_count(self) -> int:
+        """Rows that fit in the widget, the height option until it has been drawn."""
+        if self._slots and self.winfo_ismapped():
+            box = self.bbox(self._slots[0])  # (x, y, width, height), y is below the headings
+            if box:
+                return max(1, (self.winfo_height() - box[1]) // box[3])
+        return int(self.cget("height"))
+
+    def _render(self):
+        """Fill the slots with the rows of the current window."""
+        if self._format_row is None:
+            return
+        shown = min(self._visible_count(), self._count)
+        self._first = max(0, min(self._first, self._count - shown))
+        while len(self._slots) < shown:
+            self._slots.append(super().insert("", tk.END))
+        while len(self._slots) > shown:
+            super().delete(self._slots.pop())
+
+        for i, item in enumerate(self._slots):
+            values, tags = self._row(self._first + i)
+            self.item(item, values=values, tags=tags)
+        self.selection_set([item for i, item in enumerate(self._slots) if self._first + i in self._selected_rows])
+        if self._yscrollcommand:
+            self._yscrollcommand(*self.yview())
+
+    def _scroll_rows(self, rows: int):
+        """Move the window by a number of rows."""
+        self._first += rows
+        self._render()
+        return "break"
+
+    # =================================================================
+    # SCROLLING AND SELECTION
+    # =================================================================
+
+    def yview(self, *args):
+        """Scrollbar protocol over the virtual rows: no args returns (top, bottom) fractions."""
+        if not args:
+            total = max(1, self._count)
+            return self._first / total, min(1.0, (self._first + len(self._slots)) / total)
+        if args[0] == "moveto":
+            self._first = int(float(args[1]) * self._count)
+        elif args[0] == "scroll":
+            page = max(1, len(self._slots) - 1)
+            self._first += int(args[1]) * (page if str(args[2]).startswith("page") else 1)
+        self._render()
+        return None
+
+    def yview_moveto(self, fraction):
+        """Scroll so the row at fraction of the rows is at the top."""
+        self.yview("moveto", fraction)
+
+    def yview_scroll(self, number, what):
+        """Scroll by number units (rows) or pages."""
+        self.yview("scroll", number, what)
+
+    def configure(self, cnf=None, **kw):
+        """ttk.Treeview.configure, keeping yscrollcommand for the virtual scroll position."""
+        if isinstance(cnf, dict) and "yscrollcommand" in cnf:
+            cnf = dict(cnf)
+            self._yscrollcommand = cnf.pop("yscrollcommand")
+        if "yscrollcommand" in kw:
+            self._yscrollcommand = kw.pop("yscrollcommand")
+        return super().configure(cnf, **kw)
+
+    config = configure
+
+    def _on_mousewheel(self, event):
+        """Scroll WHEEL_ROWS rows per notch."""
+        return self._scroll_rows(-WHEEL_ROWS if event.delta > 0 else WHEEL_ROWS)
+
+    def _on_select(self, event=None):
+        """Remember selected rows by position, so the selection survives scrolling."""
+        visible = range(self._first, self._first + len(self._slots))
+        self._selected_rows = {row for row in self._selected_rows if row not in visible}
+        self._selected_rows.update(self.row_of(item) for item in self.selection() if item in self._slots)
+
+    def _on_nav_key(self, step):
+        """Move the focus row with the keyboard, scrolling the window to keep it visible."""
+        if not self._slots:
+            return "break"
+        focus = self.focus()
+        current = self.row_of(focus) if focus else self._first
+        page = max(1, len(self._slots) - 1)
+        target = {"page-": current - page, "page+": current + page, "home": 0, "end": self._count - 1}.get(
+            step, current + step if isinstance(step, int) else current
+        )
+        target = max(0, min(target, self._count - 1))
+        if target < self._first:
+            self._first = target
+        elif target >= self._first + len(self._slots):
+            self._first = target - len(self._slots) + 1
+        self._selected_rows = {target}
+        self._render()
+        item = self._slots[target - self._first]
+        self.focus(item)
+        return "break"